@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module benchmarks the throughput of the browser sessions driven from
+Python: the synchronous selenium path (one worker process per browser session,
+as the parallel runner does) against the asyncio orchestration (all the
+sessions driven by one event loop, through one shared HTTP client). Both paths
+run the same flows (tests/demopage_flows.py) against the same WebDriver server and
+report the flows per second, the CPU time of the Python processes (startup
+and per flow), the sessions per core (the sessions divided by the cores kept
+busy by their Python processes) and the memory of the Python processes (the
+server and the browsers are not counted).
+With no --remote_url, the static DOM WebDriver endpoint is started in a
+separate process, so the benchmark needs no browser.
+
+Usage (from the project folder):
+» python -m benchmarks.bench_async_sessions --sessions 16 --iterations 10
+» python -m benchmarks.bench_async_sessions --remote_url http://127.0.0.1:4444 --browser_name chrome
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import resource
+import time
+
+from selenium import webdriver
+from selenium.webdriver.common.options import ArgOptions
+
+from pageobjects.demopage import DemoPage
+from pageobjects.demopage_base import DemoPageBase
+from tests.demopage_flows import DEMOPAGE_FLOWS, run_flow
+from utilities.async_sessions import get_capabilities, get_flow_runs, run_sessions
+from utilities.launch_profiles import (
+    BROWSER_OPTIONS,
+    build_browser_options,
+    parse_profile_names,
+    remove_profile_copy,
+)
+from utilities.static_dom_server import run_server
+
+# Flows run by default: the ones the static DOM WebDriver can fully serve
+DEFAULT_FLOWS = "test_radio_button_selection"
+
+# Logger of the benchmarked flows (the records are discarded)
+benchmark_logger = logging.getLogger("demoqa.benchmark")
+benchmark_logger.addHandler(logging.NullHandler())
+benchmark_logger.propagate = False
+
+
+def __prepare_worker__(debug_pauses):
+    """
+    Helper method used to prepare a benchmark process: the debug showcase
+    pauses are not part of the measured throughput, unless requested.
+
+    :param debug_pauses: (bool) if True, the debug showcase pauses are kept
+    """
+    if not debug_pauses:
+        DemoPageBase.get_debug_showcase = lambda demopage: False
+
+
+def __process_usage__(startup_cpu_time):
+    """
+    Helper method used to read the resource usage of the current process.
+
+    :param startup_cpu_time: (float) CPU time spent before the flows (interpreter
+        startup and imports), in seconds
+    :return: (dict) the startup and total CPU times (seconds) and the peak
+        resident memory (MB)
+    """
+    return {
+        "startup_cpu_time": startup_cpu_time,
+        "cpu_time": time.process_time(),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_sync_worker(remote_url, browser_name, flow_names, iterations, options):
+    """
+    Function used to run one synchronous session, in its own process.
+
+    :param remote_url: (str) url of the WebDriver server
+    :param browser_name: (str) name of the browser
+    :param flow_names: (list) names of the flows (test names)
+    :param iterations: (int) number of times the flows are repeated
+    :param options: (dict) the benchmark options (debug_pauses, launch_profile)
+    :return: (dict) flow runs, passed runs and the resource usage of the process
+    """
+    startup_cpu_time = time.process_time()
+    __prepare_worker__(options["debug_pauses"])
+    if browser_name in BROWSER_OPTIONS:
+        browser_options, profile_dir = build_browser_options(
+            browser_name, parse_profile_names(options["launch_profile"])
+        )
+    else:
+        browser_options, profile_dir = ArgOptions(), None
+    driver = webdriver.Remote(command_executor=remote_url, options=browser_options)
+    flow_runs, passed_runs = 0, 0
+    try:
+        for _ in range(iterations):
+            for flow_name, _, data_row in get_flow_runs(flow_names):
+                flow_runs += 1
+                try:
+                    demopage = DemoPage(driver, reuse_page=True)
+                    if data_row is None:
+                        flow = DEMOPAGE_FLOWS[flow_name](demopage, benchmark_logger)
+                    else:
+                        flow = DEMOPAGE_FLOWS[flow_name](
+                            demopage, benchmark_logger, data_row
+                        )
+                    run_flow(flow)
+                    passed_runs += 1
+                except Exception:
+                    pass
+    finally:
+        driver.quit()
+        remove_profile_copy(profile_dir)
+    return dict(
+        __process_usage__(startup_cpu_time),
+        flow_runs=flow_runs,
+        passed_runs=passed_runs,
+    )
+
+
+def run_async_worker(
+    remote_url, browser_name, flow_names, iterations, options, session_count
+):
+    """
+    Function used to run all the asynchronous sessions, in one process.
+
+    :param remote_url: (str) url of the WebDriver server
+    :param browser_name: (str) name of the browser
+    :param flow_names: (list) names of the flows (test names)
+    :param iterations: (int) number of times each session repeats the flows
+    :param options: (dict) the benchmark options (debug_pauses, launch_profile)
+    :param session_count: (int) number of concurrent sessions
+    :return: (dict) flow runs, passed runs and the resource usage of the process
+    """
+    startup_cpu_time = time.process_time()
+    __prepare_worker__(options["debug_pauses"])
+    capabilities, profile_dir = get_capabilities(
+        browser_name, parse_profile_names(options["launch_profile"])
+    )
+    try:
+        flow_results = asyncio.run(
+            run_sessions(
+                remote_url,
+                session_count,
+                flow_names,
+                capabilities,
+                log=benchmark_logger,
+                iterations=iterations,
+            )
+        )
+    finally:
+        remove_profile_copy(profile_dir)
+    return dict(
+        __process_usage__(startup_cpu_time),
+        flow_runs=len(flow_results),
+        passed_runs=sum(flow_result.passed for flow_result in flow_results),
+    )
+
+
+def measure_path(path_name, worker_calls):
+    """
+    Function used to run the worker processes of a path and to aggregate their usage.
+
+    :param path_name: (str) name of the measured path
+    :param worker_calls: (list) tuples of (worker function, arguments), one per process
+    :return: (dict) the aggregated measures of the path
+    """
+    spawn_context = multiprocessing.get_context("spawn")
+    start_time = time.perf_counter()
+    with spawn_context.Pool(len(worker_calls)) as worker_pool:
+        worker_results = [
+            worker_pool.apply_async(worker_function, worker_arguments)
+            for worker_function, worker_arguments in worker_calls
+        ]
+        worker_usages = [worker_result.get() for worker_result in worker_results]
+    wall_time = time.perf_counter() - start_time
+    return {
+        "path": path_name,
+        "processes": len(worker_calls),
+        "wall_time": wall_time,
+        "flow_runs": sum(usage["flow_runs"] for usage in worker_usages),
+        "passed_runs": sum(usage["passed_runs"] for usage in worker_usages),
+        "startup_cpu_time": sum(usage["startup_cpu_time"] for usage in worker_usages),
+        "cpu_time": sum(usage["cpu_time"] for usage in worker_usages),
+        "peak_rss_mb": sum(usage["peak_rss_mb"] for usage in worker_usages),
+    }
+
+
+def main():
+    """
+    Function used to run the benchmark and print the comparison.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--remote_url", default=None)
+    parser.add_argument("--browser_name", default="static")
+    parser.add_argument("--launch_profile", default="headless")
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--flows", default=DEFAULT_FLOWS)
+    parser.add_argument("--debug_pauses", action="store_true")
+    arguments = parser.parse_args()
+    flow_names = [name.strip() for name in arguments.flows.split(",") if name.strip()]
+    options = {
+        "debug_pauses": arguments.debug_pauses,
+        "launch_profile": arguments.launch_profile,
+    }
+
+    # Start the static DOM WebDriver endpoint, if no server is given
+    server_process = None
+    remote_url = arguments.remote_url
+    if remote_url is None:
+        spawn_context = multiprocessing.get_context("spawn")
+        url_queue = spawn_context.Queue()
+        server_process = spawn_context.Process(
+            target=run_server, kwargs={"url_queue": url_queue}, daemon=True
+        )
+        server_process.start()
+        remote_url = url_queue.get(timeout=60)
+
+    try:
+        sync_arguments = (
+            remote_url,
+            arguments.browser_name,
+            flow_names,
+            arguments.iterations,
+            options,
+        )
+        path_measures = [
+            measure_path(
+                "sync selenium",
+                [(run_sync_worker, sync_arguments)] * arguments.sessions,
+            ),
+            measure_path(
+                "asyncio",
+                [(run_async_worker, (*sync_arguments, arguments.sessions))],
+            ),
+        ]
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+
+    print(
+        f"{arguments.sessions} sessions x {arguments.iterations} iterations of "
+        f"{', '.join(flow_names)} ({arguments.browser_name}, {remote_url}):"
+    )
+    print(
+        f"{'path':>14} {'procs':>6} {'passed':>11} {'wall (s)':>9} {'flows/s':>8} "
+        f"{'startup CPU':>12} {'CPU/flow':>10} {'sess/core':>10} "
+        f"{'RSS (MB)':>9} {'RSS/sess':>9}"
+    )
+    for measures in path_measures:
+        cores_used = measures["cpu_time"] / measures["wall_time"]
+        flow_cpu_time = measures["cpu_time"] - measures["startup_cpu_time"]
+        print(
+            f"{measures['path']:>14} {measures['processes']:>6} "
+            f"{measures['passed_runs']:>5}/{measures['flow_runs']:<5} "
+            f"{measures['wall_time']:>9.2f} "
+            f"{measures['flow_runs'] / measures['wall_time']:>8.1f} "
+            f"{measures['startup_cpu_time']:>10.2f} s "
+            f"{flow_cpu_time / measures['flow_runs'] * 1000:>7.2f} ms "
+            f"{arguments.sessions / cores_used:>10.1f} "
+            f"{measures['peak_rss_mb']:>9.1f} "
+            f"{measures['peak_rss_mb'] / arguments.sessions:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module benchmarks the database work done by a single test, comparing the
+former access pattern (one connection per DemoPage, two queries per record)
+with the shared read-only connection and the in-memory locator registry.
+
+Usage (from the project folder):
+» python -m benchmarks.bench_data_access --iterations 2000
+"""
+
+import argparse
+import sqlite3
+import time
+
+from testdata.data_access import database_path, get_shared_database
+from testdata.locator_registry import locator_registry
+
+# Records looked up by test_color_change_demo, in the order of the test steps
+TEST_WORKLOAD = (
+    ("text_fields", "name", "text_input_field", "*"),
+    ("text_fields", "name", "pre_filled_text_field", "*"),
+    ("text_fields", "name", "placeholder_text_field", "*"),
+    ("text_fields", "name", "text_area", "*"),
+    ("misc_items", "name", "button", "*"),
+    ("misc_items", "name", "read_only_text_field", "*"),
+    ("misc_items", "name", "paragraph_with_text", "*"),
+    ("misc_items", "name", "button", "*"),
+    ("misc_items", "name", "button", "*"),
+    ("misc_items", "name", "read_only_text_field", "*"),
+    ("misc_items", "name", "paragraph_with_text", "*"),
+)
+
+
+def run_test_before():
+    """
+    Function used to replay the database work of one test, as done before
+    the shared access layer (connection per page, two queries per record).
+    """
+    demopage_db = sqlite3.connect(database_path)
+    cursor_object = demopage_db.cursor()
+    cursor_object.execute("SELECT * FROM general").fetchone()
+    for table_name, record_filter, record_name, field_name in TEST_WORKLOAD:
+        current_command = f"""
+            SELECT {field_name} FROM {table_name} WHERE {record_filter}='{record_name}'
+        """
+        query_result = cursor_object.execute(current_command)
+        keys_in_record = [f"{column[0]}" for column in query_result.description]
+        record_data = cursor_object.execute(current_command).fetchone()
+        dict(zip(keys_in_record, record_data))
+    demopage_db.close()
+
+
+def run_test_after():
+    """
+    Function used to replay the database work of one test, through the
+    shared read-only connection and the in-memory locator registry.
+    """
+    get_shared_database(database_path).fetch_one("SELECT * FROM general")
+    for table_name, _, record_name, _ in TEST_WORKLOAD:
+        locator_registry.get_record(table_name, record_name)
+
+
+def measure(test_function, iterations):
+    """
+    Function used to measure the average execution time of a test function.
+
+    :param test_function: (function) the replayed test workload
+    :param iterations: (int) number of executions to be averaged
+    :return: (float) the average time per test, in microseconds
+    """
+    test_function()
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        test_function()
+    return (time.perf_counter() - start_time) / iterations * 1e6
+
+
+def main():
+    """
+    Function used to run the benchmark and print the comparison.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    time_before = measure(run_test_before, arguments.iterations)
+    time_after = measure(run_test_after, arguments.iterations)
+    print(f"Database work per test, {arguments.iterations} iterations:")
+    print(f"  connection per page : {time_before:10.1f} us")
+    print(f"  shared + registry   : {time_after:10.1f} us")
+    print(f"  speedup             : {time_before / time_after:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
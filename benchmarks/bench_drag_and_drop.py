@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module benchmarks the drag and drop engines of the DemoPage in a real
+browser: the native drag events engine against the jQuery simulation (which
+downloads jQuery at runtime and fails on runners with no network access).
+
+Usage (from the project folder):
+» python -m benchmarks.bench_drag_and_drop --browser_name firefox --iterations 10
+"""
+
+import argparse
+import statistics
+import time
+
+from pageobjects.demopage import DemoPage
+from utilities.launch_profiles import (
+    launch_browser,
+    parse_profile_names,
+    remove_profile_copy,
+)
+
+# Drag and drop engines to be compared
+DRAG_AND_DROP_ENGINES = ("native", "jquery")
+
+
+def measure_engine(driver, drag_and_drop_engine, iterations):
+    """
+    Function used to measure the drag and drop duration of an engine;
+    the page is reset before every iteration.
+
+    :param driver: (obj) the selenium driver
+    :param drag_and_drop_engine: (str) name of the drag and drop engine
+    :param iterations: (int) number of drag and drop actions to be measured
+    :return: (list, int, str) the durations in seconds, the number of
+        successful drops and the last error message (or None)
+    """
+    durations, successful_drops, last_error = list(), 0, None
+    for _ in range(iterations):
+        demopage = DemoPage(driver, reuse_page=True)
+        demopage.click_checkbox()
+        start_time = time.perf_counter()
+        try:
+            verification_flag, _ = demopage.drag_and_drop_picture(drag_and_drop_engine)
+        except Exception as drag_and_drop_error:
+            verification_flag, last_error = False, str(drag_and_drop_error).strip()
+        durations.append(time.perf_counter() - start_time)
+        successful_drops += 1 if verification_flag else 0
+    return durations, successful_drops, last_error
+
+
+def main():
+    """
+    Function used to run the benchmark and print the comparison.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--browser_name", default="firefox")
+    parser.add_argument("--launch_profile", default="default")
+    parser.add_argument("--iterations", type=int, default=10)
+    arguments = parser.parse_args()
+
+    driver, profile_dir = launch_browser(
+        arguments.browser_name, parse_profile_names(arguments.launch_profile)
+    )
+    try:
+        print(f"Drag and drop, {arguments.iterations} iterations per engine:")
+        for drag_and_drop_engine in DRAG_AND_DROP_ENGINES:
+            durations, successful_drops, last_error = measure_engine(
+                driver, drag_and_drop_engine, arguments.iterations
+            )
+            print(
+                f"  {drag_and_drop_engine:>6}: median {statistics.median(durations) * 1000:8.1f} ms, "
+                f"mean {statistics.mean(durations) * 1000:8.1f} ms, "
+                f"{successful_drops}/{arguments.iterations} successful drops"
+            )
+            if last_error:
+                print(f"          last error: {last_error.splitlines()[0]}")
+    finally:
+        driver.quit()
+        remove_profile_copy(profile_dir)
+
+
+if __name__ == "__main__":
+    main()
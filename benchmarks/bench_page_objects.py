@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module benchmarks the own overhead of the page objects, with no browser:
+the DemoPage and the helper functions of the test flows are run against the fake
+WebDriver, and the latency of the database lookups, the locator builds and the
+command dispatch is compared with a stored baseline.
+
+Usage (from the project folder):
+» python -m benchmarks.bench_page_objects --iterations 2000
+» python -m benchmarks.bench_page_objects --write_baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+from pageobjects.demopage import DemoPage
+from pageobjects.locator import Locator
+from tests.demopage_flows import (
+    run_flow,
+    verify_button_selection_values,
+    verify_displayed_progress_value,
+    verify_text_in_all_items,
+)
+from utilities.fake_webdriver import FakeWebDriver
+
+# Default location of the baseline file
+baseline_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "page_objects_baseline.json"
+)
+
+# Logger of the replayed test helpers (the records are discarded)
+benchmark_logger = logging.getLogger("demoqa.benchmark")
+benchmark_logger.addHandler(logging.NullHandler())
+benchmark_logger.propagate = False
+
+
+def build_operations(driver):
+    """
+    Function used to build the measured operations, around one DemoPage.
+
+    :param driver: (obj) the fake WebDriver
+    :return: (dict) operation name -> function running the operation once
+    """
+    demopage = DemoPage(driver)
+    button_record = demopage.__convert_record_to_dict__(
+        ("misc_items", "name", "button", "*")
+    )
+    radio_button = demopage.get_radio_button1_data()
+    button_locator = demopage.__locator_handler__(button_record)
+    return {
+        # Database lookups
+        "db_lookup.registry_record": lambda: demopage.__convert_record_to_dict__(
+            ("misc_items", "name", "button", "*")
+        ),
+        "db_lookup.sql_record": lambda: demopage.retrieve_record_from_db(
+            "misc_items", "name", "button", "*"
+        ),
+        # Locator builds
+        "locator_build.compile": lambda: Locator.compile(
+            button_record["locator_type"], button_record["locator_hook"]
+        ),
+        "locator_build.from_record": lambda: demopage.__locator_handler__(
+            button_record
+        ),
+        # Command dispatch
+        "command_dispatch.find_element": lambda: driver.find_element(*button_locator),
+        "command_dispatch.cached_click": demopage.click_button,
+        "command_dispatch.batched_read": demopage.read_all_items_text,
+        # Page setup and test helpers
+        "page.setup": lambda: DemoPage(driver),
+        "test_helper.verify_text_in_all_items": lambda: run_flow(
+            verify_text_in_all_items(demopage, "Canned", benchmark_logger)
+        ),
+        "test_helper.verify_button_selection_values": lambda: run_flow(
+            verify_button_selection_values(
+                demopage, benchmark_logger, (True, True, False), radio_button
+            )
+        ),
+        "test_helper.verify_displayed_progress_value": lambda: run_flow(
+            verify_displayed_progress_value(
+                demopage, benchmark_logger, "slider", "Canned text"
+            )
+        ),
+    }
+
+
+def measure(operation, iterations, rounds=20):
+    """
+    Function used to measure the latency of an operation; the executions are
+    timed in rounds, so the sub-microsecond operations are not lost in the
+    resolution of the clock.
+
+    :param operation: (function) the measured operation
+    :param iterations: (int) number of executions
+    :param rounds: (int) number of timed rounds the executions are split into
+    :return: (dict) median and mean latency per execution, in microseconds
+    """
+    operation()
+    round_size = max(iterations // rounds, 1)
+    durations = list()
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        for _ in range(round_size):
+            operation()
+        durations.append((time.perf_counter() - start_time) / round_size * 1e6)
+    return {
+        "median_us": round(statistics.median(durations), 3),
+        "mean_us": round(statistics.mean(durations), 3),
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance, slack_us=1.0):
+    """
+    Function used to find the operations slower than their baseline.
+
+    :param results: (dict) operation name -> measured latency
+    :param baseline: (dict) operation name -> baseline latency
+    :param tolerance: (float) allowed slowdown factor (e.g.: 2.0)
+    :param slack_us: (float) allowed absolute slowdown, in microseconds
+        (it keeps the sub-microsecond operations from flagging noise)
+    :return: (list) names of the regressed operations
+    """
+    return [
+        operation_name
+        for operation_name, operation_result in results.items()
+        if operation_name in baseline
+        and operation_result["median_us"]
+        > baseline[operation_name]["median_us"] * tolerance + slack_us
+    ]
+
+
+def main():
+    """
+    Function used to run the benchmark, print the latencies and compare them
+    with the baseline (or write the baseline).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--baseline", default=baseline_path)
+    parser.add_argument("--write_baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    arguments = parser.parse_args()
+
+    driver = FakeWebDriver()
+    results = dict()
+    for operation_name, operation in build_operations(driver).items():
+        results[operation_name] = measure(operation, arguments.iterations)
+        driver.command_executor.commands.clear()
+
+    baseline = dict()
+    if os.path.isfile(arguments.baseline):
+        with open(arguments.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["operations"]
+    print(f"Page object overhead, {arguments.iterations} iterations (fake WebDriver):")
+    for operation_name, operation_result in results.items():
+        baseline_median = baseline.get(operation_name, {}).get("median_us")
+        baseline_text = f"{baseline_median:10.1f} us" if baseline_median else " " * 13
+        print(
+            f"  {operation_name:<45} median {operation_result['median_us']:10.1f} us, "
+            f"baseline {baseline_text}"
+        )
+
+    if arguments.write_baseline:
+        with open(arguments.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "iterations": arguments.iterations,
+                    "python": sys.version.split()[0],
+                    "operations": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Baseline written to {arguments.baseline}")
+        return 0
+    regressed_operations = compare_with_baseline(results, baseline, arguments.tolerance)
+    for operation_name in regressed_operations:
+        print(
+            f"Regression: {operation_name} is slower than {arguments.tolerance}x its baseline"
+        )
+    return 1 if regressed_operations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
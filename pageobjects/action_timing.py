@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the opt-in timing instrumentation of the page objects:
+every DemoPage action and helper, the element finds and the database lookups
+are wrapped, and their call counts, total and own (exclusive) wall times are
+recorded per test.
+"""
+
+import functools
+import json
+import threading
+import time
+
+
+class ActionTimer:
+    """
+    Class definition for the action timings of the process, grouped by test.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class; the timings are recorded only when enabled.
+        """
+        self.enabled = False
+        self.current_test = None
+        self.__records__ = dict()
+        self.__lock__ = threading.Lock()
+        self.__local__ = threading.local()
+
+    def start_test(self, test_name):
+        """
+        Method used to set the test the following actions are recorded for.
+
+        :param test_name: (str) identifier of the test
+        """
+        self.current_test = test_name
+
+    def stop_test(self):
+        """
+        Method used to stop recording the actions of the current test.
+        """
+        self.current_test = None
+
+    def time_action(self, action_name, action_function, *args, **kwargs):
+        """
+        Method used to execute an action and to record its duration; the time
+        spent in nested instrumented actions is excluded from its own time.
+
+        :param action_name: (str) name of the action (e.g.: "DemoPage.click_button")
+        :param action_function: (function) the wrapped function
+        :return: the result of the action
+        """
+        test_name = self.current_test
+        if not self.enabled or test_name is None:
+            return action_function(*args, **kwargs)
+        call_stack = getattr(self.__local__, "call_stack", None)
+        if call_stack is None:
+            call_stack = self.__local__.call_stack = list()
+        call_stack.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            return action_function(*args, **kwargs)
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            own_time = elapsed_time - call_stack.pop()
+            if call_stack:
+                call_stack[-1] += elapsed_time
+            self.__record__(test_name, action_name, elapsed_time, own_time)
+
+    def __record__(self, test_name, action_name, elapsed_time, own_time):
+        """
+        Helper method used to accumulate the duration of an action.
+
+        :param test_name: (str) identifier of the test
+        :param action_name: (str) name of the action
+        :param elapsed_time: (float) duration of the action, in seconds
+        :param own_time: (float) duration without the nested actions, in seconds
+        """
+        with self.__lock__:
+            action_data = self.__records__.setdefault(test_name, dict()).setdefault(
+                action_name, {"calls": 0, "total": 0.0, "own": 0.0}
+            )
+            action_data["calls"] += 1
+            action_data["total"] += elapsed_time
+            action_data["own"] += own_time
+
+    def get_test_records(self, test_name):
+        """
+        Method used to retrieve the action timings of a test.
+
+        :param test_name: (str) identifier of the test
+        :return: (dict) per action: calls, total and own time, sorted by
+            the own time (descending)
+        """
+        with self.__lock__:
+            test_records = dict(self.__records__.get(test_name, {}))
+        return dict(
+            sorted(
+                test_records.items(),
+                key=lambda action_item: action_item[1]["own"],
+                reverse=True,
+            )
+        )
+
+    def get_records(self):
+        """
+        Method used to retrieve the action timings of all the tests.
+
+        :return: (dict) test identifier -> action timings
+        """
+        with self.__lock__:
+            test_names = list(self.__records__)
+        return {test_name: self.get_test_records(test_name) for test_name in test_names}
+
+    def export_json(self, file_path):
+        """
+        Method used to write the action timings of all the tests to a JSON file.
+
+        :param file_path: (str) path of the JSON artifact
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.get_records(), f, indent=2)
+
+
+# Process-wide action timer
+action_timer = ActionTimer()
+
+
+def __timed__(action_name, action_function):
+    """
+    Helper method used to wrap a function, so its calls are timed.
+
+    :param action_name: (str) name of the action
+    :param action_function: (function) the function to be wrapped
+    :return: (function) the timed function
+    """
+
+    @functools.wraps(action_function)
+    def timed_function(*args, **kwargs):
+        return action_timer.time_action(action_name, action_function, *args, **kwargs)
+
+    timed_function.__timed_action__ = action_name
+    return timed_function
+
+
+def instrument_class(target_class, method_names=None):
+    """
+    Function used to wrap the methods of a class with the action timer; the
+    class is instrumented once, however many times the function is called.
+
+    :param target_class: (class) the class to be instrumented
+    :param method_names: (tuple) names of the methods to be wrapped;
+        all the methods defined by the class if None
+    """
+    for method_name, method in list(vars(target_class).items()):
+        if method_names is not None and method_name not in method_names:
+            continue
+        is_static = isinstance(method, staticmethod)
+        method_function = method.__func__ if is_static else method
+        if not callable(method_function) or isinstance(method, (classmethod, type)):
+            continue
+        if hasattr(method_function, "__timed_action__"):
+            continue
+        timed_function = __timed__(
+            f"{target_class.__name__}.{method_name}", method_function
+        )
+        setattr(
+            target_class,
+            method_name,
+            staticmethod(timed_function) if is_static else timed_function,
+        )
+
+
+def instrument_page_objects():
+    """
+    Function used to enable the action timings of the page objects: the DemoPage
+    actions and helpers, the element finds and the database lookups.
+    """
+    from pageobjects.demopage import DemoPage
+    from pageobjects.demopage_base import DemoPageBase
+    from pageobjects.element_cache import ElementCache
+    from pageobjects.wait_engine import WaitEngine
+    from testdata.data_access import SharedDatabase
+    from testdata.locator_registry import LocatorRegistry
+
+    instrument_class(DemoPageBase)
+    instrument_class(DemoPage)
+    instrument_class(ElementCache, ("find", "refind", "run"))
+    instrument_class(WaitEngine, ("find", "until", "wait_in_page"))
+    instrument_class(SharedDatabase, ("fetch_one", "fetch_all"))
+    instrument_class(LocatorRegistry, ("get_record", "get_locator", "find_locator"))
+    action_timer.enabled = True
@@ -0,0 +1,763 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the asynchronous variant of the demo page objects, driven
+by an AsyncWebDriver session: the records, locators and test data are the ones
+of the DemoPage (both inherit DemoPageBase), while every browser action is a
+coroutine, so one event loop can run the test flows of many sessions concurrently.
+"""
+
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+
+from pageobjects.demopage_base import DemoPageBase
+from pageobjects.element_cache import AsyncElementCache
+from pageobjects.form_fill import NATIVE_FILL, SCRIPT_FILL, form_fill_statistics
+from pageobjects.page_state import (
+    FULL_LOAD,
+    STATE_RESET,
+    async_capture_page_state,
+    async_install_listener_tracker,
+    async_restore_page_state,
+    page_setup_statistics,
+)
+from pageobjects.wait_engine import AsyncWaitEngine
+from utilities.screenshots import screenshot_pipeline
+from utilities.scripts import script_registry
+
+# Duration of the pointer moves, in milliseconds (as the selenium ActionChains)
+POINTER_MOVE_DURATION = 250
+
+
+def pointer_move(origin, x_offset=0, y_offset=0):
+    """
+    Function used to build a W3C pointer move, to the center of an element
+    (or by an offset from the current pointer position, if origin is "pointer").
+
+    :param origin: (AsyncWebElement or str) the element, or "pointer"
+    :param x_offset: (int) horizontal offset from the origin
+    :param y_offset: (int) vertical offset from the origin
+    :return: (dict) the W3C pointer action
+    """
+    return {
+        "type": "pointerMove",
+        "duration": POINTER_MOVE_DURATION,
+        "origin": origin,
+        "x": int(x_offset),
+        "y": int(y_offset),
+    }
+
+
+# Left mouse button press and release, as W3C pointer actions
+POINTER_DOWN = {"type": "pointerDown", "button": 0}
+POINTER_UP = {"type": "pointerUp", "button": 0}
+
+
+class AsyncDemoPage(DemoPageBase):
+    """
+    Class definition for the asynchronous demo page objects and actions.
+    """
+
+    # Engines of the page objects, with awaitable finds and waits
+    wait_engine_class = AsyncWaitEngine
+    element_cache_class = AsyncElementCache
+
+    @classmethod
+    async def create(cls, driver, reuse_page=False):
+        """
+        Method used to build the page objects and to open the page.
+
+        :param driver: (AsyncWebDriver) the asynchronous session
+        :param reuse_page: (bool) if True, the page already opened by a previous flow
+            is reset to its initial state; a full load is done only if the reset fails
+        :return: (AsyncDemoPage) the opened page
+        """
+        demopage = cls(driver)
+        await demopage.open(reuse_page)
+        return demopage
+
+    async def open(self, reuse_page=False):
+        """
+        Method used to open the page, or to reset the page left by the previous flow.
+
+        :param reuse_page: (bool) if True, the page state is reset instead of reloaded
+        """
+        setup_start_time = time.perf_counter()
+        if reuse_page and await async_restore_page_state(self.driver, self.url_path):
+            self.page_setup_mode = STATE_RESET
+        else:
+            await self.driver.set_timeouts(implicit=0)
+            if reuse_page:
+                await async_install_listener_tracker(self.driver)
+            await self.driver.get(self.url_path)
+            await self.driver.maximize_window()
+            if reuse_page:
+                await async_capture_page_state(self.driver, self.url_path)
+            self.page_setup_mode = FULL_LOAD
+        self.element_cache.invalidate()
+        self.page_setup_time = time.perf_counter() - setup_start_time
+        page_setup_statistics.record(self.page_setup_mode, self.page_setup_time)
+
+    async def __find_element__(self, locator):
+        """
+        Helper method used to find an element through the element cache.
+
+        :param locator: (Locator) the locator of the element
+        :return: (AsyncWebElement) the web element
+        """
+        return await self.element_cache.find(locator)
+
+    async def __element_action__(self, locator, element_action):
+        """
+        Helper method used to execute an action on a cached element,
+        finding it again if its handle went stale.
+
+        :param locator: (Locator) the locator of the element
+        :param element_action: (function) coroutine function receiving the web element
+        :return: the result of the action
+        """
+        return await self.element_cache.run(locator, element_action)
+
+    async def __switch_to_frame__(self, frame_reference):
+        """
+        Helper method used to switch to a frame, dropping the cached elements.
+
+        :param frame_reference: (str) name or id of the frame
+        """
+        await self.driver.switch_to_frame(frame_reference)
+        self.element_cache.invalidate()
+
+    async def __switch_to_default_content__(self):
+        """
+        Helper method used to switch back to the page, dropping the cached elements.
+        """
+        await self.driver.switch_to_default_content()
+        self.element_cache.invalidate()
+
+    async def read_elements_state(self, state_requests):
+        """
+        Method used to read the state of multiple elements in a single
+        browser round trip (see DemoPage.read_elements_state).
+
+        :param state_requests: (list) tuples of (locator, state kind, state name)
+        :return: (dict) the value read for each request, indexed by the request tuple
+        """
+        state_requests = [tuple(state_request) for state_request in state_requests]
+        script_requests = [
+            [locator[0], locator[1], state_kind, state_name]
+            for locator, state_kind, state_name in state_requests
+        ]
+        script_results = await script_registry.async_execute(
+            self.driver, "element_state_reader", script_requests
+        )
+        elements_state = dict()
+        for state_request, (element_found, state_value) in zip(
+            state_requests, script_results
+        ):
+            if not element_found:
+                raise NoSuchElementException(
+                    f"Unable to locate element: {tuple(state_request[0])}"
+                )
+            elements_state[state_request] = state_value
+        return elements_state
+
+    async def capture_item_screenshot(self, table_name, record_name, screenshot_name):
+        """
+        Method used to capture a screenshot cropped to a page item.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the page item record
+        :param screenshot_name: (str) name of the screenshot (e.g.: the test identifier)
+        :return: (str, str) paths of the image and of its thumbnail
+        """
+
+        async def capture_item(item_elem):
+            return screenshot_pipeline.submit(
+                await item_elem.screenshot_as_png(), screenshot_name
+            )
+
+        return await self.__element_action__(
+            self.__item_locator__(table_name, record_name), capture_item
+        )
+
+    async def __inject_text_in_box__(self, text_to_insert, box_in_focus):
+        """
+        Method used to inject text in a specific box on the screen.
+
+        :param text_to_insert: (str) text string to be inserted
+        :param box_in_focus: (dict) item of the box in focus
+        """
+        box_item = self.__locator_handler__(box_in_focus)
+
+        async def inject_text(box_elem):
+            if box_in_focus["clear_required"]:
+                await box_elem.clear()
+            await box_elem.send_keys(text_to_insert)
+
+        await self.__element_action__(box_item, inject_text)
+
+    async def inject_text_input_field(self, text_to_insert):
+        """
+        Method used to inject text in the text input field box.
+
+        :param text_to_insert: (str) text string to be inserted
+        """
+        query_data = ("text_fields", "name", "text_input_field", "*")
+        text_input_field = self.__convert_record_to_dict__(query_data)
+        await self.__inject_text_in_box__(text_to_insert, text_input_field)
+
+    async def inject_text_pre_filled_field(self, text_to_insert):
+        """
+        Method used to inject text in the text input pre-filled box.
+
+        :param text_to_insert: (str) text string to be inserted
+        """
+        query_data = ("text_fields", "name", "pre_filled_text_field", "*")
+        pre_filled_text_field = self.__convert_record_to_dict__(query_data)
+        await self.__inject_text_in_box__(text_to_insert, pre_filled_text_field)
+
+    async def read_placeholder_text(self):
+        """
+        Method used to read the placeholder of the text placeholder field box.
+
+        :return: (str) the placeholder text
+        """
+        return await self.__element_action__(
+            self.__item_locator__("text_fields", "placeholder_text_field"),
+            lambda placeholder_elem: placeholder_elem.get_property("placeholder"),
+        )
+
+    async def inject_text_placeholder_field(self, text_to_insert):
+        """
+        Method used to inject text in the text placeholder field box.
+
+        :param text_to_insert: (str) text string to be inserted
+        :return: (str) the placeholder text, read before the injection
+        """
+        query_data = ("text_fields", "name", "placeholder_text_field", "*")
+        placeholder_text_field = self.__convert_record_to_dict__(query_data)
+        placeholder_text = await self.read_placeholder_text()
+        await self.__inject_text_in_box__(text_to_insert, placeholder_text_field)
+        return placeholder_text
+
+    async def inject_text_area(self, text_to_insert):
+        """
+        Method used to inject text in the text area box.
+
+        :param text_to_insert: (str) text string to be inserted
+        """
+        query_data = ("text_fields", "name", "text_area", "*")
+        text_area = self.__convert_record_to_dict__(query_data)
+        await self.__inject_text_in_box__(text_to_insert, text_area)
+
+    async def fill_form(self, field_values, native_keys=False):
+        """
+        Method used to fill multiple text fields at once (see DemoPage.fill_form).
+
+        :param field_values: (dict) text to be inserted, indexed by the record
+            name of the text_fields table (e.g.: {"text_area": "Some text"})
+        :param native_keys: (bool) if True, the fields are typed with send_keys
+        :return: (dict) the value of each field after the fill
+        """
+        fill_start_time = time.perf_counter()
+        field_records = {
+            field_name: self.__convert_record_to_dict__(
+                ("text_fields", "name", field_name, "*")
+            )
+            for field_name in field_values
+        }
+        field_locators = {
+            field_name: self.__locator_handler__(field_record)
+            for field_name, field_record in field_records.items()
+        }
+        if native_keys:
+            for field_name, text_to_insert in field_values.items():
+                await self.__inject_text_in_box__(
+                    text_to_insert, field_records[field_name]
+                )
+            field_states = await self.read_elements_state(
+                [(locator, "property", "value") for locator in field_locators.values()]
+            )
+            filled_values = {
+                field_name: field_states[(locator, "property", "value")]
+                for field_name, locator in field_locators.items()
+            }
+        else:
+            fill_requests = [
+                [
+                    *field_locators[field_name],
+                    text_to_insert,
+                    bool(field_records[field_name]["clear_required"]),
+                ]
+                for field_name, text_to_insert in field_values.items()
+            ]
+            fill_results = await script_registry.async_execute(
+                self.driver, "form_filler", fill_requests
+            )
+            filled_values = dict()
+            for field_name, (element_found, field_value) in zip(
+                field_values, fill_results
+            ):
+                if not element_found:
+                    raise NoSuchElementException(
+                        f"Unable to locate element: {tuple(field_locators[field_name])}"
+                    )
+                filled_values[field_name] = field_value
+        form_fill_statistics.record(
+            NATIVE_FILL if native_keys else SCRIPT_FILL,
+            time.perf_counter() - fill_start_time,
+            len(field_values),
+        )
+        return filled_values
+
+    async def __read_item_text__(self, *readable_item):
+        """
+        Method used to read the text from a specific item.
+
+        :param readable_item: (locator) Selenium locator for the item to be read
+        :return text: (str) the text read from the box
+        """
+        return await self.__element_action__(
+            readable_item, lambda readable_elem: readable_elem.get_text()
+        )
+
+    async def read_dynamic_subhead(self):
+        """
+        Method used to read the text from the dynamic subhead of the page.
+        """
+        return await self.__read_item_text__(
+            *self.__item_locator__("misc_items", "dynamic_subhead")
+        )
+
+    async def read_button(self):
+        """
+        Method used to read the text from the "Button" of the page.
+        """
+        return await self.__read_item_text__(
+            *self.__item_locator__("misc_items", "button")
+        )
+
+    async def read_paragraph(self):
+        """
+        Method used to read the text from the paragraph of the page.
+        """
+        return await self.__read_item_text__(
+            *self.__item_locator__("misc_items", "paragraph_with_text")
+        )
+
+    async def read_all_items_text(self):
+        """
+        Method used to read, in a single browser round trip, the texts of the
+        "Button", of the read only field and of the paragraph of the page.
+
+        :return: (tuple) button text, read only field text, paragraph text
+        """
+        state_requests = (
+            (self.__item_locator__("misc_items", "button"), "text", None),
+            (
+                self.__item_locator__("misc_items", "read_only_text_field"),
+                "property",
+                "value",
+            ),
+            (self.__item_locator__("misc_items", "paragraph_with_text"), "text", None),
+        )
+        elements_state = await self.read_elements_state(state_requests)
+        return tuple(elements_state[state_request] for state_request in state_requests)
+
+    async def read_only_field(self):
+        """
+        Method used to read the text from the read only field of the page.
+
+        :return text: the text value read from the read only field of the page.
+        """
+        return await self.__element_action__(
+            self.__item_locator__("misc_items", "read_only_text_field"),
+            lambda read_only_elem: read_only_elem.get_property("value"),
+        )
+
+    async def hover_click_option(self):
+        """
+        Method used to click on a hovering menu option.
+
+        :return: (str) The text for the hovering option selected.
+        """
+        hover_dropdown_item = self.__item_locator__("misc_items", "hover_dropdown")
+        await self.__element_action__(
+            hover_dropdown_item,
+            lambda hover_dropdown_elem: self.driver.perform_pointer_actions(
+                [pointer_move(hover_dropdown_elem)]
+            ),
+        )
+        query_data = ("misc_items", "name", "hover_option_text", "*")
+        hover_option_text = self.__convert_record_to_dict__(query_data)
+        hover_option_item = self.__locator_handler__(hover_option_text)
+        await self.__element_action__(
+            hover_option_item,
+            lambda hover_option_elem: self.driver.perform_pointer_actions(
+                [pointer_move(hover_option_elem), POINTER_DOWN, POINTER_UP]
+            ),
+        )
+        return hover_option_text["locator_hook"]
+
+    async def select_click_option(self):
+        """
+        Method used to click on a select menu option.
+
+        :return: (str) The text for the menu option selected.
+        """
+        query_data = ("bar_and_label_values", "name", "meter_label", "*")
+        meter_label = self.__convert_record_to_dict__(query_data)
+        option_to_select = meter_label["end_progress_value"]
+
+        async def select_by_value(dropdown_elem):
+            option_elem = await dropdown_elem.find_element(
+                "css selector", f'option[value="{option_to_select}"]'
+            )
+            if not await option_elem.is_selected():
+                await option_elem.click()
+
+        await self.__element_action__(
+            self.__item_locator__("slider_dropdown", "select_dropdown"),
+            select_by_value,
+        )
+        return option_to_select
+
+    async def read_selected_option(self):
+        """
+        Method used to read the text from the selected menu option.
+
+        :return: (str) the selected dropdown menu option text
+        """
+        option_request = (
+            self.__item_locator__("slider_dropdown", "select_dropdown"),
+            "selected_option",
+            None,
+        )
+        return (await self.read_elements_state((option_request,)))[option_request]
+
+    async def __click_item__(self, *clickable_item):
+        """
+        Method used to click on a clickable item from the page.
+
+        :param clickable_item: (locator) Selenium locator for the clickable item.
+        """
+        await self.__element_action__(
+            clickable_item, lambda clickable_elem: clickable_elem.click()
+        )
+
+    async def click_button(self):
+        """
+        Method used to click on the page's "Button".
+        """
+        await self.__click_item__(*self.__item_locator__("misc_items", "button"))
+
+    async def click_checkbox(self):
+        """
+        Method used to click on the page's "CheckBox".
+        """
+        await self.__click_item__(*self.__item_locator__("misc_items", "checkbox"))
+
+    async def click_html_svg_rect(self):
+        """
+        Method used to click on the HTML SVG rectangle.
+        """
+        await self.__click_item__(
+            *self.__item_locator__("html_svg_item", "html_svg_rect")
+        )
+
+    async def wait_for_html_svg_rect_width(self, expected_width, timeout=5):
+        """
+        Method used to wait, inside the page, until the HTML SVG rectangle
+        reaches the expected width.
+
+        :param expected_width: (str) the expected width (e.g.: "154px")
+        :param timeout: (float) the timeout of the wait, in seconds
+        """
+        html_svg_rect_item = self.__item_locator__("html_svg_item", "html_svg_rect")
+        await self.wait_engine.wait_in_page(
+            "css_value", html_svg_rect_item, ["width", expected_width], timeout
+        )
+
+    async def read_html_svg_rect_width(self):
+        """
+        Method used to read the width of the HTML SVG rectangle.
+
+        :return: (str) HTML SVG rectangle width value
+        """
+        return await self.__element_action__(
+            self.__item_locator__("html_svg_item", "html_svg_rect"),
+            lambda html_svg_rect_elem: html_svg_rect_elem.value_of_css_property(
+                "width"
+            ),
+        )
+
+    async def drag_and_drop_picture(self):
+        """
+        Method used to drag and drop an item on the page, through the native
+        drag events (with a W3C Actions fallback).
+
+        :return: (bool, str) Verification that the draggable item is
+        in the correct position
+        """
+
+        # Log messages list
+        log_messages = list()
+
+        # Wait, inside the page, for the element to become visible
+        draggable_item = self.__item_locator__("misc_items", "draggable_item")
+        await self.wait_engine.wait_in_page("visible", draggable_item, timeout=3)
+
+        # Identify the source and target zones and the item to be dragged
+        source_zone = await self.__find_element__(
+            self.__item_locator__("misc_items", "dropzone_1")
+        )
+        target_item = self.__item_locator__("misc_items", "dropzone_2")
+        target_zone = await self.__find_element__(target_item)
+        draggable_elem = await self.__find_element__(draggable_item)
+
+        # Verify that the item is located in the source zone
+        verification_flag, verification_msg = (
+            await self.__verify_draggable_item_position__(draggable_elem, source_zone)
+        )
+        log_messages.append(verification_msg)
+        if not verification_flag:
+            return verification_flag, log_messages
+
+        # Perform the drag and drop action
+        drag_result = await script_registry.async_execute(
+            self.driver, "native_drag_and_drop", *draggable_item, *target_item
+        )
+        if not (drag_result and drag_result["performed"]):
+            log_messages.append(
+                f"Native drag events not dispatched "
+                f"({drag_result and drag_result['error']}), "
+                "falling back to the W3C Actions"
+            )
+            await self.__element_action__(
+                draggable_item,
+                lambda draggable_elem: self.driver.perform_pointer_actions(
+                    [
+                        pointer_move(draggable_elem),
+                        POINTER_DOWN,
+                        pointer_move(target_zone),
+                        POINTER_UP,
+                    ]
+                ),
+            )
+        log_messages.append("Drag and drop action performed (native)")
+
+        # Verify that the item is located in the target zone
+        verification_flag, verification_msg = await self.__element_action__(
+            draggable_item,
+            lambda draggable_elem: self.__verify_draggable_item_position__(
+                draggable_elem, target_zone
+            ),
+        )
+        log_messages.append(verification_msg)
+        return verification_flag, log_messages
+
+    async def switch_to_iframes(self):
+        """
+        Method used to verify the switch to iFrames functionality
+        :return: (bool, str) Verification that the iFrame switches succeeded
+        """
+        query_data = ("iframe_items", "name", "iframe2", "*")
+        iframe2_dict = self.__convert_record_to_dict__(query_data)
+        await self.__switch_to_frame__(iframe2_dict["iframe_name"])
+        iframe2_item = self.__locator_handler__(iframe2_dict)
+        iframe2_text = await self.__read_item_text__(*iframe2_item)
+        expected_text = iframe2_dict["expected_text"]
+        if iframe2_text != expected_text:
+            return (
+                False,
+                f"Detected iFrame text: {iframe2_text}, expected: {expected_text}",
+            )
+        await self.__switch_to_default_content__()
+        query_data = ("iframe_items", "name", "iframe3", "*")
+        iframe3_dict = self.__convert_record_to_dict__(query_data)
+        await self.__switch_to_frame__(iframe3_dict["iframe_name"])
+        await self.__click_item__(*self.__locator_handler__(iframe3_dict))
+        await self.__switch_to_default_content__()
+        return True, "Detected iFrame2 text as expected, iFrame3 checkbox clicked"
+
+    async def __read_bar_value__(self, *readable_bar):
+        """
+        Helper method used to retrieve the displayed bar value.
+
+        :return: (str) The displayed bar value
+        """
+        return await self.__element_action__(
+            readable_bar, lambda readable_elem: readable_elem.get_attribute("value")
+        )
+
+    async def read_progress_bar_value(self):
+        """
+        Method used to retrieve the displayed progress bar value.
+
+        :return: (str) The displayed progress bar value
+        """
+        return await self.__read_bar_value__(
+            *self.__item_locator__("bar_and_label_values", "progress_bar")
+        )
+
+    async def read_meter_bar_value(self):
+        """
+        Method used to retrieve the displayed meter bar value.
+
+        :return: (str) The displayed meter bar value
+        """
+        return await self.__read_bar_value__(
+            *self.__item_locator__("bar_and_label_values", "meter_bar")
+        )
+
+    async def __read_label_value__(self, *readable_label):
+        """
+        Helper method used to retrieve the displayed label value.
+
+        :return: (str) The displayed label value
+        """
+        return self.__parse_label_value__(
+            await self.__read_item_text__(*readable_label)
+        )
+
+    async def read_progress_label_value(self):
+        """
+        Method used to retrieve the displayed progress label value.
+
+        :return: (str) The displayed progress label value
+        """
+        return await self.__read_label_value__(
+            *self.__item_locator__("bar_and_label_values", "progress_label")
+        )
+
+    async def read_meter_label_value(self):
+        """
+        Method used to retrieve the displayed meter label value.
+
+        :return: (str) The displayed meter label value
+        """
+        return await self.__read_label_value__(
+            *self.__item_locator__("bar_and_label_values", "meter_label")
+        )
+
+    async def read_progress_values(self):
+        """
+        Method used to retrieve, in a single browser round trip,
+        the displayed progress label and progress bar values.
+
+        :return: (tuple) the displayed progress label and progress bar values
+        """
+        label_request = (
+            self.__item_locator__("bar_and_label_values", "progress_label"),
+            "text",
+            None,
+        )
+        bar_request = (
+            self.__item_locator__("bar_and_label_values", "progress_bar"),
+            "attribute",
+            "value",
+        )
+        elements_state = await self.read_elements_state((label_request, bar_request))
+        return (
+            self.__parse_label_value__(elements_state[label_request]),
+            elements_state[bar_request],
+        )
+
+    async def read_meter_values(self):
+        """
+        Method used to retrieve, in a single browser round trip, the selected
+        dropdown option and the displayed meter label and meter bar values.
+
+        :return: (tuple) the selected option, the meter label and meter bar values
+        """
+        option_request = (
+            self.__item_locator__("slider_dropdown", "select_dropdown"),
+            "selected_option",
+            None,
+        )
+        label_request = (
+            self.__item_locator__("bar_and_label_values", "meter_label"),
+            "text",
+            None,
+        )
+        bar_request = (
+            self.__item_locator__("bar_and_label_values", "meter_bar"),
+            "attribute",
+            "value",
+        )
+        elements_state = await self.read_elements_state(
+            (option_request, label_request, bar_request)
+        )
+        return (
+            elements_state[option_request],
+            self.__parse_label_value__(elements_state[label_request]),
+            elements_state[bar_request],
+        )
+
+    async def move_slider_control(self):
+        """
+        Method used to verify the input slider control movement functionality.
+        """
+        query_data = ("slider_dropdown", "name", "input_slider_control", "*")
+        input_slider_control = self.__convert_record_to_dict__(query_data)
+        await self.__element_action__(
+            self.__locator_handler__(input_slider_control),
+            lambda slider_elem: self.driver.perform_pointer_actions(
+                [
+                    pointer_move(slider_elem),
+                    POINTER_DOWN,
+                    pointer_move(
+                        "pointer",
+                        input_slider_control["custom_field1"],
+                        input_slider_control["custom_field2"],
+                    ),
+                    POINTER_UP,
+                ]
+            ),
+        )
+
+    async def verify_radio_button_selected(self, radio_button):
+        """
+        Method used to verify if a radio button is selected.
+
+        :param radio_button: (dict) the radio button for which the verification is done
+        :return: (bool) verification result
+        """
+        radio_button_item = self.__locator_handler__(radio_button)
+        state_requests = tuple(
+            (radio_button_item, "state", state_name)
+            for state_name in ("displayed", "enabled", "selected")
+        )
+        elements_state = await self.read_elements_state(state_requests)
+        return tuple(elements_state[state_request] for state_request in state_requests)
+
+    async def click_radio_button(self, radio_button):
+        """
+        Method used to click on a specific radio button.
+
+        :param radio_button: (dict) the radio button on which to click
+        """
+        await self.__click_item__(*self.__locator_handler__(radio_button))
+
+    @staticmethod
+    async def __verify_draggable_item_position__(draggable_item, expected_zone):
+        """
+        Method used to verify that the draggable item is within the expected zone range.
+
+        :param draggable_item: the draggable item to be verified
+        :param expected_zone: the expected zone where the item should be situated
+        :return: (bool, str) the verification result
+        """
+        margin_tolerance = 10
+        expected_x = (await expected_zone.get_location())["x"]
+        expected_range = range(expected_x, expected_x + margin_tolerance)
+        if (await draggable_item.get_location())["x"] not in expected_range:
+            return False, f"Draggable item not in the expected range: {expected_range}"
+        return True, f"Draggable item in expected range: {expected_range}"
@@ -12,95 +12,156 @@ This module defines the page objects and actions for the "demo page"
 a string to a specific text box).
 """
 
-import os
-import sqlite3
+import time
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver import ActionChains
 from selenium.webdriver.support.select import Select
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions
-
-database_path = "..\\testdata\\demopage_data.db"
-
-
-class DemoPage:
+from selenium.common.exceptions import NoSuchElementException
+
+from pageobjects.demopage_base import DemoPageBase
+from pageobjects.element_cache import ElementCache
+from pageobjects.form_fill import NATIVE_FILL, SCRIPT_FILL, form_fill_statistics
+from pageobjects.page_state import (
+    FULL_LOAD,
+    STATE_RESET,
+    capture_page_state,
+    install_listener_tracker,
+    page_setup_statistics,
+    restore_page_state,
+)
+from pageobjects.wait_engine import WaitEngine
+from utilities.screenshots import screenshot_pipeline
+from utilities.scripts import script_registry
+
+
+class DemoPage(DemoPageBase):
     """
     Class definition for the demo page objects and actions.
     """
 
-    def __init__(self, driver):
+    # Engines of the page objects
+    wait_engine_class = WaitEngine
+    element_cache_class = ElementCache
+
+    def __init__(self, driver, reuse_page=False):
         """
         Constructor for the class, where the configuration file is read,
         the page objects are being initialized and the url is being opened.
 
         :param driver: (obj) the selenium driver to be used for accessing the URL
+        :param reuse_page: (bool) if True, the page already opened by a previous test
+            is reset to its initial state; a full load is done only if the reset fails
         """
-        # Load the demopage_data database
-        self.driver = driver
-        self.driver.implicitly_wait(5)
+        super().__init__(driver)
+        self.open(reuse_page)
+
+    def open(self, reuse_page=False):
+        """
+        Method used to open the page, or to reset the page left by the previous test.
+
+        :param reuse_page: (bool) if True, the page state is reset instead of reloaded
+        """
+        setup_start_time = time.perf_counter()
+        self.driver.implicitly_wait(0)
         self.actions = ActionChains(self.driver)
-        self.demopage_db = sqlite3.connect(database_path)
-        self.cursor_object = self.demopage_db.cursor()
-        query_result = self.cursor_object.execute("SELECT * FROM general").fetchone()
-        self.demopage_url = query_result[0]
-        self.debug_showcase = bool(query_result[1])
-        self.local_demo_page = bool(query_result[2])
-
-        # Load a local html file into the web browser
-        if self.local_demo_page:
-            dir_path = os.path.dirname(os.path.abspath(__file__))
-            par_path = os.path.abspath(os.path.join(dir_path, os.pardir))
-            url_path = os.path.join(par_path, query_result[3])
-
-        # Load a demo page into the web browser
+
+        # Reset the page left by the previous test, or fall back to a full load
+        if reuse_page and restore_page_state(self.driver, self.url_path):
+            self.page_setup_mode = STATE_RESET
         else:
-            url_path = self.demopage_url
-        self.driver.get(url_path)
-        self.driver.maximize_window()
+            if reuse_page:
+                install_listener_tracker(self.driver)
+            self.driver.get(self.url_path)
+            self.driver.maximize_window()
+            if reuse_page:
+                capture_page_state(self.driver, self.url_path)
+            self.page_setup_mode = FULL_LOAD
+        self.element_cache.invalidate()
+        self.page_setup_time = time.perf_counter() - setup_start_time
+        page_setup_statistics.record(self.page_setup_mode, self.page_setup_time)
 
-    def __del__(self):
+    def __find_element__(self, locator):
         """
-        De-constructor used to close the previously opened database
+        Helper method used to find an element through the element cache.
+
+        :param locator: (Locator) the locator of the element
+        :return: (obj) the web element
         """
-        self.demopage_db.close()
+        return self.element_cache.find(locator)
 
-    def retrieve_record_from_db(
-        self, table_name, record_filter, record_name, field_name
-    ):
+    def __element_action__(self, locator, element_action):
+        """
+        Helper method used to execute an action on a cached element,
+        finding it again if its handle went stale.
+
+        :param locator: (Locator) the locator of the element
+        :param element_action: (function) action receiving the web element
+        :return: the result of the action
         """
-        Method used to retrieve record data from the sqlite database.
+        return self.element_cache.run(locator, element_action)
 
-        :param table_name: (str) name of the table where the query has to be executed
-        :param record_filter: (str) filter type to be used for finding the record
-        :param record_name: (str) name of the record data to be found
-        :param field_name: (str) name of the record's field to be retrieved
-        :return: (obj) retrieved record data from the database
+    def __switch_to_frame__(self, frame_reference):
         """
-        current_command = f"""
-            SELECT {field_name} FROM {table_name} WHERE {record_filter}='{record_name}'
+        Helper method used to switch to a frame; the cached elements
+        belong to the previous browsing context, so they are dropped.
+
+        :param frame_reference: (str) name or id of the frame
         """
-        return self.cursor_object.execute(current_command)
+        self.driver.switch_to.frame(frame_reference)
+        self.element_cache.invalidate()
 
-    def __convert_record_to_dict__(self, query_data):
-        keys_in_record = list()
-        record_as_dict = dict()
-        query_result = self.retrieve_record_from_db(*query_data)
-        for column in query_result.description:
-            keys_in_record.append(f"{column[0]}")
-        query_result = self.retrieve_record_from_db(*query_data)
-        record_data = query_result.fetchone()
-        for key_index, key_name in enumerate(keys_in_record):
-            record_as_dict[key_name] = record_data[key_index]
-        return record_as_dict
+    def __switch_to_default_content__(self):
+        """
+        Helper method used to switch back to the page, dropping the cached elements.
+        """
+        self.driver.switch_to.default_content()
+        self.element_cache.invalidate()
 
-    def get_debug_showcase(self):
+    def read_elements_state(self, state_requests):
         """
-        Method used to return the debug showcase flag, used to display logging information.
+        Method used to read the state of multiple elements in a single
+        browser round trip; the elements are found and read in the page.
 
-        :return: (bool) debug_showcase member
+        :param state_requests: (list) tuples of (locator, state kind, state name), where
+            the state kind is one of "text", "property", "attribute", "css", "state"
+            (state name "displayed", "enabled" or "selected") or "selected_option"
+        :return: (dict) the value read for each request, indexed by the request tuple
         """
-        return self.debug_showcase
+        state_requests = [tuple(state_request) for state_request in state_requests]
+        script_requests = [
+            [locator[0], locator[1], state_kind, state_name]
+            for locator, state_kind, state_name in state_requests
+        ]
+        script_results = script_registry.execute(
+            self.driver, "element_state_reader", script_requests
+        )
+        elements_state = dict()
+        for state_request, (element_found, state_value) in zip(
+            state_requests, script_results
+        ):
+            if not element_found:
+                raise NoSuchElementException(
+                    f"Unable to locate element: {tuple(state_request[0])}"
+                )
+            elements_state[state_request] = state_value
+        return elements_state
+
+    def capture_item_screenshot(self, table_name, record_name, screenshot_name):
+        """
+        Method used to capture a screenshot cropped to a page item, which stays
+        much smaller than a full page screenshot.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the page item record
+        :param screenshot_name: (str) name of the screenshot (e.g.: the test identifier)
+        :return: (str, str) paths of the image and of its thumbnail
+        """
+        return self.__element_action__(
+            self.__item_locator__(table_name, record_name),
+            lambda item_elem: screenshot_pipeline.capture(
+                self.driver, screenshot_name, item_elem
+            ),
+        )
 
     def __inject_text_in_box__(self, text_to_insert, box_in_focus):
         """
@@ -110,9 +171,13 @@ class DemoPage:
         :param box_in_focus: (dict) item of the box in focus
         """
         box_item = self.__locator_handler__(box_in_focus)
-        if box_in_focus["clear_required"]:
-            self.driver.find_element(*box_item).clear()
-        self.driver.find_element(*box_item).send_keys(text_to_insert)
+
+        def inject_text(box_elem):
+            if box_in_focus["clear_required"]:
+                box_elem.clear()
+            box_elem.send_keys(text_to_insert)
+
+        self.__element_action__(box_item, inject_text)
 
     def inject_text_input_field(self, text_to_insert):
         """
@@ -134,18 +199,27 @@ class DemoPage:
         pre_filled_text_field = self.__convert_record_to_dict__(query_data)
         self.__inject_text_in_box__(text_to_insert, pre_filled_text_field)
 
+    def read_placeholder_text(self):
+        """
+        Method used to read the placeholder of the text placeholder field box.
+
+        :return: (str) the placeholder text
+        """
+        return self.__element_action__(
+            self.__item_locator__("text_fields", "placeholder_text_field"),
+            lambda placeholder_elem: placeholder_elem.get_property("placeholder"),
+        )
+
     def inject_text_placeholder_field(self, text_to_insert):
         """
         Method used to inject text in the text placeholder field box.
 
         :param text_to_insert: (str) text string to be inserted
+        :return: (str) the placeholder text, read before the injection
         """
         query_data = ("text_fields", "name", "placeholder_text_field", "*")
         placeholder_text_field = self.__convert_record_to_dict__(query_data)
-        placeholder_item = self.__locator_handler__(placeholder_text_field)
-        placeholder_text = self.driver.find_element(*placeholder_item).get_property(
-            "placeholder"
-        )
+        placeholder_text = self.read_placeholder_text()
         self.__inject_text_in_box__(text_to_insert, placeholder_text_field)
         return placeholder_text
 
@@ -159,6 +233,68 @@ class DemoPage:
         text_area = self.__convert_record_to_dict__(query_data)
         self.__inject_text_in_box__(text_to_insert, text_area)
 
+    def fill_form(self, field_values, native_keys=False):
+        """
+        Method used to fill multiple text fields at once. By default, all the
+        fields are set by a single script call, which fires the input and change
+        events of each field; the native keystrokes (one send_keys per field)
+        are used for keystroke-level fidelity. As with send_keys, the text is
+        appended to the current value unless the field requires a clear.
+
+        :param field_values: (dict) text to be inserted, indexed by the record
+            name of the text_fields table (e.g.: {"text_area": "Some text"})
+        :param native_keys: (bool) if True, the fields are typed with send_keys
+        :return: (dict) the value of each field after the fill
+        """
+        fill_start_time = time.perf_counter()
+        field_records = {
+            field_name: self.__convert_record_to_dict__(
+                ("text_fields", "name", field_name, "*")
+            )
+            for field_name in field_values
+        }
+        field_locators = {
+            field_name: self.__locator_handler__(field_record)
+            for field_name, field_record in field_records.items()
+        }
+        if native_keys:
+            for field_name, text_to_insert in field_values.items():
+                self.__inject_text_in_box__(text_to_insert, field_records[field_name])
+            field_states = self.read_elements_state(
+                [(locator, "property", "value") for locator in field_locators.values()]
+            )
+            filled_values = {
+                field_name: field_states[(locator, "property", "value")]
+                for field_name, locator in field_locators.items()
+            }
+        else:
+            fill_requests = [
+                [
+                    *field_locators[field_name],
+                    text_to_insert,
+                    bool(field_records[field_name]["clear_required"]),
+                ]
+                for field_name, text_to_insert in field_values.items()
+            ]
+            fill_results = script_registry.execute(
+                self.driver, "form_filler", fill_requests
+            )
+            filled_values = dict()
+            for field_name, (element_found, field_value) in zip(
+                field_values, fill_results
+            ):
+                if not element_found:
+                    raise NoSuchElementException(
+                        f"Unable to locate element: {tuple(field_locators[field_name])}"
+                    )
+                filled_values[field_name] = field_value
+        form_fill_statistics.record(
+            NATIVE_FILL if native_keys else SCRIPT_FILL,
+            time.perf_counter() - fill_start_time,
+            len(field_values),
+        )
+        return filled_values
+
     def __read_item_text__(self, *readable_item):
         """
         Method used to read the text from a specific item.
@@ -166,7 +302,9 @@ class DemoPage:
         :param readable_item: (locator) Selenium locator for the item to be read
         :return text: (str) the text read from the box
         """
-        return self.driver.find_element(*readable_item).text
+        return self.__element_action__(
+            readable_item, lambda readable_elem: readable_elem.text
+        )
 
     def read_dynamic_subhead(self):
         """
@@ -195,6 +333,25 @@ class DemoPage:
         paragraph_item = self.__locator_handler__(paragraph_with_text)
         return self.__read_item_text__(*paragraph_item)
 
+    def read_all_items_text(self):
+        """
+        Method used to read, in a single browser round trip, the texts of the
+        "Button", of the read only field and of the paragraph of the page.
+
+        :return: (tuple) button text, read only field text, paragraph text
+        """
+        state_requests = (
+            (self.__item_locator__("misc_items", "button"), "text", None),
+            (
+                self.__item_locator__("misc_items", "read_only_text_field"),
+                "property",
+                "value",
+            ),
+            (self.__item_locator__("misc_items", "paragraph_with_text"), "text", None),
+        )
+        elements_state = self.read_elements_state(state_requests)
+        return tuple(elements_state[state_request] for state_request in state_requests)
+
     def read_only_field(self):
         """
         Method used to read the text from the read only field of the page.
@@ -204,7 +361,9 @@ class DemoPage:
         query_data = ("misc_items", "name", "read_only_text_field", "*")
         read_only_text_field = self.__convert_record_to_dict__(query_data)
         read_only_item = self.__locator_handler__(read_only_text_field)
-        return self.driver.find_element(*read_only_item).get_property("value")
+        return self.__element_action__(
+            read_only_item, lambda read_only_elem: read_only_elem.get_property("value")
+        )
 
     def hover_click_option(self):
         """
@@ -215,24 +374,21 @@ class DemoPage:
         query_data = ("misc_items", "name", "hover_dropdown", "*")
         hover_dropdown = self.__convert_record_to_dict__(query_data)
         hover_dropdown_item = self.__locator_handler__(hover_dropdown)
-        self.actions.move_to_element(
-            self.driver.find_element(*hover_dropdown_item)
-        ).perform()
+        self.__element_action__(
+            hover_dropdown_item,
+            lambda hover_dropdown_elem: self.actions.move_to_element(
+                hover_dropdown_elem
+            ).perform(),
+        )
         query_data = ("misc_items", "name", "hover_option_text", "*")
         hover_option_text = self.__convert_record_to_dict__(query_data)
         hover_option_item = self.__locator_handler__(hover_option_text)
-        self.actions.click(self.driver.find_element(*hover_option_item)).perform()
+        self.__element_action__(
+            hover_option_item,
+            lambda hover_option_elem: self.actions.click(hover_option_elem).perform(),
+        )
         return hover_option_text["locator_hook"]
 
-    def get_select_dropdown_data(self):
-        """
-        Method used to retrieve the select dropdown data.
-
-        :return: (dict) select dropdown data (locator, maximum width value)
-        """
-        query_data = ("slider_dropdown", "name", "select_dropdown", "*")
-        return self.__convert_record_to_dict__(query_data)
-
     def __dropdown_select__(self):
         """
         Helper method used to select a dropdown menu.
@@ -242,8 +398,7 @@ class DemoPage:
         query_data = ("slider_dropdown", "name", "select_dropdown", "*")
         select_dropdown = self.__convert_record_to_dict__(query_data)
         dropdown_element = self.__locator_handler__(select_dropdown)
-        dropdown_item = self.driver.find_element(*dropdown_element)
-        selected_dropdown = Select(dropdown_item)
+        selected_dropdown = self.__element_action__(dropdown_element, Select)
         return selected_dropdown
 
     def select_click_option(self):
@@ -274,7 +429,9 @@ class DemoPage:
 
         :param clickable_item: (locator) Selenium locator for the clickable item.
         """
-        self.driver.find_element(*clickable_item).click()
+        self.__element_action__(
+            clickable_item, lambda clickable_elem: clickable_elem.click()
+        )
 
     def click_button(self):
         """
@@ -303,14 +460,18 @@ class DemoPage:
         html_svg_item = self.__locator_handler__(html_svg_rect)
         self.__click_item__(*html_svg_item)
 
-    def get_html_svg_rect_data(self):
+    def wait_for_html_svg_rect_width(self, expected_width, timeout=5):
         """
-        Method used to retrieve the HTML SVG rectangle data.
+        Method used to wait, inside the page, until the HTML SVG rectangle
+        reaches the expected width.
 
-        :return: (dict) HTML SVG rectangle data (locator, maximum width value)
+        :param expected_width: (str) the expected width (e.g.: "154px")
+        :param timeout: (float) the timeout of the wait, in seconds
         """
-        query_data = ("html_svg_item", "name", "html_svg_rect", "*")
-        return self.__convert_record_to_dict__(query_data)
+        html_svg_rect_item = self.__item_locator__("html_svg_item", "html_svg_rect")
+        self.wait_engine.wait_in_page(
+            "css_value", html_svg_rect_item, ["width", expected_width], timeout
+        )
 
     def read_html_svg_rect_width(self):
         """
@@ -321,15 +482,25 @@ class DemoPage:
         query_data = ("html_svg_item", "name", "html_svg_rect", "*")
         html_svg_rect = self.__convert_record_to_dict__(query_data)
         html_svg_rect_item = self.__locator_handler__(html_svg_rect)
-        html_svg_rect_elem = self.driver.find_element(*html_svg_rect_item)
-        return html_svg_rect_elem.value_of_css_property("width")
+        return self.__element_action__(
+            html_svg_rect_item,
+            lambda html_svg_rect_elem: html_svg_rect_elem.value_of_css_property(
+                "width"
+            ),
+        )
 
-    def drag_and_drop_picture(self):
+    def drag_and_drop_picture(self, drag_and_drop_engine="native"):
         """
         Method used to drag and drop an item on the page.
+
+        :param drag_and_drop_engine: (str) "native" (native drag events in a single
+            script call, with a W3C Actions fallback) or "jquery" (jQuery simulation,
+            which downloads jQuery at runtime)
         :return: (bool, str) Verification that the draggable item is
         in the correct position
         """
+        if drag_and_drop_engine not in ("native", "jquery"):
+            raise ValueError(f"Unknown drag and drop engine: {drag_and_drop_engine}")
 
         # Log messages list
         log_messages = list()
@@ -339,22 +510,21 @@ class DemoPage:
         draggable_data = self.__convert_record_to_dict__(query_data)
         draggable_item = self.__locator_handler__(draggable_data)
 
-        # Set up a web driver wait procedure, based on the visibility of the element condition
-        wait = WebDriverWait(self.driver, 3)
-        wait.until(expected_conditions.visibility_of_element_located(draggable_item))
+        # Wait, inside the page, for the element to become visible
+        self.wait_engine.wait_in_page("visible", draggable_item, timeout=3)
 
         # Identify the source and target zones
         query_data = ("misc_items", "name", "dropzone_1", "*")
         dropzone_1 = self.__convert_record_to_dict__(query_data)
         source_item = self.__locator_handler__(dropzone_1)
-        source_zone = self.driver.find_element(*source_item)
+        source_zone = self.__find_element__(source_item)
         query_data = ("misc_items", "name", "dropzone_2", "*")
         dropzone_2 = self.__convert_record_to_dict__(query_data)
         target_item = self.__locator_handler__(dropzone_2)
-        target_zone = self.driver.find_element(*target_item)
+        target_zone = self.__find_element__(target_item)
 
         # Identify the item to be dragged
-        draggable_elem = self.driver.find_element(*draggable_item)
+        draggable_elem = self.__find_element__(draggable_item)
 
         # Verify that the item is located in the source zone
         verification_flag, verification_msg = self.__verify_draggable_item_position__(
@@ -366,47 +536,77 @@ class DemoPage:
         if not verification_flag:
             return verification_flag, log_messages
 
-        self.driver.set_script_timeout(2)
-
-        # Load the jQuery helper
-        with open("..\\utilities\\jquery_load_helper.js") as f:
-            load_jquery_js = f.read()
-            f.close()
-        with open("..\\utilities\\jquery_load_helper.js") as f:
-            load_jquery_lines = f.readlines()
-            f.close()
-        jquery_url = ""
-        for jquery_line in load_jquery_lines:
-            if "jqueryUrl =" in jquery_line:
-                jquery_url = jquery_line.split("= ")[-1].split(";")[0].replace("'", "")
-
-        # Load the jQuery
-        self.driver.execute_async_script(load_jquery_js, jquery_url)
-
-        # Load the javascript drag and drop helper
-        with open("..\\utilities\\drag_and_drop_helper.js") as f:
-            drag_and_drop_js = f.read()
-
         # Perform the drag and drop action
-        sim_drag_and_drop_str = "$('%s').simulateDragDrop({ dropTarget: '%s'});" % (
-            draggable_data["locator_hook"],
-            dropzone_2["locator_hook"],
-        )
-        self.driver.execute_script(drag_and_drop_js + sim_drag_and_drop_str)
-        log_messages.append("Drag and drop action performed")
-
-        # Identify the item to be dragged
-        draggable_elem = self.driver.find_element(*draggable_item)
+        if drag_and_drop_engine == "native":
+            self.__native_drag_and_drop__(
+                draggable_item, target_item, target_zone, log_messages
+            )
+        else:
+            self.__jquery_drag_and_drop__(draggable_data, dropzone_2)
+        log_messages.append(f"Drag and drop action performed ({drag_and_drop_engine})")
 
         # Verify that the item is located in the target zone
-        verification_flag, verification_msg = self.__verify_draggable_item_position__(
-            draggable_elem, target_zone
+        verification_flag, verification_msg = self.__element_action__(
+            draggable_item,
+            lambda draggable_elem: self.__verify_draggable_item_position__(
+                draggable_elem, target_zone
+            ),
         )
         log_messages.append(verification_msg)
 
         # Return the result
         return verification_flag, log_messages
 
+    def __native_drag_and_drop__(
+        self, draggable_item, target_item, target_zone, log_messages
+    ):
+        """
+        Helper method used to drag and drop an item through native drag events,
+        dispatched with a real DataTransfer in a single script call (no network
+        access required); the W3C Actions are used if the events can't be dispatched.
+
+        :param draggable_item: (Locator) locator of the item to be dragged
+        :param target_item: (Locator) locator of the drop zone
+        :param target_zone: (obj) the drop zone element
+        :param log_messages: (list) log messages list, completed with the fallback reason
+        """
+        drag_result = script_registry.execute(
+            self.driver, "native_drag_and_drop", *draggable_item, *target_item
+        )
+        if drag_result and drag_result["performed"]:
+            return
+        log_messages.append(
+            f"Native drag events not dispatched ({drag_result and drag_result['error']}), "
+            "falling back to the W3C Actions"
+        )
+        self.__element_action__(
+            draggable_item,
+            lambda draggable_elem: ActionChains(self.driver)
+            .drag_and_drop(draggable_elem, target_zone)
+            .perform(),
+        )
+
+    def __jquery_drag_and_drop__(self, draggable_data, dropzone_data):
+        """
+        Helper method used to drag and drop an item through the jQuery simulation.
+
+        :param draggable_data: (dict) record of the item to be dragged
+        :param dropzone_data: (dict) record of the drop zone
+        """
+        self.wait_engine.set_script_timeout(2)
+
+        # Load the jQuery (the url is parsed once, from the jQuery load helper)
+        jquery_url = script_registry.get("jquery_load_helper").metadata["jqueryUrl"]
+        script_registry.execute(self.driver, "jquery_load_helper", jquery_url)
+
+        # Perform the drag and drop action, through the helper pinned in the page
+        script_registry.execute(
+            self.driver,
+            "simulate_drag_drop",
+            draggable_data["locator_hook"],
+            dropzone_data["locator_hook"],
+        )
+
     def switch_to_iframes(self):
         """
         Method used to verify the switch to iFrames functionality
@@ -414,67 +614,33 @@ class DemoPage:
         """
         query_data = ("iframe_items", "name", "iframe2", "*")
         iframe2_dict = self.__convert_record_to_dict__(query_data)
-        self.driver.switch_to.frame(iframe2_dict["iframe_name"])
+        self.__switch_to_frame__(iframe2_dict["iframe_name"])
         iframe2_item = self.__locator_handler__(iframe2_dict)
-        iframe2_text = self.driver.find_element(*iframe2_item).text
+        iframe2_text = self.__read_item_text__(*iframe2_item)
         expected_text = iframe2_dict["expected_text"]
         if iframe2_text != expected_text:
             return (
                 False,
                 f"Detected iFrame text: {iframe2_text}, expected: {expected_text}",
             )
-        self.driver.switch_to.default_content()
+        self.__switch_to_default_content__()
         query_data = ("iframe_items", "name", "iframe3", "*")
         iframe3_dict = self.__convert_record_to_dict__(query_data)
-        self.driver.switch_to.frame(iframe3_dict["iframe_name"])
+        self.__switch_to_frame__(iframe3_dict["iframe_name"])
         iframe3_item = self.__locator_handler__(iframe3_dict)
         self.__click_item__(*iframe3_item)
-        self.driver.switch_to.default_content()
+        self.__switch_to_default_content__()
         return True, "Detected iFrame2 text as expected, iFrame3 checkbox clicked"
 
-    def get_progress_bar_data(self):
-        """
-        Method used to retrieve the progress bar data.
-
-        :return: (dict) Progress bar data (locator, start & end expected values)
-        """
-        query_data = ("bar_and_label_values", "name", "progress_bar", "*")
-        return self.__convert_record_to_dict__(query_data)
-
-    def get_progress_label_data(self):
-        """
-        Method used to retrieve the progress label data.
-
-        :return: (dict) Progress label data (locator, start & end expected values)
-        """
-        query_data = ("bar_and_label_values", "name", "progress_label", "*")
-        return self.__convert_record_to_dict__(query_data)
-
-    def get_meter_bar_data(self):
-        """
-        Method used to retrieve the meter bar data.
-
-        :return: (dict) Progress meter data (locator, start & end expected values)
-        """
-        query_data = ("bar_and_label_values", "name", "meter_bar", "*")
-        return self.__convert_record_to_dict__(query_data)
-
-    def get_meter_label_data(self):
-        """
-        Method used to retrieve the meter label data.
-
-        :return: (dict) Progress meter data (locator, start & end expected values)
-        """
-        query_data = ("bar_and_label_values", "name", "meter_label", "*")
-        return self.__convert_record_to_dict__(query_data)
-
     def __read_bar_value__(self, *readable_bar):
         """
         Helper method used to retrieve the displayed bar value.
 
         :return: (str) The displayed bar value
         """
-        return self.driver.find_element(*readable_bar).get_attribute("value")
+        return self.__element_action__(
+            readable_bar, lambda readable_elem: readable_elem.get_attribute("value")
+        )
 
     def read_progress_bar_value(self):
         """
@@ -506,13 +672,7 @@ class DemoPage:
 
         :return: (str) The displayed bar value
         """
-        label_value = (
-            self.driver.find_element(*readable_label)
-            .text.split(": ")[-1]
-            .replace("(", "")
-            .replace(")", "")
-        )
-        return label_value
+        return self.__parse_label_value__(self.__read_item_text__(*readable_label))
 
     def read_progress_label_value(self):
         """
@@ -538,14 +698,59 @@ class DemoPage:
         )
         return self.__read_label_value__(*label_value_item)
 
-    def get_slider_data(self):
+    def read_progress_values(self):
         """
-        Method used to retrieve the slider object data.
+        Method used to retrieve, in a single browser round trip,
+        the displayed progress label and progress bar values.
 
-        :return: (dict) slider object data.
+        :return: (tuple) the displayed progress label and progress bar values
         """
-        query_data = ("slider_dropdown", "name", "input_slider_control", "*")
-        return self.__convert_record_to_dict__(query_data)
+        label_request = (
+            self.__item_locator__("bar_and_label_values", "progress_label"),
+            "text",
+            None,
+        )
+        bar_request = (
+            self.__item_locator__("bar_and_label_values", "progress_bar"),
+            "attribute",
+            "value",
+        )
+        elements_state = self.read_elements_state((label_request, bar_request))
+        return (
+            self.__parse_label_value__(elements_state[label_request]),
+            elements_state[bar_request],
+        )
+
+    def read_meter_values(self):
+        """
+        Method used to retrieve, in a single browser round trip, the selected
+        dropdown option and the displayed meter label and meter bar values.
+
+        :return: (tuple) the selected option, the meter label and meter bar values
+        """
+        option_request = (
+            self.__item_locator__("slider_dropdown", "select_dropdown"),
+            "selected_option",
+            None,
+        )
+        label_request = (
+            self.__item_locator__("bar_and_label_values", "meter_label"),
+            "text",
+            None,
+        )
+        bar_request = (
+            self.__item_locator__("bar_and_label_values", "meter_bar"),
+            "attribute",
+            "value",
+        )
+        elements_state = self.read_elements_state(
+            (option_request, label_request, bar_request)
+        )
+        return (
+            elements_state[option_request],
+            self.__parse_label_value__(elements_state[label_request]),
+            elements_state[bar_request],
+        )
 
     def move_slider_control(self):
         """
@@ -554,37 +759,14 @@ class DemoPage:
         query_data = ("slider_dropdown", "name", "input_slider_control", "*")
         input_slider_control = self.__convert_record_to_dict__(query_data)
         slider_item = self.__locator_handler__(input_slider_control)
-        slider_elem = self.driver.find_element(*slider_item)
-        self.actions.drag_and_drop_by_offset(
-            slider_elem,
-            xoffset=input_slider_control["custom_field1"],
-            yoffset=input_slider_control["custom_field2"],
-        ).perform()
-
-    def __get_radio_button_data__(self, radio_button):
-        """
-        Method used to retrieve the radio button data.
-
-        :return: (dict) radio button data
-        """
-        query_data = ("radio_buttons", "name", radio_button, "*")
-        return self.__convert_record_to_dict__(query_data)
-
-    def get_radio_button1_data(self):
-        """
-        Method used to retrieve the radio button1 data.
-
-        :return: (dict) radio button1 data.
-        """
-        return self.__get_radio_button_data__("radio_button1")
-
-    def get_radio_button2_data(self):
-        """
-        Method used to retrieve the radio button1 data.
-
-        :return: (dict) radio button1 data.
-        """
-        return self.__get_radio_button_data__("radio_button2")
+        self.__element_action__(
+            slider_item,
+            lambda slider_elem: self.actions.drag_and_drop_by_offset(
+                slider_elem,
+                xoffset=input_slider_control["custom_field1"],
+                yoffset=input_slider_control["custom_field2"],
+            ).perform(),
+        )
 
     def verify_radio_button_selected(self, radio_button):
         """
@@ -594,11 +776,13 @@ class DemoPage:
         :return: (bool) verification result
         """
         radio_button_item = self.__locator_handler__(radio_button)
-        radio_button_elem = self.driver.find_element(*radio_button_item)
-        radio_button_selected = (
-            radio_button_elem.is_displayed(),
-            radio_button_elem.is_enabled(),
-            radio_button_elem.is_selected(),
+        state_requests = tuple(
+            (radio_button_item, "state", state_name)
+            for state_name in ("displayed", "enabled", "selected")
+        )
+        elements_state = self.read_elements_state(state_requests)
+        radio_button_selected = tuple(
+            elements_state[state_request] for state_request in state_requests
         )
         return radio_button_selected
 
@@ -627,31 +811,3 @@ class DemoPage:
         if draggable_item.location["x"] not in expected_range:
             return False, f"Draggable item not in the expected range: {expected_range}"
         return True, f"Draggable item in expected range: {expected_range}"
-
-    @staticmethod
-    def __locator_handler__(locator_element):
-        """
-        Helper method used to handle the locator in function of its type.
-
-        :param locator_element: the locator to be handled
-        :return: (locator_item) the constructed locator
-        """
-        # Depending on the locator type, return the constructed locator
-        if locator_element["locator_type"] == "XPATH":
-            locator_item = (By.XPATH, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "LINK_TEXT":
-            locator_item = (By.LINK_TEXT, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "PARTIAL_LINK_TEXT":
-            locator_item = (By.PARTIAL_LINK_TEXT, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "NAME":
-            locator_item = (By.NAME, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "TAG_NAME":
-            locator_item = (By.TAG_NAME, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "CLASS_NAME":
-            locator_item = (By.CLASS_NAME, locator_element["locator_hook"])
-        elif locator_element["locator_type"] == "CSS_SELECTOR":
-            locator_item = (By.CSS_SELECTOR, locator_element["locator_hook"])
-        # The default locator type will be considered to be "ID"
-        else:
-            locator_item = (By.ID, locator_element["locator_hook"])
-        return locator_item
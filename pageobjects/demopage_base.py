@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the base of the demo page objects, shared by the
+synchronous (DemoPage) and the asynchronous (AsyncDemoPage) page objects: the
+general settings, the records, locators and test data of the demopage_data
+database, and the engines of the page objects. The browser actions are
+defined by the page objects themselves.
+"""
+
+import os
+
+from testdata.data_access import database_path, get_shared_database
+from testdata.locator_registry import locator_registry
+
+
+class DemoPageBase:
+    """
+    Class definition for the base of the demo page objects.
+    """
+
+    # Engines of the page objects, set by the synchronous and asynchronous page objects
+    wait_engine_class = None
+    element_cache_class = None
+
+    def __init__(self, driver):
+        """
+        Constructor for the class, where the configuration is read and the
+        page objects are initialized; the page is opened by the page objects.
+
+        :param driver: (obj) the selenium driver, or the asynchronous driver
+        """
+
+        # Load the demopage_data database
+        self.driver = driver
+        self.wait_engine = self.wait_engine_class(self.driver)
+        self.element_cache = self.element_cache_class(
+            self.driver, self.wait_engine.find
+        )
+        self.url_path = self.__load_general_settings__()
+        self.page_setup_mode = None
+        self.page_setup_time = None
+
+    def __load_general_settings__(self):
+        """
+        Helper method used to load the demopage_data database and its general settings.
+
+        :return: (str) the url of the page to be opened (the local html file,
+            or the demo page url)
+        """
+        self.demopage_db = get_shared_database(database_path)
+        # The queries of the shared database are read as from a sqlite cursor
+        self.cursor_object = self.demopage_db
+        _, query_result = self.demopage_db.fetch_one("SELECT * FROM general")
+        self.demopage_url = query_result[0]
+        self.debug_showcase = bool(query_result[1])
+        self.local_demo_page = bool(query_result[2])
+
+        # Load a local html file into the web browser
+        if self.local_demo_page:
+            dir_path = os.path.dirname(os.path.abspath(__file__))
+            par_path = os.path.abspath(os.path.join(dir_path, os.pardir))
+            return os.path.join(par_path, query_result[3])
+
+        # Load a demo page into the web browser
+        return self.demopage_url
+
+    def retrieve_record_from_db(
+        self, table_name, record_filter, record_name, field_name
+    ):
+        """
+        Method used to retrieve record data from the sqlite database.
+
+        :param table_name: (str) name of the table where the query has to be executed
+        :param record_filter: (str) filter type to be used for finding the record
+        :param record_name: (str) name of the record data to be found
+        :param field_name: (str) name of the record's field to be retrieved
+        :return: (obj) retrieved record data from the database
+        """
+        current_command = f"""
+            SELECT {field_name} FROM {table_name} WHERE {record_filter}='{record_name}'
+        """
+        return self.cursor_object.execute(current_command)
+
+    def __convert_record_to_dict__(self, query_data):
+        """
+        Helper method used to retrieve a record as a dictionary. The locator
+        records are served from the in-memory locator registry, while any other
+        record is read from the database with a single query.
+
+        :param query_data: (tuple) table name, record filter, record name, field name
+        :return: (dict) the record, as {column name: value}
+        """
+        table_name, record_filter, record_name, field_name = query_data
+        if (
+            record_filter == "name"
+            and field_name == "*"
+            and locator_registry.contains(table_name, record_name)
+        ):
+            return locator_registry.get_record(table_name, record_name)
+        query_result = self.retrieve_record_from_db(*query_data)
+        keys_in_record = [column[0] for column in query_result.description]
+        return dict(zip(keys_in_record, query_result.fetchone()))
+
+    def set_locator_timeout(self, table_name, record_name, timeout):
+        """
+        Method used to set a specific wait timeout for a page item.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the page item record
+        :param timeout: (float) the timeout to be used, in seconds
+        """
+        self.wait_engine.set_timeout(
+            self.__item_locator__(table_name, record_name), timeout
+        )
+
+    def get_element_cache_stats(self):
+        """
+        Method used to retrieve the element cache counters.
+
+        :return: (dict) hits, misses, stale re-finds and invalidations
+        """
+        return self.element_cache.get_stats()
+
+    def __item_locator__(self, table_name, record_name):
+        """
+        Helper method used to retrieve the locator of a page item.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the page item record
+        :return: (Locator) the locator of the page item
+        """
+        query_data = (table_name, "name", record_name, "*")
+        return self.__locator_handler__(self.__convert_record_to_dict__(query_data))
+
+    def get_debug_showcase(self):
+        """
+        Method used to return the debug showcase flag, used to display logging information.
+
+        :return: (bool) debug_showcase member
+        """
+        return self.debug_showcase
+
+    def get_select_dropdown_data(self):
+        """
+        Method used to retrieve the select dropdown data.
+
+        :return: (dict) select dropdown data (locator, maximum width value)
+        """
+        query_data = ("slider_dropdown", "name", "select_dropdown", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_html_svg_rect_data(self):
+        """
+        Method used to retrieve the HTML SVG rectangle data.
+
+        :return: (dict) HTML SVG rectangle data (locator, maximum width value)
+        """
+        query_data = ("html_svg_item", "name", "html_svg_rect", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_progress_bar_data(self):
+        """
+        Method used to retrieve the progress bar data.
+
+        :return: (dict) Progress bar data (locator, start & end expected values)
+        """
+        query_data = ("bar_and_label_values", "name", "progress_bar", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_progress_label_data(self):
+        """
+        Method used to retrieve the progress label data.
+
+        :return: (dict) Progress label data (locator, start & end expected values)
+        """
+        query_data = ("bar_and_label_values", "name", "progress_label", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_meter_bar_data(self):
+        """
+        Method used to retrieve the meter bar data.
+
+        :return: (dict) Progress meter data (locator, start & end expected values)
+        """
+        query_data = ("bar_and_label_values", "name", "meter_bar", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_meter_label_data(self):
+        """
+        Method used to retrieve the meter label data.
+
+        :return: (dict) Progress meter data (locator, start & end expected values)
+        """
+        query_data = ("bar_and_label_values", "name", "meter_label", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    @staticmethod
+    def __parse_label_value__(label_text):
+        """
+        Helper method used to extract the value from a displayed label text.
+
+        :param label_text: (str) the displayed label text
+        :return: (str) The displayed label value
+        """
+        label_value = label_text.split(": ")[-1].replace("(", "").replace(")", "")
+        return label_value
+
+    def get_slider_data(self):
+        """
+        Method used to retrieve the slider object data.
+
+        :return: (dict) slider object data.
+        """
+        query_data = ("slider_dropdown", "name", "input_slider_control", "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def __get_radio_button_data__(self, radio_button):
+        """
+        Method used to retrieve the radio button data.
+
+        :return: (dict) radio button data
+        """
+        query_data = ("radio_buttons", "name", radio_button, "*")
+        return self.__convert_record_to_dict__(query_data)
+
+    def get_radio_button1_data(self):
+        """
+        Method used to retrieve the radio button1 data.
+
+        :return: (dict) radio button1 data.
+        """
+        return self.__get_radio_button_data__("radio_button1")
+
+    def get_radio_button2_data(self):
+        """
+        Method used to retrieve the radio button1 data.
+
+        :return: (dict) radio button1 data.
+        """
+        return self.__get_radio_button_data__("radio_button2")
+
+    @staticmethod
+    def __locator_handler__(locator_element):
+        """
+        Helper method used to handle the locator in function of its type.
+
+        :param locator_element: the locator to be handled
+        :return: (Locator) the compiled locator, usable as a (By, hook) tuple
+        """
+        return locator_registry.find_locator(locator_element)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the web element cache, used to reuse the elements found
+during one page load instead of finding them again for every action.
+"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+class ElementCache:
+    """
+    Class definition for the web element cache of a page load
+    (to be invalidated on navigation and on frame switches).
+    """
+
+    def __init__(self, driver, find_function=None):
+        """
+        Constructor for the class.
+
+        :param driver: (obj) the selenium driver used to find the elements
+        :param find_function: (function) function receiving a locator and returning
+            the element (e.g.: an explicit wait), defaults to driver.find_element
+        """
+        self.driver = driver
+        self.find_function = find_function
+        self.__elements__ = dict()
+        self.hits = 0
+        self.misses = 0
+        self.stale_refinds = 0
+        self.invalidations = 0
+
+    def find(self, locator):
+        """
+        Method used to retrieve an element, finding it only if it is not cached.
+
+        :param locator: (Locator) the locator of the element
+        :return: (obj) the web element
+        """
+        element = self.__elements__.get(locator)
+        if element is not None:
+            self.hits += 1
+            return element
+        self.misses += 1
+        if self.find_function is not None:
+            element = self.find_function(locator)
+        else:
+            element = self.driver.find_element(*locator)
+        self.__elements__[locator] = element
+        return element
+
+    def refind(self, locator):
+        """
+        Method used to find an element again, replacing its cached handle.
+
+        :param locator: (Locator) the locator of the element
+        :return: (obj) the web element
+        """
+        self.__elements__.pop(locator, None)
+        return self.find(locator)
+
+    def run(self, locator, element_action):
+        """
+        Method used to execute an action on a cached element; if the cached
+        handle went stale, the element is found again and the action repeated.
+
+        :param locator: (Locator) the locator of the element
+        :param element_action: (function) action receiving the web element
+        :return: the result of the action
+        """
+        element = self.find(locator)
+        try:
+            return element_action(element)
+        except StaleElementReferenceException:
+            self.stale_refinds += 1
+            return element_action(self.refind(locator))
+
+    def invalidate(self):
+        """
+        Method used to drop all the cached elements (e.g.: after a navigation
+        or a frame switch).
+        """
+        self.__elements__.clear()
+        self.invalidations += 1
+
+    def get_stats(self):
+        """
+        Method used to retrieve the cache counters; each hit is a WebDriver
+        find_element round trip saved.
+
+        :return: (dict) hits, misses, stale re-finds and invalidations
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_refinds": self.stale_refinds,
+            "invalidations": self.invalidations,
+        }
+
+
+class AsyncElementCache(ElementCache):
+    """
+    Class definition for the web element cache of an asynchronous page
+    (AsyncDemoPage): the same cache and counters, with awaitable finds.
+    """
+
+    async def find(self, locator):
+        """
+        Method used to retrieve an element, finding it only if it is not cached.
+
+        :param locator: (Locator) the locator of the element
+        :return: (AsyncWebElement) the web element
+        """
+        element = self.__elements__.get(locator)
+        if element is not None:
+            self.hits += 1
+            return element
+        self.misses += 1
+        if self.find_function is not None:
+            element = await self.find_function(locator)
+        else:
+            element = await self.driver.find_element(*locator)
+        self.__elements__[locator] = element
+        return element
+
+    async def refind(self, locator):
+        """
+        Method used to find an element again, replacing its cached handle.
+
+        :param locator: (Locator) the locator of the element
+        :return: (AsyncWebElement) the web element
+        """
+        self.__elements__.pop(locator, None)
+        return await self.find(locator)
+
+    async def run(self, locator, element_action):
+        """
+        Method used to execute an action on a cached element; if the cached
+        handle went stale, the element is found again and the action repeated.
+
+        :param locator: (Locator) the locator of the element
+        :param element_action: (function) coroutine function receiving the web element
+        :return: the result of the action
+        """
+        element = await self.find(locator)
+        try:
+            return await element_action(element)
+        except StaleElementReferenceException:
+            self.stale_refinds += 1
+            return await element_action(await self.refind(locator))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the form fill modes of the page objects and the timings
+of the form fills, aggregated by mode, used to compare the single script fill
+with the native keystrokes on large data tables.
+"""
+
+import threading
+
+# Form fill modes: all the fields set by one script call, or typed with send_keys
+SCRIPT_FILL = "script"
+NATIVE_FILL = "send_keys"
+
+
+class FormFillStatistics:
+    """
+    Class definition for the form fill timings of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        self.__summary__ = dict()
+        self.__lock__ = threading.Lock()
+
+    def record(self, fill_mode, fill_time, field_count):
+        """
+        Method used to register the duration of a form fill (one data row);
+        the timings are aggregated by fill mode as they are registered.
+
+        :param fill_mode: (str) SCRIPT_FILL or NATIVE_FILL
+        :param fill_time: (float) duration of the form fill, in seconds
+        :param field_count: (int) number of filled fields
+        """
+        with self.__lock__:
+            mode_summary = self.__summary__.setdefault(
+                fill_mode, {"rows": 0, "fields": 0, "total": 0.0}
+            )
+            mode_summary["rows"] += 1
+            mode_summary["fields"] += field_count
+            mode_summary["total"] += fill_time
+
+    def get_summary(self):
+        """
+        Method used to retrieve the form fill timings, aggregated by fill mode.
+
+        :return: (dict) per fill mode: rows, fields, total and average time per row
+        """
+        with self.__lock__:
+            return {
+                fill_mode: dict(
+                    mode_summary, average=mode_summary["total"] / mode_summary["rows"]
+                )
+                for fill_mode, mode_summary in self.__summary__.items()
+            }
+
+
+# Process-wide form fill statistics
+form_fill_statistics = FormFillStatistics()
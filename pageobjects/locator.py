@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the immutable locator type built once per database
+record, with the Selenium "By" strategy already resolved.
+"""
+
+import threading
+
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+
+# Locator types accepted in the database, mapped to the Selenium strategies
+LOCATOR_STRATEGIES = {
+    "ID": By.ID,
+    "XPATH": By.XPATH,
+    "LINK_TEXT": By.LINK_TEXT,
+    "PARTIAL_LINK_TEXT": By.PARTIAL_LINK_TEXT,
+    "NAME": By.NAME,
+    "TAG_NAME": By.TAG_NAME,
+    "CLASS_NAME": By.CLASS_NAME,
+    "CSS_SELECTOR": By.CSS_SELECTOR,
+}
+
+# Locators already built, indexed by (locator type, locator hook)
+__compiled_locators__ = dict()
+__compiled_locators_lock__ = threading.Lock()
+
+
+class Locator(namedtuple("Locator", ("by", "hook"))):
+    """
+    Class definition for a compiled locator. Being a tuple of (By strategy, hook),
+    it can be unpacked directly into find_element() or used as a cache key.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, locator_type, locator_hook):
+        """
+        Method used to build a locator, validating its type.
+
+        :param locator_type: (str) locator type, as stored in the database (e.g.: "XPATH")
+        :param locator_hook: (str) the locator value
+        :return: (Locator) the compiled locator
+        """
+        try:
+            locator_by = LOCATOR_STRATEGIES[locator_type]
+        except KeyError:
+            raise ValueError(
+                f"Unknown locator type '{locator_type}' for locator '{locator_hook}', "
+                f"expected one of: {', '.join(LOCATOR_STRATEGIES)}"
+            ) from None
+        return cls(locator_by, locator_hook)
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Method used to retrieve the locator of a database record; the locator
+        is built at the first request and then reused for the same record.
+
+        :param record: (dict) record holding the "locator_type" and "locator_hook" fields
+        :return: (Locator) the compiled locator
+        """
+        locator_key = (record["locator_type"], record["locator_hook"])
+        locator = __compiled_locators__.get(locator_key)
+        if locator is None:
+            locator = cls.compile(*locator_key)
+            with __compiled_locators_lock__:
+                locator = __compiled_locators__.setdefault(locator_key, locator)
+        return locator
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module handles the page state between tests, when a browser session is
+reused: the state of a freshly loaded page is captured in the page itself and
+restored by a single script call, instead of reloading the page. The clone of
+the page drops the listeners added by scripts, so the reset is only trusted when
+a listener tracker, evaluated before the scripts of the page (Chromium browsers,
+through the DevTools protocol), proves that the page holds no script listener,
+timer or observer, and when the restored page matches the signature of the
+captured one (markup, form values and tracker state); otherwise the page is
+fully loaded again.
+"""
+
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from utilities.async_webdriver import CDP_VENDOR_PREFIXES
+from utilities.scripts import script_registry
+
+# Page setup modes
+FULL_LOAD = "full load"
+STATE_RESET = "state reset"
+
+# Signatures of the captured pages, indexed by (session id, page url)
+__captured_signatures__ = dict()
+__captured_signatures_lock__ = threading.Lock()
+
+# Sessions in which the listener tracker was installed (or could not be installed)
+__tracker_sessions__ = set()
+
+# DevTools protocol command evaluating a script before the scripts of every page
+ADD_PRELOAD_SCRIPT_COMMAND = "Page.addScriptToEvaluateOnNewDocument"
+
+
+def __claim_tracker_session__(driver):
+    """
+    Helper method used to install the listener tracker once per session.
+
+    :param driver: (obj) the selenium driver, or the asynchronous driver
+    :return: (bool) True if the tracker is still to be installed in the session
+    """
+    with __captured_signatures_lock__:
+        if driver.session_id in __tracker_sessions__:
+            return False
+        __tracker_sessions__.add(driver.session_id)
+        return True
+
+
+def __store_signature__(driver, page_url, page_signature):
+    """
+    Helper method used to keep the signature of a captured page.
+
+    :param driver: (obj) the selenium driver, or the asynchronous driver
+    :param page_url: (str) the url of the captured page
+    :param page_signature: (str) the signature returned by the capture
+    """
+    with __captured_signatures_lock__:
+        __captured_signatures__[(driver.session_id, page_url)] = page_signature
+
+
+def __verify_signature__(driver, page_url, page_signature):
+    """
+    Helper method used to verify that a restored page matches its captured signature.
+
+    :param driver: (obj) the selenium driver, or the asynchronous driver
+    :param page_url: (str) the url of the restored page
+    :param page_signature: (str) the signature returned by the restore (None if
+        the page could not be restored)
+    :return: (bool) True if the page is back to its captured state
+    """
+    with __captured_signatures_lock__:
+        captured_signature = __captured_signatures__.get((driver.session_id, page_url))
+    return page_signature is not None and page_signature == captured_signature
+
+
+def install_listener_tracker(driver):
+    """
+    Function used to have the listener tracker evaluated before the scripts of
+    every page loaded in the session; the browsers without the DevTools protocol
+    are skipped (their pages are then fully loaded again instead of being reset,
+    the static DOM driver excepted, which resets its pages itself).
+
+    :param driver: (obj) the selenium driver
+    """
+    browser_name = driver.capabilities.get("browserName")
+    if browser_name not in CDP_VENDOR_PREFIXES or not __claim_tracker_session__(driver):
+        return
+    try:
+        driver.execute_cdp_cmd(
+            ADD_PRELOAD_SCRIPT_COMMAND,
+            {"source": script_registry.get("page_listener_tracker").source},
+        )
+    except WebDriverException:
+        pass
+
+
+def capture_page_state(driver, page_url):
+    """
+    Function used to capture the state of a freshly loaded page.
+
+    :param driver: (obj) the selenium driver
+    :param page_url: (str) the url of the loaded page
+    """
+    __store_signature__(
+        driver,
+        page_url,
+        script_registry.execute(driver, "page_state_snapshot", "capture", page_url),
+    )
+
+
+def restore_page_state(driver, page_url):
+    """
+    Function used to restore the page to its captured state.
+
+    :param driver: (obj) the selenium driver
+    :param page_url: (str) the url of the page expected in the browser
+    :return: (bool) True if the state was restored, False if a full load is required
+    """
+    try:
+        driver.switch_to.default_content()
+        return __verify_signature__(
+            driver,
+            page_url,
+            script_registry.execute(driver, "page_state_snapshot", "restore", page_url),
+        )
+    except WebDriverException:
+        return False
+
+
+async def async_install_listener_tracker(driver):
+    """
+    Function used to have the listener tracker evaluated before the scripts of
+    every page loaded in an asynchronous session.
+
+    :param driver: (obj) the asynchronous driver
+    """
+    if not __claim_tracker_session__(driver):
+        return
+    try:
+        await driver.execute_cdp_cmd(
+            ADD_PRELOAD_SCRIPT_COMMAND,
+            {"source": script_registry.get("page_listener_tracker").source},
+        )
+    except WebDriverException:
+        pass
+
+
+async def async_capture_page_state(driver, page_url):
+    """
+    Function used to capture the state of a freshly loaded page, through an
+    asynchronous session.
+
+    :param driver: (obj) the asynchronous driver
+    :param page_url: (str) the url of the loaded page
+    """
+    __store_signature__(
+        driver,
+        page_url,
+        await script_registry.async_execute(
+            driver, "page_state_snapshot", "capture", page_url
+        ),
+    )
+
+
+async def async_restore_page_state(driver, page_url):
+    """
+    Function used to restore the page to its captured state, through an
+    asynchronous session.
+
+    :param driver: (obj) the asynchronous driver
+    :param page_url: (str) the url of the page expected in the browser
+    :return: (bool) True if the state was restored, False if a full load is required
+    """
+    try:
+        await driver.switch_to_default_content()
+        return __verify_signature__(
+            driver,
+            page_url,
+            await script_registry.async_execute(
+                driver, "page_state_snapshot", "restore", page_url
+            ),
+        )
+    except WebDriverException:
+        return False
+
+
+class PageSetupStatistics:
+    """
+    Class definition for the page setup timings of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        self.__summary__ = dict()
+        self.__lock__ = threading.Lock()
+
+    def record(self, setup_mode, setup_time):
+        """
+        Method used to register the duration of a page setup; the timings are
+        aggregated by setup mode as they are registered.
+
+        :param setup_mode: (str) FULL_LOAD or STATE_RESET
+        :param setup_time: (float) duration of the page setup, in seconds
+        """
+        with self.__lock__:
+            mode_summary = self.__summary__.setdefault(
+                setup_mode, {"count": 0, "total": 0.0}
+            )
+            mode_summary["count"] += 1
+            mode_summary["total"] += setup_time
+
+    def get_summary(self):
+        """
+        Method used to retrieve the page setup timings, aggregated by setup mode.
+
+        :return: (dict) per setup mode: count, total and average time
+        """
+        with self.__lock__:
+            return {
+                setup_mode: dict(
+                    mode_summary, average=mode_summary["total"] / mode_summary["count"]
+                )
+                for setup_mode, mode_summary in self.__summary__.items()
+            }
+
+
+# Process-wide page setup statistics
+page_setup_statistics = PageSetupStatistics()
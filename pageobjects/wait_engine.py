@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the explicit wait engine used by the page objects:
+per-locator timeouts, adaptive polling, in-page waits resolved by a
+MutationObserver and latency statistics for every wait (with an awaitable
+variant for the asynchronous sessions).
+"""
+
+import asyncio
+import threading
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from utilities.scripts import script_registry
+
+# Exceptions considered as "condition not yet met" while polling
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class WaitStatistics:
+    """
+    Class definition for the latency statistics of the waits of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        self.__records__ = list()
+        self.__lock__ = threading.Lock()
+
+    def record(self, wait_name, elapsed_time, satisfied, polls):
+        """
+        Method used to register the outcome of a wait.
+
+        :param wait_name: (str) description of the wait (condition and locator)
+        :param elapsed_time: (float) time spent waiting, in seconds
+        :param satisfied: (bool) True if the condition was met before the timeout
+        :param polls: (int) number of WebDriver round trips used by the wait
+        """
+        with self.__lock__:
+            self.__records__.append((wait_name, elapsed_time, satisfied, polls))
+
+    def get_records(self):
+        """
+        Method used to retrieve the registered waits.
+
+        :return: (list) tuples of (wait name, elapsed time, satisfied, polls)
+        """
+        with self.__lock__:
+            return list(self.__records__)
+
+    def get_summary(self):
+        """
+        Method used to aggregate the registered waits by their name.
+
+        :return: (dict) per wait name: count, total, maximum time, timeouts and polls,
+            sorted by the total waiting time (descending)
+        """
+        summary = dict()
+        for wait_name, elapsed_time, satisfied, polls in self.get_records():
+            wait_summary = summary.setdefault(
+                wait_name,
+                {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0, "polls": 0},
+            )
+            wait_summary["count"] += 1
+            wait_summary["total"] += elapsed_time
+            wait_summary["max"] = max(wait_summary["max"], elapsed_time)
+            wait_summary["timeouts"] += 0 if satisfied else 1
+            wait_summary["polls"] += polls
+        return dict(
+            sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True)
+        )
+
+    def clear(self):
+        """
+        Method used to drop the registered waits.
+        """
+        with self.__lock__:
+            self.__records__.clear()
+
+
+# Process-wide wait statistics, shared by all the wait engines
+wait_statistics = WaitStatistics()
+
+
+class WaitEngine:
+    """
+    Class definition for the explicit wait engine of a driver.
+    """
+
+    def __init__(
+        self,
+        driver,
+        default_timeout=5,
+        minimum_poll_interval=0.05,
+        maximum_poll_interval=0.5,
+    ):
+        """
+        Constructor for the class.
+
+        :param driver: (obj) the selenium driver used by the waits
+        :param default_timeout: (float) timeout used for locators with no specific timeout
+        :param minimum_poll_interval: (float) first interval between two polls, in seconds
+        :param maximum_poll_interval: (float) upper limit of the growing poll interval
+        """
+        self.driver = driver
+        self.default_timeout = default_timeout
+        self.minimum_poll_interval = minimum_poll_interval
+        self.maximum_poll_interval = maximum_poll_interval
+        self.locator_timeouts = dict()
+        self.__script_timeout__ = None
+
+    def set_timeout(self, locator, timeout):
+        """
+        Method used to set a specific timeout for a locator.
+
+        :param locator: (Locator) the locator of the element
+        :param timeout: (float) the timeout to be used, in seconds
+        """
+        self.locator_timeouts[locator] = timeout
+
+    def get_timeout(self, locator):
+        """
+        Method used to retrieve the timeout of a locator.
+
+        :param locator: (Locator) the locator of the element
+        :return: (float) the timeout of the locator, in seconds
+        """
+        return self.locator_timeouts.get(locator, self.default_timeout)
+
+    def set_script_timeout(self, timeout):
+        """
+        Method used to set the asynchronous script timeout of the driver
+        (kept by the engine, in order to skip redundant round trips).
+
+        :param timeout: (float) the script timeout, in seconds
+        """
+        if self.__script_timeout__ != timeout:
+            self.driver.set_script_timeout(timeout)
+            self.__script_timeout__ = timeout
+
+    def until(self, condition, wait_name, timeout):
+        """
+        Method used to poll a condition until it returns a truthy value; the
+        interval between polls grows from the minimum to the maximum interval.
+
+        :param condition: (function) condition receiving the driver
+        :param wait_name: (str) description of the wait, used for the statistics
+        :param timeout: (float) the timeout of the wait, in seconds
+        :return: the value returned by the condition
+        """
+        start_time = time.perf_counter()
+        end_time = start_time + timeout
+        poll_interval = self.minimum_poll_interval
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                condition_value = condition(self.driver)
+                if condition_value:
+                    wait_statistics.record(
+                        wait_name, time.perf_counter() - start_time, True, polls
+                    )
+                    return condition_value
+            except IGNORED_EXCEPTIONS:
+                pass
+            remaining_time = end_time - time.perf_counter()
+            if remaining_time <= 0:
+                wait_statistics.record(
+                    wait_name, time.perf_counter() - start_time, False, polls
+                )
+                raise TimeoutException(f"Wait timed out after {timeout}s: {wait_name}")
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(poll_interval * 2, self.maximum_poll_interval)
+
+    def find(self, locator, timeout=None):
+        """
+        Method used to find an element, waiting for it to be present.
+
+        :param locator: (Locator) the locator of the element
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        :return: (obj) the web element
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+        try:
+            return self.until(
+                lambda driver: driver.find_element(*locator),
+                f"present {tuple(locator)}",
+                timeout,
+            )
+        except TimeoutException:
+            raise NoSuchElementException(
+                f"Unable to locate element within {timeout}s: {tuple(locator)}"
+            ) from None
+
+    def wait_visible(self, locator, timeout=None):
+        """
+        Method used to wait for an element to be visible.
+
+        :param locator: (Locator) the locator of the element
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        :return: (obj) the visible web element
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+
+        def element_visible(driver):
+            element = driver.find_element(*locator)
+            return element if element.is_displayed() else None
+
+        return self.until(element_visible, f"visible {tuple(locator)}", timeout)
+
+    def wait_in_page(self, condition_name, locator, expected_value=None, timeout=None):
+        """
+        Method used to wait inside the page, through a single asynchronous script:
+        the condition is checked on every DOM mutation and animation frame, so the
+        wait resolves as soon as the condition holds, with no polling round trips.
+
+        :param condition_name: (str) one of "present", "visible", "text_contains"
+            or "css_value" (expected value given as [css property, value])
+        :param locator: (Locator) the locator of the element
+        :param expected_value: the value expected by the condition, if any
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+        wait_name = f"in-page {condition_name} {tuple(locator)}"
+
+        # The script timeout has to outlast the in-page timeout
+        if self.__script_timeout__ is None or self.__script_timeout__ < timeout + 1:
+            self.set_script_timeout(timeout + 1)
+
+        start_time = time.perf_counter()
+        wait_result = script_registry.execute(
+            self.driver,
+            "dom_condition_waiter",
+            condition_name,
+            locator[0],
+            locator[1],
+            expected_value,
+            int(timeout * 1000),
+        )
+        satisfied = bool(wait_result and wait_result["satisfied"])
+        wait_statistics.record(
+            wait_name, time.perf_counter() - start_time, satisfied, 1
+        )
+        if not satisfied:
+            error_message = wait_result["error"] if wait_result else None
+            raise TimeoutException(
+                f"Wait timed out after {timeout}s: {wait_name}"
+                + (f" ({error_message})" if error_message else "")
+            )
+
+
+class AsyncWaitEngine(WaitEngine):
+    """
+    Class definition for the explicit wait engine of an asynchronous session
+    (AsyncWebDriver): the same timeouts and statistics, with awaitable waits,
+    so the other sessions of the event loop run while a wait polls.
+    """
+
+    async def set_script_timeout(self, timeout):
+        """
+        Method used to set the asynchronous script timeout of the session
+        (kept by the engine, in order to skip redundant round trips).
+
+        :param timeout: (float) the script timeout, in seconds
+        """
+        if self.__script_timeout__ != timeout:
+            await self.driver.set_timeouts(script=timeout)
+            self.__script_timeout__ = timeout
+
+    async def until(self, condition, wait_name, timeout):
+        """
+        Method used to poll a condition until it returns a truthy value; the
+        interval between polls grows from the minimum to the maximum interval.
+
+        :param condition: (function) coroutine function receiving the driver
+        :param wait_name: (str) description of the wait, used for the statistics
+        :param timeout: (float) the timeout of the wait, in seconds
+        :return: the value returned by the condition
+        """
+        start_time = time.perf_counter()
+        end_time = start_time + timeout
+        poll_interval = self.minimum_poll_interval
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                condition_value = await condition(self.driver)
+                if condition_value:
+                    wait_statistics.record(
+                        wait_name, time.perf_counter() - start_time, True, polls
+                    )
+                    return condition_value
+            except IGNORED_EXCEPTIONS:
+                pass
+            remaining_time = end_time - time.perf_counter()
+            if remaining_time <= 0:
+                wait_statistics.record(
+                    wait_name, time.perf_counter() - start_time, False, polls
+                )
+                raise TimeoutException(f"Wait timed out after {timeout}s: {wait_name}")
+            await asyncio.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(poll_interval * 2, self.maximum_poll_interval)
+
+    async def find(self, locator, timeout=None):
+        """
+        Method used to find an element, waiting for it to be present.
+
+        :param locator: (Locator) the locator of the element
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        :return: (AsyncWebElement) the web element
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+        try:
+            return await self.until(
+                lambda driver: driver.find_element(*locator),
+                f"present {tuple(locator)}",
+                timeout,
+            )
+        except TimeoutException:
+            raise NoSuchElementException(
+                f"Unable to locate element within {timeout}s: {tuple(locator)}"
+            ) from None
+
+    async def wait_visible(self, locator, timeout=None):
+        """
+        Method used to wait for an element to be visible.
+
+        :param locator: (Locator) the locator of the element
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        :return: (AsyncWebElement) the visible web element
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+
+        async def element_visible(driver):
+            element = await driver.find_element(*locator)
+            return element if await element.is_displayed() else None
+
+        return await self.until(element_visible, f"visible {tuple(locator)}", timeout)
+
+    async def wait_in_page(
+        self, condition_name, locator, expected_value=None, timeout=None
+    ):
+        """
+        Method used to wait inside the page, through a single asynchronous script
+        (see WaitEngine.wait_in_page).
+
+        :param condition_name: (str) one of "present", "visible", "text_contains"
+            or "css_value" (expected value given as [css property, value])
+        :param locator: (Locator) the locator of the element
+        :param expected_value: the value expected by the condition, if any
+        :param timeout: (float) the timeout of the wait, defaults to the locator timeout
+        """
+        if timeout is None:
+            timeout = self.get_timeout(locator)
+        wait_name = f"in-page {condition_name} {tuple(locator)}"
+
+        # The script timeout has to outlast the in-page timeout
+        if self.__script_timeout__ is None or self.__script_timeout__ < timeout + 1:
+            await self.set_script_timeout(timeout + 1)
+
+        start_time = time.perf_counter()
+        wait_result = await script_registry.async_execute(
+            self.driver,
+            "dom_condition_waiter",
+            condition_name,
+            locator[0],
+            locator[1],
+            expected_value,
+            int(timeout * 1000),
+        )
+        satisfied = bool(wait_result and wait_result["satisfied"])
+        wait_statistics.record(
+            wait_name, time.perf_counter() - start_time, satisfied, 1
+        )
+        if not satisfied:
+            error_message = wait_result["error"] if wait_result else None
+            raise TimeoutException(
+                f"Wait timed out after {timeout}s: {wait_name}"
+                + (f" ({error_message})" if error_message else "")
+            )
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the shared, read-only access layer to the sqlite
+databases of the framework: one connection per database file and process,
+opened in immutable URI mode and closed deterministically at session end.
+"""
+
+import os
+import sqlite3
+import threading
+
+from urllib.request import pathname2url
+
+# Location of the "demopage_data" database, independent of the working directory
+database_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "demopage_data.db"
+)
+
+
+class QueryResult:
+    """
+    Class definition for the rows of a query, fetched while the shared
+    connection was locked and read as from a sqlite cursor.
+    """
+
+    def __init__(self, description, rows):
+        """
+        Constructor for the class.
+
+        :param description: (tuple) the column descriptions of the query
+        :param rows: (list) the fetched rows
+        """
+        self.description = description
+        self.__rows__ = iter(rows)
+
+    def fetchone(self):
+        """
+        Method used to read the next row of the query.
+
+        :return: (tuple) the row, or None if all the rows were read
+        """
+        return next(self.__rows__, None)
+
+    def fetchall(self):
+        """
+        Method used to read the remaining rows of the query.
+
+        :return: (list) the remaining rows
+        """
+        return list(self.__rows__)
+
+    def __iter__(self):
+        """
+        Method used to iterate over the remaining rows of the query.
+        """
+        return self.__rows__
+
+
+class SharedDatabase:
+    """
+    Class definition for a read-only database shared by the whole process.
+    """
+
+    def __init__(self, database_path):
+        """
+        Constructor for the class; the connection is opened at the first use.
+
+        :param database_path: (str) path to the sqlite database file
+        """
+        self.database_path = os.path.abspath(database_path)
+        self.__connection__ = None
+        self.__lock__ = threading.RLock()
+
+    def __open_connection__(self):
+        """
+        Helper method used to open the database in read-only, immutable mode.
+        The connection may be handed out to any thread; the statements are
+        serialized through the lock of the instance.
+
+        :return: (obj) the sqlite connection
+        """
+        if not os.path.isfile(self.database_path):
+            raise FileNotFoundError(f"Database not found: {self.database_path}")
+        database_uri = f"file:{pathname2url(self.database_path)}?mode=ro&immutable=1"
+        return sqlite3.connect(database_uri, uri=True, check_same_thread=False)
+
+    def connection(self):
+        """
+        Method used to retrieve the shared connection, opening it if required.
+
+        :return: (obj) the sqlite connection
+        """
+        with self.__lock__:
+            if self.__connection__ is None:
+                self.__connection__ = self.__open_connection__()
+            return self.__connection__
+
+    def execute(self, query, parameters=()):
+        """
+        Method used to execute a query and fetch all of its rows while the shared
+        connection is locked; the result is read as from a sqlite cursor.
+
+        :param query: (str) the SQL query to be executed
+        :param parameters: (tuple) the query parameters
+        :return: (QueryResult) the column descriptions and the rows of the query
+        """
+        with self.__lock__:
+            query_result = self.connection().execute(query, parameters)
+            return QueryResult(query_result.description, query_result.fetchall())
+
+    def fetch_one(self, query, parameters=()):
+        """
+        Method used to execute a query and fetch its first row; the row is
+        fetched while the shared connection is locked.
+
+        :param query: (str) the SQL query to be executed
+        :param parameters: (tuple) the query parameters
+        :return: (list, tuple) the column names and the fetched row (None if no row)
+        """
+        with self.__lock__:
+            query_result = self.connection().execute(query, parameters)
+            keys_in_record = [column[0] for column in query_result.description]
+            return keys_in_record, query_result.fetchone()
+
+    def fetch_all(self, query, parameters=()):
+        """
+        Method used to execute a query and fetch all of its rows at once.
+
+        :param query: (str) the SQL query to be executed
+        :param parameters: (tuple) the query parameters
+        :return: (list, list) the column names and the fetched rows
+        """
+        with self.__lock__:
+            query_result = self.connection().execute(query, parameters)
+            keys_in_record = [column[0] for column in query_result.description]
+            return keys_in_record, query_result.fetchall()
+
+    def iterate(self, query, parameters=(), chunk_size=500):
+        """
+        Method used to stream the rows of a query, fetched in chunks; the shared
+        connection is only locked while a chunk is fetched.
+
+        :param query: (str) the SQL query to be executed
+        :param parameters: (tuple) the query parameters
+        :param chunk_size: (int) number of rows fetched at once
+        :return: (generator) the rows of the query
+        """
+        with self.__lock__:
+            query_result = self.connection().cursor()
+            query_result.arraysize = chunk_size
+            query_result.execute(query, parameters)
+        while True:
+            with self.__lock__:
+                rows = query_result.fetchmany()
+            if not rows:
+                return
+            yield from rows
+
+    def is_open(self):
+        """
+        Method used to verify if the shared connection is currently open.
+
+        :return: (bool) True if the connection is open
+        """
+        return self.__connection__ is not None
+
+    def close(self):
+        """
+        Method used to close the shared connection; it will be opened
+        again at the next use (e.g.: after the database file was replaced).
+        """
+        with self.__lock__:
+            if self.__connection__ is not None:
+                self.__connection__.close()
+                self.__connection__ = None
+
+
+# Shared databases of the process, indexed by their absolute path
+__shared_databases__ = dict()
+__shared_databases_lock__ = threading.Lock()
+
+
+def get_shared_database(path=database_path):
+    """
+    Function used to retrieve the shared access object for a database file.
+
+    :param path: (str) path to the sqlite database file
+    :return: (SharedDatabase) the access object, unique per file and process
+    """
+    absolute_path = os.path.abspath(path)
+    with __shared_databases_lock__:
+        if absolute_path not in __shared_databases__:
+            __shared_databases__[absolute_path] = SharedDatabase(absolute_path)
+        return __shared_databases__[absolute_path]
+
+
+def close_shared_databases():
+    """
+    Function used to close all the shared connections of the process
+    (called at the end of the test session).
+    """
+    with __shared_databases_lock__:
+        shared_databases = list(__shared_databases__.values())
+    for shared_database in shared_databases:
+        shared_database.close()
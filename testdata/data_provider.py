@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the data provider of the data-driven tests: every table
+listed in "repetitive_tests" is a data table, used by the test of the same
+name ("test_<table name>") or by the tests marked with "data_table". Only the
+row ids are read at collection time, streamed in chunks; the rows themselves
+are read when the tests are set up, one chunk of consecutive ids at a time,
+and only the most recently used chunks are kept, so the memory used does not
+grow with the size of the data tables (whatever the order of the tests).
+"""
+
+import threading
+from collections import OrderedDict
+
+from testdata.data_access import database_path, get_shared_database
+
+# Marker mapping a test to its data table: @pytest.mark.data_table("table_name")
+DATA_TABLE_MARKER = "data_table"
+
+# Fixture receiving the data rows of a data-driven test
+DATA_FIXTURE = "get_data"
+
+# Number of rows read at once, when streaming the row ids or reading the rows
+DEFAULT_CHUNK_SIZE = 500
+
+# Number of row chunks kept in memory, across all the data tables
+DEFAULT_CACHED_CHUNKS = 8
+
+
+class DataProvider:
+    """
+    Class definition for the data provider of the data-driven tests.
+    """
+
+    def __init__(
+        self,
+        database_path,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        cached_chunks=DEFAULT_CACHED_CHUNKS,
+    ):
+        """
+        Constructor for the class.
+
+        :param database_path: (str) path to the sqlite database holding the data tables
+        :param chunk_size: (int) number of rows read at once
+        :param cached_chunks: (int) number of row chunks kept in memory
+        """
+        self.database_path = database_path
+        self.chunk_size = chunk_size
+        self.cached_chunks = cached_chunks
+        self.__data_tables__ = None
+        self.__row_chunks__ = OrderedDict()
+        self.__lock__ = threading.Lock()
+
+    def get_data_tables(self):
+        """
+        Method used to retrieve the data tables listed in "repetitive_tests".
+
+        :return: (tuple) names of the data tables
+        """
+        if self.__data_tables__ is None:
+            demopage_db = get_shared_database(self.database_path)
+            _, table_rows = demopage_db.fetch_all("SELECT name FROM repetitive_tests")
+            _, schema_rows = demopage_db.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+            existing_tables = {schema_row[0] for schema_row in schema_rows}
+            for (table_name,) in table_rows:
+                if table_name not in existing_tables:
+                    raise ValueError(
+                        f"Data table '{table_name}' of repetitive_tests does not exist"
+                    )
+            self.__data_tables__ = tuple(table_row[0] for table_row in table_rows)
+        return self.__data_tables__
+
+    def resolve_table(self, test_name, marked_table=None):
+        """
+        Method used to find the data table of a test.
+
+        :param test_name: (str) name of the test function (e.g.: "test_color_change_demo")
+        :param marked_table: (str) table of the "data_table" marker of the test, if any
+        :return: (str) name of the data table
+        """
+        data_tables = self.get_data_tables()
+        table_name = marked_table or test_name.removeprefix("test_")
+        if table_name not in data_tables:
+            raise ValueError(
+                f"No data table for {test_name}: '{table_name}' is not listed "
+                f"in repetitive_tests ({', '.join(data_tables)})"
+            )
+        return table_name
+
+    def iter_row_ids(self, table_name, row_filter=None, limit=None):
+        """
+        Method used to stream the ids of the data rows of a table.
+
+        :param table_name: (str) name of the data table
+        :param row_filter: (str) SQL condition the rows must meet, if any
+        :param limit: (int) maximum number of rows, if any
+        :return: (generator) the row ids, in table order
+        """
+        query = f"SELECT rowid FROM {self.resolve_table(table_name, table_name)}"
+        if row_filter:
+            query += f" WHERE {row_filter}"
+        query += " ORDER BY rowid"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        demopage_db = get_shared_database(self.database_path)
+        for (row_id,) in demopage_db.iterate(query, chunk_size=self.chunk_size):
+            yield row_id
+
+    def get_row(self, table_name, row_id):
+        """
+        Method used to read a data row; the rows are read by chunks of
+        consecutive ids (the chunk of the row id) and the most recently
+        used chunks are kept.
+
+        :param table_name: (str) name of the data table
+        :param row_id: (int) id of the row
+        :return: (tuple) the row, without its id
+        """
+        chunk_key = (table_name, row_id // self.chunk_size)
+        with self.__lock__:
+            row_chunk = self.__row_chunks__.get(chunk_key)
+            if row_chunk is None:
+                chunk_start = chunk_key[1] * self.chunk_size
+                demopage_db = get_shared_database(self.database_path)
+                _, chunk_rows = demopage_db.fetch_all(
+                    f"SELECT rowid, * FROM {self.resolve_table(table_name, table_name)} "
+                    f"WHERE rowid >= ? AND rowid < ?",
+                    (chunk_start, chunk_start + self.chunk_size),
+                )
+                row_chunk = {chunk_row[0]: chunk_row[1:] for chunk_row in chunk_rows}
+                self.__row_chunks__[chunk_key] = row_chunk
+                while len(self.__row_chunks__) > self.cached_chunks:
+                    self.__row_chunks__.popitem(last=False)
+            else:
+                self.__row_chunks__.move_to_end(chunk_key)
+        try:
+            return row_chunk[row_id]
+        except KeyError:
+            raise KeyError(f"No row {row_id} in data table '{table_name}'") from None
+
+    def invalidate(self):
+        """
+        Method used to drop the data table names and the cached rows
+        (e.g.: after the database file changed).
+        """
+        with self.__lock__:
+            self.__data_tables__ = None
+            self.__row_chunks__.clear()
+
+
+# Process-wide data provider of the data-driven tests
+data_provider = DataProvider(database_path)
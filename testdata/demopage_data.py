@@ -11,7 +11,7 @@ This module reads the configuration data and returns the data sets
 used for multiple executions of a single test.
 """
 
-import sqlite3
+from testdata.data_provider import DataProvider, data_provider
 
 
 class DemoPageData:
@@ -22,13 +22,18 @@ class DemoPageData:
     @staticmethod
     def get_test_data(database_path):
         """
-        Static method used to read the config file and the data sets.
+        Static method used to read the data sets of the first data table; kept for
+        compatibility, the data-driven tests are fed by testdata.data_provider.
 
+        :param database_path: (str) path to the sqlite database holding the data tables
         :return: (list) List of tuples consisting of the data sets.
         """
-        demopage_db = sqlite3.connect(database_path)
-        cursor_object = demopage_db.cursor()
-        testcase_name = cursor_object.execute(f"SELECT * FROM repetitive_tests").fetchall()[0][0]
-        data_sets = cursor_object.execute(f"SELECT * FROM {testcase_name}").fetchall()
-        demopage_db.close()
-        return data_sets
+        if database_path == data_provider.database_path:
+            table_provider = data_provider
+        else:
+            table_provider = DataProvider(database_path)
+        table_name = table_provider.get_data_tables()[0]
+        return [
+            table_provider.get_row(table_name, row_id)
+            for row_id in table_provider.iter_row_ids(table_name)
+        ]
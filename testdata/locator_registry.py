@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the process-wide locator registry, which loads all the
+locator tables from the "demopage_data" database in a single pass and
+serves the records from memory, together with their compiled locators. When
+the "locator_costs" database holds a faster strategy for an unchanged record
+(see utilities.locator_optimizer), that strategy is used to find the element,
+while the record itself (also used as test data) is served unchanged.
+"""
+
+import os
+import sqlite3
+import threading
+from urllib.request import pathname2url
+
+from pageobjects.locator import Locator
+from testdata.data_access import database_path, get_shared_database
+
+# Tables of the database holding the page objects localization data
+LOCATOR_TABLES = (
+    "text_fields",
+    "misc_items",
+    "iframe_items",
+    "slider_dropdown",
+    "bar_and_label_values",
+    "html_svg_item",
+    "radio_buttons",
+)
+
+# Table holding the measured lookup costs and the fastest strategy of the records
+LOCATOR_COSTS_TABLE = "locator_costs"
+
+# Location of the locator costs database, separate from the tracked "demopage_data"
+locator_costs_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "locator_costs.db"
+)
+
+
+class LocatorRegistry:
+    """
+    Class definition for the in-memory locator registry.
+    """
+
+    def __init__(
+        self,
+        database_path,
+        table_names=LOCATOR_TABLES,
+        use_fastest_locators=True,
+        costs_path=locator_costs_path,
+    ):
+        """
+        Constructor for the class. The records are loaded lazily,
+        at the first lookup, or explicitly through reload().
+
+        :param database_path: (str) path to the sqlite database to be loaded
+        :param table_names: (tuple) names of the locator tables to be loaded
+        :param use_fastest_locators: (bool) if True, the elements are found with
+            the fastest strategy measured in the locator costs database
+        :param costs_path: (str) path to the locator costs database
+        """
+        self.database_path = database_path
+        self.table_names = tuple(table_names)
+        self.use_fastest_locators = use_fastest_locators
+        self.costs_path = costs_path
+        self.__records__ = None
+        self.__locators__ = None
+        self.__substitutes__ = dict()
+        self.__lock__ = threading.Lock()
+
+    def __load_records__(self):
+        """
+        Helper method used to read all the locator tables in one pass and
+        to build the locator of each record (unknown locator types are
+        reported here, at load time).
+
+        :return: (dict, dict, dict) records and locators indexed by (table name,
+            record name), and the substitutes indexed by the (type, hook) they replace
+        """
+        records = dict()
+        locators = dict()
+        substitutes = dict()
+        demopage_db = get_shared_database(self.database_path)
+        fastest_locators = (
+            load_fastest_locators(self.costs_path)
+            if self.use_fastest_locators
+            else dict()
+        )
+        for table_name in self.table_names:
+            keys_in_record, table_rows = demopage_db.fetch_all(
+                f"SELECT * FROM {table_name}"
+            )
+            for record_data in table_rows:
+                record_as_dict = dict(zip(keys_in_record, record_data))
+                record_key = (table_name, record_as_dict["name"])
+                source_locator, fastest_locator = fastest_locators.get(
+                    record_key, (None, None)
+                )
+                try:
+                    locators[record_key] = Locator.from_record(record_as_dict)
+                    if source_locator == (
+                        record_as_dict["locator_type"],
+                        record_as_dict["locator_hook"],
+                    ):
+                        locators[record_key] = Locator.compile(*fastest_locator)
+                        substitutes[source_locator] = locators[record_key]
+                except ValueError as locator_error:
+                    raise ValueError(
+                        f"Invalid locator record {record_key}: {locator_error}"
+                    ) from None
+                records[record_key] = record_as_dict
+        return records, locators, substitutes
+
+    def __get_records__(self):
+        """
+        Helper method used to return the loaded records, loading them if required.
+
+        :return: (dict) records indexed by (table name, record name)
+        """
+        records = self.__records__
+        if records is None:
+            with self.__lock__:
+                if self.__records__ is None:
+                    (
+                        self.__records__,
+                        self.__locators__,
+                        self.__substitutes__,
+                    ) = self.__load_records__()
+                records = self.__records__
+        return records
+
+    def is_loaded(self):
+        """
+        Method used to verify if the locator tables are currently loaded in memory.
+
+        :return: (bool) True if the records are loaded
+        """
+        return self.__records__ is not None
+
+    def invalidate(self):
+        """
+        Method used to drop the loaded records; the tables will be read
+        again at the next lookup (e.g.: after the database file changed).
+        """
+        with self.__lock__:
+            self.__records__ = None
+            self.__locators__ = None
+            self.__substitutes__ = dict()
+
+    def reload(self):
+        """
+        Method used to read all the locator tables again, immediately.
+        The shared connection is reopened, as it assumes an immutable file.
+        """
+        get_shared_database(self.database_path).close()
+        records, locators, substitutes = self.__load_records__()
+        with self.__lock__:
+            self.__records__, self.__locators__ = records, locators
+            self.__substitutes__ = substitutes
+
+    def contains(self, table_name, record_name):
+        """
+        Method used to verify if a record is present in the registry.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the record to be found
+        :return: (bool) True if the record is known
+        """
+        return (table_name, record_name) in self.__get_records__()
+
+    def get_record(self, table_name, record_name):
+        """
+        Method used to retrieve a locator record from memory.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the record to be found
+        :return: (dict) a copy of the record, as {column name: value}
+        """
+        try:
+            record = self.__get_records__()[(table_name, record_name)]
+        except KeyError:
+            raise KeyError(
+                f"No record named '{record_name}' in table '{table_name}'"
+            ) from None
+        return dict(record)
+
+    def get_locator(self, table_name, record_name):
+        """
+        Method used to retrieve the compiled locator of a record.
+
+        :param table_name: (str) name of the locator table
+        :param record_name: (str) name of the record to be found
+        :return: (Locator) the locator built when the tables were loaded
+        """
+        self.__get_records__()
+        try:
+            return self.__locators__[(table_name, record_name)]
+        except KeyError:
+            raise KeyError(
+                f"No record named '{record_name}' in table '{table_name}'"
+            ) from None
+
+    def find_locator(self, record):
+        """
+        Method used to retrieve the locator used to find the element of a record:
+        the fastest measured strategy if the record is unchanged since the
+        measurement, else the locator of the record itself.
+
+        :param record: (dict) record holding the "locator_type" and "locator_hook" fields
+        :return: (Locator) the compiled locator
+        """
+        self.__get_records__()
+        substitute = self.__substitutes__.get(
+            (record["locator_type"], record["locator_hook"])
+        )
+        return substitute if substitute is not None else Locator.from_record(record)
+
+
+def load_fastest_locators(costs_path=locator_costs_path):
+    """
+    Function used to read the fastest strategies of the locator costs database;
+    the database is optional (it is created by the locator optimizer).
+
+    :param costs_path: (str) path to the locator costs database
+    :return: (dict) (table name, record name) -> (measured locator, fastest locator),
+        each locator as a (locator type, locator hook) pair
+    """
+    if not os.path.isfile(costs_path):
+        return dict()
+    costs_uri = f"file:{pathname2url(os.path.abspath(costs_path))}?mode=ro"
+    connection = sqlite3.connect(costs_uri, uri=True)
+    try:
+        table_rows = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+            (LOCATOR_COSTS_TABLE,),
+        ).fetchall()
+        if not table_rows:
+            return dict()
+        cost_rows = connection.execute(f"""
+            SELECT table_name, name, locator_type, locator_hook,
+                best_locator_type, best_locator_hook
+            FROM {LOCATOR_COSTS_TABLE}
+            """).fetchall()
+    finally:
+        connection.close()
+    return {
+        (table_name, name): ((locator_type, locator_hook), (best_type, best_hook))
+        for table_name, name, locator_type, locator_hook, best_type, best_hook in cost_rows
+    }
+
+
+# Process-wide registry instance, shared by all the page objects
+locator_registry = LocatorRegistry(database_path)
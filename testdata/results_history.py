@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the results history store: the outcome and the duration
+of every test (and data row) of every run, with the browser and the worker,
+are written to a local sqlite database, separate from "demopage_data". The
+store uses the WAL journal and batched inserts, so that the parallel workers
+can write to it with almost no overhead per test; the query helpers return
+the duration trends (p50/p95) and the flakiness rate of the tests.
+
+Usage (from the project folder):
+» python -m testdata.results_history --last_runs 20
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+import uuid
+
+# Location of the results history database, next to the "demopage_data" database
+results_history_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "results_history.db"
+)
+
+# Environment variable sharing the run identifier with the worker processes
+RUN_ID_VARIABLE = "DEMOQA_RUN_ID"
+
+# Outcomes of the tests, as stored in the history
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+SKIPPED = "skipped"
+XFAILED = "xfailed"
+XPASSED = "xpassed"
+
+# Outcomes of the tests which were executed to the end (used by the trends)
+EXECUTED_OUTCOMES = (PASSED, FAILED, XFAILED, XPASSED)
+
+RESULTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    test_name TEXT NOT NULL,
+    data_row TEXT,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    browser_name TEXT,
+    worker TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test_name, recorded_at);
+"""
+
+
+def get_run_id():
+    """
+    Function used to retrieve the identifier of the current run; it is created
+    by the first process of the run and inherited by its worker processes.
+
+    :return: (str) the run identifier, sortable by start time
+    """
+    return os.environ.setdefault(
+        RUN_ID_VARIABLE, f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    )
+
+
+def split_nodeid(nodeid):
+    """
+    Function used to split a test identifier into the test and its data row.
+
+    :param nodeid: (str) the pytest node identifier
+    :return: (str, str) the test identifier and the data row id (or None)
+    """
+    test_name, separator, data_row = nodeid.partition("[")
+    return test_name, data_row[:-1] if separator else None
+
+
+def __percentile__(durations, percent):
+    """
+    Helper method used to compute a percentile of the durations (linear interpolation).
+
+    :param durations: (list) the durations
+    :param percent: (int) the percentile (e.g.: 95)
+    :return: (float) the percentile value
+    """
+    if len(durations) == 1:
+        return durations[0]
+    return statistics.quantiles(durations, n=100, method="inclusive")[percent - 1]
+
+
+class ResultsHistory:
+    """
+    Class definition for the results history store of the process.
+    """
+
+    def __init__(self, database_path=results_history_path, batch_size=50):
+        """
+        Constructor for the class; the database is opened at the first write.
+
+        :param database_path: (str) path to the sqlite results database
+        :param batch_size: (int) number of results written in one transaction
+        """
+        self.database_path = database_path
+        self.batch_size = batch_size
+        self.enabled = True
+        self.browser_name = None
+        self.worker = None
+        self.__connection__ = None
+        self.__pending_results__ = list()
+        self.__test_phases__ = dict()
+        self.__lock__ = threading.Lock()
+
+    def __connect__(self):
+        """
+        Helper method used to open the results database, in WAL mode.
+
+        :return: (obj) the sqlite connection
+        """
+        if self.__connection__ is None:
+            connection = sqlite3.connect(
+                self.database_path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(RESULTS_SCHEMA)
+            self.__connection__ = connection
+        return self.__connection__
+
+    def record_phase(self, nodeid, when, outcome, duration, expected_failure=False):
+        """
+        Method used to register a phase (setup, call or teardown) of a test;
+        the test result is queued once its teardown is registered.
+
+        :param nodeid: (str) the pytest node identifier
+        :param when: (str) "setup", "call" or "teardown"
+        :param outcome: (str) the pytest outcome of the phase
+        :param duration: (float) duration of the phase, in seconds
+        :param expected_failure: (bool) True if the test is marked as xfail
+        """
+        if not self.enabled:
+            return
+        with self.__lock__:
+            test_outcome, test_duration = self.__test_phases__.pop(
+                nodeid, (PASSED, 0.0)
+            )
+            test_duration += duration
+            if test_outcome == PASSED and outcome != PASSED:
+                if outcome == SKIPPED:
+                    test_outcome = XFAILED if expected_failure else SKIPPED
+                else:
+                    test_outcome = FAILED if when == "call" else ERROR
+            elif test_outcome == PASSED and expected_failure and when == "call":
+                test_outcome = XPASSED
+            if when != "teardown":
+                self.__test_phases__[nodeid] = (test_outcome, test_duration)
+                return
+            self.__pending_results__.append(
+                (
+                    get_run_id(),
+                    nodeid,
+                    *split_nodeid(nodeid),
+                    test_outcome,
+                    test_duration,
+                    self.browser_name,
+                    self.worker,
+                    time.time(),
+                )
+            )
+            if len(self.__pending_results__) < self.batch_size:
+                return
+        self.flush()
+
+    def flush(self):
+        """
+        Method used to write the queued results, in a single transaction.
+        """
+        with self.__lock__:
+            pending_results, self.__pending_results__ = self.__pending_results__, []
+            if not pending_results:
+                return
+            connection = self.__connect__()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    pending_results,
+                )
+
+    def close(self):
+        """
+        Method used to write the queued results and to close the database.
+        """
+        self.flush()
+        with self.__lock__:
+            if self.__connection__ is not None:
+                self.__connection__.close()
+                self.__connection__ = None
+
+    def __read_last_runs__(self, last_runs, test_name=None, excluded_run_id=None):
+        """
+        Helper method used to read the results of the last runs, in recording order.
+
+        :param last_runs: (int) number of runs to be read
+        :param test_name: (str) test identifier (without data row) to be read, if any
+        :param excluded_run_id: (str) run to be ignored (e.g.: the current one), if any
+        :return: (list) the (nodeid, outcome, duration) results
+        """
+        self.flush()
+        query = """
+            SELECT nodeid, outcome, duration FROM results
+            WHERE run_id IN (
+                SELECT run_id FROM results WHERE run_id != ? GROUP BY run_id
+                ORDER BY MAX(recorded_at) DESC LIMIT ?
+            )
+        """
+        parameters = [excluded_run_id or "", last_runs]
+        if test_name is not None:
+            query += " AND test_name = ?"
+            parameters.append(test_name)
+        query += " ORDER BY recorded_at"
+        with self.__lock__:
+            return self.__connect__().execute(query, parameters).fetchall()
+
+    def get_duration_trends(self, last_runs=20, test_name=None):
+        """
+        Method used to compute the duration percentiles of the tests, per data row.
+
+        :param last_runs: (int) number of runs taken into account
+        :param test_name: (str) test identifier (without data row) to be analyzed, if any
+        :return: (dict) per nodeid: runs, p50 and p95 durations (executed tests only),
+            sorted by decreasing p95
+        """
+        durations = dict()
+        for nodeid, outcome, duration in self.__read_last_runs__(last_runs, test_name):
+            if outcome in EXECUTED_OUTCOMES:
+                durations.setdefault(nodeid, []).append(duration)
+        trends = {
+            nodeid: {
+                "runs": len(test_durations),
+                "p50": __percentile__(test_durations, 50),
+                "p95": __percentile__(test_durations, 95),
+            }
+            for nodeid, test_durations in durations.items()
+        }
+        return dict(sorted(trends.items(), key=lambda trend: -trend[1]["p95"]))
+
+    def get_expected_durations(self, last_runs=10, excluded_run_id=None):
+        """
+        Method used to estimate the duration of the tests from their last runs.
+
+        :param last_runs: (int) number of runs taken into account
+        :param excluded_run_id: (str) run to be ignored (e.g.: the current one), if any
+        :return: (dict) per nodeid: the median duration of its executed runs
+        """
+        durations = dict()
+        for nodeid, outcome, duration in self.__read_last_runs__(
+            last_runs, excluded_run_id=excluded_run_id
+        ):
+            if outcome in EXECUTED_OUTCOMES:
+                durations.setdefault(nodeid, []).append(duration)
+        return {
+            nodeid: statistics.median(test_durations)
+            for nodeid, test_durations in durations.items()
+        }
+
+    def get_recent_failures(self, last_runs=3, excluded_run_id=None):
+        """
+        Method used to find the tests which failed in their last runs.
+
+        :param last_runs: (int) number of runs taken into account
+        :param excluded_run_id: (str) run to be ignored (e.g.: the current one), if any
+        :return: (set) the nodeids of the tests which failed or errored
+        """
+        return {
+            nodeid
+            for nodeid, outcome, _ in self.__read_last_runs__(
+                last_runs, excluded_run_id=excluded_run_id
+            )
+            if outcome in (FAILED, ERROR)
+        }
+
+    def get_flakiness(self, last_runs=20, test_name=None):
+        """
+        Method used to compute the flakiness of the tests, per data row: the rate
+        of outcome changes between consecutive runs (a test failing in every run
+        is broken, not flaky) and the failure rate.
+
+        :param last_runs: (int) number of runs taken into account
+        :param test_name: (str) test identifier (without data row) to be analyzed, if any
+        :return: (dict) per nodeid: runs, failures, flips, flip rate and failure
+            rate, sorted by decreasing flip rate
+        """
+        outcomes = dict()
+        for nodeid, outcome, _ in self.__read_last_runs__(last_runs, test_name):
+            if outcome not in (SKIPPED, XFAILED):
+                outcomes.setdefault(nodeid, []).append(outcome == PASSED)
+        flakiness = dict()
+        for nodeid, test_passes in outcomes.items():
+            flips = sum(
+                previous_pass != current_pass
+                for previous_pass, current_pass in zip(test_passes, test_passes[1:])
+            )
+            failures = test_passes.count(False)
+            flakiness[nodeid] = {
+                "runs": len(test_passes),
+                "failures": failures,
+                "flips": flips,
+                "flip_rate": (
+                    flips / (len(test_passes) - 1) if len(test_passes) > 1 else 0.0
+                ),
+                "failure_rate": failures / len(test_passes),
+            }
+        return dict(sorted(flakiness.items(), key=lambda test: -test[1]["flip_rate"]))
+
+
+# Process-wide results history store
+results_history = ResultsHistory()
+
+
+def main():
+    """
+    Function used to print the duration trends and the flakiness of the tests.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--database", default=results_history_path)
+    parser.add_argument("--last_runs", type=int, default=20)
+    parser.add_argument("--test_name", default=None)
+    arguments = parser.parse_args()
+    if not os.path.isfile(arguments.database):
+        print(f"No results history in {arguments.database}")
+        return 1
+    history = ResultsHistory(arguments.database)
+    print(f"Duration trends, last {arguments.last_runs} runs:")
+    print(f"{'runs':>6} {'p50 (s)':>9} {'p95 (s)':>9}  test")
+    trends = history.get_duration_trends(arguments.last_runs, arguments.test_name)
+    for nodeid, trend in trends.items():
+        print(f"{trend['runs']:>6} {trend['p50']:>9.3f} {trend['p95']:>9.3f}  {nodeid}")
+    print(f"Flakiness, last {arguments.last_runs} runs:")
+    print(f"{'runs':>6} {'failures':>9} {'flip rate':>10}  test")
+    flakiness = history.get_flakiness(arguments.last_runs, arguments.test_name)
+    for nodeid, test_flakiness in flakiness.items():
+        print(
+            f"{test_flakiness['runs']:>6} {test_flakiness['failures']:>9} "
+            f"{test_flakiness['flip_rate']:>10.0%}  {nodeid}"
+        )
+    history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,12 +10,40 @@ Description:
 This module configures the testing framework.
 """
 
-import pytest
+import html
+import os
 
-from selenium import webdriver
+import pytest
 
-# Prototype definition and initialization of the driver as an empty object
-driver = None
+from pageobjects.action_timing import action_timer, instrument_page_objects
+from pageobjects.form_fill import form_fill_statistics
+from pageobjects.page_state import page_setup_statistics
+from pageobjects.wait_engine import wait_statistics
+from testdata.data_access import close_shared_databases
+from testdata.data_provider import DATA_FIXTURE, DATA_TABLE_MARKER, data_provider
+from testdata.locator_registry import locator_registry
+from testdata.results_history import get_run_id, results_history, results_history_path
+from utilities.command_profiler import COMMAND_BUDGET_MARKER, command_profiler
+from utilities.static_dom_driver import STATIC_DOM_MARKER
+from utilities.locator_preflight import run_preflight
+from utilities.log_pipeline import log_pipeline, reset_log_context, set_log_context
+from utilities.launch_profiles import (
+    BROWSER_STAND_INS,
+    LAUNCH_PROFILES,
+    launch_browser,
+    parse_profile_names,
+    remove_profile_copy,
+    startup_statistics,
+)
+from utilities.parallel_runner import get_worker_id, run_parallel, select_shard
+from utilities.result_cache import (
+    RESULT_CACHE_ENTRY,
+    RESULT_CACHE_PROPERTY,
+    is_cached_report,
+    result_cache,
+)
+from utilities.screenshots import screenshot_pipeline
+from utilities.duration_scheduler import load_schedule, order_for_feedback
 
 
 def pytest_addoption(parser):
@@ -23,7 +51,328 @@ def pytest_addoption(parser):
     PyTest's method used to add options to the parser
     (e.g.: browser to be used).
     """
-    parser.addoption("--browser_name", action="store", default="firefox")
+    parser.addoption(
+        "--browser_name",
+        action="store",
+        default="firefox",
+        help='browser to be used: chrome, firefox or "static" (browserless static DOM)',
+    )
+    parser.addoption(
+        "--launch_profile",
+        action="store",
+        default="default",
+        help=f"comma separated browser launch profiles: {', '.join(LAUNCH_PROFILES)}",
+    )
+    parser.addoption(
+        "--profile_template",
+        action="store",
+        default=None,
+        help='browser profile folder copied for the "template" launch profile',
+    )
+    parser.addoption(
+        "--reuse_session",
+        action="store_true",
+        default=False,
+        help="use one browser session for the whole run and reset the page between tests",
+    )
+    parser.addoption(
+        "--workers",
+        action="store",
+        type=int,
+        default=1,
+        help="number of parallel worker processes, each one with its own browser",
+    )
+    parser.addoption(
+        "--parallel_dir",
+        action="store",
+        default="parallel_results",
+        help="folder for the worker outputs and the merged reports of a parallel run",
+    )
+    parser.addoption(
+        "--action_timing",
+        action="store",
+        default=None,
+        help="time every page object action, per test, into the given JSON file",
+    )
+    parser.addoption(
+        "--screenshot_dir",
+        action="store",
+        default="screenshots",
+        help="folder of the failure screenshots",
+    )
+    parser.addoption(
+        "--preflight_locators",
+        action="store_true",
+        default=False,
+        help="validate all the locators against the local demo page before any browser starts",
+    )
+    parser.addoption(
+        "--original_locators",
+        action="store_true",
+        default=False,
+        help="use the locators of the tables, not the fastest ones of the locator costs table",
+    )
+    parser.addoption(
+        "--results_history",
+        action="store",
+        default=results_history_path,
+        help='sqlite database storing the results of every run ("" to disable)',
+    )
+    parser.addoption(
+        "--result_cache",
+        action="store_true",
+        default=False,
+        help="replay the cached passes of the tests whose inputs did not change",
+    )
+    parser.addoption(
+        "--full_run",
+        action="store_true",
+        default=False,
+        help="execute all the tests and refresh the result cache",
+    )
+    parser.addoption(
+        "--file_order",
+        action="store_true",
+        default=False,
+        help="run the tests in file order, not scheduled from the results history",
+    )
+    parser.addoption(
+        "--native_form_fill",
+        action="store_true",
+        default=False,
+        help="type the form fields with send_keys instead of the single script fill",
+    )
+    parser.addoption(
+        "--data_filter",
+        action="append",
+        default=[],
+        help='SQL condition on the rows of a data table, as "table:condition" '
+        '(e.g.: "color_change_demo:color_to_change = 1"); repeatable',
+    )
+    parser.addoption(
+        "--data_limit",
+        action="store",
+        type=int,
+        default=None,
+        help="maximum number of rows used from each data table",
+    )
+    parser.addoption("--shard_index", action="store", type=int, default=None)
+    parser.addoption("--shard_count", action="store", type=int, default=None)
+
+
+def pytest_configure(config):
+    """
+    PyTest's method used to register the markers of the framework.
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{COMMAND_BUDGET_MARKER}(max_commands): maximum number of WebDriver "
+        "commands the test is allowed to issue",
+    )
+    config.addinivalue_line(
+        "markers",
+        f"{STATIC_DOM_MARKER}: read-only flow, also executed by the static DOM browser",
+    )
+    config.addinivalue_line(
+        "markers",
+        f"{DATA_TABLE_MARKER}(table_name): data table of the test, listed in "
+        "repetitive_tests (default: the table named as the test, without test_)",
+    )
+
+
+def pytest_cmdline_main(config):
+    """
+    PyTest's method used to run the suite in parallel worker processes,
+    when more than one worker is requested (--workers).
+    """
+    worker_count = config.getoption("workers")
+    if worker_count > 1 and config.getoption("shard_count") is None:
+        # The workers inherit the run identifier of the results history
+        get_run_id()
+        return run_parallel(config, worker_count)
+
+
+def pytest_generate_tests(metafunc):
+    """
+    PyTest's method used to parametrize the data-driven tests with the ids
+    of the rows of their data table, filtered through the data options.
+    """
+    if DATA_FIXTURE not in metafunc.fixturenames:
+        return
+    data_table_marker = metafunc.definition.get_closest_marker(DATA_TABLE_MARKER)
+    table_name = data_provider.resolve_table(
+        metafunc.function.__name__,
+        data_table_marker.args[0] if data_table_marker else None,
+    )
+    row_filters = [
+        data_filter.partition(":")[2]
+        for data_filter in metafunc.config.getoption("data_filter")
+        if data_filter.partition(":")[0] == table_name
+    ]
+    row_ids = data_provider.iter_row_ids(
+        table_name,
+        " AND ".join(f"({row_filter})" for row_filter in row_filters),
+        metafunc.config.getoption("data_limit"),
+    )
+    metafunc.parametrize(
+        DATA_FIXTURE,
+        [(table_name, row_id) for row_id in row_ids],
+        indirect=True,
+        ids=lambda data_row: f"{data_row[0]}-{data_row[1]}",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    PyTest's method used to skip the browser tests requiring a real browser
+    (the ones using the "setup" fixture), when the static DOM browser is used,
+    to keep only the tests of the current worker's
+    shard and to order the tests from their past durations (recently failing
+    tests first, then the fastest ones).
+    """
+    if config.getoption("browser_name") in BROWSER_STAND_INS:
+        browser_only = pytest.mark.skip(
+            reason="requires a real browser (page scripts or pointer actions)"
+        )
+        for item in items:
+            if "setup" in getattr(item, "fixturenames", ()) and (
+                item.get_closest_marker(STATIC_DOM_MARKER) is None
+            ):
+                item.add_marker(browser_only)
+    schedule = None
+    if not config.getoption("file_order"):
+        schedule = load_schedule(config.getoption("results_history"))
+    shard_count = config.getoption("shard_count")
+    if shard_count is not None:
+        selected_items, deselected_items = select_shard(
+            items,
+            config.getoption("shard_index"),
+            shard_count,
+            schedule.expected_durations if schedule else None,
+        )
+        if deselected_items:
+            config.hook.pytest_deselected(items=deselected_items)
+            items[:] = selected_items
+    if schedule is not None:
+        items[:] = order_for_feedback(items, schedule)
+
+
+def pytest_sessionstart(session):
+    """
+    PyTest's method called at the start of the session, used to load
+    all the locator tables in memory, in a single pass, and to check the
+    data filters.
+    """
+    locator_registry.use_fastest_locators = not session.config.getoption(
+        "original_locators"
+    )
+    locator_registry.reload()
+    data_tables = data_provider.get_data_tables()
+    for data_filter in session.config.getoption("data_filter"):
+        table_name, separator, row_filter = data_filter.partition(":")
+        if table_name not in data_tables or not separator or not row_filter.strip():
+            raise pytest.UsageError(
+                f'Invalid --data_filter {data_filter!r}: expected "table:condition" '
+                f"with one of the data tables ({', '.join(data_tables)})"
+            )
+    log_pipeline.configure("logfile.log")
+    screenshot_pipeline.output_dir = session.config.getoption("screenshot_dir")
+    results_history.database_path = session.config.getoption("results_history")
+    results_history.enabled = bool(results_history.database_path)
+    results_history.browser_name = session.config.getoption("browser_name")
+    results_history.worker = get_worker_id()
+    if session.config.getoption("action_timing"):
+        instrument_page_objects()
+    if session.config.getoption("result_cache") or session.config.getoption("full_run"):
+        if getattr(session.config, "cache", None) is None:
+            raise pytest.UsageError(
+                "The result cache requires the cacheprovider plugin"
+            )
+        result_cache.configure(
+            session.config.cache,
+            not session.config.getoption("full_run"),
+            " ".join(
+                str(session.config.getoption(option_name))
+                for option_name in (
+                    "browser_name",
+                    "launch_profile",
+                    "native_form_fill",
+                    "original_locators",
+                )
+            ),
+        )
+    if session.config.getoption("preflight_locators"):
+        preflight_passed, report_lines = run_preflight()
+        if not preflight_passed:
+            pytest.exit(
+                "Locator pre-flight failed:\n" + "\n".join(report_lines),
+                returncode=pytest.ExitCode.USAGE_ERROR,
+            )
+        terminal_reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+        if terminal_reporter is not None:
+            terminal_reporter.write_line(report_lines[0])
+
+
+def pytest_sessionfinish(session):
+    """
+    PyTest's method called at the end of the session, used to close
+    the shared database connections deterministically.
+    """
+    close_shared_databases()
+    results_history.close()
+    screenshot_pipeline.flush()
+    log_pipeline.shutdown()
+    action_timing_path = session.config.getoption("action_timing")
+    if action_timing_path:
+        action_timer.export_json(action_timing_path)
+
+
+def _launch_browser(config):
+    """
+    Method used to launch the browser to be used, with the selected launch profiles.
+
+    :param config: (obj) the pytest configuration
+    :return: (obj, str) the selenium driver and the copied profile folder (or None)
+    """
+    driver, profile_dir = launch_browser(
+        config.getoption("browser_name"),
+        parse_profile_names(config.getoption("launch_profile")),
+        config.getoption("profile_template"),
+    )
+    command_profiler.attach(driver)
+    return driver, profile_dir
+
+
+@pytest.fixture(scope="session")
+def browser_session(request):
+    """
+    Setup method used to launch one browser for the whole run (--reuse_session).
+    """
+    session_driver, profile_dir = _launch_browser(request.config)
+    yield session_driver
+    session_driver.quit()
+    remove_profile_copy(profile_dir)
+
+
+@pytest.fixture(autouse=True)
+def log_context(request):
+    """
+    Setup method used to attach the current test and data row to the logged lines.
+    """
+    callspec = getattr(request.node, "callspec", None)
+    token = set_log_context(request.node.name, callspec.id if callspec else None)
+    yield
+    reset_log_context(token)
+
+
+@pytest.fixture(autouse=True)
+def action_timing(request):
+    """
+    Setup method used to record the page object action timings of the current test.
+    """
+    action_timer.start_test(request.node.nodeid)
+    yield
+    action_timer.stop_test()
 
 
 @pytest.fixture(scope="class")
@@ -31,56 +380,266 @@ def setup(request):
     """
     Setup method used when invoking the test class.
     """
-    # Initialization of the driver as a global variable
-    # to be used by the test class.
-    global driver
-
-    # Setting up the browser to be used
-    browser_name = request.config.getoption("browser_name")
-    if browser_name == "chrome":
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--start-maximized")
-        driver = webdriver.Chrome(options=chrome_options)
-    elif browser_name == "firefox":
-        firefox_options = webdriver.FirefoxOptions()
-        firefox_options.add_argument("--start-maximized")
-        driver = webdriver.Firefox(options=firefox_options)
-
-    # Passing the driver to the request parameters,
-    # in order to be used by the test classes. The driver will be then
-    # yielded until the test executions have ended.
+    # Setting up the browser to be used, or reusing the session browser
+    reuse_session = request.config.getoption("reuse_session")
+    profile_dir = None
+    if reuse_session:
+        driver = request.getfixturevalue("browser_session")
+    else:
+        driver, profile_dir = _launch_browser(request.config)
+
+    # Passing the driver to the request parameters, in order to be used by
+    # the test classes (each worker process owns its driver). The driver will
+    # be then yielded until the test executions have ended.
     request.cls.driver = driver
+    request.cls.reuse_page = reuse_session
+    request.cls.native_form_fill = request.config.getoption("native_form_fill")
     yield
-    driver.close()
+    if not reuse_session:
+        driver.close()
+        remove_profile_copy(profile_dir)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    PyTest's method used to record the WebDriver commands issued by the test
+    and to fail the test when it exceeds its command budget.
+    """
+    command_profiler.start_test(item.nodeid)
+    try:
+        result = yield
+    finally:
+        command_profiler.stop_test()
+    budget_marker = item.get_closest_marker(COMMAND_BUDGET_MARKER)
+    if budget_marker is not None:
+        max_commands = budget_marker.args[0]
+        command_count = command_profiler.get_command_count(item.nodeid)
+        if command_count > max_commands:
+            command_counts = ", ".join(
+                f"{command}: {command_data['count']}"
+                for command, command_data in command_profiler.get_summary(
+                    item.nodeid
+                ).items()
+            )
+            pytest.fail(
+                f"{command_count} WebDriver commands issued, the budget is "
+                f"{max_commands} ({command_counts})"
+            )
+    return result
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    PyTest's method used to replay the cached pass of a test whose inputs did
+    not change (--result_cache), instead of calling the test function. The
+    setup and the teardown of the fixtures still run as usual.
+    """
+    cache_entry = result_cache.lookup(pyfuncitem)
+    if cache_entry is None:
+        return None
+    pyfuncitem.stash[RESULT_CACHE_ENTRY] = cache_entry
+    return True
+
+
+def pytest_report_teststatus(report, config):
+    """
+    PyTest's method used to show the replayed passes as "cached" results.
+    """
+    if report.when == "call" and is_cached_report(report):
+        return "cached", "c", ("CACHED", {"green": True})
+
+
+def pytest_runtest_logreport(report):
+    """
+    PyTest's method used to write the outcome and the duration of every test
+    (and data row) to the results history; the test functions of the cached
+    passes are not called, so their calls are not recorded.
+    """
+    if is_cached_report(report):
+        return
+    results_history.record_phase(
+        report.nodeid,
+        report.when,
+        report.outcome,
+        report.duration,
+        hasattr(report, "wasxfail"),
+    )
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item):
     """
     Method used to extend the PyTest Plugin to take
-    and embed a screenshot in html report, whenever a test fails.
+    and embed a screenshot in html report, whenever a test fails,
+    and to embed the action timings of the test (--action_timing);
+    the call of a replayed test is marked as a cached pass.
     """
     pytest_html = item.config.pluginmanager.getplugin("html")
     outcome = yield
     report = outcome.get_result()
+    cache_entry = item.stash.get(RESULT_CACHE_ENTRY, None)
+    if report.when == "call" and cache_entry is not None:
+        report.user_properties.append((RESULT_CACHE_PROPERTY, cache_entry["passed_at"]))
+        if pytest_html:
+            report.extras = getattr(report, "extras", []) + [
+                pytest_html.extras.html(_cached_result_html(cache_entry))
+            ]
+    result_cache.record_report(item, report)
     extra = getattr(report, "extra", [])
 
     if report.when == "call" or report.when == "setup":
         xfail = hasattr(report, "wasxfail")
         if (report.skipped and xfail) or (report.failed and not xfail):
-            file_name = report.nodeid.replace("::", "_") + ".png"
-            _capture_screenshot(file_name)
-            if file_name:
+            screenshot_paths = _capture_screenshot(
+                getattr(item.cls, "driver", None), report.nodeid
+            )
+            if screenshot_paths:
                 html = (
                     '<div><img src="%s" alt="screenshot" style="width:304px;height:228px;" '
-                    'onclick="window.open(this.src)" align="right"/></div>' % file_name
+                    'onclick="window.open(\'%s\')" align="right"/></div>'
+                    % tuple(
+                        screenshot_path.replace(os.sep, "/")
+                        for screenshot_path in reversed(screenshot_paths)
+                    )
                 )
                 extra.append(pytest_html.extras.html(html))
+        if report.when == "call" and action_timer.enabled and pytest_html:
+            extra.append(
+                pytest_html.extras.html(
+                    _action_timing_table(action_timer.get_test_records(item.nodeid))
+                )
+            )
         report.extra = extra
 
 
-def _capture_screenshot(name):
+def _cached_result_html(cache_entry):
+    """
+    Method used to render the time of the cached pass replayed by a test.
+
+    :param cache_entry: (dict) the result cache entry of the test
+    :return: (str) the html note
+    """
+    return (
+        f"<div>Cached result: passed on {html.escape(cache_entry['passed_at'])}, "
+        f"inputs unchanged since</div>"
+    )
+
+
+def _action_timing_table(action_records):
+    """
+    Method used to render the action timings of a test as a html table.
+
+    :param action_records: (dict) per action: calls, total and own time
+    :return: (str) the html table
+    """
+    table_rows = "".join(
+        f"<tr><td>{html.escape(action_name)}</td><td>{action_data['calls']}</td>"
+        f"<td>{action_data['total'] * 1000:.1f}</td><td>{action_data['own'] * 1000:.1f}</td></tr>"
+        for action_name, action_data in action_records.items()
+    )
+    return (
+        "<div><table><tr><th>Action</th><th>Calls</th><th>Total (ms)</th>"
+        f"<th>Own (ms)</th></tr>{table_rows}</table></div>"
+    )
+
+
+def _capture_screenshot(driver, name):
+    """
+    Method used to capture page screenshots; the image is written to disk
+    in the background.
+
+    :return: (str, str) paths of the image and of its thumbnail, or None
+    """
+    if driver is not None:
+        return screenshot_pipeline.capture(driver, name)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """
+    PyTest html plugin's method used to add the browser cold start
+    times to the summary of the html report.
+    """
+    for browser_name, profile_names, startup_time in startup_statistics.get_records():
+        prefix.append(
+            f"<p>Browser cold start: {browser_name} ({profile_names}) "
+            f"in {startup_time:.3f}s</p>"
+        )
+
+
+def pytest_terminal_summary(terminalreporter):
     """
-    Method used to capture page screenshots.
+    PyTest's method used to add the browser startup, page setup, form fill,
+    WebDriver command and wait latency statistics to the terminal summary.
     """
-    driver.get_screenshot_as_file(name)
+    startup_records = startup_statistics.get_records()
+    if startup_records:
+        terminalreporter.section("browser cold start")
+        for browser_name, profile_names, startup_time in startup_records:
+            terminalreporter.write_line(
+                f"{browser_name} ({profile_names}): {startup_time:.3f}s"
+            )
+
+    setup_summary = page_setup_statistics.get_summary()
+    if setup_summary:
+        terminalreporter.section("page setup time")
+        for setup_mode, setup_data in setup_summary.items():
+            terminalreporter.write_line(
+                f"{setup_mode:>12}: {setup_data['count']:>4} tests, "
+                f"average {setup_data['average']:.3f}s, total {setup_data['total']:.3f}s"
+            )
+
+    if result_cache.is_enabled():
+        terminalreporter.section("result cache")
+        terminalreporter.write_line(
+            f"{result_cache.hits} cached passes replayed, "
+            f"{result_cache.stored} passes stored"
+            + ("" if result_cache.replay else " (full run)")
+        )
+
+    fill_summary = form_fill_statistics.get_summary()
+    if fill_summary:
+        terminalreporter.section("form fill time")
+        for fill_mode, fill_data in fill_summary.items():
+            terminalreporter.write_line(
+                f"{fill_mode:>12}: {fill_data['rows']:>4} rows ({fill_data['fields']} fields), "
+                f"average {fill_data['average']:.3f}s per row, total {fill_data['total']:.3f}s"
+            )
+
+    command_summary = command_profiler.get_summary()
+    if command_summary:
+        terminalreporter.section("top webdriver commands")
+        terminalreporter.write_line(
+            f"{'total (s)':>10} {'max (s)':>9} {'count':>6} {'sent':>9} {'received':>10}  command"
+        )
+        for command, command_data in list(command_summary.items())[:10]:
+            terminalreporter.write_line(
+                f"{command_data['total']:>10.3f} {command_data['max']:>9.3f} "
+                f"{command_data['count']:>6} {command_data['request_size']:>9} "
+                f"{command_data['response_size']:>10}  {command}"
+            )
+
+    screenshot_stats = screenshot_pipeline.get_stats()
+    if screenshot_stats["frames"]:
+        terminalreporter.section("failure screenshots")
+        terminalreporter.write_line(
+            f"{screenshot_stats['frames']} captured, {screenshot_stats['duplicates']} "
+            f"duplicates, {screenshot_stats['files']} files "
+            f"({screenshot_stats['written_bytes']} bytes) in {screenshot_pipeline.output_dir}"
+        )
+
+    wait_summary = wait_statistics.get_summary()
+    if not wait_summary:
+        return
+    terminalreporter.section("wait latency")
+    terminalreporter.write_line(
+        f"{'total (s)':>10} {'max (s)':>9} {'count':>6} {'timeouts':>9} {'polls':>6}  wait"
+    )
+    for wait_name, wait_data in wait_summary.items():
+        terminalreporter.write_line(
+            f"{wait_data['total']:>10.3f} {wait_data['max']:>9.3f} "
+            f"{wait_data['count']:>6} {wait_data['timeouts']:>9} "
+            f"{wait_data['polls']:>6}  {wait_name}"
+        )
@@ -0,0 +1,553 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the test flows of the demo page, shared by the tests of
+test_demopage.py (DemoPage) and by the asynchronous sessions (AsyncDemoPage).
+A flow is a generator which yields every browser action of the page objects
+and receives its result: run_flow() drives it with the synchronous page
+objects, whose actions are already done when yielded, and async_run_flow()
+awaits the coroutines of the asynchronous page objects. The records and test
+data of the page objects are read directly, in both variants.
+"""
+
+import asyncio
+import time
+
+
+class DebugPause:
+    """
+    Class definition for a debug showcase pause, yielded by the flows.
+    """
+
+    def __init__(self, seconds):
+        """
+        Constructor for the class.
+
+        :param seconds: (float) duration of the pause
+        """
+        self.seconds = seconds
+
+
+def run_flow(flow):
+    """
+    Function used to run a flow with the synchronous page objects.
+
+    :param flow: (generator) the flow, built with a DemoPage
+    :return: the value returned by the flow
+    """
+    step_result = None
+    try:
+        while True:
+            flow_step = flow.send(step_result)
+            if isinstance(flow_step, DebugPause):
+                time.sleep(flow_step.seconds)
+                flow_step = None
+            step_result = flow_step
+    except StopIteration as flow_end:
+        return flow_end.value
+
+
+async def async_run_flow(flow):
+    """
+    Function used to run a flow with the asynchronous page objects; the
+    errors of the awaited actions are raised inside the flow.
+
+    :param flow: (generator) the flow, built with an AsyncDemoPage
+    :return: the value returned by the flow
+    """
+    step_result, step_error = None, None
+    while True:
+        try:
+            if step_error is not None:
+                flow_step = flow.throw(step_error)
+            else:
+                flow_step = flow.send(step_result)
+        except StopIteration as flow_end:
+            return flow_end.value
+        step_result, step_error = None, None
+        try:
+            if isinstance(flow_step, DebugPause):
+                await asyncio.sleep(flow_step.seconds)
+            else:
+                step_result = await flow_step
+        except Exception as action_error:
+            step_error = action_error
+
+
+def __verify__(condition, log, error_message):
+    """
+    Helper method used to assert a verification of a flow, logging its failure.
+
+    :param condition: (bool) the verification result
+    :param log: the logging object used to log the messages
+    :param error_message: (str) the message logged and raised on failure
+    """
+    if condition is not True:
+        log.error(error_message)
+        raise AssertionError(error_message)
+
+
+def verify_text_in_all_items(demopage_obj, text_item, logger):
+    """
+    Local method used to verify that a specific text is present in
+    all specified page objects.
+
+    :param demopage_obj: the demopage class used to execute page operations
+    :param text_item: the required text to be found in the specified objects
+    :param logger: object for the test logger
+    :return: (bool) verification result
+    """
+
+    # Read the required text from the screen, in a single browser round trip
+    required_texts = yield demopage_obj.read_all_items_text()
+    logger.info(
+        f"Button text: {required_texts[0]}, "
+        f"Read only field text: {required_texts[1]}, "
+        f"Paragraph text: {required_texts[2]}"
+    )
+
+    # Verify that the text item exists in all the required texts
+    return all(text_item in text_elem for text_elem in required_texts)
+
+
+def verify_displayed_progress_value(
+    demopage_obj, log, object_type, expected_progress_value
+):
+    """
+    Local method used to verify that the progress value is correctly displayed
+
+    :param demopage_obj: the demopage class used to execute page operations
+    :param log: the logging object used to log the messages
+    :param object_type: (str) label for the type of value to be verified
+    :param expected_progress_value: (str) text containing the expected value
+    :return: (bool) verification result
+    """
+
+    # Read the displayed progress value, in a single browser round trip
+    if object_type == "slider":
+        detected_progress_value = yield demopage_obj.read_progress_values()
+    else:
+        detected_progress_value = yield demopage_obj.read_meter_values()
+    log_msg = f"Detected value: {detected_progress_value}, expecting value: {expected_progress_value}"
+    log.info(log_msg)
+
+    # Verify that the detected and expected values match
+    return detected_progress_value == expected_progress_value
+
+
+def verify_button_selection_values(
+    demopage_obj, log, expected_button_values, radio_button
+):
+    """
+    Method used to verify the selection values for a radio button
+
+    :param demopage_obj: the demopage class used to execute page operations
+    :param log: the logging object used to log the messages
+    :param expected_button_values: the expected selection values for the radio button
+    :param radio_button: the radio button for which the verification is done
+    :return: (bool) verification result
+    """
+
+    # Retrieve the detected button selection values
+    detected_button_values = yield demopage_obj.verify_radio_button_selected(
+        radio_button
+    )
+    log.info(
+        f"Detected button {radio_button['locator_hook']} selection values = (displayed: {detected_button_values[0]}, "
+        f"enabled: {detected_button_values[1]}, selected: {detected_button_values[2]})"
+    )
+    return detected_button_values == expected_button_values
+
+
+def color_change_demo(demopage, log, data_row, native_form_fill=False):
+    """
+    Flow used to verify the color changing functionality.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    :param data_row: (tuple) the data row of the color_change_demo table
+    :param native_form_fill: (bool) if True, the fields are typed with send_keys
+    """
+    log.info(f"Received data is: {data_row}")
+
+    # Set up the test data
+    color_name, text_input, pre_filled_input, color_to_change = data_row[:4]
+
+    # Execute the text inject operations, in a single form fill
+    if color_to_change:
+        placeholder_input = "Color change will execute"
+    else:
+        placeholder_input = "Color change will skip"
+    placeholder_text = yield demopage.read_placeholder_text()
+    yield demopage.fill_form(
+        {
+            "text_input_field": f"{text_input}: for {color_name}",
+            "pre_filled_text_field": pre_filled_input,
+            "placeholder_text_field": placeholder_input,
+            "text_area": f"{text_input}: {color_name}\n{pre_filled_input}",
+        },
+        native_keys=native_form_fill,
+    )
+
+    # Log the initial and the new placeholder text
+    log.info(
+        f"Initial placeholder text: {placeholder_text}, "
+        f"New placeholder text: {placeholder_input}"
+    )
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(2)
+
+    # If the text in the "Button", "Read-Only Text Field"
+    # and "Paragraph with Text" differs, click on "Button"
+    if not (yield from verify_text_in_all_items(demopage, color_name, log)):
+        yield demopage.click_button()
+
+    # If the text is still not matching in all the above fields,
+    # assert the failure and log the error
+    __verify__(
+        (yield from verify_text_in_all_items(demopage, color_name, log)),
+        log,
+        f"Failed to successfully change the color to {color_name}",
+    )
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Log success message
+    log.info(f"{color_name} color change demo testcase succeeded")
+
+
+def hover_select_by_text(demopage, log):
+    """
+    Flow used to verify the hover menu functionality.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Hover on the menu and click on the required option
+    selected_text = yield demopage.hover_click_option()
+
+    # Read the page dynamic subhead
+    dynamic_subhead = yield demopage.read_dynamic_subhead()
+
+    # Log the selected hovering option and the subhead title
+    log.info(
+        f"Selected Option text: {selected_text}, Dynamic subhead title: {dynamic_subhead}"
+    )
+
+    # If the selected hovering option text is not found in the
+    # subhead title, assert the failure and log the error
+    __verify__(
+        selected_text in dynamic_subhead,
+        log,
+        f"Failed to successfully detect {selected_text} in {dynamic_subhead}",
+    )
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Log success message
+    log.info(f"{selected_text} identified, testcase succeeded")
+
+
+def drag_and_drop(demopage, log):
+    """
+    Flow used to verify the functionality of the CheckBox (revealing of the
+    "Drag and Drop" fields on the page) and the "Drag and Drop" operation.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Click on the checkbox
+    yield demopage.click_checkbox()
+
+    # Verify the drag and drop result and assert an error if the operation fails
+    verif_response, verif_msg = yield demopage.drag_and_drop_picture()
+    for log_msg in verif_msg:
+        log.info(log_msg)
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+    __verify__(verif_response, log, "Drag and drop action failed")
+
+    # Log success message
+    log.info("Drag and drop action executed, testcase succeeded")
+
+
+def iframe_switch(demopage, log):
+    """
+    Flow used to verify the functionality of switching to another frame.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Switch to the iFrame, read the body text and
+    # assert if operation fails
+    verification_response, verification_msg = yield demopage.switch_to_iframes()
+    log.info(verification_msg)
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+    __verify__(verification_response, log, verification_msg)
+
+    # Log success message
+    log.info("iFrame switches executed, testcase succeeded")
+
+
+def input_slider_control(demopage, log):
+    """
+    Flow used to verify the functionality of the input slider control.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Retrieve the initial progress label and bar values
+    object_data = demopage.get_slider_data()
+    object_type = object_data["object_type"]
+    progress_label_data = demopage.get_progress_label_data()
+    expected_label_value = progress_label_data["start_progress_value"]
+    progress_bar_data = demopage.get_progress_bar_data()
+    expected_bar_value = progress_bar_data["start_progress_value"]
+
+    # Verify that the initial values are correctly registered, or
+    # assert and log an error
+    expected_value = (expected_label_value, expected_bar_value)
+    __verify__(
+        (
+            yield from verify_displayed_progress_value(
+                demopage, log, object_type, expected_value
+            )
+        ),
+        log,
+        "Progress not correctly registered",
+    )
+
+    # Move the input slider control
+    yield demopage.move_slider_control()
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Retrieve the final progress label and bar values
+    expected_label_value = progress_label_data["end_progress_value"]
+    expected_bar_value = progress_bar_data["end_progress_value"]
+
+    # Verify that the final values are correctly registered, or
+    # assert and log an error
+    expected_value = (expected_label_value, expected_bar_value)
+    __verify__(
+        (
+            yield from verify_displayed_progress_value(
+                demopage, log, object_type, expected_value
+            )
+        ),
+        log,
+        "Progress not correctly registered",
+    )
+
+    # Log success message
+    log.info("Progress correctly registered, testcase succeeded")
+
+
+def select_dropdown_by_option_value(demopage, log):
+    """
+    Flow used to verify the select dropdown menu functionality.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Read the dropdown menu data and displayed selected option
+    object_data = demopage.get_select_dropdown_data()
+    object_type = object_data["object_type"]
+    expected_dropdown_option = object_data["custom_field1"]
+
+    # Retrieve the initial meter label and bar values
+    meter_label_data = demopage.get_meter_label_data()
+    expected_label_value = meter_label_data["start_progress_value"]
+    meter_bar_data = demopage.get_meter_bar_data()
+    expected_bar_value = meter_bar_data["start_progress_value"]
+
+    # Verify that the initial option and values are correctly registered,
+    # or assert and log an error
+    expected_value = (
+        expected_dropdown_option,
+        expected_label_value,
+        expected_bar_value,
+    )
+    __verify__(
+        (
+            yield from verify_displayed_progress_value(
+                demopage, log, object_type, expected_value
+            )
+        ),
+        log,
+        "Progress not correctly registered",
+    )
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Click on the select menu and choose on the required option
+    selected_option = yield demopage.select_click_option()
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Log the selected option
+    log.info(f"Selected Option value: {selected_option}")
+
+    # Retrieve the final progress label and bar values
+    expected_dropdown_option = object_data["custom_field2"]
+    expected_label_value = meter_label_data["end_progress_value"]
+    expected_bar_value = meter_bar_data["end_progress_value"]
+
+    # Verify that the final values are correctly registered,
+    # or assert and log an error
+    expected_value = (
+        expected_dropdown_option,
+        expected_label_value,
+        expected_bar_value,
+    )
+    __verify__(
+        (
+            yield from verify_displayed_progress_value(
+                demopage, log, object_type, expected_value
+            )
+        ),
+        log,
+        "Progress not correctly registered",
+    )
+
+    # Log success message
+    log.info("Progress correctly registered, testcase succeeded")
+
+
+def html_svg_rectangle(demopage, log):
+    """
+    Flow used to verify the functionality of the HTML SVG rectangle responsiveness.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Retrieve the HTML SVG rectangle data
+    html_svg_rect_data = demopage.get_html_svg_rect_data()
+    max_width_px = float(html_svg_rect_data["max_width_px"].split("px")[0])
+    log.info(f"Maximum HTML SVG rectangle width: {max_width_px}")
+
+    # Wait for the HTML SVG rectangle to reach max width
+    yield demopage.wait_for_html_svg_rect_width(html_svg_rect_data["max_width_px"])
+    html_svg_rect_width = float(
+        (yield demopage.read_html_svg_rect_width()).split("px")[0]
+    )
+    log.info(f"Initial HTML SVG rectangle width: {html_svg_rect_width}")
+    __verify__(
+        html_svg_rect_width == max_width_px,
+        log,
+        f"HTML SVG failed to reach max width of {max_width_px}",
+    )
+
+    # Click the HTML SVG rectangle and verify its responsiveness by having its width changed
+    yield demopage.click_html_svg_rect()
+    html_svg_rect_width = float(
+        (yield demopage.read_html_svg_rect_width()).split("px")[0]
+    )
+    log.info(f"Modified HTML SVG rectangle width: {html_svg_rect_width}")
+    __verify__(
+        html_svg_rect_width < max_width_px,
+        log,
+        "HTML SVG failed to change its width, responsiveness test failed",
+    )
+
+    # Log success message
+    log.info("HTML SVG Rectangle width changed, testcase succeeded")
+
+
+def radio_button_selection(demopage, log):
+    """
+    Flow used to verify the radio button selection functionality.
+
+    :param demopage: the page objects of the session
+    :param log: the logging object used to log the messages
+    """
+
+    # Retrieve the radio buttons data
+    radio_button1 = demopage.get_radio_button1_data()
+    radio_button2 = demopage.get_radio_button2_data()
+
+    # Verify the initial selection values of both buttons
+    for radio_button in (radio_button1, radio_button2):
+        expected_button_values = (
+            radio_button["is_displayed"],
+            radio_button["is_enabled"],
+            radio_button["is_selected"],
+        )
+        __verify__(
+            (
+                yield from verify_button_selection_values(
+                    demopage, log, expected_button_values, radio_button
+                )
+            ),
+            log,
+            f"Button {radio_button['locator_hook']} selection expected: {expected_button_values}",
+        )
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Click on radio button2
+    yield demopage.click_radio_button(radio_button2)
+
+    # If the debug_showcase flag is True, pause for a few seconds
+    if demopage.get_debug_showcase():
+        yield DebugPause(3)
+
+    # Verify the final selection values of both buttons
+    for radio_button in (radio_button1, radio_button2):
+        expected_button_values = (
+            radio_button["is_displayed"],
+            radio_button["is_enabled"],
+            not radio_button["is_selected"],
+        )
+        __verify__(
+            (
+                yield from verify_button_selection_values(
+                    demopage, log, expected_button_values, radio_button
+                )
+            ),
+            log,
+            f"Button {radio_button['locator_hook']} selection expected: {expected_button_values}",
+        )
+
+    # Log success message
+    log.info("Radio buttons selection changed, testcase succeeded")
+
+
+# Flows of the demo page, indexed by the name of their test in test_demopage.py
+DEMOPAGE_FLOWS = {
+    "test_color_change_demo": color_change_demo,
+    "test_hover_select_by_text": hover_select_by_text,
+    "test_drag_and_drop": drag_and_drop,
+    "test_iframe_switch": iframe_switch,
+    "test_input_slider_control": input_slider_control,
+    "test_select_dropdown_by_option_value": select_dropdown_by_option_value,
+    "test_html_svg_rectangle": html_svg_rectangle,
+    "test_radio_button_selection": radio_button_selection,
+}
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the helper running sample test modules in a separate pytest
+process, with the hooks of the framework (tests.conftest) loaded as a plugin;
+it is used by the browserless tests of the hooks.
+"""
+
+import os
+import subprocess
+import sys
+
+PROJECT_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_sample_tests(test_folder, *pytest_args):
+    """
+    Function used to run the sample tests of a folder with the framework hooks
+    (the results history is disabled).
+
+    :param test_folder: (Path) folder holding the sample tests, used as working folder
+    :param pytest_args: (str) arguments of the pytest run
+    :return: (CompletedProcess) the finished run, with its captured output
+    """
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-p",
+            "tests.conftest",
+            "--results_history=",
+            *pytest_args,
+        ],
+        cwd=test_folder,
+        env={**os.environ, "PYTHONPATH": PROJECT_FOLDER},
+        capture_output=True,
+        text=True,
+    )
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the smoke test of the asynchronous sessions: the static_dom
+marked flows are run in concurrent sessions of the static DOM WebDriver
+endpoint, served in-process. No browser is required.
+"""
+
+import asyncio
+
+from tests import test_demopage
+from tests.demopage_flows import DEMOPAGE_FLOWS
+from utilities.async_sessions import get_static_dom_flows, run_sessions
+from utilities.static_dom_server import serve
+
+
+async def __run_static_dom_sessions__(session_count, flow_names):
+    """
+    Helper method used to run the flows against an in-process static DOM endpoint.
+
+    :param session_count: (int) number of concurrent sessions
+    :param flow_names: (list) names of the flows (test names)
+    :return: (list) the FlowResult of every flow run
+    """
+    endpoint_url = asyncio.get_running_loop().create_future()
+    server_task = asyncio.create_task(
+        serve(port=0, ready_callback=endpoint_url.set_result)
+    )
+    try:
+        return await run_sessions(
+            await asyncio.wait_for(endpoint_url, 10), session_count, flow_names
+        )
+    finally:
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
+
+
+def test_flows_match_the_demo_page_tests():
+    """
+    Test case used to verify that every test of TestDemoPage has its flow.
+    """
+    test_names = [
+        name for name in vars(test_demopage.TestDemoPage) if name.startswith("test_")
+    ]
+    assert list(DEMOPAGE_FLOWS) == test_names
+    assert get_static_dom_flows()
+
+
+def test_static_dom_flows_in_concurrent_sessions():
+    """
+    Test case used to verify that the static_dom marked flows pass in
+    concurrent sessions of the static DOM endpoint.
+    """
+    flow_names = get_static_dom_flows()
+    flow_results = asyncio.run(__run_static_dom_sessions__(2, flow_names))
+    assert [flow_result.error for flow_result in flow_results] == [None] * (
+        2 * len(flow_names)
+    )
+    assert all(flow_result.passed for flow_result in flow_results)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the tests of the parallel runner helpers: the split of the
+tests between the workers, the worker command line and the merge of the worker
+JUnit reports and logs. No browser and no worker process are required.
+"""
+
+import os
+from types import SimpleNamespace
+import xml.etree.ElementTree as ElementTree
+
+from utilities.parallel_runner import (
+    __merge_junit_reports__,
+    __merge_log_files__,
+    __worker_arguments__,
+    select_shard,
+)
+
+SAMPLE_ITEMS = [
+    SimpleNamespace(nodeid=f"tests/test_sample.py::test_{index}") for index in range(5)
+]
+
+WORKER_REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">{test_cases}</testsuite></testsuites>
+"""
+
+
+def __nodeids__(items):
+    """
+    Helper method used to list the node ids of the items.
+    """
+    return [item.nodeid for item in items]
+
+
+def test_select_shard_round_robin():
+    """
+    Test case used to verify that, without durations, every n-th test goes to
+    the same worker and that every test is selected by exactly one worker.
+    """
+    selected_items, deselected_items = select_shard(SAMPLE_ITEMS, 1, 2)
+    assert __nodeids__(selected_items) == __nodeids__(SAMPLE_ITEMS[1::2])
+    assert __nodeids__(deselected_items) == __nodeids__(SAMPLE_ITEMS[0::2])
+
+
+def test_select_shard_by_duration():
+    """
+    Test case used to verify that the known durations balance the workers
+    and that the selected tests keep the collection order.
+    """
+    expected_durations = {
+        SAMPLE_ITEMS[0].nodeid: 10.0,
+        SAMPLE_ITEMS[1].nodeid: 1.0,
+        SAMPLE_ITEMS[2].nodeid: 4.0,
+        SAMPLE_ITEMS[3].nodeid: 4.0,
+        SAMPLE_ITEMS[4].nodeid: 1.0,
+    }
+    shards = [
+        __nodeids__(select_shard(SAMPLE_ITEMS, shard_index, 2, expected_durations)[0])
+        for shard_index in range(2)
+    ]
+    assert shards == [
+        __nodeids__(SAMPLE_ITEMS[0:1]),
+        __nodeids__(SAMPLE_ITEMS[1:5]),
+    ]
+
+
+def test_worker_arguments(tmp_path):
+    """
+    Test case used to verify that the main run options are dropped (with their
+    values) and that the test paths are made absolute for the workers.
+    """
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_sample.py").write_text("")
+    invocation_args = (
+        "--workers",
+        "2",
+        "--html=report.html",
+        "--junitxml",
+        "report.xml",
+        "--browser_name",
+        "static",
+        "tests/test_sample.py::test_1",
+        "-k",
+        "test_1",
+    )
+    assert __worker_arguments__(invocation_args, str(tmp_path)) == [
+        "--browser_name",
+        "static",
+        os.path.join(str(tmp_path), "tests/test_sample.py::test_1"),
+        "-k",
+        "test_1",
+    ]
+    assert __worker_arguments__(("-q",), str(tmp_path)) == ["-q", str(tmp_path)]
+
+
+def test_merge_junit_reports(tmp_path):
+    """
+    Test case used to verify that the worker reports are merged into one suite,
+    with the totals of the workers and the worker of every test case.
+    """
+    worker_reports = dict()
+    for worker_id, test_cases in (
+        (
+            "worker0",
+            '<testcase classname="test_sample" name="test_1" time="1.5"/>'
+            '<testcase classname="test_sample" name="test_2" time="0.5">'
+            "<failure/></testcase>",
+        ),
+        (
+            "worker1",
+            '<testcase classname="test_sample" name="test_3" time="2">'
+            "<skipped/></testcase>",
+        ),
+    ):
+        worker_reports[worker_id] = str(tmp_path / f"{worker_id}.xml")
+        with open(worker_reports[worker_id], "w") as f:
+            f.write(WORKER_REPORT.format(test_cases=test_cases))
+    worker_reports["worker2"] = str(tmp_path / "missing.xml")
+    merged_report_path = str(tmp_path / "report.xml")
+    merged_results = __merge_junit_reports__(worker_reports, merged_report_path)
+    assert merged_results == [
+        {
+            "test": "test_sample::test_1",
+            "outcome": "passed",
+            "duration": 1.5,
+            "worker": "worker0",
+        },
+        {
+            "test": "test_sample::test_2",
+            "outcome": "failure",
+            "duration": 0.5,
+            "worker": "worker0",
+        },
+        {
+            "test": "test_sample::test_3",
+            "outcome": "skipped",
+            "duration": 2.0,
+            "worker": "worker1",
+        },
+    ]
+    merged_suite = ElementTree.parse(merged_report_path).getroot().find("testsuite")
+    assert {
+        total_name: merged_suite.get(total_name)
+        for total_name in ("tests", "failures", "errors", "skipped", "time")
+    } == {
+        "tests": "3",
+        "failures": "1",
+        "errors": "0",
+        "skipped": "1",
+        "time": "4.000",
+    }
+    assert [
+        test_case.find("properties/property").get("value")
+        for test_case in merged_suite.iter("testcase")
+    ] == ["worker0", "worker0", "worker1"]
+
+
+def test_merge_log_files(tmp_path):
+    """
+    Test case used to verify that the worker logs are merged in time order,
+    with the continuation lines kept after their record.
+    """
+    worker_logs = {
+        "worker0": "2024-01-01 12:00:00,100 first\n"
+        "Traceback (most recent call last):\n"
+        "2024-01-01 12:00:00,300 third\n",
+        "worker1": "2024-01-01 12:00:00,200 second\n",
+    }
+    worker_dirs = dict()
+    for worker_id, log_text in worker_logs.items():
+        worker_dirs[worker_id] = tmp_path / worker_id
+        worker_dirs[worker_id].mkdir()
+        (worker_dirs[worker_id] / "logfile.log").write_text(log_text)
+    merged_log_path = tmp_path / "logfile.log"
+    __merge_log_files__(worker_dirs, str(merged_log_path))
+    assert merged_log_path.read_text().splitlines() == [
+        "[worker0] 2024-01-01 12:00:00,100 first",
+        "[worker0] Traceback (most recent call last):",
+        "[worker1] 2024-01-01 12:00:00,200 second",
+        "[worker0] 2024-01-01 12:00:00,300 third",
+    ]
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the tests of the result cache replay: the hooks of the
+framework are loaded in a separate pytest run of a sample module, in which the
+executed and the replayed tests alternate across two test classes. No browser
+is required.
+"""
+
+import os
+
+from tests.framework_runs import run_sample_tests
+from utilities.result_cache import get_input_sources
+
+SAMPLE_TESTS = """
+import pytest
+
+
+@pytest.fixture(scope="class")
+def class_events(request):
+    with open("events.txt", "a") as f:
+        f.write(f"setup {request.cls.__name__}\\n")
+    yield
+    with open("events.txt", "a") as f:
+        f.write(f"teardown {request.cls.__name__}\\n")
+
+
+@pytest.mark.usefixtures("class_events")
+class TestFirst:
+    def test_1(self):
+        pass
+
+    def test_2(self):
+        pass
+
+
+@pytest.mark.usefixtures("class_events")
+class TestSecond:
+    def test_3(self):
+        pass
+
+    def test_4(self):
+        pass
+"""
+
+
+def __run_sample_tests__(test_folder, *pytest_args):
+    """
+    Helper method used to run the sample tests with the result cache enabled.
+
+    :param test_folder: (Path) folder holding the sample tests
+    :param pytest_args: (str) additional arguments of the pytest run
+    :return: (CompletedProcess, list) the finished run and the class fixture events
+    """
+    events_path = test_folder / "events.txt"
+    if events_path.exists():
+        events_path.unlink()
+    completed_run = run_sample_tests(
+        test_folder, "--result_cache", "--file_order", "test_sample.py", *pytest_args
+    )
+    return completed_run, events_path.read_text().splitlines()
+
+
+def test_replayed_tests_tear_down_the_previous_fixtures(tmp_path):
+    """
+    Test case used to verify that a replayed test tears down the class fixtures
+    of the previous tests, so that the next executed test can be set up.
+    """
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS)
+    first_run, _ = __run_sample_tests__(tmp_path, "-k", "test_2 or test_3")
+    assert first_run.returncode == 0, first_run.stdout
+    second_run, class_events = __run_sample_tests__(tmp_path)
+    assert second_run.returncode == 0, second_run.stdout
+    assert "2 passed, 2 cached" in second_run.stdout
+    assert class_events == [
+        "setup TestFirst",
+        "teardown TestFirst",
+        "setup TestSecond",
+        "teardown TestSecond",
+    ]
+
+
+def test_locator_option_changes_the_cached_inputs(tmp_path):
+    """
+    Test case used to verify that the passes cached with the fastest locators
+    are not replayed with the original locators.
+    """
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS)
+    first_run, _ = __run_sample_tests__(tmp_path)
+    assert first_run.returncode == 0, first_run.stdout
+    second_run, _ = __run_sample_tests__(tmp_path, "--original_locators")
+    assert second_run.returncode == 0, second_run.stdout
+    assert "4 passed in" in second_run.stdout
+    third_run, _ = __run_sample_tests__(tmp_path)
+    assert "4 cached" in third_run.stdout
+
+
+def test_cached_inputs_include_the_page_sources():
+    """
+    Test case used to verify that the page object modules, the shared test flows
+    and the javascript helpers are part of the cached inputs.
+    """
+    source_names = {os.path.basename(path) for path in get_input_sources()}
+    assert {
+        "demopage_base.py",
+        "element_cache.py",
+        "form_fill.py",
+        "locator.py",
+        "wait_engine.py",
+        "demopage_flows.py",
+        "form_filler.js",
+        "page_state_snapshot.js",
+    } <= source_names
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the tests of the screenshot thumbnails built without
+Pillow: sample PNG images are encoded with every scanline filter and
+downscaled by the PNG decoder of the framework. No browser is required.
+"""
+
+import struct
+import zlib
+
+import pytest
+
+from utilities.screenshots import PNG_SIGNATURE, downscale_png, recompress_png
+
+
+def __paeth__(left, up, upper_left):
+    """
+    Helper method used to compute the Paeth predictor of a byte.
+    """
+    estimate = left + up - upper_left
+    distances = [abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)]
+    return (left, up, upper_left)[distances.index(min(distances))]
+
+
+def __encode_png__(pixels, width, pixel_size, filter_type):
+    """
+    Helper method used to encode an 8 bit PNG image with a single scanline filter.
+
+    :param pixels: (list) the scanlines, as bytes
+    :param width: (int) width of the image, in pixels
+    :param pixel_size: (int) bytes per pixel (3: RGB, 4: RGBA)
+    :param filter_type: (int) the PNG filter type (0 to 4)
+    :return: (bytes) the PNG image
+    """
+    predictors = {
+        0: lambda left, up, upper_left: 0,
+        1: lambda left, up, upper_left: left,
+        2: lambda left, up, upper_left: up,
+        3: lambda left, up, upper_left: (left + up) >> 1,
+        4: __paeth__,
+    }
+    scanlines, previous_row = list(), bytes(len(pixels[0]))
+    for row in pixels:
+        filtered_row = bytearray([filter_type])
+        for i, value in enumerate(row):
+            left = row[i - pixel_size] if i >= pixel_size else 0
+            upper_left = previous_row[i - pixel_size] if i >= pixel_size else 0
+            predictor = predictors[filter_type](left, previous_row[i], upper_left)
+            filtered_row.append((value - predictor) & 255)
+        scanlines.append(bytes(filtered_row))
+        previous_row = row
+    header = struct.pack(
+        ">IIBBBBB", width, len(pixels), 8, {3: 2, 4: 6}[pixel_size], 0, 0, 0
+    )
+    chunks = [
+        (b"IHDR", header),
+        (b"IDAT", zlib.compress(b"".join(scanlines))),
+        (b"IEND", b""),
+    ]
+    return PNG_SIGNATURE + b"".join(
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+        for kind, data in chunks
+    )
+
+
+def __decode_pixels__(png_bytes, pixel_size):
+    """
+    Helper method used to read the pixels of a PNG image encoded without filters.
+
+    :return: (tuple) width, height and scanlines of the image
+    """
+    width, height = struct.unpack(">II", png_bytes[16:24])
+    image_data = zlib.decompress(png_bytes[41:-12])
+    row_length = width * pixel_size
+    scanlines = [
+        image_data[y * (row_length + 1) : (y + 1) * (row_length + 1)]
+        for y in range(height)
+    ]
+    assert all(scanline[0] == 0 for scanline in scanlines)
+    return width, height, [scanline[1:] for scanline in scanlines]
+
+
+@pytest.mark.parametrize("pixel_size", [3, 4])
+@pytest.mark.parametrize("filter_type", [0, 1, 2, 3, 4])
+def test_downscale_png(filter_type, pixel_size):
+    """
+    Test case used to verify that the decoder reverses every scanline filter
+    and keeps every n-th pixel of every n-th scanline.
+    """
+    width, height = 20, 9
+    pixels = [
+        bytes(
+            (x * 13 + y * 7 + channel * 50) % 256
+            for x in range(width)
+            for channel in range(pixel_size)
+        )
+        for y in range(height)
+    ]
+    png_bytes = __encode_png__(pixels, width, pixel_size, filter_type)
+    thumbnail = downscale_png(png_bytes, max_size=(8, 8))
+    thumbnail_width, thumbnail_height, scanlines = __decode_pixels__(
+        thumbnail, pixel_size
+    )
+    assert (thumbnail_width, thumbnail_height) == (7, 3)
+    assert scanlines == [
+        b"".join(
+            pixels[y][x * pixel_size : (x + 1) * pixel_size] for x in range(0, width, 3)
+        )
+        for y in range(0, height, 3)
+    ]
+    assert downscale_png(recompress_png(png_bytes), max_size=(8, 8)) == thumbnail
+
+
+def test_downscale_png_unsupported_images():
+    """
+    Test case used to verify that the images of an unsupported format are not downscaled.
+    """
+    png_bytes = __encode_png__([bytes(3)], 1, 3, 0)
+    sixteen_bit_header = png_bytes[:24] + b"\x10" + png_bytes[25:]
+    assert downscale_png(b"GIF89a") is None
+    assert downscale_png(sixteen_bit_header) is None
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the tests of the static DOM engine: the html parsing, the
+supported, unsupported and rejected CSS selector and XPath syntax, the locator
+pre-flight and the resolution of the locator tables against the local demo page.
+No browser is required.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from tests.framework_runs import run_sample_tests
+from utilities.locator_optimizer import LocatorCost, write_locator_costs
+from utilities.locator_preflight import (
+    INVALID,
+    LOCATOR_ERRORS,
+    UNSUPPORTED,
+    validate_locators,
+)
+from utilities.static_dom import (
+    SelectorError,
+    UnsupportedSelectorError,
+    compile_locator,
+    find_elements,
+    parse_html,
+)
+from utilities.static_dom_driver import get_local_page_path
+
+SAMPLE_PAGE = """
+<html><head><title>Sample</title><style>p { color: red; }</style></head>
+<body>
+<div id="main" class="box wide" data-role="panel">
+    <p id="first" class="text">First <b>paragraph</b></p>
+    <p id="second" class="text note" lang="en-US">Second</p>
+    <ul>
+        <li>One<li>Two<li>Three
+    </ul>
+    <input type="radio" id="radio1" name="group" checked>
+    <input type="radio" id="radio2" name="group">
+    <input type="text" id="disabledField" disabled>
+    <select id="choice"><option value="a">A</option><option value="b" selected>B</option></select>
+    <a href="#top" id="link">Back to top</a>
+</div>
+<div id="hiddenBox" style="display: none"><span id="hiddenText">Hidden</span></div>
+</body></html>
+"""
+
+
+STATIC_TIER_TESTS = """
+from utilities.baseclass import BaseClass
+
+
+def test_browserless():
+    pass
+
+
+class TestBrowser(BaseClass):
+    def test_page(self):
+        pass
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_document():
+    """
+    Setup method used to parse the sample page once for the module.
+    """
+    return parse_html(SAMPLE_PAGE)
+
+
+def __element_ids__(nodes):
+    """
+    Helper method used to identify the matched elements.
+
+    :param nodes: (list) the matched elements
+    :return: (list) the ids of the elements (their tag if they have no id)
+    """
+    return [node.attributes.get("id", node.tag) for node in nodes]
+
+
+def test_parse_html_builds_the_tree(sample_document):
+    """
+    Test case used to verify the parsed tree: implicitly closed items, text and state.
+    """
+    list_items = find_elements(sample_document, "tag name", "li")
+    assert [item.text_content().strip() for item in list_items] == [
+        "One",
+        "Two",
+        "Three",
+    ]
+    first_paragraph = find_elements(sample_document, "id", "first")[0]
+    assert first_paragraph.visible_text() == "First paragraph"
+    assert find_elements(sample_document, "id", "radio1")[0].is_selected()
+    assert not find_elements(sample_document, "id", "disabledField")[0].is_enabled()
+    assert not find_elements(sample_document, "id", "hiddenText")[0].is_displayed()
+    assert find_elements(sample_document, "id", "choice")[0].get_value() == "b"
+
+
+@pytest.mark.parametrize(
+    "selector, expected_ids",
+    [
+        ("#first", ["first"]),
+        ("p.text", ["first", "second"]),
+        (".text.note", ["second"]),
+        ("div#main > p", ["first", "second"]),
+        ("#main b", ["b"]),
+        ("#first + p", ["second"]),
+        ("#first ~ input", ["radio1", "radio2", "disabledField"]),
+        ("[data-role]", ["main"]),
+        ("[data-role='panel']", ["main"]),
+        ('[class~="wide"]', ["main"]),
+        ("[href^='#']", ["link"]),
+        ("[lang|=en]", ["second"]),
+        ("[id$=Field]", ["disabledField"]),
+        ("[id*=idden]", ["hiddenBox", "hiddenText"]),
+        ("li:nth-child(2)", ["li"]),
+        ("li:first-child, li:last-child", ["li", "li"]),
+        ("ul > li:nth-child(odd)", ["li", "li"]),
+        ("input:checked", ["radio1"]),
+        ("input:disabled", ["disabledField"]),
+        ("option:selected", ["option"]),
+        ("#main > p:nth-of-type(2)", ["second"]),
+    ],
+)
+def test_supported_css_selectors(sample_document, selector, expected_ids):
+    """
+    Test case used to verify the supported CSS selector syntax.
+    """
+    assert __element_ids__(
+        find_elements(sample_document, "css selector", selector)
+    ) == (expected_ids)
+
+
+@pytest.mark.parametrize(
+    "expression, expected_ids",
+    [
+        ("//*[@id='first']", ["first"]),
+        ("//p", ["first", "second"]),
+        ("/html/body/div/p[2]", ["second"]),
+        ("//ul/li[last()]", ["li"]),
+        ("//input[@checked]", ["radio1"]),
+        ("//p[@class='text' and @id='first']", ["first"]),
+        ("//p[contains(@class, 'note')]", ["second"]),
+        ("//a[starts-with(@href, '#')]", ["link"]),
+        ("//p[text()='Second']", ["second"]),
+        ("//p[normalize-space()='First paragraph']", ["first"]),
+        ("//b/..", ["first"]),
+        ("//span | //b", ["b", "hiddenText"]),
+        ("//div[@id='main']//option[@selected]", ["option"]),
+    ],
+)
+def test_supported_xpath_expressions(sample_document, expression, expected_ids):
+    """
+    Test case used to verify the supported XPath syntax.
+    """
+    assert __element_ids__(find_elements(sample_document, "xpath", expression)) == (
+        expected_ids
+    )
+
+
+def test_other_locator_strategies(sample_document):
+    """
+    Test case used to verify the id, name, class, tag and link text strategies.
+    """
+    assert __element_ids__(find_elements(sample_document, "name", "group")) == [
+        "radio1",
+        "radio2",
+    ]
+    assert __element_ids__(find_elements(sample_document, "class name", "note")) == [
+        "second"
+    ]
+    assert __element_ids__(
+        find_elements(sample_document, "link text", "Back to top")
+    ) == ["link"]
+    assert __element_ids__(
+        find_elements(sample_document, "partial link text", "to top")
+    ) == ["link"]
+    main_box = find_elements(sample_document, "id", "main")[0]
+    assert __element_ids__(find_elements(main_box, "css selector", "p.note")) == [
+        "second"
+    ]
+    assert __element_ids__(find_elements(main_box, "xpath", ".//b")) == ["b"]
+
+
+@pytest.mark.parametrize(
+    "locator_by, locator_hook",
+    [
+        ("css selector", ""),
+        ("css selector", "> p"),
+        ("css selector", "p,"),
+        ("css selector", "#"),
+        ("css selector", "li:nth-child(x)"),
+        ("css selector", "p:unknown-state"),
+        ("css selector", "p!"),
+        ("xpath", ""),
+        ("xpath", "//p["),
+        ("xpath", "(//p"),
+        ("xpath", "//p[@@id]"),
+        ("xpath", "//p/@id"),
+        ("xpath", "//p/text()"),
+        ("xpath", "//p | "),
+        ("link", "Back to top"),
+    ],
+)
+def test_rejected_locators(locator_by, locator_hook):
+    """
+    Test case used to verify that the locators the browsers reject are invalid.
+    """
+    with pytest.raises(SelectorError) as selector_error:
+        compile_locator(locator_by, locator_hook)
+        find_elements(parse_html(SAMPLE_PAGE), locator_by, locator_hook)
+    assert not isinstance(selector_error.value, UnsupportedSelectorError)
+
+
+@pytest.mark.parametrize(
+    "locator_by, locator_hook",
+    [
+        ("css selector", "p:hover"),
+        ("css selector", "p:not(.note)"),
+        ("css selector", "li:not(:nth-child(2))"),
+        ("css selector", "a::before"),
+        ("css selector", "[lang='EN-us' i]"),
+        ("css selector", "svg|rect"),
+        ("xpath", "(//input)[2]"),
+        ("xpath", "//p[@id='first' or @id='second']"),
+        ("xpath", "//p[position() > 1]"),
+        ("xpath", "//p/following-sibling::input"),
+        ("xpath", "//input[not(@checked)]"),
+    ],
+)
+def test_unsupported_locators(locator_by, locator_hook):
+    """
+    Test case used to verify that the valid locators using a syntax not
+    supported by the static DOM are reported as unsupported.
+    """
+    with pytest.raises(UnsupportedSelectorError):
+        compile_locator(locator_by, locator_hook)
+
+
+def test_preflight_reports_unsupported_locators_as_warnings(tmp_path):
+    """
+    Test case used to verify the classification of the pre-flight issues: the
+    unsupported locators are warnings, the invalid ones and the invalid fastest
+    strategies of the locator costs database are errors.
+    """
+    database_path = str(tmp_path / "locators.db")
+    with sqlite3.connect(database_path) as connection:
+        connection.execute(
+            "CREATE TABLE text_fields (name TEXT, locator_type TEXT, locator_hook TEXT)"
+        )
+        connection.executemany(
+            "INSERT INTO text_fields VALUES (?, ?, ?)",
+            [
+                ("text_input", "CSS_SELECTOR", "#myTextInput"),
+                ("second_input", "XPATH", "(//input[@type='text'])[2]"),
+                ("broken_input", "XPATH", "//input[@@id]"),
+            ],
+        )
+    connection.close()
+    costs_path = str(tmp_path / "locator_costs.db")
+    write_locator_costs(
+        [
+            LocatorCost(
+                "text_fields",
+                "text_input",
+                "CSS_SELECTOR",
+                "#myTextInput",
+                1.0,
+                "CSS_SELECTOR",
+                "#myTextInput:",
+                0.5,
+            )
+        ],
+        "firefox",
+        path=costs_path,
+    )
+    locator_issues, locator_count = validate_locators(
+        table_names=("text_fields",), path=database_path, costs_path=costs_path
+    )
+    assert locator_count == 4
+    assert {issue.name: issue.problem for issue in locator_issues} == {
+        "second_input": UNSUPPORTED,
+        "broken_input": INVALID,
+        "text_input (fastest)": INVALID,
+    }
+    assert UNSUPPORTED not in LOCATOR_ERRORS
+
+
+def test_local_demo_page_exists():
+    """
+    Test case used to verify that the local demo page of the general table is shipped.
+    """
+    assert os.path.isfile(get_local_page_path())
+
+
+def test_local_demo_page_resolves_all_locators():
+    """
+    Test case used to verify that every locator of the locator tables resolves to
+    a single element of the local demo page (the frame items inside their frame).
+    """
+    locator_issues, locator_count = validate_locators()
+    assert locator_count > 0
+    assert locator_issues == []
+
+
+def test_static_browser_only_skips_the_browser_tests(tmp_path):
+    """
+    Test case used to verify that the static DOM browser only skips the browser
+    tests (the ones using the setup fixture), not the browserless tests.
+    """
+    (tmp_path / "test_sample.py").write_text(STATIC_TIER_TESTS)
+    completed_run = run_sample_tests(
+        tmp_path, "--browser_name", "static", "--file_order", "-rs", "test_sample.py"
+    )
+    assert completed_run.returncode == 0, completed_run.stdout
+    assert "1 passed, 1 skipped" in completed_run.stdout
+    assert "requires a real browser" in completed_run.stdout
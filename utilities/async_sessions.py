@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module runs the test flows of the demo page (tests/demopage_flows.py)
+with the asynchronous page objects (AsyncDemoPage), in many browser sessions
+driven concurrently by a single event loop: every session runs the selected
+flows (with every data row of the data-driven flows) on its own page, through
+one shared HTTP client. The flows are indexed by the tests of TestDemoPage,
+whose markers select the read-only flows run by the static DOM sessions.
+
+Usage (from the project folder, with a WebDriver server or Selenium Grid):
+» python -m utilities.async_sessions --remote_url http://127.0.0.1:4444 --browser_name chrome --sessions 24
+» python -m utilities.async_sessions --browser_name static
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+
+from pageobjects.async_demopage import AsyncDemoPage
+from testdata.data_provider import data_provider
+from tests.demopage_flows import DEMOPAGE_FLOWS, async_run_flow
+from tests.test_demopage import TestDemoPage
+from utilities.async_webdriver import AsyncHttpClient, AsyncWebDriver
+from utilities.launch_profiles import (
+    BROWSER_OPTIONS,
+    BROWSER_STAND_INS,
+    build_browser_options,
+    parse_profile_names,
+    remove_profile_copy,
+)
+from utilities.log_pipeline import log_pipeline, reset_log_context, set_log_context
+from utilities.static_dom_driver import STATIC_DOM_MARKER
+
+# Result of a flow run in a session (data_row is None for the flows with no data)
+FlowResult = namedtuple(
+    "FlowResult",
+    ("session", "flow_name", "data_row", "passed", "duration", "error"),
+)
+
+
+def get_static_dom_flows():
+    """
+    Function used to list the flows run by the static DOM sessions: the ones
+    of the TestDemoPage tests marked with "static_dom".
+
+    :return: (list) names of the flows (test names)
+    """
+    return [
+        flow_name
+        for flow_name in DEMOPAGE_FLOWS
+        if any(
+            test_marker.name == STATIC_DOM_MARKER
+            for test_marker in getattr(
+                getattr(TestDemoPage, flow_name), "pytestmark", []
+            )
+        )
+    ]
+
+
+def get_flow_runs(flow_names):
+    """
+    Function used to list the flow runs of a session: one per flow, or one per
+    data row for the data-driven flows.
+
+    :param flow_names: (list) names of the flows (test names)
+    :return: (list) tuples of (flow name, data row id, data row)
+    """
+    unknown_names = [name for name in flow_names if name not in DEMOPAGE_FLOWS]
+    if unknown_names:
+        raise ValueError(
+            f"Unknown flow(s): {', '.join(unknown_names)}, "
+            f"expected one of: {', '.join(DEMOPAGE_FLOWS)}"
+        )
+    data_tables = data_provider.get_data_tables()
+    flow_runs = list()
+    for flow_name in flow_names:
+        table_name = flow_name.removeprefix("test_")
+        if table_name not in data_tables:
+            flow_runs.append((flow_name, None, None))
+            continue
+        for row_id in data_provider.iter_row_ids(table_name):
+            flow_runs.append(
+                (
+                    flow_name,
+                    f"{table_name}-{row_id}",
+                    data_provider.get_row(table_name, row_id),
+                )
+            )
+    return flow_runs
+
+
+async def run_session(
+    http_client,
+    remote_url,
+    capabilities,
+    session_index,
+    flow_runs,
+    log,
+    iterations=1,
+    reuse_page=True,
+    native_form_fill=False,
+):
+    """
+    Function used to run the flows in a new browser session, in order.
+
+    :param http_client: (AsyncHttpClient) the HTTP client shared by the sessions
+    :param remote_url: (str) url of the WebDriver server
+    :param capabilities: (dict) the requested capabilities
+    :param session_index: (int) index of the session
+    :param flow_runs: (list) the flow runs, from get_flow_runs()
+    :param log: the logging object used to log the messages
+    :param iterations: (int) number of times the flow runs are repeated
+    :param reuse_page: (bool) if True, the page is reset between the flows
+        instead of reloaded
+    :param native_form_fill: (bool) if True, the fields are typed with send_keys
+    :return: (list) the FlowResult of every flow run
+    """
+    driver = await AsyncWebDriver.start(http_client, remote_url, capabilities)
+    flow_results = list()
+    try:
+        for _ in range(iterations):
+            for flow_name, data_row_id, data_row in flow_runs:
+                token = set_log_context(
+                    f"{flow_name}[session {session_index}]", data_row_id
+                )
+                start_time = time.perf_counter()
+                try:
+                    demopage = await AsyncDemoPage.create(driver, reuse_page)
+                    if data_row is None:
+                        flow = DEMOPAGE_FLOWS[flow_name](demopage, log)
+                    else:
+                        flow = DEMOPAGE_FLOWS[flow_name](
+                            demopage, log, data_row, native_form_fill
+                        )
+                    await async_run_flow(flow)
+                    passed, error = True, None
+                except (AssertionError, WebDriverException) as flow_error:
+                    passed = False
+                    error = f"{type(flow_error).__name__}: {str(flow_error).strip()}"
+                finally:
+                    reset_log_context(token)
+                flow_results.append(
+                    FlowResult(
+                        session_index,
+                        flow_name,
+                        data_row_id,
+                        passed,
+                        time.perf_counter() - start_time,
+                        error,
+                    )
+                )
+    finally:
+        await driver.quit()
+    return flow_results
+
+
+async def run_sessions(
+    remote_url,
+    session_count,
+    flow_names,
+    capabilities=None,
+    log=None,
+    iterations=1,
+    reuse_page=True,
+    native_form_fill=False,
+    connections_per_host=64,
+):
+    """
+    Function used to run the flows in many concurrent browser sessions, on the
+    current event loop, through one shared HTTP client.
+
+    :param remote_url: (str) url of the WebDriver server
+    :param session_count: (int) number of concurrent sessions
+    :param flow_names: (list) names of the flows (test names)
+    :param capabilities: (dict) the requested capabilities
+    :param log: the logging object used to log the messages (the tests logger if None)
+    :param iterations: (int) number of times each session repeats the flows
+    :param reuse_page: (bool) if True, the page is reset between the flows
+    :param native_form_fill: (bool) if True, the fields are typed with send_keys
+    :param connections_per_host: (int) maximum number of HTTP connections to the server
+    :return: (list) the FlowResult of every flow run; a session which could not
+        start is reported as a failed "session start" run
+    """
+    flow_runs = get_flow_runs(flow_names)
+    log = log or log_pipeline.get_logger()
+    http_client = AsyncHttpClient(connections_per_host)
+    try:
+        session_results = await asyncio.gather(
+            *(
+                run_session(
+                    http_client,
+                    remote_url,
+                    capabilities,
+                    session_index,
+                    flow_runs,
+                    log,
+                    iterations,
+                    reuse_page,
+                    native_form_fill,
+                )
+                for session_index in range(session_count)
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        await http_client.close()
+    flow_results = list()
+    for session_index, session_result in enumerate(session_results):
+        if isinstance(session_result, BaseException):
+            flow_results.append(
+                FlowResult(
+                    session_index,
+                    "session start",
+                    None,
+                    False,
+                    0.0,
+                    f"{type(session_result).__name__}: {str(session_result).strip()}",
+                )
+            )
+        else:
+            flow_results.extend(session_result)
+    return flow_results
+
+
+def get_capabilities(browser_name, profile_names, profile_template=None):
+    """
+    Function used to build the session capabilities of a browser, with the
+    selected launch profiles.
+
+    :param browser_name: (str) "chrome", "firefox" or "static" (no capabilities)
+    :param profile_names: (list) names of the launch profiles to be combined
+    :param profile_template: (str) folder of the browser profile template, if any
+    :return: (dict, str) the capabilities and the copied profile folder (or None)
+    """
+    if browser_name not in BROWSER_OPTIONS:
+        return {}, None
+    browser_options, profile_dir = build_browser_options(
+        browser_name, profile_names, profile_template
+    )
+    return browser_options.to_capabilities(), profile_dir
+
+
+def main():
+    """
+    Function used to run the flows in concurrent sessions and print the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--remote_url", default="http://127.0.0.1:4444")
+    parser.add_argument("--browser_name", default="chrome")
+    parser.add_argument("--launch_profile", default="headless")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument(
+        "--flows",
+        default=None,
+        help="comma separated test names (default: every flow, or the static_dom "
+        "marked flows for the static browser)",
+    )
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--full_load", action="store_true")
+    parser.add_argument("--native_form_fill", action="store_true")
+    arguments = parser.parse_args()
+    if arguments.flows is None:
+        flow_names = (
+            get_static_dom_flows()
+            if arguments.browser_name in BROWSER_STAND_INS
+            else list(DEMOPAGE_FLOWS)
+        )
+    else:
+        flow_names = [name.strip() for name in arguments.flows.split(",")]
+
+    capabilities, profile_dir = get_capabilities(
+        arguments.browser_name, parse_profile_names(arguments.launch_profile)
+    )
+    start_time = time.perf_counter()
+    try:
+        flow_results = asyncio.run(
+            run_sessions(
+                arguments.remote_url,
+                arguments.sessions,
+                [flow_name for flow_name in flow_names if flow_name],
+                capabilities,
+                iterations=arguments.iterations,
+                reuse_page=not arguments.full_load,
+                native_form_fill=arguments.native_form_fill,
+            )
+        )
+    finally:
+        remove_profile_copy(profile_dir)
+        log_pipeline.shutdown()
+    wall_time = time.perf_counter() - start_time
+
+    flow_summary = dict()
+    for flow_result in flow_results:
+        passed_runs, failed_runs, last_error = flow_summary.get(
+            flow_result.flow_name, (0, 0, None)
+        )
+        if flow_result.passed:
+            passed_runs += 1
+        else:
+            failed_runs, last_error = failed_runs + 1, flow_result.error
+        flow_summary[flow_result.flow_name] = (passed_runs, failed_runs, last_error)
+    print(
+        f"{arguments.sessions} sessions, {len(flow_results)} flow runs "
+        f"in {wall_time:.2f}s ({len(flow_results) / wall_time:.1f} flows/s):"
+    )
+    for flow_name, (passed_runs, failed_runs, last_error) in flow_summary.items():
+        print(f"  {flow_name}: {passed_runs} passed, {failed_runs} failed")
+        if last_error:
+            print(f"      last error: {last_error.splitlines()[0]}")
+    return 1 if any(not flow_result.passed for flow_result in flow_results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
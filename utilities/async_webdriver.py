@@ -0,0 +1,633 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the asyncio variant of the driver plumbing: a W3C WebDriver
+client issuing its commands over a shared asynchronous HTTP client (keep-alive
+connections, pooled per host, on the asyncio streams of the standard library),
+so that a single event loop can drive many independent browser sessions. The
+command routes, the locator conversion and the error mapping are the ones of
+the selenium Remote WebDriver, so the page objects handle the same exceptions.
+"""
+
+import asyncio
+import base64
+import json
+import string
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote import webelement
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from utilities.fake_webdriver import ELEMENT_KEY
+
+# Headers sent with every W3C command
+REQUEST_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json;charset=UTF-8",
+    "Connection": "keep-alive",
+}
+
+# Route of the Chrome DevTools Protocol commands (Chromium browsers only)
+EXECUTE_CDP_COMMAND = "executeCdpCommand"
+session_commands = dict(
+    remote_commands,
+    **{EXECUTE_CDP_COMMAND: ("POST", "/session/$sessionId/$vendorPrefix/cdp/execute")},
+)
+
+# Vendor prefixes of the Chromium drivers, by browser name
+CDP_VENDOR_PREFIXES = {"chrome": "goog", "MicrosoftEdge": "ms", "msedge": "ms"}
+
+# Selenium atoms, shared with the synchronous WebElement
+if webelement.isDisplayed_js is None:
+    webelement._load_js()
+IS_DISPLAYED_SCRIPT = (
+    f"/* isDisplayed */return ({webelement.isDisplayed_js}).apply(null, arguments);"
+)
+GET_ATTRIBUTE_SCRIPT = (
+    f"/* getAttribute */return ({webelement.getAttribute_js}).apply(null, arguments);"
+)
+
+
+class StaleConnectionError(ConnectionError):
+    """
+    Class definition for the error raised when a pooled connection was closed
+    by the server before any byte of the response was read.
+    """
+
+
+class AsyncHttpClient:
+    """
+    Class definition for the asynchronous HTTP/1.1 client shared by the sessions:
+    the connections are kept alive and pooled per host, and the number of
+    connections opened to a host is bounded.
+    """
+
+    def __init__(self, connections_per_host=64, timeout=120):
+        """
+        Constructor for the class.
+
+        :param connections_per_host: (int) maximum number of connections to a host
+        :param timeout: (float) timeout of a request, in seconds
+        """
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.requests = 0
+        self.connections_opened = 0
+        self.__idle_connections__ = dict()
+        self.__host_slots__ = dict()
+
+    async def request(self, method, url, payload=None):
+        """
+        Method used to send a request and to read its response; a request failing
+        on a reused connection closed by the server meanwhile (before any byte of
+        the response was read) is sent again on another connection.
+
+        :param method: (str) the HTTP method
+        :param url: (str) the absolute url
+        :param payload: (obj) the JSON payload of the request, if any
+        :return: (int, bytes) the status code and the body of the response
+        """
+        url_parts = urlsplit(url)
+        secure = url_parts.scheme == "https"
+        host_key = (
+            url_parts.hostname,
+            url_parts.port or (443 if secure else 80),
+            secure,
+        )
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        request_head = (
+            f"{method} {url_parts.path or '/'} HTTP/1.1\r\nHost: {url_parts.netloc}\r\n"
+        )
+        for header_name, header_value in REQUEST_HEADERS.items():
+            request_head += f"{header_name}: {header_value}\r\n"
+        request_bytes = (
+            f"{request_head}Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+        )
+        host_slots = self.__host_slots__.setdefault(
+            host_key, asyncio.Semaphore(self.connections_per_host)
+        )
+        async with host_slots:
+            self.requests += 1
+            idle_connections = self.__idle_connections__.setdefault(host_key, [])
+            while idle_connections:
+                connection = idle_connections.pop()
+                try:
+                    return await self.__exchange__(host_key, connection, request_bytes)
+                except StaleConnectionError:
+                    continue
+            connection = await self.__open_connection__(host_key)
+            return await self.__exchange__(host_key, connection, request_bytes)
+
+    async def __open_connection__(self, host_key):
+        """
+        Helper method used to open a connection to a host.
+
+        :param host_key: (tuple) host name, port and secure flag
+        :return: (tuple) the stream reader and writer
+        """
+        host_name, port, secure = host_key
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(host_name, port, ssl=secure or None), self.timeout
+        )
+        self.connections_opened += 1
+        return connection
+
+    async def __exchange__(self, host_key, connection, request_bytes):
+        """
+        Helper method used to send a request on a connection and to read its
+        response; the connection is returned to the pool unless it is closed, and
+        it is closed if the exchange failed (e.g.: timeout, invalid response).
+
+        :param host_key: (tuple) host name, port and secure flag
+        :param connection: (tuple) the stream reader and writer
+        :param request_bytes: (bytes) the request
+        :return: (int, bytes) the status code and the body of the response
+        """
+        reader, writer = connection
+        exchange_completed = False
+        try:
+            try:
+                writer.write(request_bytes)
+                await writer.drain()
+            except ConnectionError as write_error:
+                raise StaleConnectionError(str(write_error)) from None
+            status_code, headers, body = await asyncio.wait_for(
+                self.__read_response__(reader), self.timeout
+            )
+            exchange_completed = True
+        finally:
+            if not exchange_completed:
+                writer.close()
+        if headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self.__idle_connections__[host_key].append(connection)
+        return status_code, body
+
+    @staticmethod
+    async def __read_response__(reader):
+        """
+        Helper method used to read a response (sized or chunked body).
+
+        :param reader: (obj) the stream reader
+        :return: (int, dict, bytes) the status code, the headers and the body
+        """
+        try:
+            status_line = await reader.readuntil(b"\r\n")
+        except asyncio.IncompleteReadError as read_error:
+            if read_error.partial:
+                raise
+            raise StaleConnectionError(
+                "The connection was closed by the server"
+            ) from None
+        except ConnectionResetError as read_error:
+            raise StaleConnectionError(str(read_error)) from None
+        if not status_line.strip():
+            raise ConnectionResetError("Invalid status line in the response")
+        status_code = int(status_line.split()[1])
+        headers = dict()
+        while True:
+            header_line = (await reader.readuntil(b"\r\n")).decode("latin-1").strip()
+            if not header_line:
+                break
+            header_name, _, header_value = header_line.partition(":")
+            headers[header_name.strip().lower()] = header_value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                chunk_size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if chunk_size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                body += await reader.readexactly(chunk_size)
+                await reader.readexactly(2)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return status_code, headers, body
+
+    async def close(self):
+        """
+        Method used to close the pooled connections.
+        """
+        for idle_connections in self.__idle_connections__.values():
+            for _, writer in idle_connections:
+                writer.close()
+            idle_connections.clear()
+
+
+class AsyncWebElement:
+    """
+    Class definition for a web element of an asynchronous session.
+    """
+
+    def __init__(self, driver, element_id):
+        """
+        Constructor for the class.
+
+        :param driver: (AsyncWebDriver) the session holding the element
+        :param element_id: (str) the W3C element identifier
+        """
+        self.driver = driver
+        self.id = element_id
+
+    def __execute__(self, command, params=None):
+        """
+        Helper method used to execute a command on the element.
+
+        :param command: (str) name of the W3C command
+        :param params: (dict) parameters of the command
+        :return: (coroutine) the value of the W3C response
+        """
+        return self.driver.execute(command, dict(params or {}, id=self.id))
+
+    def to_reference(self):
+        """
+        Method used to retrieve the W3C reference of the element (script argument).
+
+        :return: (dict) the W3C web element reference
+        """
+        return {ELEMENT_KEY: self.id}
+
+    async def find_element(self, by, value):
+        """
+        Method used to find a child element.
+
+        :param by: (str) the selenium By value
+        :param value: (str) the locator hook
+        :return: (AsyncWebElement) the child element
+        """
+        using, value = LocatorConverter().convert(by, value)
+        return await self.__execute__(
+            Command.FIND_CHILD_ELEMENT, {"using": using, "value": value}
+        )
+
+    async def click(self):
+        """
+        Method used to click on the element.
+        """
+        await self.__execute__(Command.CLICK_ELEMENT)
+
+    async def clear(self):
+        """
+        Method used to clear the value of the element.
+        """
+        await self.__execute__(Command.CLEAR_ELEMENT)
+
+    async def send_keys(self, text):
+        """
+        Method used to type a text in the element.
+
+        :param text: (str) the text to be typed
+        """
+        await self.__execute__(
+            Command.SEND_KEYS_TO_ELEMENT, {"text": text, "value": list(text)}
+        )
+
+    async def get_text(self):
+        """
+        Method used to read the visible text of the element.
+
+        :return: (str) the text
+        """
+        return await self.__execute__(Command.GET_ELEMENT_TEXT)
+
+    async def get_property(self, name):
+        """
+        Method used to read a property of the element.
+
+        :param name: (str) name of the property
+        :return: the property value
+        """
+        return await self.__execute__(Command.GET_ELEMENT_PROPERTY, {"name": name})
+
+    async def get_attribute(self, name):
+        """
+        Method used to read an attribute (or property) of the element,
+        through the same atom as the selenium WebElement.
+
+        :param name: (str) name of the attribute
+        :return: (str) the attribute value
+        """
+        return await self.driver.execute_script(GET_ATTRIBUTE_SCRIPT, self, name)
+
+    async def value_of_css_property(self, property_name):
+        """
+        Method used to read a computed css property of the element.
+
+        :param property_name: (str) name of the css property
+        :return: (str) the css value
+        """
+        return await self.__execute__(
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY, {"propertyName": property_name}
+        )
+
+    async def is_displayed(self):
+        """
+        Method used to verify if the element is displayed.
+
+        :return: (bool) True if the element is displayed
+        """
+        return await self.driver.execute_script(IS_DISPLAYED_SCRIPT, self)
+
+    async def is_enabled(self):
+        """
+        Method used to verify if the element is enabled.
+
+        :return: (bool) True if the element is enabled
+        """
+        return await self.__execute__(Command.IS_ELEMENT_ENABLED)
+
+    async def is_selected(self):
+        """
+        Method used to verify if the element is selected.
+
+        :return: (bool) True if the element is selected
+        """
+        return await self.__execute__(Command.IS_ELEMENT_SELECTED)
+
+    async def get_location(self):
+        """
+        Method used to read the location of the element.
+
+        :return: (dict) the "x" and "y" coordinates
+        """
+        element_rect = await self.__execute__(Command.GET_ELEMENT_RECT)
+        return {"x": round(element_rect["x"]), "y": round(element_rect["y"])}
+
+    async def screenshot_as_png(self):
+        """
+        Method used to capture a screenshot of the element.
+
+        :return: (bytes) the PNG image
+        """
+        return base64.b64decode(
+            (await self.__execute__(Command.ELEMENT_SCREENSHOT)).encode("ascii")
+        )
+
+
+class AsyncWebDriver:
+    """
+    Class definition for an asynchronous W3C WebDriver session.
+    """
+
+    def __init__(self, http_client, remote_url, session_id, capabilities=None):
+        """
+        Constructor for the class; the sessions are created by start().
+
+        :param http_client: (AsyncHttpClient) the shared HTTP client
+        :param remote_url: (str) url of the WebDriver server (e.g.: a Selenium Grid)
+        :param session_id: (str) the W3C session identifier
+        :param capabilities: (dict) the capabilities returned by the server
+        """
+        self.http_client = http_client
+        self.remote_url = remote_url.rstrip("/")
+        self.session_id = session_id
+        self.capabilities = capabilities or {}
+        self.error_handler = ErrorHandler()
+        self.commands = 0
+
+    @classmethod
+    async def start(cls, http_client, remote_url, capabilities=None):
+        """
+        Method used to create a new session on the WebDriver server.
+
+        :param http_client: (AsyncHttpClient) the shared HTTP client
+        :param remote_url: (str) url of the WebDriver server
+        :param capabilities: (dict) the requested capabilities
+            (e.g.: the to_capabilities() of the selenium browser options)
+        :return: (AsyncWebDriver) the started session
+        """
+        driver = cls(http_client, remote_url, None)
+        session = await driver.execute(
+            Command.NEW_SESSION,
+            {"capabilities": {"firstMatch": [{}], "alwaysMatch": capabilities or {}}},
+        )
+        driver.session_id = session["sessionId"]
+        driver.capabilities = session.get("capabilities", {})
+        return driver
+
+    async def execute(self, command, params=None):
+        """
+        Method used to send a W3C command and to check its response.
+
+        :param command: (str) name of the W3C command (selenium Command value)
+        :param params: (dict) parameters of the command; the ones named in the
+            route (e.g.: the element id) are not sent in the body
+        :return: the unwrapped value of the W3C response
+        """
+        method, route = session_commands[command]
+        route_params = dict(params or {}, sessionId=self.session_id)
+        path = string.Template(route).substitute(route_params)
+        payload = {
+            param_name: param_value
+            for param_name, param_value in (params or {}).items()
+            if f"${param_name}" not in route
+        }
+        self.commands += 1
+        status_code, body = await self.http_client.request(
+            method,
+            self.remote_url + path,
+            self.__wrap_value__(payload) if method == "POST" else None,
+        )
+        response_text = body.decode("utf-8")
+        if status_code >= 400:
+            self.error_handler.check_response(
+                {"status": status_code, "value": response_text.strip()}
+            )
+            raise WebDriverException(f"HTTP {status_code}: {response_text}")
+        response = json.loads(response_text) if response_text.strip() else {}
+        self.error_handler.check_response(response)
+        return self.__unwrap_value__(response.get("value"))
+
+    def __wrap_value__(self, value):
+        """
+        Helper method used to replace the elements of a payload by their references.
+
+        :param value: the payload value
+        :return: the wrapped value
+        """
+        if isinstance(value, AsyncWebElement):
+            return value.to_reference()
+        if isinstance(value, dict):
+            return {key: self.__wrap_value__(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.__wrap_value__(item) for item in value]
+        return value
+
+    def __unwrap_value__(self, value):
+        """
+        Helper method used to replace the element references of a response by elements.
+
+        :param value: the response value
+        :return: the unwrapped value
+        """
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self.__unwrap_value__(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.__unwrap_value__(item) for item in value]
+        return value
+
+    async def get(self, url):
+        """
+        Method used to load a page.
+
+        :param url: (str) the url of the page
+        """
+        await self.execute(Command.GET, {"url": url})
+
+    async def maximize_window(self):
+        """
+        Method used to maximize the browser window.
+        """
+        await self.execute(Command.W3C_MAXIMIZE_WINDOW)
+
+    async def set_timeouts(self, implicit=None, script=None, page_load=None):
+        """
+        Method used to set the timeouts of the session.
+
+        :param implicit: (float) the implicit wait, in seconds
+        :param script: (float) the asynchronous script timeout, in seconds
+        :param page_load: (float) the page load timeout, in seconds
+        """
+        timeouts = {
+            timeout_name: int(timeout * 1000)
+            for timeout_name, timeout in (
+                ("implicit", implicit),
+                ("script", script),
+                ("pageLoad", page_load),
+            )
+            if timeout is not None
+        }
+        await self.execute(Command.SET_TIMEOUTS, timeouts)
+
+    async def find_element(self, by, value):
+        """
+        Method used to find an element.
+
+        :param by: (str) the selenium By value
+        :param value: (str) the locator hook
+        :return: (AsyncWebElement) the element
+        """
+        using, value = LocatorConverter().convert(by, value)
+        return await self.execute(
+            Command.FIND_ELEMENT, {"using": using, "value": value}
+        )
+
+    async def find_elements(self, by, value):
+        """
+        Method used to find all the elements of a locator.
+
+        :param by: (str) the selenium By value
+        :param value: (str) the locator hook
+        :return: (list) the elements
+        """
+        using, value = LocatorConverter().convert(by, value)
+        return await self.execute(
+            Command.FIND_ELEMENTS, {"using": using, "value": value}
+        )
+
+    async def execute_script(self, script, *script_args):
+        """
+        Method used to execute a synchronous script in the page.
+
+        :param script: (str) the javascript source
+        :param script_args: the arguments of the script
+        :return: the value returned by the script
+        """
+        return await self.execute(
+            Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(script_args)}
+        )
+
+    async def execute_async_script(self, script, *script_args):
+        """
+        Method used to execute an asynchronous script in the page.
+
+        :param script: (str) the javascript source, calling back its last argument
+        :param script_args: the arguments of the script
+        :return: the value passed to the callback
+        """
+        return await self.execute(
+            Command.W3C_EXECUTE_SCRIPT_ASYNC,
+            {"script": script, "args": list(script_args)},
+        )
+
+    async def execute_cdp_cmd(self, cmd, cmd_args):
+        """
+        Method used to send a Chrome DevTools Protocol command, as the
+        execute_cdp_cmd of the selenium Chromium drivers; the other browsers
+        raise a WebDriverException.
+
+        :param cmd: (str) name of the command (e.g.: "Page.addScriptToEvaluateOnNewDocument")
+        :param cmd_args: (dict) parameters of the command
+        :return: the result of the command
+        """
+        vendor_prefix = CDP_VENDOR_PREFIXES.get(self.capabilities.get("browserName"))
+        if vendor_prefix is None:
+            raise WebDriverException(
+                f"{self.capabilities.get('browserName')} does not support the DevTools protocol"
+            )
+        return await self.execute(
+            EXECUTE_CDP_COMMAND,
+            {"vendorPrefix": vendor_prefix, "cmd": cmd, "params": cmd_args},
+        )
+
+    async def switch_to_frame(self, frame_reference):
+        """
+        Method used to switch to a frame, by its name or id (as in the
+        selenium switch_to.frame) or by its element.
+
+        :param frame_reference: (str or AsyncWebElement) the frame
+        """
+        if isinstance(frame_reference, str):
+            try:
+                frame_reference = await self.find_element("id", frame_reference)
+            except WebDriverException:
+                frame_reference = await self.find_element("name", frame_reference)
+        await self.execute(Command.SWITCH_TO_FRAME, {"id": frame_reference})
+
+    async def switch_to_default_content(self):
+        """
+        Method used to switch back to the top document.
+        """
+        await self.execute(Command.SWITCH_TO_FRAME, {"id": None})
+
+    async def perform_pointer_actions(self, pointer_actions):
+        """
+        Method used to perform a sequence of mouse actions, in a single command.
+
+        :param pointer_actions: (list) the W3C pointer actions
+            (e.g.: {"type": "pointerMove", "origin": element, "x": 0, "y": 0})
+        """
+        await self.execute(
+            Command.W3C_ACTIONS,
+            {
+                "actions": [
+                    {
+                        "type": "pointer",
+                        "id": "mouse",
+                        "parameters": {"pointerType": "mouse"},
+                        "actions": pointer_actions,
+                    }
+                ]
+            },
+        )
+
+    async def quit(self):
+        """
+        Method used to end the session.
+        """
+        if self.session_id is not None:
+            await self.execute(Command.QUIT)
+            self.session_id = None
@@ -10,10 +10,10 @@ Description:
 This module defines the base class for the testcases.
 """
 
-import inspect
-import logging
 import pytest
 
+from utilities.log_pipeline import log_pipeline
+
 
 @pytest.mark.usefixtures("setup")
 class BaseClass:
@@ -21,23 +21,21 @@ class BaseClass:
     Class definition for the base class, used to set up and retrieve the logger.
     """
 
+    # Reset the page left by the previous test instead of reloading it
+    # (set by the setup fixture, when the browser session is reused)
+    reuse_page = False
+
+    # Type the form fields with native keystrokes instead of the single script fill
+    # (set by the setup fixture, from the "--native_form_fill" option)
+    native_form_fill = False
+
     @staticmethod
     def get_logger():
         """
-        Method used to set up the logger's name, filename, format
-        and level of logging (DEBUG, INFO, WARNING, ERROR, etc.)
+        Method used to retrieve the logger of the tests. The logging pipeline
+        (filename, format and level of logging) is configured once per process,
+        and the name of the current test is attached to every logged line.
 
         :return: (obj) the logger object used to log information in the tests.
         """
-        logger_name = inspect.stack()[1][3]
-        logger = logging.getLogger(logger_name)
-        file_handler = logging.FileHandler("logfile.log")
-        formatter = logging.Formatter(
-            "%(asctime)s :%(levelname)s : %(name)s :%(message)s"
-        )
-        file_handler.setFormatter(formatter)
-
-        # filehandler object
-        logger.addHandler(file_handler)
-        logger.setLevel(logging.DEBUG)
-        return logger
+        return log_pipeline.get_logger()
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module profiles the WebDriver commands: every command sent by a driver to
+the browser driver (geckodriver, chromedriver) is a HTTP round trip, so its
+name, duration and payload sizes are recorded per test, in order to summarize
+the costliest commands and to enforce the command budgets of the tests. The
+commands are aggregated as they are recorded (per test and for the whole run);
+only the latest raw records are kept.
+"""
+
+import collections
+import functools
+import json
+import threading
+import time
+
+# Name of the pytest marker declaring the command budget of a test
+COMMAND_BUDGET_MARKER = "command_budget"
+
+# Number of raw command records kept (the aggregates cover every command)
+RECORDS_LIMIT = 10000
+
+
+def __payload_size__(payload):
+    """
+    Helper method used to measure the serialized size of a command payload.
+
+    :param payload: the command parameters or response
+    :return: (int) the size of the payload, in characters
+    """
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload)
+    return len(json.dumps(payload, default=str))
+
+
+class CommandProfiler:
+    """
+    Class definition for the WebDriver command profiler of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class; the commands are recorded only during a test.
+        """
+        self.current_test = None
+        self.__records__ = collections.deque(maxlen=RECORDS_LIMIT)
+        self.__summary__ = dict()
+        self.__test_summaries__ = dict()
+        self.__command_counts__ = collections.Counter()
+        self.__lock__ = threading.Lock()
+
+    def attach(self, driver):
+        """
+        Method used to hook the command executor of a driver; a driver is hooked once.
+
+        :param driver: (obj) the selenium driver
+        """
+        command_executor = driver.command_executor
+        if getattr(command_executor, "__profiled__", False):
+            return
+        execute_command = command_executor.execute
+
+        @functools.wraps(execute_command)
+        def profiled_execute(command, params=None):
+            start_time = time.perf_counter()
+            response = execute_command(command, params)
+            test_name = self.current_test
+            if test_name is not None:
+                self.__record__(
+                    test_name,
+                    command,
+                    time.perf_counter() - start_time,
+                    __payload_size__(params),
+                    __payload_size__(response),
+                )
+            return response
+
+        command_executor.execute = profiled_execute
+        command_executor.__profiled__ = True
+
+    def start_test(self, test_name):
+        """
+        Method used to set the test the following commands are recorded for.
+
+        :param test_name: (str) identifier of the test
+        """
+        self.current_test = test_name
+
+    def stop_test(self):
+        """
+        Method used to stop recording the commands of the current test.
+        """
+        self.current_test = None
+
+    def __record__(self, test_name, command, duration, request_size, response_size):
+        """
+        Helper method used to register a command.
+
+        :param test_name: (str) identifier of the test
+        :param command: (str) name of the W3C command (e.g.: "findElement")
+        :param duration: (float) duration of the round trip, in seconds
+        :param request_size: (int) size of the command parameters
+        :param response_size: (int) size of the command response
+        """
+        with self.__lock__:
+            self.__records__.append(
+                (test_name, command, duration, request_size, response_size)
+            )
+            self.__command_counts__[test_name] += 1
+            for summary in (
+                self.__summary__,
+                self.__test_summaries__.setdefault(test_name, dict()),
+            ):
+                command_summary = summary.setdefault(
+                    command,
+                    {
+                        "count": 0,
+                        "total": 0.0,
+                        "max": 0.0,
+                        "request_size": 0,
+                        "response_size": 0,
+                    },
+                )
+                command_summary["count"] += 1
+                command_summary["total"] += duration
+                command_summary["max"] = max(command_summary["max"], duration)
+                command_summary["request_size"] += request_size
+                command_summary["response_size"] += response_size
+
+    def get_records(self, test_name=None):
+        """
+        Method used to retrieve the latest registered commands (at most
+        RECORDS_LIMIT records are kept).
+
+        :param test_name: (str) identifier of the test; all the tests if None
+        :return: (list) tuples of (test, command, duration, request size, response size)
+        """
+        with self.__lock__:
+            return [
+                command_record
+                for command_record in self.__records__
+                if test_name is None or command_record[0] == test_name
+            ]
+
+    def get_command_count(self, test_name):
+        """
+        Method used to count the commands issued by a test.
+
+        :param test_name: (str) identifier of the test
+        :return: (int) the number of commands
+        """
+        with self.__lock__:
+            return self.__command_counts__[test_name]
+
+    def get_summary(self, test_name=None):
+        """
+        Method used to aggregate the registered commands by their name.
+
+        :param test_name: (str) identifier of the test; all the tests if None
+        :return: (dict) per command: count, total and maximum time, request and
+            response sizes, sorted by the total time (descending)
+        """
+        with self.__lock__:
+            if test_name is None:
+                summary = self.__summary__
+            else:
+                summary = self.__test_summaries__.get(test_name, dict())
+            summary = {
+                command: dict(command_summary)
+                for command, command_summary in summary.items()
+            }
+        return dict(
+            sorted(
+                summary.items(),
+                key=lambda summary_item: summary_item[1]["total"],
+                reverse=True,
+            )
+        )
+
+
+# Process-wide WebDriver command profiler
+command_profiler = CommandProfiler()
@@ -0,0 +1,65 @@
+/** wait in the page until a DOM condition holds (requires page_element_helper.js) */
+(function(conditionName, locatorBy, locatorHook, expectedValue, timeoutMs, callback) {
+    var finished = false;
+    var observer = null;
+    var timer = null;
+    var frame = null;
+    function evaluateCondition() {
+        var element = findElement(locatorBy, locatorHook);
+        switch (conditionName) {
+            case 'present':
+                return element !== null;
+            case 'visible':
+                return element !== null && isDisplayed(element);
+            case 'text_contains':
+                return element !== null && element.innerText.indexOf(expectedValue) >= 0;
+            case 'css_value':
+                return element !== null && window.getComputedStyle(element)
+                    .getPropertyValue(expectedValue[0]) == expectedValue[1];
+        }
+        throw new Error('Unknown wait condition: ' + conditionName);
+    }
+    function finish(satisfied, errorMessage) {
+        finished = true;
+        if (observer !== null) {
+            observer.disconnect();
+        }
+        clearTimeout(timer);
+        cancelAnimationFrame(frame);
+        callback({satisfied: satisfied, error: errorMessage || null});
+    }
+    function checkCondition() {
+        if (finished) {
+            return true;
+        }
+        try {
+            if (evaluateCondition()) {
+                finish(true);
+                return true;
+            }
+        } catch (conditionError) {
+            finish(false, String(conditionError));
+            return true;
+        }
+        return false;
+    }
+    function checkOnFrame() {
+        /* computed styles (e.g.: CSS transitions) change without DOM mutations */
+        if (!checkCondition()) {
+            frame = requestAnimationFrame(checkOnFrame);
+        }
+    }
+    if (checkCondition()) {
+        return;
+    }
+    observer = new MutationObserver(checkCondition);
+    observer.observe(document, {attributes: true, childList: true, subtree: true,
+        characterData: true});
+    frame = requestAnimationFrame(checkOnFrame);
+    timer = setTimeout(function() {
+        if (!finished) {
+            finish(false);
+        }
+    }, timeoutMs);
+})(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4],
+    arguments[arguments.length - 1]);
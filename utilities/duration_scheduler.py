@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module schedules the collected tests from their past durations, read
+from the results history: the recently failing tests run first, then the
+fastest ones, for the fastest feedback; when the suite is split between
+workers, the tests are bin-packed by expected duration, so that every shard
+finishes at about the same time.
+"""
+
+import os
+import statistics
+from collections import namedtuple
+
+from testdata.results_history import ResultsHistory, get_run_id
+
+# Expected durations (nodeid -> seconds) and recently failing tests (nodeids)
+ScheduleData = namedtuple("ScheduleData", ("expected_durations", "recent_failures"))
+
+
+def load_schedule(database_path, last_runs=10, failure_runs=3):
+    """
+    Function used to read the schedule data from the results history; the
+    current run is ignored, so every worker of the run reads the same data.
+
+    :param database_path: (str) path to the results history database
+    :param last_runs: (int) number of runs used for the expected durations
+    :param failure_runs: (int) number of runs in which a failure is recent
+    :return: (ScheduleData) the schedule data, or None if there is no history
+    """
+    if not database_path or not os.path.isfile(database_path):
+        return None
+    history = ResultsHistory(database_path)
+    try:
+        return ScheduleData(
+            history.get_expected_durations(last_runs, get_run_id()),
+            history.get_recent_failures(failure_runs, get_run_id()),
+        )
+    finally:
+        history.close()
+
+
+def estimate_durations(items, expected_durations):
+    """
+    Function used to assign an expected duration to every item; the tests
+    with no history get the median duration of the known ones.
+
+    :param items: (list) the collected pytest items
+    :param expected_durations: (dict) nodeid -> expected duration
+    :return: (dict) nodeid -> expected duration, for every item
+    """
+    known_durations = [
+        expected_durations[item.nodeid]
+        for item in items
+        if item.nodeid in expected_durations
+    ]
+    default_duration = statistics.median(known_durations) if known_durations else 0.0
+    return {
+        item.nodeid: expected_durations.get(item.nodeid, default_duration)
+        for item in items
+    }
+
+
+def order_for_feedback(items, schedule):
+    """
+    Function used to order the tests for the fastest feedback: the recently
+    failing tests first, then by increasing expected duration. The tests of
+    a class stay together, as they share the browser of the class.
+
+    :param items: (list) the collected pytest items
+    :param schedule: (ScheduleData) the schedule data
+    :return: (list) the ordered items
+    """
+    item_durations = estimate_durations(items, schedule.expected_durations)
+    item_groups = dict()
+    for item_index, item in enumerate(items):
+        item_groups.setdefault(item.parent.nodeid, []).append((item_index, item))
+
+    def item_key(indexed_item):
+        item_index, item = indexed_item
+        return (
+            item.nodeid not in schedule.recent_failures,
+            item_durations[item.nodeid],
+            item_index,
+        )
+
+    ordered_groups = [
+        sorted(group_items, key=item_key) for group_items in item_groups.values()
+    ]
+    ordered_groups.sort(
+        key=lambda group_items: (
+            item_key(group_items[0])[0],
+            sum(item_durations[item.nodeid] for _, item in group_items),
+        )
+    )
+    return [item for group_items in ordered_groups for _, item in group_items]
+
+
+def pack_shards(items, expected_durations, shard_count):
+    """
+    Function used to split the tests between the shards by expected duration
+    (longest test first, to the least loaded shard); the split only depends
+    on the items and on the durations, so every worker computes the same one.
+
+    :param items: (list) the collected pytest items
+    :param expected_durations: (dict) nodeid -> expected duration
+    :param shard_count: (int) number of shards
+    :return: (list, list) the items of each shard (in collection order) and
+        the expected duration of each shard
+    """
+    item_durations = estimate_durations(items, expected_durations)
+    shard_indexes, shard_loads = dict(), [0.0] * shard_count
+    for item in sorted(
+        items, key=lambda item: (-item_durations[item.nodeid], item.nodeid)
+    ):
+        shard_index = min(
+            range(shard_count), key=lambda index: (shard_loads[index], index)
+        )
+        shard_indexes[item.nodeid] = shard_index
+        shard_loads[shard_index] += item_durations[item.nodeid]
+    shard_items = [list() for _ in range(shard_count)]
+    for item in items:
+        shard_items[shard_indexes[item.nodeid]].append(item)
+    return shard_items, shard_loads
@@ -0,0 +1,42 @@
+/** read the state of multiple elements in a single call (requires page_element_helper.js) */
+return (function(stateRequests) {
+    function readState(element, stateKind, stateName) {
+        switch (stateKind) {
+            case 'text':
+                return element.innerText.trim();
+            case 'property':
+                return element[stateName];
+            case 'attribute':
+                var value = element[stateName];
+                if (value === undefined || value === null) {
+                    value = element.getAttribute(stateName);
+                }
+                return value === null ? null : String(value);
+            case 'css':
+                return window.getComputedStyle(element).getPropertyValue(stateName);
+            case 'state':
+                if (stateName == 'displayed') {
+                    return isDisplayed(element);
+                }
+                if (stateName == 'enabled') {
+                    return !element.disabled;
+                }
+                return !!(element.checked || element.selected);
+            case 'selected_option':
+                var option = element.options[element.selectedIndex];
+                return option ? option.text.trim() : null;
+        }
+        throw new Error('Unknown state kind: ' + stateKind);
+    }
+    var results = [];
+    for (var i = 0; i < stateRequests.length; i++) {
+        var stateRequest = stateRequests[i];
+        var element = findElement(stateRequest[0], stateRequest[1]);
+        if (element === null) {
+            results.push([false, null]);
+        } else {
+            results.push([true, readState(element, stateRequest[2], stateRequest[3])]);
+        }
+    }
+    return results;
+})(arguments[0]);
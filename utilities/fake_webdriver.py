@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines an in-process fake WebDriver: a selenium Remote WebDriver
+whose command executor records every W3C command and answers with canned
+values, with no browser and no HTTP round trip. It is used to measure the own
+overhead of the framework (database lookups, locator builds, command dispatch).
+"""
+
+import base64
+import itertools
+import threading
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# W3C identifier of the web element references
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# 1x1 transparent PNG image, returned by the screenshot commands
+BLANK_PNG = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000001e221bc330000"
+        "000049454e44ae426082"
+    )
+).decode("ascii")
+
+# Canned values of the commands, indexed by the W3C command name
+CANNED_VALUES = {
+    "getCurrentUrl": "about:blank",
+    "getTitle": "Fake page",
+    "getPageSource": "<html><body></body></html>",
+    "getElementText": "Canned text",
+    "getElementTagName": "div",
+    "getElementAttribute": "canned",
+    "getElementProperty": "canned",
+    "getElementValueOfCssProperty": "canned",
+    "isElementSelected": True,
+    "isElementEnabled": True,
+    "getElementRect": {"x": 0, "y": 0, "width": 100, "height": 20},
+    "getWindowRect": {"x": 0, "y": 0, "width": 1920, "height": 1080},
+    "w3cMaximizeWindow": {"x": 0, "y": 0, "width": 1920, "height": 1080},
+    "w3cGetCurrentWindowHandle": "fake-window",
+    "w3cGetWindowHandles": ["fake-window"],
+    "screenshot": BLANK_PNG,
+    "elementScreenshot": BLANK_PNG,
+    "getTimeouts": {"implicit": 0, "pageLoad": 300000, "script": 30000},
+    # Result of the asynchronous scripts (e.g.: the in-page waits are satisfied)
+    "w3cExecuteScriptAsync": {"satisfied": True, "error": None},
+}
+
+# Canned values of the element states read by the element state reader helper
+CANNED_STATES = {"displayed": True, "enabled": True, "selected": False}
+
+
+class CommandError(Exception):
+    """
+    Class definition for the error answered to a command, as a W3C error response.
+    """
+
+    def __init__(self, error_code, message):
+        """
+        Constructor for the class.
+
+        :param error_code: (str) the W3C error code (e.g.: "no such element")
+        :param message: (str) the error message
+        """
+        super().__init__(message)
+        self.error_code = error_code
+
+
+class FakeCommandExecutor:
+    """
+    Class definition for the command executor of the fake WebDriver.
+    """
+
+    def __init__(self, canned_values=None):
+        """
+        Constructor for the class.
+
+        :param canned_values: (dict) values overriding the default canned values,
+            indexed by the W3C command name
+        """
+        self.canned_values = dict(CANNED_VALUES, **(canned_values or {}))
+        self.commands = list()
+        self.__element_ids__ = itertools.count(1)
+        self.__lock__ = threading.Lock()
+
+    def execute(self, command, params=None):
+        """
+        Method used to record a command and to answer it with its canned value.
+
+        :param command: (str) name of the W3C command (e.g.: "findElement")
+        :param params: (dict) parameters of the command
+        :return: (dict) the W3C response of the command
+        """
+        with self.__lock__:
+            self.commands.append((command, params))
+        try:
+            return {"value": self.respond(command, params or {})}
+        except CommandError as command_error:
+            return {
+                "status": command_error.error_code,
+                "value": {
+                    "error": command_error.error_code,
+                    "message": str(command_error),
+                },
+            }
+
+    def respond(self, command, params):
+        """
+        Method used to build the value answered to a command.
+
+        :param command: (str) name of the W3C command
+        :param params: (dict) parameters of the command
+        :return: the value of the W3C response
+        """
+        if command == "newSession":
+            return {
+                "sessionId": "fake-session",
+                "capabilities": {"browserName": "fake"},
+            }
+        if command in ("findElement", "findChildElement"):
+            return self.new_element_reference()
+        if command in ("findElements", "findChildElements"):
+            return [self.new_element_reference()]
+        if command == "w3cExecuteScript":
+            return self.respond_script(params.get("script", ""), params.get("args", []))
+        return self.canned_values.get(command)
+
+    def respond_script(self, script, script_args):
+        """
+        Method used to answer a synchronous script; the batched element state reads
+        are answered element by element, any other script with its canned value.
+
+        :param script: (str) the javascript source
+        :param script_args: (list) the arguments of the script
+        :return: the value returned by the script
+        """
+        if (
+            script_args
+            and isinstance(script_args[0], list)
+            and all(
+                isinstance(state_request, list) and len(state_request) == 4
+                for state_request in script_args[0]
+            )
+        ):
+            return [
+                [True, self.canned_state(state_kind, state_name)]
+                for _, _, state_kind, state_name in script_args[0]
+            ]
+        return self.canned_values.get("w3cExecuteScript")
+
+    def canned_state(self, state_kind, state_name):
+        """
+        Method used to retrieve the canned value of an element state.
+
+        :param state_kind: (str) kind of the state (e.g.: "text", "state")
+        :param state_name: (str) name of the state (e.g.: "selected")
+        :return: the canned value of the state
+        """
+        if state_kind == "state":
+            return CANNED_STATES.get(state_name, True)
+        if state_kind in ("text", "selected_option"):
+            return self.canned_values["getElementText"]
+        return self.canned_values["getElementProperty"]
+
+    def new_element_reference(self):
+        """
+        Method used to create a new web element reference.
+
+        :return: (dict) the W3C web element reference
+        """
+        return {ELEMENT_KEY: f"fake-element-{next(self.__element_ids__)}"}
+
+    def get_command_counts(self):
+        """
+        Method used to count the recorded commands by their name.
+
+        :return: (dict) W3C command name -> number of commands
+        """
+        command_counts = dict()
+        with self.__lock__:
+            for command, _ in self.commands:
+                command_counts[command] = command_counts.get(command, 0) + 1
+        return command_counts
+
+
+class FakeWebDriver(WebDriver):
+    """
+    Class definition for the fake WebDriver: the selenium Remote WebDriver,
+    driven by the fake command executor.
+    """
+
+    def __init__(self, canned_values=None, command_executor=None):
+        """
+        Constructor for the class.
+
+        :param canned_values: (dict) values overriding the default canned values
+        :param command_executor: (obj) the command executor; a FakeCommandExecutor if None
+        """
+        super().__init__(
+            command_executor=command_executor or FakeCommandExecutor(canned_values),
+            options=ArgOptions(),
+        )
@@ -0,0 +1,31 @@
+/** fill multiple form fields in a single call (requires page_element_helper.js) */
+return (function(fieldRequests) {
+    function setNativeValue(element, value) {
+        /* the native setter keeps the value tracking of the page frameworks in sync */
+        var prototype = Object.getPrototypeOf(element);
+        var descriptor = Object.getOwnPropertyDescriptor(prototype, 'value');
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+    }
+    var results = [];
+    for (var i = 0; i < fieldRequests.length; i++) {
+        var fieldRequest = fieldRequests[i];
+        var element = findElement(fieldRequest[0], fieldRequest[1]);
+        if (element === null) {
+            results.push([false, null]);
+            continue;
+        }
+        /* like send_keys, the text is appended unless the field is to be cleared */
+        var value = fieldRequest[3] ? fieldRequest[2] : element.value + fieldRequest[2];
+        element.focus();
+        setNativeValue(element, value);
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        element.blur();
+        results.push([true, element.value]);
+    }
+    return results;
+})(arguments[0]);
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the named browser launch profiles (e.g.: headless, eager
+page load, pre-built profile template) and measures the browser cold start.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+
+from selenium import webdriver
+
+from utilities.static_dom_driver import StaticDomWebDriver
+
+# Launch profiles: browser arguments, preferences and page load strategy,
+# per browser; several profiles can be combined (e.g.: "headless,eager,lean")
+LAUNCH_PROFILES = {
+    "default": {
+        "chrome": {"arguments": ["--start-maximized"]},
+        "firefox": {"arguments": ["--start-maximized"]},
+    },
+    "headless": {
+        "chrome": {"arguments": ["--headless=new", "--window-size=1920,1080"]},
+        "firefox": {"arguments": ["-headless", "--width=1920", "--height=1080"]},
+    },
+    "eager": {
+        "chrome": {"page_load_strategy": "eager"},
+        "firefox": {"page_load_strategy": "eager"},
+    },
+    "lean": {
+        "chrome": {
+            "arguments": [
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-component-update",
+                "--disable-default-apps",
+                "--disable-sync",
+                "--no-first-run",
+                "--no-default-browser-check",
+            ]
+        },
+        "firefox": {
+            "preferences": {
+                "extensions.update.enabled": False,
+                "app.update.auto": False,
+                "app.normandy.enabled": False,
+                "browser.shell.checkDefaultBrowser": False,
+                "browser.startup.homepage_override.mstone": "ignore",
+                "datareporting.policy.dataSubmissionEnabled": False,
+                "network.prefetch-next": False,
+                "toolkit.telemetry.reportingpolicy.firstRun": False,
+            }
+        },
+    },
+    # The browser profile is copied from the --profile_template folder
+    "template": {"chrome": {}, "firefox": {}},
+}
+
+# Browser options classes, per browser
+BROWSER_OPTIONS = {
+    "chrome": webdriver.ChromeOptions,
+    "firefox": webdriver.FirefoxOptions,
+}
+
+# Browser driver classes, per browser
+BROWSER_DRIVERS = {"chrome": webdriver.Chrome, "firefox": webdriver.Firefox}
+
+# Browserless stand-ins, launched with no browser options (the launch profiles
+# do not apply to them)
+BROWSER_STAND_INS = {"static": StaticDomWebDriver}
+
+
+def parse_profile_names(profile_option):
+    """
+    Function used to parse and validate the launch profile option.
+
+    :param profile_option: (str) comma separated profile names (e.g.: "headless,eager")
+    :return: (list) the profile names
+    """
+    profile_names = [name.strip() for name in profile_option.split(",") if name.strip()]
+    unknown_names = [name for name in profile_names if name not in LAUNCH_PROFILES]
+    if unknown_names:
+        raise ValueError(
+            f"Unknown launch profile(s): {', '.join(unknown_names)}, "
+            f"expected one of: {', '.join(LAUNCH_PROFILES)}"
+        )
+    return profile_names or ["default"]
+
+
+def build_browser_options(browser_name, profile_names, profile_template=None):
+    """
+    Function used to build the browser options for the selected launch profiles.
+
+    :param browser_name: (str) name of the browser ("chrome" or "firefox")
+    :param profile_names: (list) names of the launch profiles to be combined
+    :param profile_template: (str) folder of the browser profile template, if any
+    :return: (obj, str) the browser options and the copied profile folder (or None)
+    """
+    browser_options = BROWSER_OPTIONS[browser_name]()
+    for profile_name in profile_names:
+        profile_settings = LAUNCH_PROFILES[profile_name][browser_name]
+        for argument in profile_settings.get("arguments", ()):
+            browser_options.add_argument(argument)
+        for preference_name, preference_value in profile_settings.get(
+            "preferences", {}
+        ).items():
+            browser_options.set_preference(preference_name, preference_value)
+        if "page_load_strategy" in profile_settings:
+            browser_options.page_load_strategy = profile_settings["page_load_strategy"]
+
+    # Copy the pre-built profile, so the template itself is never modified
+    profile_dir = None
+    if "template" in profile_names:
+        if not profile_template:
+            raise ValueError(
+                'The "template" launch profile requires --profile_template'
+            )
+        profile_dir = tempfile.mkdtemp(prefix=f"{browser_name}_profile_")
+        shutil.copytree(profile_template, profile_dir, dirs_exist_ok=True)
+        if browser_name == "chrome":
+            browser_options.add_argument(f"--user-data-dir={profile_dir}")
+        else:
+            browser_options.add_argument("-profile")
+            browser_options.add_argument(profile_dir)
+    return browser_options, profile_dir
+
+
+class StartupStatistics:
+    """
+    Class definition for the browser cold start timings of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        self.__records__ = list()
+        self.__lock__ = threading.Lock()
+
+    def record(self, browser_name, profile_names, startup_time):
+        """
+        Method used to register a browser cold start.
+
+        :param browser_name: (str) name of the browser
+        :param profile_names: (list) names of the launch profiles used
+        :param startup_time: (float) duration of the browser launch, in seconds
+        """
+        with self.__lock__:
+            self.__records__.append(
+                (browser_name, ",".join(profile_names), startup_time)
+            )
+
+    def get_records(self):
+        """
+        Method used to retrieve the registered cold starts.
+
+        :return: (list) tuples of (browser name, launch profiles, startup time)
+        """
+        with self.__lock__:
+            return list(self.__records__)
+
+
+# Process-wide browser startup statistics
+startup_statistics = StartupStatistics()
+
+
+def launch_browser(browser_name, profile_names, profile_template=None):
+    """
+    Function used to launch a browser with the selected launch profiles,
+    measuring its cold start time.
+
+    :param browser_name: (str) name of the browser ("chrome", "firefox" or
+        the "static" DOM stand-in)
+    :param profile_names: (list) names of the launch profiles to be combined
+    :param profile_template: (str) folder of the browser profile template, if any
+    :return: (obj, str) the selenium driver and the copied profile folder (or None)
+    """
+    if browser_name in BROWSER_STAND_INS:
+        start_time = time.perf_counter()
+        driver = BROWSER_STAND_INS[browser_name]()
+        startup_statistics.record(
+            browser_name, profile_names, time.perf_counter() - start_time
+        )
+        return driver, None
+    if browser_name not in BROWSER_DRIVERS:
+        raise ValueError(
+            f"Unknown browser '{browser_name}', expected one of: "
+            f"{', '.join([*BROWSER_DRIVERS, *BROWSER_STAND_INS])}"
+        )
+    browser_options, profile_dir = build_browser_options(
+        browser_name, profile_names, profile_template
+    )
+    start_time = time.perf_counter()
+    driver = BROWSER_DRIVERS[browser_name](options=browser_options)
+    startup_statistics.record(
+        browser_name, profile_names, time.perf_counter() - start_time
+    )
+    return driver, profile_dir
+
+
+def remove_profile_copy(profile_dir):
+    """
+    Function used to remove the copied browser profile, after the browser is closed.
+
+    :param profile_dir: (str) the copied profile folder (or None)
+    """
+    if profile_dir:
+        shutil.rmtree(profile_dir, ignore_errors=True)
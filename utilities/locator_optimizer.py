@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module measures the lookup cost of every locator of the locator tables
+in a browser session and proposes equivalent, faster strategies (e.g.: an ID
+or a short CSS selector instead of a deep XPath): a candidate is kept only when
+it matches the same single element. The measured costs and the fastest working
+strategy of each record are written to the "locator_costs" database (a local,
+untracked file next to "demopage_data"), from which the locator registry takes
+the fastest strategy at runtime.
+
+Usage (from the project folder):
+» python -m utilities.locator_optimizer --browser_name firefox
+"""
+
+import argparse
+import re
+import sqlite3
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+from pageobjects.demopage import DemoPage
+from pageobjects.locator import LOCATOR_STRATEGIES, Locator
+from testdata.data_access import database_path, get_shared_database
+from testdata.locator_registry import (
+    LOCATOR_COSTS_TABLE,
+    LOCATOR_TABLES,
+    locator_costs_path,
+    locator_registry,
+)
+from utilities.launch_profiles import launch_browser, remove_profile_copy
+
+# Locator type names of the database, indexed by the Selenium strategies
+LOCATOR_TYPES = {
+    locator_by: type_name for type_name, locator_by in LOCATOR_STRATEGIES.items()
+}
+
+# Attribute values usable in a CSS selector without escaping
+CSS_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][\w-]*$")
+
+# A candidate replaces the locator of the table only when it is faster by this factor
+DEFAULT_SPEEDUP = 0.9
+
+# Measured cost of a locator record and its fastest working strategy
+LocatorCost = namedtuple(
+    "LocatorCost",
+    (
+        "table_name",
+        "name",
+        "locator_type",
+        "locator_hook",
+        "median_ms",
+        "best_locator_type",
+        "best_locator_hook",
+        "best_median_ms",
+    ),
+)
+
+
+def time_locator(driver, locator, repeats):
+    """
+    Function used to measure the lookup cost of a locator in the browser.
+
+    :param driver: (obj) the selenium driver
+    :param locator: (Locator) the measured locator
+    :param repeats: (int) number of timed lookups
+    :return: (list, float) the matched elements and the median lookup time, in ms
+    """
+    durations = list()
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        elements = driver.find_elements(*locator)
+        durations.append((time.perf_counter() - start_time) * 1000)
+    return elements, statistics.median(durations)
+
+
+def propose_candidates(element, locator):
+    """
+    Function used to build the candidate strategies of an element, from its
+    id, name and class attributes.
+
+    :param element: (obj) the web element matched by the locator
+    :param locator: (Locator) the locator of the table
+    :return: (list) the candidate (locator type, locator hook) pairs
+    """
+    tag_name = element.tag_name.lower()
+    element_id = element.get_dom_attribute("id")
+    element_name = element.get_dom_attribute("name")
+    class_names = (element.get_dom_attribute("class") or "").split()
+    candidates = list()
+    if element_id:
+        candidates.append(("ID", element_id))
+        if CSS_IDENTIFIER_PATTERN.match(element_id):
+            candidates.append(("CSS_SELECTOR", f"#{element_id}"))
+    if element_name:
+        candidates.append(("NAME", element_name))
+        if CSS_IDENTIFIER_PATTERN.match(element_name):
+            candidates.append(("CSS_SELECTOR", f"{tag_name}[name='{element_name}']"))
+    for class_name in class_names:
+        if CSS_IDENTIFIER_PATTERN.match(class_name):
+            candidates.append(("CLASS_NAME", class_name))
+            candidates.append(("CSS_SELECTOR", f"{tag_name}.{class_name}"))
+    source_candidate = (LOCATOR_TYPES[locator.by], locator.hook)
+    return [candidate for candidate in candidates if candidate != source_candidate]
+
+
+def optimize_record(driver, table_name, record, repeats, speedup=DEFAULT_SPEEDUP):
+    """
+    Function used to measure a locator record and its candidate strategies;
+    the caller switches to the frame of the record, if any.
+
+    :param driver: (obj) the selenium driver
+    :param table_name: (str) name of the locator table
+    :param record: (dict) the locator record, as stored in the table
+    :param repeats: (int) number of timed lookups per strategy
+    :param speedup: (float) maximum cost ratio of a kept candidate
+    :return: (LocatorCost) the measured cost, or None if the locator matches nothing
+    """
+    locator = Locator.from_record(record)
+    elements, median_ms = time_locator(driver, locator, repeats)
+    if not elements:
+        return None
+    best_type, best_hook, best_median_ms = (
+        record["locator_type"],
+        record["locator_hook"],
+        median_ms,
+    )
+    for candidate_type, candidate_hook in propose_candidates(elements[0], locator):
+        candidate = Locator.compile(candidate_type, candidate_hook)
+        candidate_elements, candidate_median_ms = time_locator(
+            driver, candidate, repeats
+        )
+        # Only the strategies matching the same single element are equivalent
+        if candidate_elements != elements[:1]:
+            continue
+        if candidate_median_ms < min(best_median_ms, median_ms * speedup):
+            best_type, best_hook, best_median_ms = (
+                candidate_type,
+                candidate_hook,
+                candidate_median_ms,
+            )
+    return LocatorCost(
+        table_name,
+        record["name"],
+        record["locator_type"],
+        record["locator_hook"],
+        round(median_ms, 3),
+        best_type,
+        best_hook,
+        round(best_median_ms, 3),
+    )
+
+
+def optimize_locators(
+    driver, table_names=LOCATOR_TABLES, path=database_path, repeats=5
+):
+    """
+    Function used to measure all the locator records on the page loaded in the browser.
+
+    :param driver: (obj) the selenium driver, with the demo page loaded
+    :param table_names: (tuple) names of the locator tables
+    :param path: (str) path of the database file
+    :param repeats: (int) number of timed lookups per strategy
+    :return: (list, list) the locator costs and the names of the unmatched records
+    """
+    database = get_shared_database(path)
+    locator_costs, unmatched_records = list(), list()
+    for table_name in table_names:
+        column_names, rows = database.fetch_all(f"SELECT * FROM {table_name}")
+        for row in rows:
+            record = dict(zip(column_names, row))
+            if record.get("iframe_name"):
+                driver.switch_to.frame(record["iframe_name"])
+            try:
+                locator_cost = optimize_record(driver, table_name, record, repeats)
+            finally:
+                if record.get("iframe_name"):
+                    driver.switch_to.default_content()
+            if locator_cost is None:
+                unmatched_records.append(f"{table_name}.{record['name']}")
+            else:
+                locator_costs.append(locator_cost)
+    return locator_costs, unmatched_records
+
+
+def write_locator_costs(locator_costs, browser_name, path=locator_costs_path):
+    """
+    Function used to write the measured costs to the locator costs database,
+    replacing the previous measurements of the same records.
+
+    :param locator_costs: (list) the locator costs
+    :param browser_name: (str) name of the browser used for the measurements
+    :param path: (str) path of the locator costs database file
+    """
+    measured_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS {LOCATOR_COSTS_TABLE} (
+                    table_name TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    locator_type TEXT NOT NULL,
+                    locator_hook TEXT NOT NULL,
+                    median_ms REAL NOT NULL,
+                    best_locator_type TEXT NOT NULL,
+                    best_locator_hook TEXT NOT NULL,
+                    best_median_ms REAL NOT NULL,
+                    browser_name TEXT NOT NULL,
+                    measured_at TEXT NOT NULL,
+                    PRIMARY KEY (table_name, name)
+                )
+                """)
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {LOCATOR_COSTS_TABLE} "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (*locator_cost, browser_name, measured_at)
+                    for locator_cost in locator_costs
+                ],
+            )
+    finally:
+        connection.close()
+    locator_registry.invalidate()
+
+
+def main():
+    """
+    Function used to run the locator optimizer from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--browser_name", default="firefox")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="print the measurements without writing the locator costs",
+    )
+    arguments = parser.parse_args()
+
+    driver, profile_dir = launch_browser(arguments.browser_name, ["default"])
+    try:
+        DemoPage(driver)
+        locator_costs, unmatched_records = optimize_locators(
+            driver, repeats=arguments.repeats
+        )
+    finally:
+        driver.quit()
+        remove_profile_copy(profile_dir)
+    print(
+        f"Locator lookup costs ({arguments.browser_name}, median of {arguments.repeats}):"
+    )
+    for locator_cost in locator_costs:
+        suggestion = ""
+        if locator_cost.best_locator_type != locator_cost.locator_type or (
+            locator_cost.best_locator_hook != locator_cost.locator_hook
+        ):
+            suggestion = (
+                f" -> {locator_cost.best_locator_type}={locator_cost.best_locator_hook}"
+                f" {locator_cost.best_median_ms:.2f} ms"
+            )
+        print(
+            f"  {locator_cost.table_name}.{locator_cost.name:<28} "
+            f"{locator_cost.locator_type}={locator_cost.locator_hook} "
+            f"{locator_cost.median_ms:.2f} ms{suggestion}"
+        )
+    for record_name in unmatched_records:
+        print(f"  {record_name}: no element matched, not measured")
+    if not arguments.dry_run:
+        write_locator_costs(locator_costs, arguments.browser_name)
+        print(f"Costs written to {locator_costs_path}")
+    return 1 if unmatched_records else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module validates every locator of the locator tables against the local
+demo page, before any browser starts: each CSS selector and XPath expression
+is compiled once and resolved in the static DOM (the locators of the frame
+items inside their frame), and the invalid, missing and ambiguous locators
+are reported. The selectors accepted by the browsers but not supported by the
+static DOM are reported as unsupported, without failing the validation. The
+fastest strategies of the locator costs database are validated too. The local
+demo page is a hand-written stand-in of the remote demo page: while the suite
+runs against the remote page, the report states that the live markup is not
+validated.
+
+Usage (from the project folder):
+» python -m utilities.locator_preflight
+"""
+
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+from pageobjects.locator import Locator
+from testdata.data_access import database_path, get_shared_database
+from testdata.locator_registry import (
+    LOCATOR_TABLES,
+    load_fastest_locators,
+    locator_costs_path,
+)
+from utilities.static_dom import SelectorError, compile_locator, find_elements
+from utilities.static_dom import UnsupportedSelectorError, parse_html
+from utilities.static_dom_driver import get_local_page_path, read_frame_source
+
+# Problems of the locators: the errors fail the pre-flight pass, the warnings do not
+INVALID = "invalid"
+MISSING = "missing"
+AMBIGUOUS = "ambiguous"
+UNSUPPORTED = "unsupported"
+FRAME_UNAVAILABLE = "frame unavailable"
+LOCATOR_ERRORS = (INVALID, MISSING)
+
+# Note of the report, when the tests run against the remote demo page
+STAND_IN_NOTE = "stand-in page only, the remote demo page of the tests is not validated"
+
+# Problem found for a locator record
+LocatorIssue = namedtuple(
+    "LocatorIssue", ("table", "name", "by", "hook", "problem", "detail")
+)
+
+
+def __frame_document__(page_document, page_path, frame_name, frame_documents):
+    """
+    Helper method used to retrieve the document of a frame of the page.
+
+    :param page_document: (DomDocument) the page document
+    :param page_path: (str) absolute path of the page
+    :param frame_name: (str) id or name of the frame
+    :param frame_documents: (dict) the frame documents already parsed
+    :return: (DomDocument) the frame document
+    """
+    if frame_name not in frame_documents:
+        frame_nodes = find_elements(page_document, "id", frame_name) or find_elements(
+            page_document, "name", frame_name
+        )
+        if not frame_nodes:
+            raise FileNotFoundError(f"No frame {frame_name!r} in the page")
+        frame_documents[frame_name] = parse_html(
+            read_frame_source(frame_nodes[0], page_path)
+        )
+    return frame_documents[frame_name]
+
+
+def __validate_locator__(record, issue_data, locator_data, page_data):
+    """
+    Helper method used to validate one locator against its document.
+
+    :param record: (dict) the locator record
+    :param issue_data: (tuple) the (table name, record name) of the issues
+    :param locator_data: (tuple) the (locator type, locator hook) to be validated
+    :param page_data: (tuple) the page document, the page path and the frame
+        documents already parsed
+    :return: (LocatorIssue) the issue found, or None
+    """
+    try:
+        locator = Locator.compile(*locator_data)
+        compile_locator(*locator)
+    except UnsupportedSelectorError as selector_error:
+        return LocatorIssue(*issue_data, *locator, UNSUPPORTED, str(selector_error))
+    except (ValueError, SelectorError) as locator_error:
+        return LocatorIssue(*issue_data, *locator_data, INVALID, str(locator_error))
+    document = page_data[0]
+    if record.get("iframe_name"):
+        try:
+            document = __frame_document__(
+                *page_data[:2], record["iframe_name"], page_data[2]
+            )
+        except FileNotFoundError as frame_error:
+            return LocatorIssue(
+                *issue_data, *locator, FRAME_UNAVAILABLE, str(frame_error)
+            )
+    match_count = len(find_elements(document, *locator))
+    if match_count == 0:
+        return LocatorIssue(*issue_data, *locator, MISSING, "no element matched")
+    if match_count > 1:
+        return LocatorIssue(
+            *issue_data,
+            *locator,
+            AMBIGUOUS,
+            f"{match_count} elements matched, the first one is used",
+        )
+    return None
+
+
+def validate_locators(
+    page_path=None,
+    table_names=LOCATOR_TABLES,
+    path=database_path,
+    costs_path=locator_costs_path,
+):
+    """
+    Function used to validate all the locator records against the local demo page,
+    together with the fastest strategies measured for the unchanged records.
+
+    :param page_path: (str) path of the html page, relative to the project
+        folder; the local demo page of the general table if None
+    :param table_names: (tuple) names of the locator tables
+    :param path: (str) path of the database file
+    :param costs_path: (str) path of the locator costs database file
+    :return: (list, int) the locator issues and the number of validated locators
+    """
+    page_path = get_local_page_path(page_path)
+    with open(page_path, encoding="utf-8") as f:
+        page_document = parse_html(f.read())
+    page_data = (page_document, page_path, dict())
+    database = get_shared_database(path)
+    fastest_locators = load_fastest_locators(costs_path)
+    locator_issues, locator_count = list(), 0
+    for table_name in table_names:
+        column_names, rows = database.fetch_all(f"SELECT * FROM {table_name}")
+        for row in rows:
+            record = dict(zip(column_names, row))
+            record_locator = (record.get("locator_type"), record.get("locator_hook"))
+            locators_data = [((table_name, record["name"]), record_locator)]
+            source_locator, fastest_locator = fastest_locators.get(
+                (table_name, record["name"]), (None, None)
+            )
+            if source_locator == record_locator:
+                locators_data.append(
+                    ((table_name, f"{record['name']} (fastest)"), fastest_locator)
+                )
+            for issue_data, locator_data in locators_data:
+                locator_count += 1
+                locator_issue = __validate_locator__(
+                    record, issue_data, locator_data, page_data
+                )
+                if locator_issue is not None:
+                    locator_issues.append(locator_issue)
+    return locator_issues, locator_count
+
+
+def format_report(locator_issues, locator_count, elapsed_time):
+    """
+    Function used to format the pre-flight report.
+
+    :param locator_issues: (list) the locator issues
+    :param locator_count: (int) number of validated locators
+    :param elapsed_time: (float) duration of the validation, in seconds
+    :return: (list) the report lines
+    """
+    error_count = sum(issue.problem in LOCATOR_ERRORS for issue in locator_issues)
+    report_lines = [
+        f"{locator_count} locators validated in {elapsed_time * 1000:.1f} ms: "
+        f"{error_count} errors, {len(locator_issues) - error_count} warnings"
+    ]
+    for issue in locator_issues:
+        report_lines.append(
+            f"{issue.problem:>17}: {issue.table}.{issue.name} "
+            f"({issue.by}={issue.hook}) - {issue.detail}"
+        )
+    return report_lines
+
+
+def uses_local_demo_page(path=database_path):
+    """
+    Function used to verify if the tests run against the local demo page.
+
+    :param path: (str) path of the database file
+    :return: (bool) the "local_demo_page" flag of the general table
+    """
+    _, (local_demo_page,) = get_shared_database(path).fetch_one(
+        "SELECT local_demo_page FROM general"
+    )
+    return bool(local_demo_page)
+
+
+def run_preflight(page_path=None):
+    """
+    Function used to run the pre-flight validation and to format its report.
+
+    :param page_path: (str) path of the html page, relative to the project folder
+    :return: (bool, list) True if no locator error was found, and the report lines
+    """
+    start_time = time.perf_counter()
+    try:
+        locator_issues, locator_count = validate_locators(page_path)
+    except FileNotFoundError as page_error:
+        return False, [f"Locator pre-flight not possible: {page_error}"]
+    report_lines = format_report(
+        locator_issues, locator_count, time.perf_counter() - start_time
+    )
+    if page_path is None and not uses_local_demo_page():
+        report_lines[0] += f" ({STAND_IN_NOTE})"
+    return (
+        not any(issue.problem in LOCATOR_ERRORS for issue in locator_issues),
+        report_lines,
+    )
+
+
+def main():
+    """
+    Function used to run the pre-flight validation from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--page_path",
+        default=None,
+        help="html page, relative to the project folder (default: the local demo page)",
+    )
+    arguments = parser.parse_args()
+    preflight_passed, report_lines = run_preflight(arguments.page_path)
+    print("\n".join(report_lines))
+    return 0 if preflight_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
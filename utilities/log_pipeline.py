@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the logging pipeline of the framework: one file handler per
+process, fed through a queue by a background listener, so the tests never wait
+for the disk. The test name and data row are attached to every record from a
+context set by the test fixtures, with no stack inspection.
+"""
+
+import contextvars
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+from utilities.parallel_runner import get_worker_id
+
+# Name of the logger used by the tests
+LOGGER_NAME = "demoqa"
+
+# Format of the log lines (the data row is empty for the tests without data rows)
+LOG_FORMAT = (
+    "%(asctime)s :%(levelname)s : %(worker)s : %(test_name)s :%(data_row)s :%(message)s"
+)
+
+# Context of the current test: (test name, data row)
+__log_context__ = contextvars.ContextVar("demoqa_log_context", default=None)
+
+
+def set_log_context(test_name, data_row=None):
+    """
+    Function used to attach the current test to the log records.
+
+    :param test_name: (str) name of the current test
+    :param data_row: (str) identifier of the current data row, if any
+    :return: (obj) token used to restore the previous context
+    """
+    return __log_context__.set((test_name, data_row))
+
+
+def reset_log_context(token):
+    """
+    Function used to restore the log context, after the test has ended.
+
+    :param token: (obj) the token returned by set_log_context()
+    """
+    __log_context__.reset(token)
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Class definition for the filter attaching the test context to the log records.
+    """
+
+    def filter(self, record):
+        """
+        Method used to attach the test name, data row and worker to a record.
+
+        :param record: (obj) the log record
+        :return: (bool) True, the records are never dropped
+        """
+        test_name, data_row = __log_context__.get() or (record.name, None)
+        record.test_name = test_name
+        record.data_row = data_row or ""
+        record.worker = get_worker_id()
+        return True
+
+
+class LogPipeline:
+    """
+    Class definition for the logging pipeline of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class; the pipeline is configured at the first use.
+        """
+        self.log_file = None
+        self.__queue_handler__ = None
+        self.__listener__ = None
+        self.__lock__ = threading.Lock()
+
+    def configure(self, log_file="logfile.log", log_level=logging.DEBUG):
+        """
+        Method used to configure the pipeline, once per process: the records are
+        queued by the tests and written to the log file by a background listener.
+
+        :param log_file: (str) path of the log file of the process
+        :param log_level: (int) logging level of the tests logger
+        """
+        with self.__lock__:
+            if self.__listener__ is not None:
+                return
+            self.log_file = os.path.abspath(log_file)
+            file_handler = logging.FileHandler(self.log_file, delay=True)
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            log_queue = queue.SimpleQueue()
+            self.__queue_handler__ = logging.handlers.QueueHandler(log_queue)
+            self.__queue_handler__.addFilter(LogContextFilter())
+            logger = logging.getLogger(LOGGER_NAME)
+            logger.addHandler(self.__queue_handler__)
+            logger.setLevel(log_level)
+            self.__listener__ = logging.handlers.QueueListener(log_queue, file_handler)
+            self.__listener__.start()
+
+    def get_logger(self):
+        """
+        Method used to retrieve the tests logger, configuring the pipeline if required.
+
+        :return: (obj) the logger object
+        """
+        if self.__listener__ is None:
+            self.configure()
+        return logging.getLogger(LOGGER_NAME)
+
+    def shutdown(self):
+        """
+        Method used to flush the queued records and to close the log file
+        (called at the end of the test session).
+        """
+        with self.__lock__:
+            if self.__listener__ is None:
+                return
+            self.__listener__.stop()
+            for handler in self.__listener__.handlers:
+                handler.close()
+            logging.getLogger(LOGGER_NAME).removeHandler(self.__queue_handler__)
+            self.__listener__ = None
+            self.__queue_handler__ = None
+
+
+# Process-wide logging pipeline
+log_pipeline = LogPipeline()
@@ -0,0 +1,33 @@
+/** drag and drop an element through native drag events (requires page_element_helper.js) */
+return (function(sourceBy, sourceHook, targetBy, targetHook) {
+    var source = findElement(sourceBy, sourceHook);
+    var target = findElement(targetBy, targetHook);
+    if (source === null || target === null) {
+        return {performed: false, error: 'Drag and drop element not found'};
+    }
+    var dataTransfer;
+    try {
+        dataTransfer = new DataTransfer();
+    } catch (dataTransferError) {
+        return {performed: false, error: 'DataTransfer not supported: ' + dataTransferError};
+    }
+    function fireDragEvent(element, eventType) {
+        var elementRect = element.getBoundingClientRect();
+        var dragEvent = new DragEvent(eventType, {
+            bubbles: true,
+            cancelable: true,
+            composed: true,
+            dataTransfer: dataTransfer,
+            clientX: elementRect.left + elementRect.width / 2,
+            clientY: elementRect.top + elementRect.height / 2
+        });
+        return element.dispatchEvent(dragEvent);
+    }
+    /* the same DataTransfer is shared by all the events, as in a real drag */
+    fireDragEvent(source, 'dragstart');
+    fireDragEvent(target, 'dragenter');
+    fireDragEvent(target, 'dragover');
+    fireDragEvent(target, 'drop');
+    fireDragEvent(source, 'dragend');
+    return {performed: true, error: null};
+})(arguments[0], arguments[1], arguments[2], arguments[3]);
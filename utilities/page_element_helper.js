@@ -0,0 +1,36 @@
+/** page element helpers: find an element from a selenium (By, hook) locator */
+function findElement(locatorBy, locatorHook) {
+    switch (locatorBy) {
+        case 'id':
+            return document.getElementById(locatorHook);
+        case 'xpath':
+            return document.evaluate(locatorHook, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'css selector':
+            return document.querySelector(locatorHook);
+        case 'name':
+            return document.getElementsByName(locatorHook)[0] || null;
+        case 'tag name':
+            return document.getElementsByTagName(locatorHook)[0] || null;
+        case 'class name':
+            return document.getElementsByClassName(locatorHook)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var linkText = links[i].innerText.trim();
+                if ((locatorBy == 'link text' && linkText == locatorHook)
+                        || (locatorBy == 'partial link text'
+                            && linkText.indexOf(locatorHook) >= 0)) {
+                    return links[i];
+                }
+            }
+            return null;
+    }
+    return null;
+}
+function isDisplayed(element) {
+    var style = window.getComputedStyle(element);
+    return element.getClientRects().length > 0 && style.visibility != 'hidden'
+        && style.display != 'none';
+}
@@ -0,0 +1,87 @@
+/** record the listeners, timers and observers of the page, from before its own scripts run */
+(function() {
+    if (window.__demoqaListenerTracker__) {
+        return;
+    }
+    var tracker = window.__demoqaListenerTracker__ = {
+        /* identifies the document: a reload installs a new tracker */
+        token: Date.now().toString(36) + Math.random().toString(36).slice(2),
+        installedBeforeLoad: document.readyState == 'loading',
+        listeners: [],
+        timeouts: {},
+        intervals: {},
+        observers: []
+    };
+    function sameListener(registration, target, args) {
+        var capture = typeof args[2] == 'object' && args[2] ? !!args[2].capture : !!args[2];
+        return registration.target === target && registration.type == args[0] &&
+            registration.listener === args[1] && registration.capture == capture;
+    }
+    var addEventListener = EventTarget.prototype.addEventListener;
+    var removeEventListener = EventTarget.prototype.removeEventListener;
+    EventTarget.prototype.addEventListener = function() {
+        var args = arguments, target = this;
+        if (args[1] && !tracker.listeners.some(function(registration) {
+                return sameListener(registration, target, args);
+            })) {
+            var capture = typeof args[2] == 'object' && args[2] ? !!args[2].capture : !!args[2];
+            tracker.listeners.push({target: target, type: args[0], listener: args[1], capture: capture});
+        }
+        return addEventListener.apply(this, arguments);
+    };
+    EventTarget.prototype.removeEventListener = function() {
+        var args = arguments, target = this;
+        tracker.listeners = tracker.listeners.filter(function(registration) {
+            return !sameListener(registration, target, args);
+        });
+        return removeEventListener.apply(this, arguments);
+    };
+    var setTimeout = window.setTimeout, clearTimeout = window.clearTimeout;
+    window.setTimeout = function(callback) {
+        var args = Array.prototype.slice.call(arguments);
+        var timeoutId;
+        if (typeof callback == 'function') {
+            args[0] = function() {
+                delete tracker.timeouts[timeoutId];
+                return callback.apply(this, arguments);
+            };
+        }
+        timeoutId = setTimeout.apply(window, args);
+        tracker.timeouts[timeoutId] = true;
+        return timeoutId;
+    };
+    window.clearTimeout = function(timeoutId) {
+        delete tracker.timeouts[timeoutId];
+        return clearTimeout.apply(window, arguments);
+    };
+    var setInterval = window.setInterval, clearInterval = window.clearInterval;
+    window.setInterval = function() {
+        var intervalId = setInterval.apply(window, arguments);
+        tracker.intervals[intervalId] = true;
+        return intervalId;
+    };
+    window.clearInterval = function(intervalId) {
+        delete tracker.intervals[intervalId];
+        return clearInterval.apply(window, arguments);
+    };
+    ['MutationObserver', 'ResizeObserver', 'IntersectionObserver'].forEach(function(observerName) {
+        var observerClass = window[observerName];
+        if (!observerClass) {
+            return;
+        }
+        var observe = observerClass.prototype.observe, disconnect = observerClass.prototype.disconnect;
+        observerClass.prototype.observe = function() {
+            if (tracker.observers.indexOf(this) < 0) {
+                tracker.observers.push(this);
+            }
+            return observe.apply(this, arguments);
+        };
+        observerClass.prototype.disconnect = function() {
+            var observer = this;
+            tracker.observers = tracker.observers.filter(function(tracked) {
+                return tracked !== observer;
+            });
+            return disconnect.apply(this, arguments);
+        };
+    });
+})();
@@ -0,0 +1,82 @@
+/** capture or restore the page state (DOM and form values) of the current document */
+return (function(snapshotAction, pageUrl) {
+    /* signature of the body: its markup and the live values of its form fields */
+    function readSignature(body) {
+        var signature = body.outerHTML;
+        var fields = body.querySelectorAll('input, select, textarea');
+        for (var i = 0; i < fields.length; i++) {
+            signature += '\n' + fields[i].value + (fields[i].checked ? '+' : '-');
+        }
+        var hash = 0;
+        for (var j = 0; j < signature.length; j++) {
+            hash = (hash * 31 + signature.charCodeAt(j)) | 0;
+        }
+        return signature.length + ':' + hash;
+    }
+    /* globals of the page, the framework helpers excepted */
+    function readGlobals() {
+        return Object.keys(window).filter(function(key) {
+            return key.indexOf('__demoqa') != 0;
+        });
+    }
+    /* handlers assigned to the on* properties (the inline attributes are kept by the
+       clone; the window handlers of the body attributes, e.g.: onload, included) */
+    function hasPropertyHandlers(targets) {
+        return targets.some(function(target) {
+            var attributeHolder = target === window ? document.body : target;
+            for (var key in target) {
+                if (key.indexOf('on') == 0 && typeof target[key] == 'function' &&
+                        !(attributeHolder.hasAttribute && attributeHolder.hasAttribute(key))) {
+                    return true;
+                }
+            }
+            return false;
+        });
+    }
+    /* state of the listener tracker, installed before the page scripts (see
+       page_listener_tracker.js): the listeners of the detached nodes are dropped */
+    function readListenerState(tracker) {
+        tracker.listeners = tracker.listeners.filter(function(registration) {
+            return !(registration.target instanceof Node) || registration.target.isConnected;
+        });
+        return [
+            tracker.token,
+            tracker.listeners.length,
+            Object.keys(tracker.timeouts).length,
+            Object.keys(tracker.intervals).length,
+            tracker.observers.length
+        ].join(':');
+    }
+    /* the page state is reset only when no listener, timer or observer could keep the old nodes */
+    function isResettable(tracker, targets) {
+        return !!tracker && tracker.installedBeforeLoad &&
+            readListenerState(tracker) == tracker.token + ':0:0:0:0' &&
+            !hasPropertyHandlers(targets);
+    }
+    var tracker = window.__demoqaListenerTracker__;
+    var windowTargets = [window, document, document.documentElement, document.head];
+    if (snapshotAction == 'capture') {
+        /* the body is cloned right after the full load, before any interaction */
+        var bodyNodes = Array.prototype.slice.call(document.body.querySelectorAll('*'));
+        window.__demoqaPageSnapshot__ = {
+            url: pageUrl,
+            body: document.body.cloneNode(true),
+            globals: readGlobals().join('\n'),
+            restorable: isResettable(tracker, windowTargets.concat([document.body], bodyNodes))
+        };
+        return readSignature(document.body) + '|' + (tracker ? readListenerState(tracker) : '');
+    }
+    var pageSnapshot = window.__demoqaPageSnapshot__;
+    if (!pageSnapshot || pageSnapshot.url != pageUrl || document.readyState != 'complete') {
+        return null;
+    }
+    /* the window state left by the previous test is not reset by the clone */
+    if (!pageSnapshot.restorable || !isResettable(tracker, windowTargets) ||
+            readGlobals().join('\n') != pageSnapshot.globals) {
+        return null;
+    }
+    /* cloning keeps the markup, the inline event handlers and the default form values */
+    document.documentElement.replaceChild(pageSnapshot.body.cloneNode(true), document.body);
+    window.scrollTo(0, 0);
+    return readSignature(document.body) + '|' + readListenerState(tracker);
+})(arguments[0], arguments[1]);
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module runs the test suite in parallel: the collected tests (including
+every parametrized data row) are split into shards, each shard is executed by
+a separate pytest worker process owning its own browser session, logs,
+screenshots and report fragment, and the worker results and logs are merged
+at the end.
+"""
+
+import html
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from utilities.duration_scheduler import pack_shards
+
+# Environment variable holding the worker identifier inside a worker process
+WORKER_ID_VARIABLE = "DEMOQA_WORKER_ID"
+
+# Options of the main run which are not forwarded to the worker processes
+MAIN_RUN_OPTIONS = ("--workers", "--parallel_dir", "--html", "--junitxml")
+
+
+def get_worker_id():
+    """
+    Function used to retrieve the identifier of the current worker process.
+
+    :return: (str) the worker identifier, "main" when not running as a worker
+    """
+    return os.environ.get(WORKER_ID_VARIABLE, "main")
+
+
+def select_shard(items, shard_index, shard_count, expected_durations=None):
+    """
+    Function used to split the collected tests between the workers: bin-packed
+    by expected duration when the durations are known, round robin otherwise.
+
+    :param items: (list) the collected pytest items, in execution order
+    :param shard_index: (int) index of the current worker
+    :param shard_count: (int) number of workers
+    :param expected_durations: (dict) nodeid -> expected duration, if known
+    :return: (list, list) the items selected for this worker and the deselected ones
+    """
+    if expected_durations:
+        shard_items, _ = pack_shards(items, expected_durations, shard_count)
+        selected_nodeids = {item.nodeid for item in shard_items[shard_index]}
+    else:
+        selected_nodeids = {
+            item.nodeid
+            for item_index, item in enumerate(items)
+            if item_index % shard_count == shard_index
+        }
+    selected_items, deselected_items = list(), list()
+    for item in items:
+        if item.nodeid in selected_nodeids:
+            selected_items.append(item)
+        else:
+            deselected_items.append(item)
+    return selected_items, deselected_items
+
+
+def __worker_arguments__(invocation_args, invocation_dir):
+    """
+    Helper method used to build the worker command line from the main one:
+    the main run options are dropped and the test paths are made absolute,
+    as the workers are executed from their own output folders.
+
+    :param invocation_args: (tuple) the command line arguments of the main run
+    :param invocation_dir: (str) the working directory of the main run
+    :return: (list) the arguments forwarded to every worker
+    """
+    worker_args = list()
+    has_test_paths = False
+    skip_value = False
+    for argument in invocation_args:
+        argument = str(argument)
+        if skip_value:
+            skip_value = False
+            continue
+        option_name = argument.split("=")[0]
+        if option_name in MAIN_RUN_OPTIONS:
+            skip_value = "=" not in argument
+            continue
+        test_path = os.path.join(invocation_dir, argument.split("::")[0])
+        if not argument.startswith("-") and os.path.exists(test_path):
+            argument = os.path.join(invocation_dir, argument)
+            has_test_paths = True
+        worker_args.append(argument)
+    if not has_test_paths:
+        worker_args.append(str(invocation_dir))
+    return worker_args
+
+
+def __merge_junit_reports__(worker_reports, merged_report_path):
+    """
+    Helper method used to merge the JUnit XML fragments of the workers.
+
+    :param worker_reports: (dict) worker identifier -> JUnit XML report path
+    :param merged_report_path: (str) path of the merged JUnit XML report
+    :return: (list) the merged results, as dicts (test, outcome, duration, worker)
+    """
+    merged_suite = ElementTree.Element("testsuite", name="pytest")
+    merged_results = list()
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    total_time = 0.0
+    for worker_id, report_path in worker_reports.items():
+        if not os.path.isfile(report_path):
+            continue
+        for test_case in ElementTree.parse(report_path).getroot().iter("testcase"):
+            outcome = "passed"
+            for outcome_tag, outcome_name in (
+                ("failure", "failures"),
+                ("error", "errors"),
+                ("skipped", "skipped"),
+            ):
+                if test_case.find(outcome_tag) is not None:
+                    outcome = outcome_tag
+                    totals[outcome_name] += 1
+                    break
+            totals["tests"] += 1
+            duration = float(test_case.get("time", 0))
+            total_time += duration
+            properties = test_case.find("properties")
+            if properties is None:
+                properties = ElementTree.SubElement(test_case, "properties")
+            ElementTree.SubElement(
+                properties, "property", name="worker", value=worker_id
+            )
+            merged_suite.append(test_case)
+            merged_results.append(
+                {
+                    "test": f"{test_case.get('classname')}::{test_case.get('name')}",
+                    "outcome": outcome,
+                    "duration": duration,
+                    "worker": worker_id,
+                }
+            )
+    for total_name, total_value in totals.items():
+        merged_suite.set(total_name, str(total_value))
+    merged_suite.set("time", f"{total_time:.3f}")
+    merged_root = ElementTree.Element("testsuites")
+    merged_root.append(merged_suite)
+    ElementTree.ElementTree(merged_root).write(
+        merged_report_path, encoding="utf-8", xml_declaration=True
+    )
+    return merged_results
+
+
+def __write_html_report__(merged_results, worker_dirs, wall_time, html_report_path):
+    """
+    Helper method used to write the merged html report, linking the
+    report fragment, the log and the screenshots of every worker.
+
+    :param merged_results: (list) the merged results of the workers
+    :param worker_dirs: (dict) worker identifier -> worker output folder
+    :param wall_time: (float) duration of the parallel run, in seconds
+    :param html_report_path: (str) path of the merged html report
+    """
+    report_dir = os.path.dirname(os.path.abspath(html_report_path))
+    outcome_count = dict()
+    for result in merged_results:
+        outcome_count[result["outcome"]] = outcome_count.get(result["outcome"], 0) + 1
+    result_rows = "\n".join(
+        f"<tr class='{result['outcome']}'><td>{html.escape(result['test'])}</td>"
+        f"<td>{result['outcome']}</td><td>{result['duration']:.2f}</td>"
+        f"<td>{result['worker']}</td></tr>"
+        for result in merged_results
+    )
+    worker_links = list()
+    for worker_id, worker_dir in worker_dirs.items():
+        artifact_links = list()
+        for file_name in sorted(os.listdir(worker_dir)):
+            if file_name.endswith((".html", ".log", ".png")):
+                file_path = os.path.relpath(
+                    os.path.join(worker_dir, file_name), report_dir
+                )
+                artifact_links.append(
+                    f"<a href='{html.escape(file_path)}'>{html.escape(file_name)}</a>"
+                )
+        worker_links.append(f"<li>{worker_id}: {', '.join(artifact_links)}</li>")
+    worker_links = "\n".join(worker_links)
+    summary = ", ".join(
+        f"{count} {outcome}" for outcome, count in sorted(outcome_count.items())
+    )
+    with open(html_report_path, "w", encoding="utf-8") as f:
+        f.write(
+            "<!DOCTYPE html>\n<html><head><meta charset='utf-8'/>"
+            "<title>Parallel test report</title><style>"
+            "body{font-family:Helvetica,Arial,sans-serif;font-size:12px}"
+            "table{border-collapse:collapse}td,th{border:1px solid #e6e6e6;padding:4px}"
+            ".passed{color:green}.failure,.error{color:red}.skipped{color:orange}"
+            "</style></head><body>\n"
+            f"<h1>Parallel test report</h1>\n<p>{len(merged_results)} tests "
+            f"({summary}) on {len(worker_dirs)} workers, wall time {wall_time:.2f}s</p>\n"
+            "<table><tr><th>Test</th><th>Result</th><th>Duration (s)</th>"
+            f"<th>Worker</th></tr>\n{result_rows}\n</table>\n"
+            f"<h2>Worker artifacts</h2>\n<ul>\n{worker_links}\n</ul>\n</body></html>\n"
+        )
+
+
+def __merge_log_files__(worker_dirs, merged_log_path):
+    """
+    Helper method used to merge the log files of the workers into one log,
+    ordered by time; every line is prefixed with its worker identifier and the
+    continuation lines (e.g.: tracebacks) are kept with their record.
+
+    :param worker_dirs: (dict) worker identifier -> worker output folder
+    :param merged_log_path: (str) path of the merged log file
+    """
+    log_records = list()
+    for worker_id, worker_dir in worker_dirs.items():
+        log_path = os.path.join(worker_dir, "logfile.log")
+        if not os.path.isfile(log_path):
+            continue
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                # The records start with their timestamp (e.g.: "2024-01-01 12:00:00,000")
+                if (
+                    log_records
+                    and log_records[-1][1] == worker_id
+                    and not line[:4].isdigit()
+                ):
+                    log_records[-1][2].append(line)
+                else:
+                    log_records.append((line[:23], worker_id, [line]))
+    log_records.sort(key=lambda log_record: log_record[0])
+    with open(merged_log_path, "w", encoding="utf-8") as f:
+        for _, worker_id, record_lines in log_records:
+            f.writelines(f"[{worker_id}] {line}" for line in record_lines)
+
+
+def run_parallel(config, worker_count):
+    """
+    Function used to execute the test suite in parallel worker processes
+    and to merge their results.
+
+    :param config: (obj) the pytest configuration of the main run
+    :param worker_count: (int) number of worker processes
+    :return: (int) the exit code of the run
+    """
+    invocation_dir = str(config.invocation_params.dir)
+    parallel_dir = os.path.join(invocation_dir, config.getoption("parallel_dir"))
+    worker_args = __worker_arguments__(config.invocation_params.args, invocation_dir)
+    html_report_path = config.getoption("htmlpath", None)
+    if html_report_path:
+        html_report_path = os.path.join(invocation_dir, html_report_path)
+
+    # Start one pytest process per worker, each one in its own output folder
+    start_time = time.perf_counter()
+    worker_processes, worker_dirs, worker_reports = dict(), dict(), dict()
+    for shard_index in range(worker_count):
+        worker_id = f"worker{shard_index}"
+        worker_dir = os.path.join(parallel_dir, worker_id)
+        os.makedirs(worker_dir, exist_ok=True)
+        worker_dirs[worker_id] = worker_dir
+        worker_reports[worker_id] = os.path.join(worker_dir, "report.xml")
+        worker_command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            *worker_args,
+            "--rootdir",
+            str(config.rootpath),
+            "--shard_index",
+            str(shard_index),
+            "--shard_count",
+            str(worker_count),
+            "--junitxml",
+            worker_reports[worker_id],
+        ]
+        if html_report_path:
+            worker_command += ["--html", os.path.join(worker_dir, "report.html")]
+        worker_env = dict(os.environ, **{WORKER_ID_VARIABLE: worker_id})
+        with open(os.path.join(worker_dir, "output.log"), "w") as output_file:
+            worker_processes[worker_id] = subprocess.Popen(
+                worker_command,
+                cwd=worker_dir,
+                env=worker_env,
+                stdout=output_file,
+                stderr=subprocess.STDOUT,
+            )
+
+    # Wait for the workers; "no tests collected" (5) is expected for empty shards
+    exit_codes = dict()
+    for worker_id, worker_process in worker_processes.items():
+        exit_codes[worker_id] = worker_process.wait()
+    wall_time = time.perf_counter() - start_time
+
+    # Merge the report fragments of the workers
+    merged_results = __merge_junit_reports__(
+        worker_reports, os.path.join(parallel_dir, "report.xml")
+    )
+    __write_html_report__(
+        merged_results,
+        worker_dirs,
+        wall_time,
+        html_report_path or os.path.join(parallel_dir, "report.html"),
+    )
+    __merge_log_files__(worker_dirs, os.path.join(parallel_dir, "logfile.log"))
+
+    # The terminal reporter is only registered in the workers: the main run,
+    # which ends before the pytest configuration, writes through its own one
+    terminal_reporter = config.pluginmanager.get_plugin(
+        "terminalreporter"
+    ) or pytest.TerminalReporter(config, sys.stdout)
+    terminal_reporter.write_sep("=", "parallel run")
+    for worker_id, exit_code in exit_codes.items():
+        terminal_reporter.write_line(
+            f"{worker_id}: exit code {exit_code}, output in {worker_dirs[worker_id]}",
+            red=exit_code not in (0, 5),
+        )
+    terminal_reporter.write_line(
+        f"{len(merged_results)} tests executed by {worker_count} workers "
+        f"in {wall_time:.2f}s, merged report in {parallel_dir}"
+    )
+    failed_codes = [code for code in exit_codes.values() if code not in (0, 5)]
+    if failed_codes:
+        return max(failed_codes)
+    return 0 if merged_results else 5
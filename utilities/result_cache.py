@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the result cache of the tests: the passes are stored under
+a hash of the inputs of the test and of its data row (the locator, general and
+data rows of the "demopage_data" database, the locator costs, the local demo
+page, the page object modules, the shared test flows, the javascript helpers,
+the test function source and the run options), and replayed while none of these
+inputs changed. The cache entries are kept in the pytest cache folder; a remote
+demo page is only identified by its url, not by its content.
+"""
+
+import glob
+import hashlib
+import inspect
+import os
+import threading
+import time
+
+import pytest
+
+from pageobjects import demopage
+from tests import demopage_flows
+from testdata.data_access import database_path, get_shared_database
+from testdata.data_provider import DATA_FIXTURE, data_provider
+from testdata.locator_registry import LOCATOR_TABLES, locator_costs_path
+from utilities.scripts import scripts_path
+from utilities.static_dom_driver import get_local_page_path
+
+# User property marking the replayed reports (value: the time of the cached pass)
+RESULT_CACHE_PROPERTY = "result_cache"
+
+# Stash key of the cache entry replayed by a test, instead of calling it
+RESULT_CACHE_ENTRY = pytest.StashKey[dict]()
+
+# Key prefix of the cache entries, in the pytest cache
+CACHE_KEY_PREFIX = "demoqa/result_cache"
+
+# Tables of the database read by every test (the data tables are hashed per row)
+INPUT_TABLES = ("general", "repetitive_tests", *LOCATOR_TABLES)
+
+# Source files run by every test: the page object modules, the shared test
+# flows and the javascript helpers injected in the page
+INPUT_SOURCE_PATTERNS = (
+    os.path.join(os.path.dirname(inspect.getsourcefile(demopage)), "*.py"),
+    inspect.getsourcefile(demopage_flows),
+    os.path.join(scripts_path, "*.js"),
+)
+
+
+def hash_table(demopage_db, table_name):
+    """
+    Function used to hash the content of a database table, in a stable row order.
+
+    :param demopage_db: (SharedDatabase) the database access object
+    :param table_name: (str) name of the table
+    :return: (str) the hash of the table, or "" if the table does not exist
+    """
+    _, schema_rows = demopage_db.fetch_all(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+    )
+    if not schema_rows:
+        return ""
+    column_names, table_rows = demopage_db.fetch_all(f"SELECT * FROM {table_name}")
+    table_hash = hashlib.sha256(repr(column_names).encode())
+    for table_row in sorted(table_rows, key=repr):
+        table_hash.update(repr(table_row).encode())
+    return table_hash.hexdigest()
+
+
+def get_input_sources():
+    """
+    Function used to list the source files run by every test, in a stable order.
+
+    :return: (list) the paths of the source files
+    """
+    return sorted(
+        source_path
+        for source_pattern in INPUT_SOURCE_PATTERNS
+        for source_path in glob.glob(source_pattern)
+    )
+
+
+def hash_file(file_path):
+    """
+    Function used to hash the content of a file.
+
+    :param file_path: (str) path of the file
+    :return: (str) the hash of the file, or "" if the file does not exist
+    """
+    if not os.path.isfile(file_path):
+        return ""
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ResultCache:
+    """
+    Class definition for the result cache of the tests.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class; the cache is disabled until it is configured.
+        """
+        self.cache = None
+        self.replay = False
+        self.run_context = ""
+        self.hits = 0
+        self.stored = 0
+        self.__inputs_hash__ = None
+        self.__item_hashes__ = dict()
+        self.__passed_calls__ = set()
+        self.__lock__ = threading.Lock()
+
+    def configure(self, cache, replay, run_context):
+        """
+        Method used to enable the result cache.
+
+        :param cache: (obj) the pytest cache (config.cache)
+        :param replay: (bool) if True, the cached passes are replayed; otherwise
+            all the tests are executed and their passes are stored again
+        :param run_context: (str) the options changing the results (e.g.: browser)
+        """
+        self.cache = cache
+        self.replay = replay
+        self.run_context = run_context
+
+    def is_enabled(self):
+        """
+        Method used to verify if the result cache is enabled.
+
+        :return: (bool) True if the passes are stored
+        """
+        return self.cache is not None
+
+    def __get_inputs_hash__(self):
+        """
+        Helper method used to hash the inputs shared by all the tests, once per session.
+
+        :return: (str) the hash of the shared inputs
+        """
+        if self.__inputs_hash__ is None:
+            demopage_db = get_shared_database(database_path)
+            inputs_hash = hashlib.sha256(self.run_context.encode())
+            for table_name in INPUT_TABLES:
+                inputs_hash.update(hash_table(demopage_db, table_name).encode())
+            inputs_hash.update(hash_file(locator_costs_path).encode())
+            # The remote demo page is only identified by its url (general table)
+            inputs_hash.update(hash_file(get_local_page_path()).encode())
+            for source_path in get_input_sources():
+                inputs_hash.update(os.path.basename(source_path).encode())
+                inputs_hash.update(hash_file(source_path).encode())
+            self.__inputs_hash__ = inputs_hash.hexdigest()
+        return self.__inputs_hash__
+
+    def get_item_hash(self, item):
+        """
+        Method used to hash the inputs of a test and of its data row.
+
+        :param item: (obj) the pytest item
+        :return: (str) the hash of the test inputs
+        """
+        with self.__lock__:
+            if item.nodeid not in self.__item_hashes__:
+                item_hash = hashlib.sha256(self.__get_inputs_hash__().encode())
+                item_hash.update(item.nodeid.encode())
+                item_hash.update(inspect.getsource(item.function).encode())
+                callspec = getattr(item, "callspec", None)
+                if callspec is not None and DATA_FIXTURE in callspec.params:
+                    data_row = data_provider.get_row(*callspec.params[DATA_FIXTURE])
+                    item_hash.update(repr(data_row).encode())
+                self.__item_hashes__[item.nodeid] = item_hash.hexdigest()
+            return self.__item_hashes__[item.nodeid]
+
+    def lookup(self, item):
+        """
+        Method used to find the cached pass of a test, when the cache is replayed.
+
+        :param item: (obj) the pytest item
+        :return: (dict) the cache entry, or None if the test has to be executed
+        """
+        if not self.is_enabled() or not self.replay:
+            return None
+        cache_entry = self.cache.get(
+            f"{CACHE_KEY_PREFIX}/{self.get_item_hash(item)}", None
+        )
+        if cache_entry is not None:
+            with self.__lock__:
+                self.hits += 1
+        return cache_entry
+
+    def record_report(self, item, report):
+        """
+        Method used to store the pass of a test once its teardown passed too
+        (the expected failures which passed are not stored).
+
+        :param item: (obj) the pytest item
+        :param report: (obj) the pytest report of a test phase
+        """
+        if not self.is_enabled() or is_cached_report(report):
+            return
+        if report.when == "call":
+            if report.passed and not hasattr(report, "wasxfail"):
+                with self.__lock__:
+                    self.__passed_calls__.add(item.nodeid)
+        elif report.when == "teardown":
+            with self.__lock__:
+                call_passed = item.nodeid in self.__passed_calls__
+                self.__passed_calls__.discard(item.nodeid)
+            if call_passed and report.passed:
+                self.store(item)
+
+    def store(self, item):
+        """
+        Method used to store the pass of a test.
+
+        :param item: (obj) the pytest item
+        """
+        if not self.is_enabled():
+            return
+        self.cache.set(
+            f"{CACHE_KEY_PREFIX}/{self.get_item_hash(item)}",
+            {"nodeid": item.nodeid, "passed_at": time.strftime("%Y-%m-%d %H:%M:%S")},
+        )
+        with self.__lock__:
+            self.stored += 1
+
+
+def is_cached_report(report):
+    """
+    Function used to verify if a test report was replayed from the result cache.
+
+    :param report: (obj) the pytest report
+    :return: (bool) True if the report is a cached pass
+    """
+    return any(
+        property_name == RESULT_CACHE_PROPERTY
+        for property_name, _ in getattr(report, "user_properties", ())
+    )
+
+
+# Process-wide result cache
+result_cache = ResultCache()
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the screenshot pipeline of the framework: the image bytes
+are grabbed once on the test thread (the whole page or a single element) and a
+background worker compresses them, writes them to disk and builds their
+thumbnails (with Pillow when installed, otherwise with the PNG decoder of the
+module). Identical frames (e.g.: every data row failing on the same screen)
+are written once.
+"""
+
+import hashlib
+import io
+import itertools
+import os
+import queue
+import re
+import struct
+import threading
+import zlib
+
+from utilities.log_pipeline import log_pipeline
+
+try:
+    from PIL import Image
+except ImportError:  # the thumbnails are downscaled by the module decoder
+    Image = None
+
+# Signature of the PNG files
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Maximum size of the thumbnails, in pixels
+THUMBNAIL_SIZE = (304, 228)
+
+# Bytes per pixel of the 8 bit PNG color types (grayscale, RGB, gray alpha, RGBA)
+PNG_PIXEL_SIZES = {0: 1, 2: 3, 4: 2, 6: 4}
+
+# Maximum length of the sanitized file names
+MAX_FILE_NAME_LENGTH = 120
+
+
+def sanitize_file_name(name):
+    """
+    Function used to turn a test identifier into a portable file name
+    (e.g.: "tests/test_demopage.py::test_x[row0]" -> "tests_test_demopage.py_test_x_row0").
+
+    :param name: (str) the test identifier
+    :return: (str) the file name, without extension
+    """
+    file_name = re.sub(r"[^\w.-]+", "_", name).strip("._") or "screenshot"
+    if len(file_name) > MAX_FILE_NAME_LENGTH:
+        name_digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+        file_name = f"{file_name[:MAX_FILE_NAME_LENGTH - 9]}_{name_digest}"
+    return file_name
+
+
+def __read_png_chunks__(png_bytes):
+    """
+    Helper function used to split a PNG image into its chunks.
+
+    :param png_bytes: (bytes) the PNG image
+    :return: (list) the (chunk type, chunk data) pairs
+    """
+    chunks, position = list(), len(PNG_SIGNATURE)
+    while position + 8 <= len(png_bytes):
+        chunk_length, chunk_type = struct.unpack(
+            ">I4s", png_bytes[position : position + 8]
+        )
+        chunks.append(
+            (chunk_type, png_bytes[position + 8 : position + 8 + chunk_length])
+        )
+        position += chunk_length + 12
+    return chunks
+
+
+def __write_png_chunk__(chunk_type, chunk_data):
+    """
+    Helper function used to encode a PNG chunk.
+
+    :param chunk_type: (bytes) the 4 letter type of the chunk
+    :param chunk_data: (bytes) the data of the chunk
+    :return: (bytes) the chunk, with its length and checksum
+    """
+    return b"".join(
+        (
+            struct.pack(">I", len(chunk_data)),
+            chunk_type + chunk_data,
+            struct.pack(">I", zlib.crc32(chunk_type + chunk_data)),
+        )
+    )
+
+
+def recompress_png(png_bytes):
+    """
+    Function used to compress a PNG image losslessly, by deflating its image
+    data again at the maximum level (the browsers favour the encoding speed).
+
+    :param png_bytes: (bytes) the PNG image
+    :return: (bytes) the compressed PNG image, or the original one if not smaller
+    """
+    if not png_bytes.startswith(PNG_SIGNATURE):
+        return png_bytes
+    chunks = __read_png_chunks__(png_bytes)
+    image_data = b"".join(
+        chunk_data for chunk_type, chunk_data in chunks if chunk_type == b"IDAT"
+    )
+    try:
+        compressed_data = zlib.compress(zlib.decompress(image_data), 9)
+    except zlib.error:
+        return png_bytes
+    compressed_png, idat_written = [PNG_SIGNATURE], False
+    for chunk_type, chunk_data in chunks:
+        if chunk_type == b"IDAT":
+            if idat_written:
+                continue
+            chunk_data, idat_written = compressed_data, True
+        compressed_png.append(__write_png_chunk__(chunk_type, chunk_data))
+    compressed_png = b"".join(compressed_png)
+    return compressed_png if len(compressed_png) < len(png_bytes) else png_bytes
+
+
+def __unfilter_png_row__(filter_type, row, previous_row, pixel_size):
+    """
+    Helper function used to reverse the filter of a PNG scanline.
+
+    :param filter_type: (int) the PNG filter type (0 to 4)
+    :param row: (bytearray) the filtered scanline, without its filter byte
+    :param previous_row: (bytearray) the reconstructed previous scanline
+    :param pixel_size: (int) bytes per pixel
+    :return: (bytearray) the reconstructed scanline
+    """
+    if filter_type == 1:  # Sub: running sum of every channel
+        for channel in range(pixel_size):
+            row[channel::pixel_size] = bytes(
+                map((255).__and__, itertools.accumulate(row[channel::pixel_size]))
+            )
+    elif filter_type == 2:  # Up: bytewise sum of the two scanlines, without carries
+        row_length = len(row)
+        low_bits = int.from_bytes(b"\x7f" * row_length, "big")
+        row_value = int.from_bytes(row, "big")
+        previous_value = int.from_bytes(previous_row, "big")
+        row = bytearray(
+            (
+                ((row_value & low_bits) + (previous_value & low_bits))
+                ^ ((row_value ^ previous_value) & ~low_bits)
+            ).to_bytes(row_length, "big")
+        )
+    elif filter_type == 3:  # Average
+        for i in range(len(row)):
+            left = row[i - pixel_size] if i >= pixel_size else 0
+            row[i] = (row[i] + ((left + previous_row[i]) >> 1)) & 255
+    elif filter_type == 4:  # Paeth
+        for i in range(len(row)):
+            if i >= pixel_size:
+                left, upper_left = row[i - pixel_size], previous_row[i - pixel_size]
+            else:
+                left = upper_left = 0
+            up = previous_row[i]
+            estimate = left + up - upper_left
+            left_distance = abs(estimate - left)
+            up_distance = abs(estimate - up)
+            upper_left_distance = abs(estimate - upper_left)
+            if left_distance <= up_distance and left_distance <= upper_left_distance:
+                predictor = left
+            elif up_distance <= upper_left_distance:
+                predictor = up
+            else:
+                predictor = upper_left
+            row[i] = (row[i] + predictor) & 255
+    return row
+
+
+def downscale_png(png_bytes, max_size=THUMBNAIL_SIZE):
+    """
+    Function used to downscale a PNG image without external packages: the
+    scanlines are decoded and every n-th pixel of every n-th scanline is kept.
+    Only the 8 bit, non interlaced images are supported (the browser screenshots).
+
+    :param png_bytes: (bytes) the PNG image
+    :param max_size: (tuple) maximum width and height of the result, in pixels
+    :return: (bytes) the downscaled PNG image, or None if the image is not supported
+    """
+    if not png_bytes.startswith(PNG_SIGNATURE):
+        return None
+    chunks = __read_png_chunks__(png_bytes)
+    if not chunks or chunks[0][0] != b"IHDR":
+        return None
+    header = chunks[0][1]
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack(
+        ">IIBBBBB", header
+    )
+    pixel_size = PNG_PIXEL_SIZES.get(color_type)
+    if bit_depth != 8 or pixel_size is None or interlace or not width or not height:
+        return None
+    step = max(1, -(-width // max_size[0]), -(-height // max_size[1]))
+    image_data = zlib.decompress(
+        b"".join(
+            chunk_data for chunk_type, chunk_data in chunks if chunk_type == b"IDAT"
+        )
+    )
+    row_length = width * pixel_size
+    previous_row, scanlines = bytearray(row_length), list()
+    for y in range(height):
+        offset = y * (row_length + 1)
+        row = __unfilter_png_row__(
+            image_data[offset],
+            bytearray(image_data[offset + 1 : offset + 1 + row_length]),
+            previous_row,
+            pixel_size,
+        )
+        if y % step == 0:
+            scanlines.append(
+                b"\x00"
+                + b"".join(
+                    row[x : x + pixel_size]
+                    for x in range(0, row_length, step * pixel_size)
+                )
+            )
+        previous_row = row
+    thumbnail_header = (
+        struct.pack(">II", -(-width // step), -(-height // step)) + header[8:]
+    )
+    return b"".join(
+        (
+            PNG_SIGNATURE,
+            __write_png_chunk__(b"IHDR", thumbnail_header),
+            __write_png_chunk__(b"IDAT", zlib.compress(b"".join(scanlines), 9)),
+            __write_png_chunk__(b"IEND", b""),
+        )
+    )
+
+
+def build_thumbnail(png_bytes):
+    """
+    Function used to downscale an image to a thumbnail; Pillow is used when
+    installed, being much faster than the decoder of the module.
+
+    :param png_bytes: (bytes) the PNG image
+    :return: (bytes) the PNG thumbnail, or None if the image is not supported
+    """
+    if Image is None:
+        return downscale_png(png_bytes)
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        image.thumbnail(THUMBNAIL_SIZE)
+        thumbnail_file = io.BytesIO()
+        image.save(thumbnail_file, format="PNG", optimize=True)
+    return thumbnail_file.getvalue()
+
+
+class ScreenshotPipeline:
+    """
+    Class definition for the screenshot pipeline of the process.
+    """
+
+    def __init__(self, output_dir="screenshots"):
+        """
+        Constructor for the class; the background worker starts at the first screenshot.
+
+        :param output_dir: (str) folder of the screenshot files
+        """
+        self.output_dir = output_dir
+        self.frames = 0
+        self.duplicates = 0
+        self.written_bytes = 0
+        self.__frame_files__ = dict()
+        self.__queue__ = queue.Queue()
+        self.__worker__ = None
+        self.__lock__ = threading.Lock()
+
+    def capture(self, driver, name, element=None):
+        """
+        Method used to grab a screenshot of the page, or a crop of an element,
+        and to hand it to the background worker.
+
+        :param driver: (obj) the selenium driver
+        :param name: (str) the test identifier
+        :param element: (obj) the web element to be cropped; the whole page if None
+        :return: (str, str) paths of the image and of its thumbnail
+        """
+        if element is not None:
+            png_bytes = element.screenshot_as_png
+        else:
+            png_bytes = driver.get_screenshot_as_png()
+        return self.submit(png_bytes, name)
+
+    def submit(self, png_bytes, name):
+        """
+        Method used to queue a screenshot for writing; identical frames share one file.
+
+        :param png_bytes: (bytes) the PNG image
+        :param name: (str) the test identifier
+        :return: (str, str) paths of the image and of its thumbnail
+        """
+        frame_digest = hashlib.sha1(png_bytes).hexdigest()
+        with self.__lock__:
+            self.frames += 1
+            image_path = self.__frame_files__.get(frame_digest)
+            if image_path is None:
+                file_name = f"{sanitize_file_name(name)}_{frame_digest[:8]}"
+                image_path = os.path.join(self.output_dir, f"{file_name}.png")
+                self.__frame_files__[frame_digest] = image_path
+                self.__start_worker__()
+                self.__queue__.put((png_bytes, image_path))
+            else:
+                self.duplicates += 1
+        return image_path, self.__thumbnail_path__(image_path)
+
+    @staticmethod
+    def __thumbnail_path__(image_path):
+        """
+        Helper method used to derive the thumbnail path of an image.
+
+        :param image_path: (str) path of the image
+        :return: (str) path of the thumbnail
+        """
+        return f"{os.path.splitext(image_path)[0]}_thumbnail.png"
+
+    def __start_worker__(self):
+        """
+        Helper method used to start the background worker, if not yet running.
+        """
+        if self.__worker__ is None or not self.__worker__.is_alive():
+            self.__worker__ = threading.Thread(
+                target=self.__process_frames__, name="screenshot-writer", daemon=True
+            )
+            self.__worker__.start()
+
+    def __process_frames__(self):
+        """
+        Helper method run by the background worker: the queued frames are
+        compressed and written to disk, together with their thumbnails (the
+        compressed frame itself when its format cannot be downscaled).
+        """
+        while True:
+            png_bytes, image_path = self.__queue__.get()
+            try:
+                os.makedirs(os.path.dirname(image_path) or ".", exist_ok=True)
+                image_bytes = recompress_png(png_bytes)
+                self.__write_file__(image_path, image_bytes)
+                self.__write_file__(
+                    self.__thumbnail_path__(image_path),
+                    build_thumbnail(png_bytes) or image_bytes,
+                )
+            except Exception as frame_error:
+                log_pipeline.get_logger().error(
+                    f"Screenshot {image_path} not written: {frame_error}"
+                )
+            finally:
+                self.__queue__.task_done()
+
+    def __write_file__(self, file_path, file_bytes):
+        """
+        Helper method used to write a screenshot file.
+
+        :param file_path: (str) path of the file
+        :param file_bytes: (bytes) content of the file
+        """
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
+        with self.__lock__:
+            self.written_bytes += len(file_bytes)
+
+    def flush(self):
+        """
+        Method used to wait until all the queued screenshots are written
+        (called at the end of the test session).
+        """
+        self.__queue__.join()
+
+    def get_stats(self):
+        """
+        Method used to retrieve the pipeline counters.
+
+        :return: (dict) captured frames, deduplicated frames, files and written bytes
+        """
+        with self.__lock__:
+            return {
+                "frames": self.frames,
+                "duplicates": self.duplicates,
+                "files": len(self.__frame_files__),
+                "written_bytes": self.written_bytes,
+            }
+
+
+# Process-wide screenshot pipeline
+screenshot_pipeline = ScreenshotPipeline()
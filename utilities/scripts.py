@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the registry of the javascript helpers of the framework.
+The helper files are loaded and pre-parsed once per process, independently of
+the working directory; the helpers called repeatedly are installed ("pinned")
+in the page once and then invoked by name, so that later calls only send
+their arguments to the browser.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+
+# Location of the javascript helpers
+scripts_path = os.path.dirname(os.path.abspath(__file__))
+
+# Page object holding the pinned helpers
+PINNED_SCRIPTS_OBJECT = "window.__demoqaScripts__"
+
+# Result returned by the invocation stub when a helper is not pinned in the page
+MISSING_SCRIPT_KEY = "__demoqaMissingScript__"
+
+
+@functools.lru_cache(maxsize=None)
+def load_script(*script_names):
+    """
+    Function used to read javascript helper files and join them into one source.
+
+    :param script_names: (str) file names of the helpers, in the order to be joined
+    :return: (str) the joined javascript source
+    """
+    script_sources = list()
+    for script_name in script_names:
+        with open(os.path.join(scripts_path, script_name)) as f:
+            script_sources.append(f.read())
+    return "\n".join(script_sources)
+
+
+class ScriptAsset:
+    """
+    Class definition for a javascript helper: its source, the metadata parsed
+    from the source and, for pinned helpers, the install and invocation scripts.
+    """
+
+    def __init__(self, name, script_names, pinned=True, asynchronous=False):
+        """
+        Constructor for the class.
+
+        :param name: (str) name of the helper
+        :param script_names: (tuple) file names of the helper, in the order to be joined
+        :param pinned: (bool) True if the helper is installed in the page and invoked by name
+        :param asynchronous: (bool) True if the helper calls back its last argument
+        """
+        self.name = name
+        self.script_names = tuple(script_names)
+        self.pinned = pinned
+        self.asynchronous = asynchronous
+        self.source = load_script(*self.script_names)
+        self.metadata = self.__parse_metadata__(self.source)
+
+        # The helper source becomes the body of a function, stored in the page
+        script_key = json.dumps(name)
+        self.install_script = (
+            f"{PINNED_SCRIPTS_OBJECT} = {PINNED_SCRIPTS_OBJECT} || {{}};\n"
+            f"{PINNED_SCRIPTS_OBJECT}[{script_key}] = function() {{\n{self.source}\n}};\n"
+            f"return {PINNED_SCRIPTS_OBJECT}[{script_key}].apply(null, arguments);"
+        )
+        missing_result = f"{{{json.dumps(MISSING_SCRIPT_KEY)}: true}}"
+        if asynchronous:
+            self.invoke_script = (
+                f"var pinned = {PINNED_SCRIPTS_OBJECT};\n"
+                f"if (!pinned || !pinned[{script_key}]) {{\n"
+                f"    arguments[arguments.length - 1]({missing_result});\n"
+                f"    return;\n}}\n"
+                f"pinned[{script_key}].apply(null, arguments);"
+            )
+        else:
+            self.invoke_script = (
+                f"var pinned = {PINNED_SCRIPTS_OBJECT};\n"
+                f"if (!pinned || !pinned[{script_key}]) {{\n"
+                f"    return {missing_result};\n}}\n"
+                f"return pinned[{script_key}].apply(null, arguments);"
+            )
+
+    @staticmethod
+    def __parse_metadata__(source):
+        """
+        Helper method used to extract the string constants assigned in the source
+        (e.g.: the jQuery url of the jQuery load helper).
+
+        :param source: (str) the javascript source
+        :return: (dict) constant name -> constant value
+        """
+        constant_pattern = r"\b(\w+)\s*=\s*['\"]([^'\"]*)['\"]\s*;"
+        return dict(re.findall(constant_pattern, source))
+
+
+class ScriptRegistry:
+    """
+    Class definition for the registry of the javascript helpers of the process.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        self.__definitions__ = dict()
+        self.__assets__ = dict()
+        self.__lock__ = threading.Lock()
+        self.installs = 0
+        self.invocations = 0
+
+    def register(self, name, script_names, pinned=True, asynchronous=False):
+        """
+        Method used to register a javascript helper; it is loaded at the first use.
+
+        :param name: (str) name of the helper
+        :param script_names: (tuple) file names of the helper, in the order to be joined
+        :param pinned: (bool) True if the helper is installed in the page and invoked by name
+        :param asynchronous: (bool) True if the helper calls back its last argument
+        """
+        with self.__lock__:
+            self.__definitions__[name] = (tuple(script_names), pinned, asynchronous)
+            self.__assets__.pop(name, None)
+
+    def get(self, name):
+        """
+        Method used to retrieve a javascript helper, loading it if required.
+
+        :param name: (str) name of the helper
+        :return: (ScriptAsset) the loaded helper
+        """
+        asset = self.__assets__.get(name)
+        if asset is None:
+            with self.__lock__:
+                if name not in self.__assets__:
+                    script_names, pinned, asynchronous = self.__definitions__[name]
+                    self.__assets__[name] = ScriptAsset(
+                        name, script_names, pinned, asynchronous
+                    )
+                asset = self.__assets__[name]
+        return asset
+
+    def execute(self, driver, name, *script_args):
+        """
+        Method used to execute a javascript helper in the page: a pinned helper is
+        invoked by name and installed only when the page does not hold it yet.
+
+        :param driver: (obj) the selenium driver
+        :param name: (str) name of the helper
+        :param script_args: the arguments of the helper
+        :return: the value returned by the helper
+        """
+        asset = self.get(name)
+        if asset.asynchronous:
+            execute_function = driver.execute_async_script
+        else:
+            execute_function = driver.execute_script
+        self.invocations += 1
+        if not asset.pinned:
+            return execute_function(asset.source, *script_args)
+        script_result = execute_function(asset.invoke_script, *script_args)
+        if isinstance(script_result, dict) and script_result.get(MISSING_SCRIPT_KEY):
+            self.installs += 1
+            script_result = execute_function(asset.install_script, *script_args)
+        return script_result
+
+    async def async_execute(self, driver, name, *script_args):
+        """
+        Method used to execute a javascript helper through an asynchronous
+        session (AsyncWebDriver), with the same pinning as execute().
+
+        :param driver: (obj) the asynchronous driver
+        :param name: (str) name of the helper
+        :param script_args: the arguments of the helper
+        :return: the value returned by the helper
+        """
+        asset = self.get(name)
+        if asset.asynchronous:
+            execute_function = driver.execute_async_script
+        else:
+            execute_function = driver.execute_script
+        self.invocations += 1
+        if not asset.pinned:
+            return await execute_function(asset.source, *script_args)
+        script_result = await execute_function(asset.invoke_script, *script_args)
+        if isinstance(script_result, dict) and script_result.get(MISSING_SCRIPT_KEY):
+            self.installs += 1
+            script_result = await execute_function(asset.install_script, *script_args)
+        return script_result
+
+
+# Process-wide registry of the javascript helpers
+script_registry = ScriptRegistry()
+script_registry.register(
+    "element_state_reader", ("page_element_helper.js", "element_state_reader.js")
+)
+script_registry.register(
+    "dom_condition_waiter",
+    ("page_element_helper.js", "dom_condition_waiter.js"),
+    asynchronous=True,
+)
+script_registry.register("page_state_snapshot", ("page_state_snapshot.js",))
+script_registry.register(
+    "page_listener_tracker", ("page_listener_tracker.js",), pinned=False
+)
+script_registry.register("form_filler", ("page_element_helper.js", "form_filler.js"))
+script_registry.register(
+    "jquery_load_helper", ("jquery_load_helper.js",), pinned=False, asynchronous=True
+)
+script_registry.register(
+    "native_drag_and_drop", ("page_element_helper.js", "native_drag_and_drop.js")
+)
+script_registry.register(
+    "simulate_drag_drop", ("drag_and_drop_helper.js", "simulate_drag_drop.js")
+)
@@ -0,0 +1,2 @@
+/** simulate the drag and drop of an element (requires drag_and_drop_helper.js and jQuery) */
+$(arguments[0]).simulateDragDrop({ dropTarget: arguments[1] });
@@ -0,0 +1,1260 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines a static DOM: an html document parsed into a tree of
+element nodes, with the selenium locator strategies resolved in Python (CSS
+selectors and XPath expressions are compiled once). It has no layout and runs
+no javascript; it is the engine of the static DOM WebDriver and of the
+pre-flight locator validation.
+"""
+
+import functools
+import re
+from html.parser import HTMLParser
+
+# Elements with no content and no end tag
+VOID_ELEMENTS = frozenset(
+    (
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    )
+)  # fmt: skip
+
+# Elements never rendered
+HIDDEN_ELEMENTS = frozenset(
+    ("head", "script", "style", "title", "meta", "link", "template", "noscript")
+)
+
+# Elements rendered as blocks: their text is separated by line breaks
+BLOCK_ELEMENTS = frozenset(
+    (
+        "address", "article", "aside", "blockquote", "div", "dl", "dt", "dd",
+        "fieldset", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+        "h6", "header", "hr", "li", "main", "nav", "ol", "option", "p", "pre", "section",
+        "table", "tbody", "thead", "tfoot", "tr", "ul",
+    )
+)  # fmt: skip
+
+# Elements which can be disabled
+DISABLEABLE_ELEMENTS = frozenset(
+    ("button", "fieldset", "input", "optgroup", "option", "select", "textarea")
+)
+
+
+class SelectorError(ValueError):
+    """
+    Class definition for the error raised by an invalid or unsupported selector.
+    """
+
+
+class UnsupportedSelectorError(SelectorError):
+    """
+    Class definition for the error raised by a valid selector (accepted by the
+    browsers) which uses a syntax not supported by the static DOM.
+    """
+
+
+class DomNode:
+    """
+    Class definition for a node of the static DOM: an element (or the document)
+    with its attributes, its children (element nodes and text strings) and its
+    form state (value, checked, selected).
+    """
+
+    __slots__ = ("tag", "attributes", "children", "parent", "state")
+
+    def __init__(self, tag, attributes=None, parent=None):
+        """
+        Constructor for the class.
+
+        :param tag: (str) lowercase tag name ("#document" for the document)
+        :param attributes: (dict) attribute name -> attribute value
+        :param parent: (DomNode) the parent node
+        """
+        self.tag = tag
+        self.attributes = attributes or dict()
+        self.children = list()
+        self.parent = parent
+        self.state = dict()
+
+    def __repr__(self):
+        element_id = self.attributes.get("id")
+        return f"<{self.tag}{' #' + element_id if element_id else ''}>"
+
+    def element_children(self):
+        """
+        Method used to retrieve the element children of the node.
+
+        :return: (list) the child element nodes
+        """
+        return [child for child in self.children if isinstance(child, DomNode)]
+
+    def iter_descendants(self):
+        """
+        Method used to iterate over the descendant elements, in document order.
+
+        :return: (generator) the descendant element nodes
+        """
+        pending_nodes = list(reversed(self.element_children()))
+        while pending_nodes:
+            node = pending_nodes.pop()
+            yield node
+            pending_nodes.extend(reversed(node.element_children()))
+
+    def get_root(self):
+        """
+        Method used to retrieve the root of the tree holding the node.
+
+        :return: (DomNode) the root node
+        """
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def get_classes(self):
+        """
+        Method used to retrieve the classes of the element.
+
+        :return: (list) the class names
+        """
+        return self.attributes.get("class", "").split()
+
+    def text_content(self):
+        """
+        Method used to retrieve the raw text of the node and its descendants.
+
+        :return: (str) the text content
+        """
+        return "".join(
+            child.text_content() if isinstance(child, DomNode) else child
+            for child in self.children
+        )
+
+    def inline_style(self):
+        """
+        Method used to parse the inline style of the element.
+
+        :return: (dict) css property name -> value
+        """
+        style_declarations = dict()
+        for declaration in self.attributes.get("style", "").split(";"):
+            property_name, _, property_value = declaration.partition(":")
+            if property_name.strip():
+                style_declarations[property_name.strip().lower()] = (
+                    property_value.strip()
+                )
+        return style_declarations
+
+    def is_displayed(self):
+        """
+        Method used to check, with no layout, that the element is rendered: it is
+        not hidden by its tag, its "hidden" attribute or its inline style, nor by
+        an ancestor.
+
+        :return: (bool) True if the element is displayed
+        """
+        node = self
+        while node is not None and node.tag != "#document":
+            if node.tag in HIDDEN_ELEMENTS or "hidden" in node.attributes:
+                return False
+            if node.tag == "input" and node.attributes.get("type") == "hidden":
+                return False
+            node_style = node.inline_style()
+            if node_style.get("display") == "none":
+                return False
+            if node_style.get("visibility") in ("hidden", "collapse"):
+                return False
+            node = node.parent
+        return True
+
+    def visible_text(self):
+        """
+        Method used to retrieve the rendered text of the element (as innerText,
+        with no layout): the hidden elements are skipped, the whitespace is
+        collapsed and the blocks are separated by line breaks.
+
+        :return: (str) the visible text
+        """
+        if not self.is_displayed():
+            return ""
+        text_parts = list()
+        self.__collect_text__(text_parts)
+        lines = (
+            re.sub(r"[ \t\r\f\v]+", " ", line).strip()
+            for line in "".join(text_parts).split("\n")
+        )
+        return "\n".join(line for line in lines if line)
+
+    def __collect_text__(self, text_parts):
+        """
+        Helper method used to collect the visible text of the node.
+
+        :param text_parts: (list) the collected text parts
+        """
+        for child in self.children:
+            if not isinstance(child, DomNode):
+                text_parts.append(child.replace("\n", " "))
+                continue
+            if child.tag in HIDDEN_ELEMENTS or "hidden" in child.attributes:
+                continue
+            if child.inline_style().get("display") == "none":
+                continue
+            if child.tag == "br":
+                text_parts.append("\n")
+            elif child.tag in BLOCK_ELEMENTS:
+                text_parts.append("\n")
+                child.__collect_text__(text_parts)
+                text_parts.append("\n")
+            elif child.tag in ("td", "th"):
+                child.__collect_text__(text_parts)
+                text_parts.append(" ")
+            else:
+                child.__collect_text__(text_parts)
+
+    def get_value(self):
+        """
+        Method used to retrieve the current value of a form element.
+
+        :return: (str) the value
+        """
+        if "value" in self.state:
+            return self.state["value"]
+        if self.tag == "textarea":
+            return self.text_content()
+        if self.tag == "select":
+            selected_option = self.get_selected_option()
+            return selected_option.get_value() if selected_option else ""
+        if self.tag == "option" and "value" not in self.attributes:
+            return self.text_content().strip()
+        return self.attributes.get("value", "")
+
+    def set_value(self, value):
+        """
+        Method used to set the current value of a form element.
+
+        :param value: (str) the new value
+        """
+        self.state["value"] = value
+
+    def is_checked(self):
+        """
+        Method used to check if a checkbox or a radio button is checked.
+
+        :return: (bool) the checked state
+        """
+        return self.state.get("checked", "checked" in self.attributes)
+
+    def is_selected(self):
+        """
+        Method used to check if an element is selected (checked, or selected option).
+
+        :return: (bool) the selection state
+        """
+        if self.tag == "option":
+            select_node = self.get_select()
+            if select_node is not None:
+                return select_node.get_selected_option() is self
+            return self.state.get("selected", "selected" in self.attributes)
+        if self.tag == "input" and self.attributes.get("type") in ("checkbox", "radio"):
+            return self.is_checked()
+        return False
+
+    def is_enabled(self):
+        """
+        Method used to check if a form element is enabled.
+
+        :return: (bool) the enabled state
+        """
+        node = self
+        while node is not None and node.tag != "#document":
+            if node.tag in DISABLEABLE_ELEMENTS and "disabled" in node.attributes:
+                return False
+            node = node.parent
+        return True
+
+    def get_select(self):
+        """
+        Method used to retrieve the select element holding an option.
+
+        :return: (DomNode) the select element, or None
+        """
+        node = self.parent
+        while node is not None and node.tag != "select":
+            node = node.parent
+        return node
+
+    def get_options(self):
+        """
+        Method used to retrieve the options of a select element.
+
+        :return: (list) the option elements
+        """
+        return [node for node in self.iter_descendants() if node.tag == "option"]
+
+    def get_selected_option(self):
+        """
+        Method used to retrieve the selected option of a select element.
+
+        :return: (DomNode) the selected option, or None
+        """
+        options = self.get_options()
+        for option in options:
+            if option.state.get("selected", "selected" in option.attributes):
+                return option
+        return options[0] if options else None
+
+    def click(self):
+        """
+        Method used to apply the default action of a click: checkboxes are toggled,
+        radio buttons are checked (unchecking their group) and options are selected.
+        """
+        input_type = self.attributes.get("type", "").lower()
+        if self.tag == "input" and input_type == "checkbox":
+            self.state["checked"] = not self.is_checked()
+        elif self.tag == "input" and input_type == "radio":
+            group_name = self.attributes.get("name")
+            if group_name:
+                for node in self.get_root().iter_descendants():
+                    if (
+                        node.tag == "input"
+                        and node.attributes.get("type", "").lower() == "radio"
+                        and node.attributes.get("name") == group_name
+                    ):
+                        node.state["checked"] = False
+            self.state["checked"] = True
+        elif self.tag == "option":
+            select_node = self.get_select()
+            if select_node is not None:
+                for option in select_node.get_options():
+                    option.state["selected"] = False
+            self.state["selected"] = True
+
+    def get_property(self, property_name):
+        """
+        Method used to read a DOM property of the element.
+
+        :param property_name: (str) name of the property (e.g.: "value", "checked")
+        :return: the property value, or None if the property is not modelled
+        """
+        if property_name == "value":
+            return self.get_value()
+        if property_name == "checked":
+            return self.is_checked()
+        if property_name == "selected":
+            return self.is_selected()
+        if property_name == "disabled":
+            return not self.is_enabled()
+        if property_name in ("textContent", "text"):
+            return self.text_content()
+        if property_name == "innerText":
+            return self.visible_text()
+        if property_name in ("tagName", "nodeName"):
+            return self.tag.upper()
+        if property_name == "className":
+            return self.attributes.get("class", "")
+        if property_name == "selectedIndex" and self.tag == "select":
+            selected_option = self.get_selected_option()
+            return self.get_options().index(selected_option) if selected_option else -1
+        if property_name == "index" and self.tag == "option":
+            select_node = self.get_select()
+            return select_node.get_options().index(self) if select_node else 0
+        return self.attributes.get(property_name)
+
+    def get_attribute(self, attribute_name):
+        """
+        Method used to read an attribute as selenium's get_attribute() does:
+        the property is preferred to the attribute, booleans are "true" or None.
+
+        :param attribute_name: (str) name of the attribute
+        :return: (str) the attribute value, or None
+        """
+        if attribute_name in ("checked", "selected", "disabled"):
+            property_value = self.get_property(attribute_name)
+            return "true" if property_value else None
+        if attribute_name in ("value", "className", "innerText", "textContent"):
+            return str(self.get_property(attribute_name))
+        if attribute_name == "class":
+            return self.attributes.get("class")
+        return self.attributes.get(attribute_name)
+
+
+class DomDocument(DomNode):
+    """
+    Class definition for the document node of the static DOM, holding the index
+    of its elements (by id, name, class and tag), built at the first lookup.
+    """
+
+    __slots__ = ("element_index",)
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        super().__init__("#document")
+        self.element_index = None
+
+    def get_index(self):
+        """
+        Method used to retrieve the index of the elements; the index only holds
+        the markup (ids, names, classes and tags), which the interactions never change.
+
+        :return: (dict) "nodes" (in document order), "positions", "subtree_ends"
+            (position of the last descendant) and the "id", "name", "class" and
+            "tag" lookups (attribute value -> nodes)
+        """
+        if self.element_index is None:
+            element_index = {
+                "nodes": list(),
+                "positions": dict(),
+                "subtree_ends": dict(),
+                "id": dict(),
+                "name": dict(),
+                "class": dict(),
+                "tag": dict(),
+            }
+            for position, node in enumerate(self.iter_descendants()):
+                element_index["nodes"].append(node)
+                element_index["positions"][id(node)] = position
+                element_index["tag"].setdefault(node.tag, []).append(node)
+                for index_name in ("id", "name"):
+                    if index_name in node.attributes:
+                        element_index[index_name].setdefault(
+                            node.attributes[index_name], []
+                        ).append(node)
+                for class_name in node.get_classes():
+                    element_index["class"].setdefault(class_name, []).append(node)
+            subtree_ends = element_index["subtree_ends"]
+            for position in range(len(element_index["nodes"]) - 1, -1, -1):
+                node = element_index["nodes"][position]
+                element_children = node.element_children()
+                subtree_ends[id(node)] = (
+                    subtree_ends[id(element_children[-1])]
+                    if element_children
+                    else position
+                )
+            self.element_index = element_index
+        return self.element_index
+
+
+class DomTreeBuilder(HTMLParser):
+    """
+    Class definition for the html parser building the static DOM.
+    """
+
+    def __init__(self):
+        """
+        Constructor for the class.
+        """
+        super().__init__(convert_charrefs=True)
+        self.document = DomDocument()
+        self.__open_nodes__ = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        parent = self.__open_nodes__[-1]
+        # The paragraphs and list items are closed implicitly by their siblings
+        if tag in ("p", "li", "option", "tr", "td", "th") and parent.tag == tag:
+            self.__open_nodes__.pop()
+            parent = self.__open_nodes__[-1]
+        node = DomNode(
+            tag, {name: "" if value is None else value for name, value in attrs}, parent
+        )
+        parent.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.__open_nodes__.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        parent = self.__open_nodes__[-1]
+        parent.children.append(
+            DomNode(
+                tag,
+                {name: "" if value is None else value for name, value in attrs},
+                parent,
+            )
+        )
+
+    def handle_endtag(self, tag):
+        for position in range(len(self.__open_nodes__) - 1, 0, -1):
+            if self.__open_nodes__[position].tag == tag:
+                del self.__open_nodes__[position:]
+                return
+
+    def handle_data(self, data):
+        self.__open_nodes__[-1].children.append(data)
+
+
+def parse_html(html_source):
+    """
+    Function used to parse an html document into a static DOM.
+
+    :param html_source: (str) the html source
+    :return: (DomNode) the document node
+    """
+    tree_builder = DomTreeBuilder()
+    tree_builder.feed(html_source)
+    tree_builder.close()
+    return tree_builder.document
+
+
+# CSS selector tokens
+CSS_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?P<combinator>[>+~])\s*
+    | (?P<descendant>\s+)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<class>[\w-]+)
+    | \[\s*(?P<attribute>[\w:-]+)\s*
+        (?:(?P<operator>[~^$*|]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+    | :(?P<pseudo>[\w-]+)(?:\(\s*(?P<argument>[^)]*?)\s*\))?
+    | (?P<tag>\*|[\w-]+)
+    """,
+    re.VERBOSE,
+)
+
+# Supported CSS pseudo classes
+CSS_PSEUDO_CLASSES = (
+    "first-child", "last-child", "only-child", "nth-child", "nth-of-type",
+    "checked", "disabled", "enabled", "selected",
+)  # fmt: skip
+
+# Other CSS pseudo classes, accepted by the browsers but not by the static DOM
+CSS_UNSUPPORTED_PSEUDO_CLASSES = (
+    "not", "is", "where", "has", "hover", "focus", "focus-within", "focus-visible",
+    "active", "visited", "link", "any-link", "target", "scope", "root", "empty",
+    "first-of-type", "last-of-type", "only-of-type", "nth-last-child",
+    "nth-last-of-type", "required", "optional", "read-only", "read-write",
+    "placeholder-shown", "default", "indeterminate", "valid", "invalid",
+    "in-range", "out-of-range", "lang", "dir", "defined",
+)  # fmt: skip
+
+# CSS syntax accepted by the browsers but not by the static DOM: pseudo elements,
+# pseudo classes with nested arguments, attribute flags, escapes and namespaces
+CSS_UNSUPPORTED_TOKEN_PATTERN = re.compile(
+    r"""
+    ::[\w-]+
+    | :[\w-]+\((?:[^()]|\([^()]*\))*\)
+    | \[\s*[\w:-]+\s*[~^$*|]?=\s*(?:"[^"]*"|'[^']*'|[^\]\s]+)\s+[iIsS]\s*\]
+    | \\.
+    | (?:[\w-]+|\*)?\|[\w*-]
+    """,
+    re.VERBOSE,
+)
+
+
+def __new_compound__():
+    """
+    Helper method used to create an empty compound CSS selector.
+
+    :return: (dict) tag, ids, classes, attribute and pseudo class conditions
+    """
+    return {"tag": None, "ids": [], "classes": [], "attributes": [], "pseudos": []}
+
+
+@functools.lru_cache(maxsize=None)
+def compile_css(selector):
+    """
+    Function used to compile a CSS selector (a supported subset: type, id, class,
+    attribute and structural pseudo class selectors, with all the combinators).
+
+    :param selector: (str) the CSS selector; a comma separated group is supported
+    :return: (tuple) per selector of the group: the (combinator, compound) steps
+    """
+    compiled_group = list()
+    for group_selector in __split_outside_brackets__(selector, ","):
+        group_selector = group_selector.strip()
+        if not group_selector:
+            raise SelectorError(f"Invalid CSS selector: {selector!r}")
+        steps, compound, combinator, position = list(), __new_compound__(), None, 0
+        while position < len(group_selector):
+            token = CSS_TOKEN_PATTERN.match(group_selector, position)
+            if token is None or token.end() == position:
+                if CSS_UNSUPPORTED_TOKEN_PATTERN.match(group_selector, position):
+                    raise UnsupportedSelectorError(
+                        f"Unsupported CSS selector: {selector!r} (at {group_selector[position:]!r})"
+                    )
+                raise SelectorError(f"Invalid CSS selector: {selector!r}")
+            position = token.end()
+            if token.group("combinator") or token.group("descendant"):
+                if compound == __new_compound__():
+                    if steps and token.group("combinator"):
+                        combinator = token.group("combinator")
+                        continue
+                    if not steps:
+                        raise SelectorError(f"Invalid CSS selector: {selector!r}")
+                    continue
+                steps.append((combinator, compound))
+                compound = __new_compound__()
+                combinator = token.group("combinator") or " "
+            elif token.group("id"):
+                compound["ids"].append(token.group("id"))
+            elif token.group("class"):
+                compound["classes"].append(token.group("class"))
+            elif token.group("attribute"):
+                attribute_value = token.group("value")
+                if attribute_value and attribute_value[0] in "\"'":
+                    attribute_value = attribute_value[1:-1]
+                compound["attributes"].append(
+                    (token.group("attribute"), token.group("operator"), attribute_value)
+                )
+            elif token.group("pseudo"):
+                pseudo_name = token.group("pseudo")
+                if pseudo_name in CSS_UNSUPPORTED_PSEUDO_CLASSES:
+                    raise UnsupportedSelectorError(
+                        f"Unsupported CSS pseudo class: :{pseudo_name} in {selector!r}"
+                    )
+                if pseudo_name not in CSS_PSEUDO_CLASSES:
+                    raise SelectorError(
+                        f"Invalid CSS pseudo class: :{pseudo_name} in {selector!r}"
+                    )
+                compound["pseudos"].append(
+                    (pseudo_name, __parse_nth__(token.group("argument") or ""))
+                )
+            else:
+                if compound["tag"] is not None:
+                    raise SelectorError(f"Invalid CSS selector: {selector!r}")
+                compound["tag"] = token.group("tag").lower()
+        if compound == __new_compound__():
+            raise SelectorError(f"Invalid CSS selector: {selector!r}")
+        steps.append((combinator, compound))
+        compiled_group.append(tuple(steps))
+    return tuple(compiled_group)
+
+
+def __parse_nth__(argument):
+    """
+    Helper method used to parse the argument of an nth pseudo class.
+
+    :param argument: (str) the argument (e.g.: "3", "odd", "2n+1")
+    :return: (tuple) the (a, b) coefficients of "an+b", or None if no argument
+    """
+    argument = argument.replace(" ", "").lower()
+    if not argument:
+        return None
+    if argument == "odd":
+        return 2, 1
+    if argument == "even":
+        return 2, 0
+    nth_match = re.fullmatch(r"([+-]?\d*)n([+-]\d+)?|([+-]?\d+)", argument)
+    if nth_match is None:
+        raise SelectorError(f"Invalid nth argument: {argument!r}")
+    if nth_match.group(3) is not None:
+        return 0, int(nth_match.group(3))
+    coefficient = nth_match.group(1)
+    coefficient = {"": 1, "+": 1, "-": -1}.get(coefficient, None) or int(coefficient)
+    return coefficient, int(nth_match.group(2) or 0)
+
+
+def __matches_nth__(position, nth_coefficients):
+    """
+    Helper method used to check a 1-based position against "an+b".
+
+    :param position: (int) position of the element among its siblings
+    :param nth_coefficients: (tuple) the (a, b) coefficients
+    :return: (bool) True if the position matches
+    """
+    coefficient, offset = nth_coefficients
+    if coefficient == 0:
+        return position == offset
+    return (position - offset) % coefficient == 0 and (
+        position - offset
+    ) // coefficient >= 0
+
+
+def __matches_compound__(node, compound):
+    """
+    Helper method used to check an element against a compound CSS selector.
+
+    :param node: (DomNode) the element
+    :param compound: (dict) the compound selector
+    :return: (bool) True if the element matches
+    """
+    if compound["tag"] not in (None, "*") and node.tag != compound["tag"]:
+        return False
+    if any(node.attributes.get("id") != element_id for element_id in compound["ids"]):
+        return False
+    if compound["classes"]:
+        node_classes = node.get_classes()
+        if any(class_name not in node_classes for class_name in compound["classes"]):
+            return False
+    for attribute_name, operator, expected_value in compound["attributes"]:
+        attribute_value = node.attributes.get(attribute_name)
+        if attribute_value is None:
+            return False
+        if operator is None:
+            continue
+        if operator == "=" and attribute_value != expected_value:
+            return False
+        if operator == "~=" and expected_value not in attribute_value.split():
+            return False
+        if operator == "^=" and not attribute_value.startswith(expected_value):
+            return False
+        if operator == "$=" and not attribute_value.endswith(expected_value):
+            return False
+        if operator == "*=" and expected_value not in attribute_value:
+            return False
+        if operator == "|=" and not (
+            attribute_value == expected_value
+            or attribute_value.startswith(expected_value + "-")
+        ):
+            return False
+    for pseudo_name, nth_coefficients in compound["pseudos"]:
+        if not __matches_pseudo__(node, pseudo_name, nth_coefficients):
+            return False
+    return True
+
+
+def __matches_pseudo__(node, pseudo_name, nth_coefficients):
+    """
+    Helper method used to check an element against a pseudo class.
+
+    :param node: (DomNode) the element
+    :param pseudo_name: (str) name of the pseudo class
+    :param nth_coefficients: (tuple) the (a, b) coefficients of an nth pseudo class
+    :return: (bool) True if the element matches
+    """
+    if pseudo_name == "checked":
+        return node.is_selected()
+    if pseudo_name == "selected":
+        return node.is_selected()
+    if pseudo_name == "disabled":
+        return not node.is_enabled()
+    if pseudo_name == "enabled":
+        return node.is_enabled()
+    siblings = node.parent.element_children() if node.parent else [node]
+    if pseudo_name == "nth-of-type":
+        siblings = [sibling for sibling in siblings if sibling.tag == node.tag]
+    position = siblings.index(node) + 1
+    if pseudo_name == "first-child":
+        return position == 1
+    if pseudo_name == "last-child":
+        return position == len(siblings)
+    if pseudo_name == "only-child":
+        return len(siblings) == 1
+    if nth_coefficients is None:
+        raise SelectorError(f":{pseudo_name} requires an argument")
+    return __matches_nth__(position, nth_coefficients)
+
+
+def __matches_steps__(node, steps, step_index):
+    """
+    Helper method used to match an element against the CSS steps, from right to left.
+
+    :param node: (DomNode) the element matching the current step
+    :param steps: (tuple) the (combinator, compound) steps
+    :param step_index: (int) index of the current step
+    :return: (bool) True if the element matches the selector
+    """
+    combinator, compound = steps[step_index]
+    if not __matches_compound__(node, compound):
+        return False
+    if step_index == 0:
+        return True
+    if combinator == ">":
+        parent = node.parent
+        return (
+            parent is not None
+            and parent.tag != "#document"
+            and __matches_steps__(parent, steps, step_index - 1)
+        )
+    if combinator == " ":
+        ancestor = node.parent
+        while ancestor is not None and ancestor.tag != "#document":
+            if __matches_steps__(ancestor, steps, step_index - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+    if node.parent is None:
+        return False
+    siblings = node.parent.element_children()
+    previous_siblings = siblings[: siblings.index(node)]
+    if combinator == "+":
+        return bool(previous_siblings) and __matches_steps__(
+            previous_siblings[-1], steps, step_index - 1
+        )
+    return any(
+        __matches_steps__(sibling, steps, step_index - 1)
+        for sibling in previous_siblings
+    )
+
+
+def select_css(context_node, selector):
+    """
+    Function used to find the descendant elements matching a CSS selector.
+
+    :param context_node: (DomNode) the document or element searched
+    :param selector: (str) the CSS selector
+    :return: (list) the matching elements, in document order
+    """
+    compiled_group = compile_css(selector)
+    if not isinstance(context_node, DomDocument):
+        return [
+            node
+            for node in context_node.iter_descendants()
+            if any(
+                __matches_steps__(node, steps, len(steps) - 1)
+                for steps in compiled_group
+            )
+        ]
+    # From the document, only the indexed candidates of the rightmost compound are matched
+    matched_nodes = list()
+    for steps in compiled_group:
+        matched_nodes.extend(
+            node
+            for node in __css_candidates__(context_node, steps)
+            if __matches_steps__(node, steps, len(steps) - 1)
+        )
+    if len(compiled_group) == 1:
+        return matched_nodes
+    return __document_order__(context_node, matched_nodes)
+
+
+def __css_candidates__(document, steps):
+    """
+    Helper method used to retrieve the indexed candidates of the rightmost
+    compound of a CSS selector.
+
+    :param document: (DomDocument) the document
+    :param steps: (tuple) the (combinator, compound) steps of the selector
+    :return: (list) the candidate elements, in document order
+    """
+    compound = steps[-1][1]
+    element_index = document.get_index()
+    if compound["ids"]:
+        return element_index["id"].get(compound["ids"][0], [])
+    candidates = __compound_candidates__(element_index, compound)
+    # An id compound on the left, linked by descendant or child combinators only,
+    # narrows the candidates to the subtree of its element
+    for step_index in range(len(steps) - 2, -1, -1):
+        if steps[step_index + 1][0] not in (">", " "):
+            break
+        anchor_compound = steps[step_index][1]
+        if not anchor_compound["ids"]:
+            continue
+        anchor_nodes = element_index["id"].get(anchor_compound["ids"][0], [])
+        if not anchor_nodes:
+            return []
+        if len(anchor_nodes) == 1:
+            subtree_start = element_index["positions"][id(anchor_nodes[0])] + 1
+            subtree_end = element_index["subtree_ends"][id(anchor_nodes[0])] + 1
+            if subtree_end - subtree_start < len(candidates):
+                return element_index["nodes"][subtree_start:subtree_end]
+        break
+    return candidates
+
+
+def __compound_candidates__(element_index, compound):
+    """
+    Helper method used to retrieve the indexed candidates of a compound selector
+    with no id.
+
+    :param element_index: (dict) the index of the document
+    :param compound: (dict) the compound selector
+    :return: (list) the candidate elements, in document order
+    """
+    if compound["classes"]:
+        return element_index["class"].get(compound["classes"][0], [])
+    if compound["tag"] not in (None, "*"):
+        return element_index["tag"].get(compound["tag"], [])
+    for attribute_name, operator, expected_value in compound["attributes"]:
+        if attribute_name in ("id", "name") and operator == "=":
+            return element_index[attribute_name].get(expected_value, [])
+    return element_index["nodes"]
+
+
+# XPath predicate forms, supported by the static DOM
+XPATH_PREDICATE_PATTERNS = (
+    ("position", re.compile(r"(\d+)")),
+    ("last", re.compile(r"last\(\)")),
+    ("attribute_exists", re.compile(r"@([\w:-]+)")),
+    ("equals", re.compile(r"(@[\w:-]+|text\(\)|\.|normalize-space\(\s*\))\s*=\s*(\"[^\"]*\"|'[^']*')")),
+    ("function", re.compile(
+        r"(contains|starts-with)\(\s*(@[\w:-]+|text\(\)|\.|normalize-space\(\s*\))"
+        r"\s*,\s*(\"[^\"]*\"|'[^']*')\s*\)"
+    )),
+)  # fmt: skip
+
+
+# XPath tokens, for the lexical check of the expressions not supported by the static DOM
+XPATH_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        "[^"]*" | '[^']*' | \d+(?:\.\d*)? | \$[\w-]+
+        | @?(?:[\w-]+:)?(?:[\w-]+|\*)(?:\s*::)?
+        | \.\. | \. | // | / | \| | != | <= | >= | [=<>+,()\[\]*-]
+    )\s*
+    """,
+    re.VERBOSE,
+)
+
+
+def __split_outside_brackets__(expression, separator):
+    """
+    Helper method used to split an expression on a separator which is not
+    enclosed in brackets, parentheses or quotes.
+
+    :param expression: (str) the expression
+    :param separator: (str) the separator (a single character)
+    :return: (list) the parts of the expression
+    """
+    parts, current_part, depth, quote = list(), list(), 0, None
+    for character in expression:
+        if quote:
+            quote = None if character == quote else quote
+        elif character in "\"'":
+            quote = character
+        elif character in "[(":
+            depth += 1
+        elif character in "])":
+            depth -= 1
+        elif character == separator and depth == 0:
+            parts.append("".join(current_part))
+            current_part = list()
+            continue
+        current_part.append(character)
+    parts.append("".join(current_part))
+    return parts
+
+
+def __unsupported_xpath__(expression, detail):
+    """
+    Helper method used to build the error of an XPath expression the static DOM
+    does not support: the expression is only reported as unsupported if it is
+    made of valid XPath tokens, with balanced brackets and parentheses.
+
+    :param expression: (str) the XPath expression
+    :param detail: (str) the unsupported part of the expression
+    :return: (SelectorError) the error to be raised
+    """
+    position, depth = 0, {"(": 0, "[": 0}
+    while position < len(expression):
+        token = XPATH_TOKEN_PATTERN.match(expression, position)
+        if token is None or token.end() == position:
+            return SelectorError(f"Invalid XPath expression: {expression!r}")
+        position = token.end()
+        bracket = token.group().strip()
+        if bracket in ("(", "["):
+            depth[bracket] += 1
+        elif bracket in (")", "]"):
+            depth["(" if bracket == ")" else "["] -= 1
+            if min(depth.values()) < 0:
+                return SelectorError(f"Invalid XPath expression: {expression!r}")
+    if any(depth.values()):
+        return SelectorError(f"Invalid XPath expression: {expression!r}")
+    return UnsupportedSelectorError(f"Unsupported XPath {detail} in {expression!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def compile_xpath(expression):
+    """
+    Function used to compile an XPath expression (a supported subset: location
+    paths with the child, descendant, self and parent steps, and predicates on
+    the position, attributes and text, joined with "and").
+
+    :param expression: (str) the XPath expression; a "|" union is supported
+    :return: (tuple) per path of the union: (absolute, steps), where every step
+        is (axis, node test, predicates)
+    """
+    compiled_union = list()
+    for path in __split_outside_brackets__(expression, "|"):
+        path = path.strip()
+        if not path:
+            raise SelectorError(f"Invalid XPath expression: {expression!r}")
+        absolute = path.startswith("/")
+        steps, position, axis = list(), 0, "child"
+        if path.startswith("//"):
+            position, axis = 2, "descendant"
+        elif absolute:
+            position = 1
+        while position < len(path):
+            step_match = re.compile(r"(\*|\.\.|\.|[\w-]+)").match(path, position)
+            if step_match is None or path.startswith("text()", position):
+                if path.startswith(("@", "text()"), position):
+                    # Selenium only accepts the expressions selecting elements
+                    raise SelectorError(
+                        f"Invalid XPath expression: {expression!r} (not an element)"
+                    )
+                raise __unsupported_xpath__(
+                    expression, f"expression (at {path[position:]!r})"
+                )
+            node_test = step_match.group(1).lower()
+            position = step_match.end()
+            predicates = list()
+            while position < len(path) and path[position] == "[":
+                closing_position = __find_closing_bracket__(path, position)
+                predicates.extend(
+                    __compile_xpath_predicates__(
+                        path[position + 1 : closing_position], expression
+                    )
+                )
+                position = closing_position + 1
+            steps.append((axis, node_test, tuple(predicates)))
+            if path.startswith("//", position):
+                position, axis = position + 2, "descendant"
+            elif path.startswith("/", position):
+                position, axis = position + 1, "child"
+            elif position < len(path):
+                raise __unsupported_xpath__(
+                    expression, f"expression (at {path[position:]!r})"
+                )
+        if not steps:
+            raise SelectorError(f"Invalid XPath expression: {expression!r}")
+        compiled_union.append((absolute, tuple(steps)))
+    return tuple(compiled_union)
+
+
+def __find_closing_bracket__(path, opening_position):
+    """
+    Helper method used to find the bracket closing a predicate.
+
+    :param path: (str) the XPath location path
+    :param opening_position: (int) position of the opening bracket
+    :return: (int) position of the closing bracket
+    """
+    depth, quote = 0, None
+    for position in range(opening_position, len(path)):
+        character = path[position]
+        if quote:
+            quote = None if character == quote else quote
+        elif character in "\"'":
+            quote = character
+        elif character == "[":
+            depth += 1
+        elif character == "]":
+            depth -= 1
+            if depth == 0:
+                return position
+    raise SelectorError(f"Unbalanced XPath predicate in {path!r}")
+
+
+def __compile_xpath_predicates__(predicate, expression):
+    """
+    Helper method used to compile a predicate, made of conditions joined with "and".
+
+    :param predicate: (str) the predicate, without its brackets
+    :param expression: (str) the whole XPath expression (for the error messages)
+    :return: (list) the (predicate form, arguments) conditions
+    """
+    conditions = list()
+    for condition in re.split(r"\s+and\s+", predicate.strip()):
+        for predicate_form, predicate_pattern in XPATH_PREDICATE_PATTERNS:
+            condition_match = predicate_pattern.fullmatch(condition.strip())
+            if condition_match is not None:
+                conditions.append((predicate_form, condition_match.groups()))
+                break
+        else:
+            raise __unsupported_xpath__(expression, f"predicate [{predicate}]")
+    return conditions
+
+
+def __xpath_value__(node, operand):
+    """
+    Helper method used to evaluate the operand of an XPath comparison.
+
+    :param node: (DomNode) the context element
+    :param operand: (str) "@name", "text()", "." or "normalize-space()"
+    :return: (str) the value, or None if the attribute is missing
+    """
+    if operand.startswith("@"):
+        return node.attributes.get(operand[1:])
+    if operand == "text()":
+        return "".join(child for child in node.children if isinstance(child, str))
+    if operand == ".":
+        return node.text_content()
+    return " ".join(node.text_content().split())
+
+
+def __matches_xpath_condition__(node, condition, position, size):
+    """
+    Helper method used to check an element against a predicate condition.
+
+    :param node: (DomNode) the element
+    :param condition: (tuple) the (predicate form, arguments) condition
+    :param position: (int) 1-based position of the element in its step candidates
+    :param size: (int) number of step candidates
+    :return: (bool) True if the element matches
+    """
+    predicate_form, arguments = condition
+    if predicate_form == "position":
+        return position == int(arguments[0])
+    if predicate_form == "last":
+        return position == size
+    if predicate_form == "attribute_exists":
+        return arguments[0] in node.attributes
+    if predicate_form == "equals":
+        return __xpath_value__(node, arguments[0]) == arguments[1][1:-1]
+    function_name, operand, expected_value = arguments
+    value = __xpath_value__(node, operand)
+    if value is None:
+        return False
+    if function_name == "contains":
+        return expected_value[1:-1] in value
+    return value.startswith(expected_value[1:-1])
+
+
+def select_xpath(context_node, expression):
+    """
+    Function used to find the elements matching an XPath expression.
+
+    :param context_node: (DomNode) the document or element used as context
+    :param expression: (str) the XPath expression
+    :return: (list) the matching elements, in document order
+    """
+    matched_nodes = list()
+    for absolute, steps in compile_xpath(expression):
+        current_nodes = [context_node.get_root() if absolute else context_node]
+        for axis, node_test, predicates in steps:
+            next_nodes, next_node_ids = list(), set()
+            for current_node in current_nodes:
+                for candidates in __xpath_candidate_groups__(
+                    current_node, axis, node_test, predicates
+                ):
+                    if node_test not in ("*", ".", ".."):
+                        candidates = [
+                            node for node in candidates if node.tag == node_test
+                        ]
+                    for condition in predicates:
+                        candidates = [
+                            node
+                            for candidate_position, node in enumerate(candidates, 1)
+                            if __matches_xpath_condition__(
+                                node, condition, candidate_position, len(candidates)
+                            )
+                        ]
+                    for node in candidates:
+                        if id(node) not in next_node_ids:
+                            next_node_ids.add(id(node))
+                            next_nodes.append(node)
+            current_nodes = next_nodes
+        matched_nodes.extend(current_nodes)
+    return __document_order__(context_node.get_root(), matched_nodes)
+
+
+def __xpath_candidate_groups__(current_node, axis, node_test, predicates):
+    """
+    Helper method used to retrieve the candidates of an XPath step, grouped by
+    parent: the positions of the predicates are counted within each group (so
+    "//td[4]" is the 4th cell of every row).
+
+    :param current_node: (DomNode) the context node of the step
+    :param axis: (str) "child" or "descendant"
+    :param node_test: (str) the node test (tag name, "*", "." or "..")
+    :param predicates: (tuple) the predicate conditions of the step
+    :return: (list) the groups of candidate nodes
+    """
+    if node_test == ".":
+        return [[current_node]]
+    if node_test == "..":
+        return [[current_node.parent]] if current_node.parent else []
+    if axis == "child":
+        return [current_node.element_children()]
+    if any(condition[0] in ("position", "last") for condition in predicates):
+        return [
+            parent.element_children()
+            for parent in (current_node, *current_node.iter_descendants())
+        ]
+    if isinstance(current_node, DomDocument):
+        element_index = current_node.get_index()
+        if predicates and predicates[0][0] == "equals" and predicates[0][1][0] == "@id":
+            return [element_index["id"].get(predicates[0][1][1][1:-1], [])]
+        if node_test != "*":
+            return [element_index["tag"].get(node_test, [])]
+        return [element_index["nodes"]]
+    return [list(current_node.iter_descendants())]
+
+
+def __document_order__(root, nodes):
+    """
+    Helper method used to sort a node set in document order, without duplicates.
+
+    :param root: (DomNode) the root of the tree
+    :param nodes: (list) the nodes
+    :return: (list) the sorted nodes
+    """
+    if len(nodes) < 2:
+        return list(nodes)
+    if isinstance(root, DomDocument):
+        positions = root.get_index()["positions"]
+        unique_nodes = {id(node): node for node in nodes}
+        return sorted(
+            unique_nodes.values(), key=lambda node: positions.get(id(node), -1)
+        )
+    node_ids = {id(node) for node in nodes}
+    return [node for node in root.iter_descendants() if id(node) in node_ids]
+
+
+def find_elements(context_node, locator_by, locator_hook):
+    """
+    Function used to find the elements matching a selenium (By, hook) locator.
+
+    :param context_node: (DomNode) the document or element searched
+    :param locator_by: (str) the selenium By value (e.g.: "css selector")
+    :param locator_hook: (str) the locator hook
+    :return: (list) the matching elements, in document order
+    """
+    if locator_by == "css selector":
+        return select_css(context_node, locator_hook)
+    if locator_by == "xpath":
+        return select_xpath(context_node, locator_hook)
+    if isinstance(context_node, DomDocument) and locator_by in (
+        "id", "name", "class name", "tag name",
+    ):  # fmt: skip
+        index_name = locator_by.split()[0]
+        if index_name == "tag":
+            locator_hook = locator_hook.lower()
+        return list(context_node.get_index()[index_name].get(locator_hook, []))
+    if locator_by == "id":
+        return [
+            node
+            for node in context_node.iter_descendants()
+            if node.attributes.get("id") == locator_hook
+        ]
+    if locator_by == "name":
+        return [
+            node
+            for node in context_node.iter_descendants()
+            if node.attributes.get("name") == locator_hook
+        ]
+    if locator_by == "class name":
+        return [
+            node
+            for node in context_node.iter_descendants()
+            if locator_hook in node.get_classes()
+        ]
+    if locator_by == "tag name":
+        return [
+            node
+            for node in context_node.iter_descendants()
+            if node.tag == locator_hook.lower()
+        ]
+    if locator_by in ("link text", "partial link text"):
+        link_nodes = (
+            node for node in context_node.iter_descendants() if node.tag == "a"
+        )
+        if locator_by == "link text":
+            return [node for node in link_nodes if node.visible_text() == locator_hook]
+        return [node for node in link_nodes if locator_hook in node.visible_text()]
+    raise SelectorError(f"Unknown locator strategy: {locator_by!r}")
+
+
+def compile_locator(locator_by, locator_hook):
+    """
+    Function used to compile the CSS selector or XPath expression of a locator,
+    raising a SelectorError if it is invalid (or not supported by the static DOM).
+
+    :param locator_by: (str) the selenium By value
+    :param locator_hook: (str) the locator hook
+    """
+    if locator_by == "css selector":
+        compile_css(locator_hook)
+    elif locator_by == "xpath":
+        compile_xpath(locator_hook)
+    elif locator_by not in (
+        "id", "name", "class name", "tag name", "link text", "partial link text",
+    ):  # fmt: skip
+        raise SelectorError(f"Unknown locator strategy: {locator_by!r}")
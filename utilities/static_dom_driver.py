@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module defines the static DOM WebDriver: a browserless stand-in which
+loads the local demo page into a static DOM and answers the W3C commands of
+the read-only flows (find, text, properties, attributes, element states, form
+values, frames) in-process. It has no layout and runs no javascript, so the
+helpers of the framework are answered in Python and the interactions relying
+on the page scripts or on pointer actions are rejected.
+"""
+
+import hashlib
+import os
+import re
+
+from testdata.data_access import database_path, get_shared_database
+from utilities.fake_webdriver import (
+    ELEMENT_KEY,
+    CommandError,
+    FakeCommandExecutor,
+    FakeWebDriver,
+)
+from utilities.static_dom import SelectorError, find_elements, parse_html
+
+# Name of the pytest marker of the tests executed by the static DOM driver
+STATIC_DOM_MARKER = "static_dom"
+
+# Project folder, the local demo page path is relative to it
+project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Name of the pinned javascript helper in an install or invocation script
+PINNED_SCRIPT_PATTERN = re.compile(r"(?:__demoqaScripts__|pinned)\[\"(\w+)\"\]")
+
+# Keys of the selenium Keys class (unicode private use area), ignored when typing
+SELENIUM_KEYS_PATTERN = re.compile("[\ue000-\uf8ff]")
+
+
+def get_local_page_path(page_path=None):
+    """
+    Function used to resolve the local demo page (the local_demopage_path
+    of the general table, by default) on the current platform.
+
+    :param page_path: (str) path of the html page, relative to the project folder
+    :return: (str) the absolute path of the html page
+    """
+    if page_path is None:
+        _, (page_path,) = get_shared_database(database_path).fetch_one(
+            "SELECT local_demopage_path FROM general"
+        )
+    page_path = page_path.replace("\\", os.sep).replace("/", os.sep)
+    return os.path.join(project_path, page_path)
+
+
+def read_frame_source(frame_node, page_path):
+    """
+    Function used to read the html source of a frame: its srcdoc, or its source
+    file next to the page.
+
+    :param frame_node: (DomNode) the frame element
+    :param page_path: (str) absolute path of the page holding the frame
+    :return: (str) the html source of the frame
+    """
+    if "srcdoc" in frame_node.attributes:
+        return frame_node.attributes["srcdoc"]
+    frame_path = os.path.join(
+        os.path.dirname(page_path), frame_node.attributes.get("src", "")
+    )
+    if not os.path.isfile(frame_path):
+        raise FileNotFoundError(f"The frame source {frame_path} is not a local file")
+    with open(frame_path, encoding="utf-8") as f:
+        return f.read()
+
+
+class StaticDomCommandExecutor(FakeCommandExecutor):
+    """
+    Class definition for the command executor of the static DOM WebDriver.
+    """
+
+    def __init__(self, page_path):
+        """
+        Constructor for the class.
+
+        :param page_path: (str) absolute path of the html page loaded by the driver
+        """
+        super().__init__()
+        self.page_path = page_path
+        self.current_url = "about:blank"
+        self.page_source = "<html><head></head><body></body></html>"
+        self.document = parse_html(self.page_source)
+        self.__frame_stack__ = [self.document]
+        self.__frame_documents__ = dict()
+        self.__page_snapshot_url__ = None
+        self.__element_nodes__ = dict()
+        self.__element_references__ = dict()
+        self.__script_handlers__ = {
+            "element_state_reader": self.__read_elements_state__,
+            "page_state_snapshot": self.__page_state_snapshot__,
+            "dom_condition_waiter": self.__wait_dom_condition__,
+            "form_filler": self.__fill_form_fields__,
+        }
+
+    def respond(self, command, params):
+        """
+        Method used to answer a command from the static DOM; the commands
+        with no effect on the DOM (e.g.: window and timeouts) get canned values.
+
+        :param command: (str) name of the W3C command
+        :param params: (dict) parameters of the command
+        :return: the value of the W3C response
+        """
+        if command == "get":
+            return self.load_page(params["url"])
+        if command == "getCurrentUrl":
+            return self.current_url
+        if command == "getPageSource":
+            return self.page_source
+        if command == "getTitle":
+            title_nodes = find_elements(self.document, "tag name", "title")
+            return title_nodes[0].text_content().strip() if title_nodes else ""
+        if command == "switchToFrame":
+            return self.switch_to_frame(params.get("id"))
+        if command == "switchToParentFrame":
+            if len(self.__frame_stack__) > 1:
+                self.__frame_stack__.pop()
+            return None
+        if command in ("findElement", "findElements"):
+            return self.find(self.__frame_stack__[-1], command, params)
+        if command in ("findChildElement", "findChildElements"):
+            return self.find(self.get_node(params["id"]), command, params)
+        if command in ("w3cExecuteScript", "w3cExecuteScriptAsync"):
+            return self.execute_script(params.get("script", ""), params.get("args", []))
+        if command in ("actions", "clearActionState"):
+            raise CommandError(
+                "unsupported operation",
+                "Pointer and keyboard actions are not supported by the static DOM driver",
+            )
+        if "id" in params and command.startswith(("getElement", "isElement")):
+            return self.read_element(command, self.get_node(params["id"]), params)
+        if command in ("clickElement", "clearElement", "sendKeysToElement"):
+            return self.interact(command, self.get_node(params["id"]), params)
+        return super().respond(command, params)
+
+    def load_page(self, url):
+        """
+        Method used to load the local demo page, whatever the requested url.
+
+        :param url: (str) the requested url
+        """
+        if not os.path.isfile(self.page_path):
+            raise CommandError(
+                "unknown error",
+                f"The local demo page {self.page_path} does not exist",
+            )
+        with open(self.page_path, encoding="utf-8") as f:
+            self.page_source = f.read()
+        self.current_url = url
+        self.__reset_document__()
+
+    def __reset_document__(self):
+        """
+        Helper method used to build a fresh DOM from the page source; the
+        references to the former elements become stale.
+        """
+        self.document = parse_html(self.page_source)
+        self.__frame_stack__ = [self.document]
+        self.__frame_documents__ = dict()
+        self.__element_nodes__ = dict()
+        self.__element_references__ = dict()
+
+    def switch_to_frame(self, frame_reference):
+        """
+        Method used to switch to a frame, built from its srcdoc or its local source.
+
+        :param frame_reference: None (the top document), the frame index or the
+            W3C reference of the frame element
+        """
+        if frame_reference is None:
+            self.__frame_stack__ = [self.document]
+            return None
+        if isinstance(frame_reference, dict):
+            frame_node = self.get_node(frame_reference[ELEMENT_KEY])
+        else:
+            frame_nodes = find_elements(
+                self.__frame_stack__[-1], "css selector", "iframe, frame"
+            )
+            if not 0 <= frame_reference < len(frame_nodes):
+                raise CommandError(
+                    "no such frame", f"No frame at index {frame_reference}"
+                )
+            frame_node = frame_nodes[frame_reference]
+        if frame_node.tag not in ("iframe", "frame"):
+            raise CommandError("no such frame", f"{frame_node!r} is not a frame")
+        frame_document = self.__frame_documents__.get(id(frame_node))
+        if frame_document is None:
+            try:
+                frame_document = parse_html(
+                    read_frame_source(frame_node, self.page_path)
+                )
+            except FileNotFoundError as frame_error:
+                raise CommandError("no such frame", str(frame_error)) from None
+            self.__frame_documents__[id(frame_node)] = frame_document
+        self.__frame_stack__.append(frame_document)
+        return None
+
+    def get_reference(self, node):
+        """
+        Method used to retrieve the W3C reference of an element.
+
+        :param node: (DomNode) the element
+        :return: (dict) the W3C web element reference
+        """
+        element_id = self.__element_references__.get(id(node))
+        if element_id is None:
+            element_id = self.new_element_reference()[ELEMENT_KEY]
+            self.__element_references__[id(node)] = element_id
+            self.__element_nodes__[element_id] = node
+        return {ELEMENT_KEY: element_id}
+
+    def get_node(self, element_id):
+        """
+        Method used to retrieve the element of a W3C reference.
+
+        :param element_id: (str) the element identifier
+        :return: (DomNode) the element
+        """
+        node = self.__element_nodes__.get(element_id)
+        if node is None:
+            raise CommandError(
+                "stale element reference",
+                f"The element {element_id} is not attached to the current document",
+            )
+        return node
+
+    def find(self, context_node, command, params):
+        """
+        Method used to answer the find commands.
+
+        :param context_node: (DomNode) the document or element searched
+        :param command: (str) name of the W3C command
+        :param params: (dict) parameters of the command ("using" and "value")
+        :return: the W3C element reference, or the list of references
+        """
+        try:
+            nodes = find_elements(context_node, params["using"], params["value"])
+        except SelectorError as selector_error:
+            raise CommandError("invalid selector", str(selector_error)) from None
+        if command.endswith("Elements"):
+            return [self.get_reference(node) for node in nodes]
+        if not nodes:
+            raise CommandError(
+                "no such element",
+                f"Unable to locate element: {params['using']}={params['value']}",
+            )
+        return self.get_reference(nodes[0])
+
+    def read_element(self, command, node, params):
+        """
+        Method used to answer the element reading commands.
+
+        :param command: (str) name of the W3C command
+        :param node: (DomNode) the element
+        :param params: (dict) parameters of the command
+        :return: the value read
+        """
+        if command == "getElementText":
+            return node.visible_text()
+        if command == "getElementTagName":
+            return node.tag
+        if command == "getElementAttribute":
+            return node.attributes.get(params["name"])
+        if command == "getElementProperty":
+            return node.get_property(params["name"])
+        if command == "getElementValueOfCssProperty":
+            return node.inline_style().get(params["propertyName"], "")
+        if command == "isElementSelected":
+            return node.is_selected()
+        if command == "isElementEnabled":
+            return node.is_enabled()
+        return super().respond(command, params)
+
+    def interact(self, command, node, params):
+        """
+        Method used to apply the default effect of an interaction on the DOM
+        (no page script reacts to it).
+
+        :param command: (str) name of the W3C command
+        :param node: (DomNode) the element
+        :param params: (dict) parameters of the command
+        """
+        if not node.is_displayed():
+            raise CommandError(
+                "element not interactable", f"The element {node!r} is not displayed"
+            )
+        if command == "clickElement":
+            node.click()
+        elif command == "clearElement":
+            node.set_value("")
+        else:
+            node.set_value(
+                node.get_value() + SELENIUM_KEYS_PATTERN.sub("", params.get("text", ""))
+            )
+
+    def execute_script(self, script, script_args):
+        """
+        Method used to answer the scripts: the javascript helpers of the framework
+        and the selenium isDisplayed / getAttribute atoms are answered in Python,
+        any other script is rejected.
+
+        :param script: (str) the javascript source
+        :param script_args: (list) the arguments of the script
+        :return: the value returned by the script
+        """
+        script_args = [self.__unwrap_argument__(argument) for argument in script_args]
+        if script.startswith("/* isDisplayed */"):
+            return script_args[0].is_displayed()
+        if script.startswith("/* getAttribute */"):
+            return script_args[0].get_attribute(script_args[1])
+        script_name = PINNED_SCRIPT_PATTERN.search(script)
+        if script_name is not None and script_name.group(1) in self.__script_handlers__:
+            return self.__script_handlers__[script_name.group(1)](*script_args)
+        raise CommandError(
+            "javascript error",
+            "Scripts are not supported by the static DOM driver"
+            + (f": {script_name.group(1)}" if script_name else ""),
+        )
+
+    def __unwrap_argument__(self, argument):
+        """
+        Helper method used to resolve the element references of a script argument.
+
+        :param argument: the script argument
+        :return: the argument, with the elements resolved
+        """
+        if isinstance(argument, dict) and ELEMENT_KEY in argument:
+            return self.get_node(argument[ELEMENT_KEY])
+        return argument
+
+    def __find_first__(self, locator_by, locator_hook):
+        """
+        Helper method used to find the first element of a locator, in the current frame.
+
+        :param locator_by: (str) the selenium By value
+        :param locator_hook: (str) the locator hook
+        :return: (DomNode) the element, or None
+        """
+        try:
+            nodes = find_elements(self.__frame_stack__[-1], locator_by, locator_hook)
+        except SelectorError as selector_error:
+            raise CommandError("javascript error", str(selector_error)) from None
+        return nodes[0] if nodes else None
+
+    def __read_elements_state__(self, state_requests):
+        """
+        Helper method answering the element_state_reader helper.
+
+        :param state_requests: (list) the [By, hook, state kind, state name] requests
+        :return: (list) the [element found, state value] results
+        """
+        state_results = list()
+        for locator_by, locator_hook, state_kind, state_name in state_requests:
+            node = self.__find_first__(locator_by, locator_hook)
+            if node is None:
+                state_results.append([False, None])
+            elif state_kind == "text":
+                state_results.append([True, node.visible_text().strip()])
+            elif state_kind == "property":
+                state_results.append([True, node.get_property(state_name)])
+            elif state_kind == "attribute":
+                attribute_value = node.get_property(state_name)
+                state_results.append(
+                    [True, None if attribute_value is None else str(attribute_value)]
+                )
+            elif state_kind == "css":
+                state_results.append([True, node.inline_style().get(state_name, "")])
+            elif state_kind == "state" and state_name == "displayed":
+                state_results.append([True, node.is_displayed()])
+            elif state_kind == "state" and state_name == "enabled":
+                state_results.append([True, node.is_enabled()])
+            elif state_kind == "state":
+                state_results.append([True, node.is_selected()])
+            elif state_kind == "selected_option":
+                selected_option = node.get_selected_option()
+                state_results.append(
+                    [True, selected_option.visible_text() if selected_option else None]
+                )
+            else:
+                raise CommandError(
+                    "javascript error", f"Unknown state kind: {state_kind}"
+                )
+        return state_results
+
+    def __fill_form_fields__(self, field_requests):
+        """
+        Helper method answering the form_filler helper.
+
+        :param field_requests: (list) the [By, hook, text, clear required] requests
+        :return: (list) the [element found, value] results
+        """
+        field_results = list()
+        for locator_by, locator_hook, text_to_insert, clear_required in field_requests:
+            node = self.__find_first__(locator_by, locator_hook)
+            if node is None:
+                field_results.append([False, None])
+                continue
+            node.set_value(
+                text_to_insert if clear_required else node.get_value() + text_to_insert
+            )
+            field_results.append([True, node.get_value()])
+        return field_results
+
+    def __page_state_snapshot__(self, snapshot_action, page_url):
+        """
+        Helper method answering the page_state_snapshot helper: the captured
+        state is the parsed page source, restored by building a fresh DOM.
+
+        :param snapshot_action: (str) "capture" or "restore"
+        :param page_url: (str) the url of the page
+        :return: (str) the signature of the captured or restored page (the hash
+            of its source), or None if the page cannot be restored
+        """
+        if snapshot_action == "capture":
+            self.__page_snapshot_url__ = page_url
+            return hashlib.sha256(self.page_source.encode()).hexdigest()
+        if self.__page_snapshot_url__ != page_url or self.current_url != page_url:
+            return None
+        self.__reset_document__()
+        return hashlib.sha256(self.page_source.encode()).hexdigest()
+
+    def __wait_dom_condition__(
+        self, condition_name, locator_by, locator_hook, expected_value, *_
+    ):
+        """
+        Helper method answering the dom_condition_waiter helper; the static DOM
+        never changes by itself, so the condition is evaluated once.
+
+        :param condition_name: (str) "present", "visible", "text_contains" or "css_value"
+        :param locator_by: (str) the selenium By value
+        :param locator_hook: (str) the locator hook
+        :param expected_value: the expected text, or the (css property, value) pair
+        :return: (dict) the satisfied flag and the error message
+        """
+        node = self.__find_first__(locator_by, locator_hook)
+        if condition_name == "present":
+            satisfied = node is not None
+        elif condition_name == "visible":
+            satisfied = node is not None and node.is_displayed()
+        elif condition_name == "text_contains":
+            satisfied = node is not None and expected_value in node.visible_text()
+        elif condition_name == "css_value":
+            satisfied = (
+                node is not None
+                and node.inline_style().get(expected_value[0]) == expected_value[1]
+            )
+        else:
+            return {
+                "satisfied": False,
+                "error": f"Unknown wait condition: {condition_name}",
+            }
+        return {"satisfied": satisfied, "error": None}
+
+
+class StaticDomWebDriver(FakeWebDriver):
+    """
+    Class definition for the static DOM WebDriver.
+    """
+
+    def __init__(self, page_path=None):
+        """
+        Constructor for the class.
+
+        :param page_path: (str) path of the html page, relative to the project
+            folder; the local demo page of the general table if None
+        """
+        super().__init__(
+            command_executor=StaticDomCommandExecutor(get_local_page_path(page_path))
+        )
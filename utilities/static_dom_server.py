@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# Demo Project: Selenium testing framework implementation with Python
+# Showcase implementation by: Theodor-Stefan Baca
+# Version 1.0
+#
+
+"""
+Description:
+This module serves the static DOM WebDriver over HTTP, as a W3C WebDriver
+endpoint: every new session gets its own static DOM command executor (the local
+demo page, no browser). It lets the synchronous selenium Remote WebDriver and
+the asynchronous sessions run the read-only flows, and be benchmarked, on
+runners with no browser installed.
+
+Usage (from the project folder):
+» python -m utilities.static_dom_server --port 4444
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import uuid
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from utilities.static_dom_driver import StaticDomCommandExecutor, get_local_page_path
+
+# HTTP status of the W3C errors (any other error is answered with 500)
+ERROR_STATUS_CODES = {
+    "invalid argument": 400,
+    "invalid selector": 400,
+    "invalid session id": 404,
+    "no such element": 404,
+    "no such frame": 404,
+    "stale element reference": 404,
+    "unknown command": 404,
+    "unsupported operation": 500,
+}
+
+# HTTP reason phrases of the answered status codes
+REASON_PHRASES = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Server Error"}
+
+
+def __compile_routes__():
+    """
+    Helper method used to build the route patterns of the W3C commands, from
+    the command table of the selenium Remote WebDriver.
+
+    :return: (list) tuples of (HTTP method, path pattern, command name)
+    """
+    routes = list()
+    for command, (method, route) in remote_commands.items():
+        path_pattern = re.sub(r"\\\$(\w+)", r"(?P<\1>[^/]+)", re.escape(route))
+        routes.append((method, re.compile(f"{path_pattern}$"), command))
+    return routes
+
+
+class StaticDomServer:
+    """
+    Class definition for the W3C WebDriver endpoint of the static DOM sessions.
+    """
+
+    def __init__(self, page_path=None):
+        """
+        Constructor for the class.
+
+        :param page_path: (str) path of the html page, relative to the project
+            folder; the local demo page of the general table if None
+        """
+        self.page_path = get_local_page_path(page_path)
+        self.sessions = dict()
+        self.routes = __compile_routes__()
+        self.commands = 0
+
+    def dispatch(self, method, path, payload):
+        """
+        Method used to execute a W3C command on the session it addresses.
+
+        :param method: (str) the HTTP method
+        :param path: (str) the request path
+        :param payload: (dict) the JSON payload of the request
+        :return: (int, dict) the HTTP status and the W3C response
+        """
+        for route_method, path_pattern, command in self.routes:
+            route_match = path_pattern.match(path)
+            if route_method == method and route_match:
+                break
+        else:
+            return self.__error__("unknown command", f"{method} {path}")
+        params = dict(payload, **route_match.groupdict())
+        session_id = params.pop("sessionId", None)
+        self.commands += 1
+        if command == Command.NEW_SESSION:
+            session_id = uuid.uuid4().hex
+            self.sessions[session_id] = StaticDomCommandExecutor(self.page_path)
+            return 200, {
+                "value": {
+                    "sessionId": session_id,
+                    "capabilities": {"browserName": "static"},
+                }
+            }
+        executor = self.sessions.get(session_id)
+        if executor is None:
+            return self.__error__("invalid session id", f"No session {session_id}")
+        if command == Command.QUIT:
+            del self.sessions[session_id]
+            return 200, {"value": None}
+        response = executor.execute(command, params)
+        if "status" in response:
+            return self.__error__(
+                response["value"]["error"], response["value"]["message"]
+            )
+        return 200, response
+
+    @staticmethod
+    def __error__(error_code, message):
+        """
+        Helper method used to build a W3C error response.
+
+        :param error_code: (str) the W3C error code
+        :param message: (str) the error message
+        :return: (int, dict) the HTTP status and the W3C error response
+        """
+        return ERROR_STATUS_CODES.get(error_code, 500), {
+            "value": {"error": error_code, "message": message, "stacktrace": ""}
+        }
+
+    async def handle_connection(self, reader, writer):
+        """
+        Method used to serve the requests of a keep-alive connection.
+
+        :param reader: (obj) the stream reader of the connection
+        :param writer: (obj) the stream writer of the connection
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = dict()
+                while True:
+                    header_line = (await reader.readline()).decode("latin-1").strip()
+                    if not header_line:
+                        break
+                    header_name, _, header_value = header_line.partition(":")
+                    headers[header_name.strip().lower()] = header_value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                payload = json.loads(body) if body.strip() else {}
+                status_code, response = self.dispatch(
+                    method, path.split("?")[0], payload or {}
+                )
+                response_body = json.dumps(response).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status_code} {REASON_PHRASES[status_code]}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    "Cache-Control: no-cache\r\n"
+                    f"Content-Length: {len(response_body)}\r\n\r\n".encode("ascii")
+                    + response_body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host="127.0.0.1", port=4444, page_path=None, ready_callback=None):
+    """
+    Function used to serve the static DOM sessions until cancelled.
+
+    :param host: (str) the listening address
+    :param port: (int) the listening port (0 for any free port)
+    :param page_path: (str) path of the html page, relative to the project folder
+    :param ready_callback: (function) called with the url of the endpoint,
+        once it is listening
+    """
+    static_dom_server = StaticDomServer(page_path)
+    server = await asyncio.start_server(
+        static_dom_server.handle_connection, host, port, backlog=1024
+    )
+    listening_port = server.sockets[0].getsockname()[1]
+    if ready_callback is not None:
+        ready_callback(f"http://{host}:{listening_port}")
+    async with server:
+        await server.serve_forever()
+
+
+def run_server(host="127.0.0.1", port=0, page_path=None, url_queue=None):
+    """
+    Function used to run the endpoint in a separate process (e.g.: in a benchmark).
+
+    :param host: (str) the listening address
+    :param port: (int) the listening port (0 for any free port)
+    :param page_path: (str) path of the html page, relative to the project folder
+    :param url_queue: (obj) multiprocessing queue receiving the url of the endpoint
+    """
+    asyncio.run(
+        serve(host, port, page_path, url_queue.put if url_queue is not None else None)
+    )
+
+
+def main():
+    """
+    Function used to serve the static DOM sessions from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument("--page_path", default=None)
+    arguments = parser.parse_args()
+    try:
+        asyncio.run(
+            serve(
+                arguments.host,
+                arguments.port,
+                arguments.page_path,
+                lambda url: print(f"Static DOM WebDriver endpoint: {url}", flush=True),
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()